@@ -4,6 +4,7 @@ Provides the Canvas class and graphics utilities.
 """
 
 from .canvas import Canvas
+from .headless import HeadlessCanvas
 from .utils import rgb_to_hex, hex_to_rgb, convert_rgba_to_rgb
 
-__all__ = ['Canvas', 'rgb_to_hex', 'hex_to_rgb', 'convert_rgba_to_rgb']
+__all__ = ['Canvas', 'HeadlessCanvas', 'rgb_to_hex', 'hex_to_rgb', 'convert_rgba_to_rgb']
@@ -7,6 +7,9 @@ import tkinter as tk
 from typing import Dict, List
 from . import drawing, input as input_module, utils
 
+# Prints the latency probe's report instead of reaching the program
+LATENCY_REPORT_KEY = 'F12'
+
 
 class Canvas:
     """
@@ -47,6 +50,18 @@ class Canvas:
         self.key_presses: List[str] = []
         self.last_keys: List[str] = []
         
+        # Optional scripted input source with next_keys() -> list of keys
+        # and next_click() -> bool, polled alongside real events
+        self.input_script = None
+        
+        # Optional observer with on_keys(keys), on_click() and on_clear(),
+        # told about input delivered to the program and new screens
+        self.input_observer = None
+        
+        # Optional latency probe with key_arrived(event_time),
+        # keys_delivered(), responded() and report()
+        self.latency_probe = None
+        
         # Bind key events
         self.root.bind('<KeyPress>', self._on_key_press)
         
@@ -71,6 +86,12 @@ class Canvas:
         else:
             key = event.keysym  # Other special keys
         
+        if self.latency_probe is not None:
+            if key == LATENCY_REPORT_KEY:
+                print(self.latency_probe.report())
+                return
+            self.latency_probe.key_arrived(event.time)
+        
         if key not in self.key_presses:
             self.key_presses.append(key)
     
@@ -132,6 +153,8 @@ class Canvas:
         """Clear all objects from the canvas."""
         self.canvas.delete('all')
         self.objects.clear()
+        if self.input_observer is not None:
+            self.input_observer.on_clear()
         self.root.update()
     
     def set_color(self, obj_id: int, color: str):
@@ -164,6 +187,22 @@ class Canvas:
         except tk.TclError:
             pass
     
+    def responded(self):
+        """
+        Flush the response to the keys last read to the display, and
+        tell the latency probe (if any) that it is on screen.
+        """
+        try:
+            self.root.update_idletasks()
+        except tk.TclError:
+            pass
+        if self.latency_probe is not None:
+            self.latency_probe.responded()
+    
+    def item_count(self) -> int:
+        """Return the number of items on the tkinter canvas."""
+        return len(self.canvas.find_all())
+    
     def update(self):
         """Update the canvas display."""
         try:
@@ -0,0 +1,107 @@
+"""
+Headless Canvas for benchmarks and tests.
+Runs the real Canvas drawing code against an in-memory stand-in for
+the tkinter window, so no display is needed.
+"""
+
+import itertools
+from typing import Dict
+from .canvas import Canvas
+from . import input as input_module
+
+
+class HeadlessCanvas(Canvas):
+    """
+    A Canvas that keeps its items in memory instead of a window.
+    """
+
+    def __init__(self, width: int = 800, height: int = 600,
+                 title: str = "Graphics Window"):
+        """
+        Create a new headless canvas.
+
+        Args:
+            width: Width of the canvas in pixels
+            height: Height of the canvas in pixels
+            title: Title of the (absent) window
+        """
+        self.width = width
+        self.height = height
+        self.title = title
+
+        # The same object stands in for both the window and the canvas
+        self.root = self.canvas = _HeadlessWidget()
+
+        self.objects: Dict = {}
+        self.key_presses = []
+        self.last_keys = []
+        self.input_script = None
+        self.input_observer = None
+        self.latency_probe = None
+
+    def wait_for_click(self):
+        """Return at once, unless an input script decides the clicks."""
+        if self.input_script is not None:
+            input_module.wait_for_click(self)
+        elif self.input_observer is not None:
+            self.input_observer.on_click()
+
+
+class _HeadlessWidget:
+    """The parts of tk.Tk and tk.Canvas that Canvas uses, in memory."""
+
+    def __init__(self):
+        self.items: Dict[int, tuple] = {}
+        self._ids = itertools.count(1)
+
+    def _create(self, kind, *coords, **options):
+        item_id = next(self._ids)
+        self.items[item_id] = (kind, coords, options)
+        return item_id
+
+    def create_rectangle(self, *coords, **options):
+        return self._create('rectangle', *coords, **options)
+
+    def create_oval(self, *coords, **options):
+        return self._create('oval', *coords, **options)
+
+    def create_text(self, *coords, **options):
+        return self._create('text', *coords, **options)
+
+    def create_line(self, *coords, **options):
+        return self._create('line', *coords, **options)
+
+    def delete(self, item):
+        if item == 'all':
+            self.items.clear()
+        else:
+            self.items.pop(item, None)
+
+    def itemconfig(self, item, **options):
+        if item in self.items:
+            self.items[item][2].update(options)
+
+    def find_all(self):
+        return tuple(self.items)
+
+    def bind(self, sequence, callback):
+        return sequence
+
+    def unbind(self, sequence, func_id=None):
+        pass
+
+    def update(self):
+        pass
+
+    update_idletasks = update
+
+    def mainloop(self):
+        pass
+
+    def destroy(self):
+        self.items.clear()
+
+    def winfo_pointerx(self):
+        return 0
+
+    winfo_pointery = winfo_rootx = winfo_rooty = winfo_pointerx
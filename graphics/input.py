@@ -17,8 +17,14 @@ def get_new_key_presses(canvas_obj) -> list:
         List of key press strings
     """
     canvas_obj.root.update()
+    if canvas_obj.input_script is not None:
+        canvas_obj.key_presses.extend(canvas_obj.input_script.next_keys())
     keys = canvas_obj.key_presses.copy()
     canvas_obj.key_presses.clear()
+    if keys and canvas_obj.latency_probe is not None:
+        canvas_obj.latency_probe.keys_delivered()
+    if keys and canvas_obj.input_observer is not None:
+        canvas_obj.input_observer.on_keys(keys)
     return keys
 
 
@@ -38,9 +44,14 @@ def wait_for_click(canvas_obj):
     
     while not click_occurred[0]:
         canvas_obj.root.update()
+        script = canvas_obj.input_script
+        if script is not None and script.next_click():
+            break
         time.sleep(0.01)
     
     canvas_obj.canvas.unbind('<Button-1>', click_id)
+    if canvas_obj.input_observer is not None:
+        canvas_obj.input_observer.on_click()
 
 
 def get_mouse_x(canvas_obj) -> int:
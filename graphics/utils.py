@@ -3,9 +3,14 @@ Utility functions for the graphics package.
 Color conversion and helper functions.
 """
 
+from functools import lru_cache
+
+
+@lru_cache(maxsize=256)
 def convert_rgba_to_rgb(color: str) -> str:
     """
     Convert RGBA color to RGB (tkinter doesn't support alpha channel).
+    Results are cached since the game reuses a small set of colors.
     
     Args:
         color: Color string (can be rgba(...) or hex or named color)
@@ -3,48 +3,132 @@ Movie Mania - A trivia quiz game about movies.
 Main entry point for the game.
 """
 
+import argparse
+import os
+import random
 from graphics import Canvas
-from src.config import WIDTH, HEIGHT, PRIZE_VALUES, TOTAL_QUESTIONS
-from src.ui.screens import show_splash_screen
-from src.game.input import get_player_name
-from src.game.questions import select_game_questions, shuffle_question_options
-from src.game.quiz import run_quiz_game
-from src.game.leaderboard import save_to_leaderboard, display_leaderboard
+from src.config import WIDTH, HEIGHT, LEADERBOARD_WINDOW
+from src.perf.latency import LatencyProbe
+from src.ui.pacing import set_speed
+from src.game.bank_reload import default_reloader
+from src.game.calibration import default_calibration
+from src.game.kiosk import play_game, run_kiosk
+from src.game.leaderboard_windows import WINDOWS
+from src.game.question_index import default_index
+from src.game.questions import select_game_questions
+from src.game.scheduler import default_scheduler
+from src.game.recording import GameRecorder, GameReplayer, ReplayFinished
 
 
-def main():
+def main(argv=None):
     """
     Main entry point for Movie Mania game.
     Orchestrates game flow from start to finish.
+    
+    Args:
+        argv: Command line arguments (defaults to sys.argv)
     """
+    args = _parse_args(argv)
+    
     # Initialize canvas
     canvas = Canvas(WIDTH, HEIGHT)
-    
-    # Get player name
-    player_name = get_player_name(canvas)
-    
-    # Show splash screen
-    show_splash_screen(canvas, player_name)
-    
-    # Select and prepare questions
-    selected_questions = select_game_questions()
-    selected_questions = [
-        shuffle_question_options(q.copy()) 
-        for q in selected_questions
-    ]
-    
-    # Run the quiz game
-    final_score = run_quiz_game(canvas, selected_questions)
-    
-    # Handle game completion
-    if final_score == TOTAL_QUESTIONS:
-        # Winner - save to leaderboard and display
-        prize_amount = PRIZE_VALUES[final_score]
-        save_to_leaderboard(player_name, prize_amount)
-        display_leaderboard(canvas)
+    if args.latency:
+        canvas.latency_probe = LatencyProbe()
+    try:
+        _play(canvas, args)
+    finally:
+        if args.latency:
+            print(canvas.latency_probe.report())
+
+
+def _play(canvas, args):
+    """Run the game mode chosen on the command line."""
+    calibration = default_calibration(default_index())
+    if args.kiosk:
+        run_kiosk(canvas, genre=args.genre, scheduler=default_scheduler(),
+                  calibration=calibration, reloader=default_reloader(),
+                  window=args.leaderboard)
+    elif args.record:
+        _record_game(canvas, args.record, args.genre, calibration)
+    elif args.replay:
+        _replay_game(canvas, args.replay, args.speed)
     else:
-        # Did not complete - just wait for click
-        canvas.wait_for_click()
+        play_game(canvas, genre=args.genre, scheduler=default_scheduler(),
+                  calibration=calibration, window=args.leaderboard)
+
+
+def _parse_args(argv):
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Movie Mania trivia game")
+    modes = parser.add_mutually_exclusive_group()
+    modes.add_argument(
+        "--kiosk", action="store_true",
+        help="play games back to back until the window is closed"
+    )
+    modes.add_argument(
+        "--record", metavar="FILE", help="record the game to FILE"
+    )
+    modes.add_argument(
+        "--replay", metavar="FILE", help="replay a recorded game"
+    )
+    parser.add_argument(
+        "--speed", type=float, default=1.0,
+        help="replay speed: 1 real time, N times faster, 0 unthrottled"
+    )
+    parser.add_argument(
+        "--genre", action="append", choices=default_index().genres(),
+        help="only ask questions from this genre (repeat for several)"
+    )
+    parser.add_argument(
+        "--leaderboard", choices=WINDOWS, default=LEADERBOARD_WINDOW,
+        help="standings shown after a game: today's, this week's or all-time"
+    )
+    parser.add_argument(
+        "--latency", action="store_true",
+        help="measure key press to screen latency (F12 prints it, and "
+             "it is printed on exit)"
+    )
+    args = parser.parse_args(argv)
+    if args.genre:
+        args.genre = list(dict.fromkeys(args.genre))
+        try:
+            select_game_questions(args.genre)
+        except ValueError:
+            parser.error(f"not enough questions for genre {', '.join(args.genre)}")
+    return args
+
+
+def _record_game(canvas, path, genre=None, calibration=None):
+    """Play one game while recording it."""
+    seed = int.from_bytes(os.urandom(4), "big")
+    random.seed(seed)
+    recorder = GameRecorder(seed)
+    canvas.input_observer = recorder
+    try:
+        play_game(canvas, recording=recorder, genre=genre,
+                  scheduler=default_scheduler(), calibration=calibration)
+    finally:
+        recorder.save(path)
+
+
+def _replay_game(canvas, path, speed):
+    """Replay a recorded game without saving its result again."""
+    try:
+        replayer = GameReplayer.load(path)
+        replayer.bank_positions()
+    except (OSError, ValueError) as e:
+        print(f"Cannot replay {path}: {e}")
+        canvas.close()
+        return
+    random.seed(replayer.seed)
+    set_speed(speed)
+    canvas.input_script = replayer
+    canvas.input_observer = replayer
+    try:
+        play_game(canvas, recording=replayer, persist=False)
+    except ReplayFinished:
+        pass
+    canvas.close()
 
 
 if __name__ == '__main__':
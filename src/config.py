@@ -26,9 +26,41 @@ TIMER_TEXT_COLOR = "#ff0000"  # Red for timer
 # Game settings
 TIMER_DURATION = 30  # seconds
 MAX_NAME_LENGTH = 15
+LEADERBOARD_BACKEND = "sqlite"  # "json", "sqlite" or "log"
 LEADERBOARD_FILE = "leaderboard.json"
+LEADERBOARD_DB = "leaderboard.sqlite"
+LEADERBOARD_LOG = "leaderboard.log"
+LEADERBOARD_SNAPSHOT = "leaderboard.snapshot"
+LEADERBOARD_COMPACT_BYTES = 64 * 1024  # log size that triggers a compaction
 LEADERBOARD_TOP_N = 10
 LEADERBOARD_DISPLAY_N = 5
+LEADERBOARD_WINDOW = "all"  # standings shown after a game: "day", "week" or "all"
+
+# Telemetry settings (set TELEMETRY_FILE to None to disable)
+TELEMETRY_FILE = "telemetry.jsonl"
+TELEMETRY_MAX_BYTES = 5 * 1024 * 1024  # rotate after this size
+TELEMETRY_BACKUPS = 3  # rotated files to keep
+TELEMETRY_FLUSH_INTERVAL = 2.0  # seconds between background writes
+
+# Game results for content tuning (set RESULTS_FILE to None to disable)
+RESULTS_FILE = "results.mmrs"
+RESULTS_BLOCK_GAMES = 16384  # games per compressed columnar block
+
+# Question bank: path to a .jsonl, .csv, .sqlite or compiled .mmqb
+# file, or None for the built-in questions in src/data/questions.py
+QUESTION_BANK = None
+BANK_RELOAD_INTERVAL = 5.0  # seconds between checks for an updated bank (None disables)
+
+# Seen-question memory per player (set SEEN_FILE to None to disable)
+SEEN_FILE = "seen_questions.db"
+SEEN_EXPECTED_GAMES = 250  # games a player's record remembers before starting over
+SEEN_FALSE_POSITIVES = 0.01  # unseen questions taken for seen
+
+# Difficulty calibration from play (set CALIBRATION_FILE to None to disable)
+CALIBRATION_FILE = "calibration.bin"
+CALIBRATION_STEP = 0.4  # starting Elo-style step size (logits)
+CALIBRATION_SAVE_INTERVAL = 60  # seconds between saves during kiosk play
+CALIBRATED_DIFFICULTY = False  # pick questions by calibrated difficulty bands
 
 # Question distribution
 EASY_QUESTIONS_COUNT = 2
@@ -0,0 +1,283 @@
+"""
+Compact binary question store for Movie Mania.
+
+compile_store() turns any question bank into a single file that
+BinaryQuestionStore memory-maps. Nothing is loaded at open beyond a
+small header, the genre names and the bucket table, so startup time and
+memory stay flat however many questions the file holds; each Question
+record is decoded only when the game asks for it.
+
+Questions are stored sorted by (difficulty, genre), so every bucket is
+a contiguous range of positions. File layout (little-endian, sections
+8-byte aligned):
+
+    header     magic, version, counts and section offsets
+    genres     UTF-8 JSON list of genre names (interned codes)
+    buckets    u64 triples: difficulty << 16 | genre, start, end
+    answers    u8 per question: index of the correct option
+    audience   4 x u8 per question: poll percentages, zero padded
+    starts     u64 per question: offset of its strings in the heap
+    lengths    u32 per question: byte length of its strings
+    hashes     u64 per question: question_hash() of its text
+    heap       UTF-8 question and options, joined by STRING_SEPARATOR
+"""
+
+import array
+import bisect
+import json
+import mmap
+import os
+import struct
+from src.data.loaders import DIFFICULTIES, MAX_OPTIONS, QuestionFormatError
+from src.data.records import Question, question_hash
+
+MAGIC = b"MMQB"
+# Version 2 adds the hashes section
+STORE_VERSION = 2
+STORE_SUFFIX = ".mmqb"
+STRING_SEPARATOR = "\x1f"
+
+# magic, version, genre count, question count, bucket count, then the
+# offsets of the genres, buckets, answers, audience, starts, lengths,
+# hashes and heap sections
+_HEADER = struct.Struct("<4sHHQQ8Q")
+
+
+class BinaryQuestionStore:
+    """Memory-mapped question bank written by compile_store()."""
+
+    def __init__(self, path):
+        """
+        Map a compiled store.
+
+        Args:
+            path: Store file
+
+        Raises:
+            ValueError: If the file is not a store of this version
+        """
+        self.path = path
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, genre_count, count, bucket_count,
+         genres_at, buckets_at, answers_at, audience_at, starts_at,
+         lengths_at, hashes_at, self._heap_at) = _HEADER.unpack_from(self._map)
+        if magic != MAGIC or version != STORE_VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a version {STORE_VERSION} question store "
+                             f"(recompile it with src.tools.bank compile)")
+
+        view = memoryview(self._map)
+        self.genre_names = json.loads(bytes(view[genres_at:buckets_at]).rstrip(b"\0"))
+        self.count = count
+        self.answers = view[answers_at:answers_at + count]
+        self.audience = view[audience_at:audience_at + count * MAX_OPTIONS]
+        self.starts = view[starts_at:starts_at + count * 8].cast('Q')
+        self.lengths = view[lengths_at:lengths_at + count * 4].cast('I')
+        self.hashes = view[hashes_at:hashes_at + count * 8].cast('Q')
+        self._views = [self.answers, self.audience, self.starts, self.lengths,
+                       self.hashes, view]
+
+        table = view[buckets_at:buckets_at + bucket_count * 24].cast('Q')
+        self.buckets = []
+        for i in range(0, len(table), 3):
+            code, start, end = table[i:i + 3]
+            key = (DIFFICULTIES[code >> 16], self.genre_names[code & 0xFFFF])
+            self.buckets.append((start, end, key))
+        table.release()
+        self._bucket_starts = [start for start, _, _ in self.buckets]
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, position):
+        """Decode the Question record at a position."""
+        if position < 0:
+            position += self.count
+        if not 0 <= position < self.count:
+            raise IndexError("question position out of range")
+        strings = self.strings(position)
+        difficulty, genre = self.key(position)
+        start = position * MAX_OPTIONS
+        options = tuple(strings[1:])
+        return Question(
+            position, strings[0], options, self.answers[position],
+            tuple(self.audience[start:start + len(options)]),
+            genre, difficulty, None
+        )
+
+    def __iter__(self):
+        for position in range(self.count):
+            yield self[position]
+
+    def index_buckets(self):
+        """
+        Contiguous position range of every (difficulty, genre) bucket.
+
+        Returns:
+            dict: (difficulty, genre) -> range of positions
+        """
+        return {key: range(start, end) for start, end, key in self.buckets}
+
+    def question_hashes(self):
+        """
+        question_hash() of every question, by position, read through
+        the map (nothing is decoded or copied).
+
+        Returns:
+            memoryview: 64-bit hashes (valid until close())
+        """
+        return self.hashes
+
+    def key(self, position):
+        """Return (difficulty, genre) of the question at a position."""
+        i = bisect.bisect_right(self._bucket_starts, position) - 1
+        return self.buckets[i][2]
+
+    def strings(self, position):
+        """Return [question, option, option, ...] for a position."""
+        start = self._heap_at + self.starts[position]
+        data = self._map[start:start + self.lengths[position]]
+        return data.decode("utf-8").split(STRING_SEPARATOR)
+
+    def close(self):
+        """Unmap the file."""
+        for view in getattr(self, '_views', ()):
+            view.release()
+        self._views = []
+        self._map.close()
+        self._file.close()
+
+
+def compile_store(questions, path):
+    """
+    Write questions to a binary store.
+
+    Streams the questions once: strings go straight to a temporary heap
+    file and only the small per-question columns are kept in memory.
+
+    Args:
+        questions: Iterable of validated question dictionaries or
+            Question records
+        path: Output store file
+
+    Returns:
+        int: Number of questions written
+
+    Raises:
+        QuestionFormatError: If a question cannot be stored
+    """
+    genre_codes = {}
+    genre_names = []
+    keys = array.array('L')
+    answers = bytearray()
+    audience = bytearray()
+    starts = array.array('Q')
+    lengths = array.array('I')
+    hashes = array.array('Q')
+
+    heap_path = path + ".heap"
+    try:
+        with open(heap_path, "wb") as heap:
+            offset = 0
+            for position, q in enumerate(questions):
+                if isinstance(q, Question):
+                    q = q.to_dict()
+                strings = [q['question']] + list(q['options'])
+                if any(STRING_SEPARATOR in s for s in strings):
+                    raise QuestionFormatError(
+                        f"question {position}: text contains the separator "
+                        f"character"
+                    )
+                data = STRING_SEPARATOR.join(strings).encode("utf-8")
+                heap.write(data)
+                starts.append(offset)
+                lengths.append(len(data))
+                hashes.append(question_hash(q['question']))
+                offset += len(data)
+
+                genre = genre_codes.get(q['genre'])
+                if genre is None:
+                    genre = genre_codes[q['genre']] = len(genre_names)
+                    genre_names.append(q['genre'])
+                keys.append(DIFFICULTIES.index(q['difficulty']) << 16 | genre)
+                answers.append(q['options'].index(q['answer']))
+                poll = [min(255, max(0, round(p))) for p in q['audience']]
+                audience.extend(poll + [0] * (MAX_OPTIONS - len(poll)))
+
+        order, buckets = _sort_by_bucket(keys)
+        _write_store(path, heap_path, genre_names, order, buckets,
+                     answers, audience, starts, lengths, hashes)
+    finally:
+        os.remove(heap_path)
+    return len(keys)
+
+
+def _sort_by_bucket(keys):
+    """
+    Group positions by bucket key in (difficulty, genre) order.
+
+    Returns:
+        tuple: (positions in store order, [(key, start, end), ...])
+    """
+    groups = {}
+    for position, key in enumerate(keys):
+        group = groups.get(key)
+        if group is None:
+            group = groups[key] = array.array('Q')
+        group.append(position)
+
+    order = array.array('Q')
+    buckets = []
+    for key in sorted(groups):
+        start = len(order)
+        order.extend(groups[key])
+        buckets.append((key, start, len(order)))
+    return order, buckets
+
+
+def _write_store(path, heap_path, genre_names, order, buckets,
+                 answers, audience, starts, lengths, hashes):
+    """Write the header, reordered columns and heap to a store file."""
+    count = len(order)
+    genres = json.dumps(genre_names).encode("utf-8")
+    table = array.array('Q')
+    for key, start, end in buckets:
+        table.extend((key, start, end))
+    sections = [
+        genres,
+        table.tobytes(),
+        bytes(answers[i] for i in order),
+        b"".join(audience[i * MAX_OPTIONS:(i + 1) * MAX_OPTIONS] for i in order),
+        array.array('Q', (starts[i] for i in order)).tobytes(),
+        array.array('I', (lengths[i] for i in order)).tobytes(),
+        array.array('Q', (hashes[i] for i in order)).tobytes(),
+    ]
+
+    offsets = []
+    position = _align(_HEADER.size)
+    for section in sections:
+        offsets.append(position)
+        position = _align(position + len(section))
+    heap_at = position
+
+    temporary = path + ".tmp"
+    with open(temporary, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, STORE_VERSION, len(genre_names), count,
+                             len(buckets), *offsets, heap_at))
+        for section, at in zip(sections, offsets):
+            f.seek(at)
+            f.write(section)
+        f.seek(heap_at)
+        with open(heap_path, "rb") as heap:
+            while True:
+                chunk = heap.read(1 << 20)
+                if not chunk:
+                    break
+                f.write(chunk)
+    os.replace(temporary, path)
+
+
+def _align(position):
+    """Round a file position up to a multiple of 8."""
+    return (position + 7) & ~7
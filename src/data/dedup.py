@@ -0,0 +1,306 @@
+"""
+Near-duplicate question detection for Movie Mania question banks.
+Finds rephrasings of the same question without comparing every pair:
+each question's text and options are cut into character shingles and
+summarised by a MinHash signature, and locality-sensitive hashing
+(LSH) over bands of the signature proposes only the pairs likely to be
+similar. Candidates are checked against the signatures and joined into
+clusters.
+
+Signatures are computed in chunks across a process pool and spooled to
+a temporary file, so memory stays bounded however large the bank is.
+
+Requires NumPy (only the dedup tool needs it, not the game).
+"""
+
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+import itertools
+import os
+import re
+import tempfile
+import numpy as np
+
+DEFAULT_THRESHOLD = 0.7
+DEFAULT_PERMUTATIONS = 128
+SHINGLE_SIZE = 5
+CHUNK_SIZE = 4096
+
+# Fixed so signatures from different runs and processes agree
+_SEED = 20250601
+_GOLDEN = np.uint64(0x9E3779B97F4A7C15)
+_NON_WORD = re.compile(r"[\W_]+")
+
+# Rows per block when reading spooled signatures back
+_BLOCK_ROWS = 1 << 16
+
+# positions: bank positions in the cluster, ascending
+# similarity: estimated Jaccard similarity of the members to the first
+DuplicateCluster = namedtuple('DuplicateCluster', ['positions', 'similarity'])
+
+
+def question_text(question, options):
+    """
+    Text compared for duplicates: the question and its options.
+
+    Options are sorted so the same question with shuffled options
+    matches exactly.
+
+    Args:
+        question: Question text
+        options: Option strings
+
+    Returns:
+        str: Normalized text
+    """
+    parts = [question] + sorted(options, key=str.casefold)
+    return _NON_WORD.sub(" ", " ".join(parts).casefold()).strip()
+
+
+def lsh_bands(permutations, threshold):
+    """
+    Choose how to split a signature into LSH bands.
+
+    Two questions become candidates when all rows of any band match,
+    which happens with probability 1 - (1 - s**rows)**bands at
+    similarity s. The split minimising the false positive area below
+    the threshold plus the false negative area above it is chosen.
+
+    Args:
+        permutations: Signature length
+        threshold: Similarity at which questions count as duplicates
+
+    Returns:
+        tuple: (bands, rows per band)
+    """
+    similarity = np.linspace(0.0, 1.0, 201)
+    below = similarity <= threshold
+    best = None
+    for rows in range(1, permutations + 1):
+        bands = permutations // rows
+        candidate = 1.0 - (1.0 - similarity ** rows) ** bands
+        error = candidate[below].sum() + (1.0 - candidate[~below]).sum()
+        if best is None or error < best[0]:
+            best = (error, bands, rows)
+    return best[1], best[2]
+
+
+def minhash_signatures(texts, permutations=DEFAULT_PERMUTATIONS,
+                       shingle_size=SHINGLE_SIZE):
+    """
+    MinHash signatures for a batch of normalized texts.
+
+    All shingles of the batch are packed and hashed at once: one
+    multiply-shift hash per permutation, then a minimum per text.
+
+    Args:
+        texts: List of strings from question_text()
+        permutations: Signature length
+        shingle_size: Characters per shingle (at most 8)
+
+    Returns:
+        ndarray: uint32 array of shape (len(texts), permutations)
+    """
+    multipliers, increments = _hash_parameters(permutations)
+    encoded = [t.encode("utf-8").ljust(shingle_size) for t in texts]
+    lengths = np.fromiter((len(e) for e in encoded), np.int64, len(encoded))
+    ends = np.cumsum(lengths)
+    data = np.frombuffer(b"".join(encoded), dtype=np.uint8).astype(np.uint64)
+
+    # Every shingle_size-byte window, packed into one integer
+    count = len(data) - shingle_size + 1
+    shingles = np.zeros(count, dtype=np.uint64)
+    for j in range(shingle_size):
+        shingles |= data[j:j + count] << np.uint64(8 * j)
+
+    # Keep the windows that lie inside a single text
+    starts = np.arange(count)
+    owner = np.searchsorted(ends, starts, side="right")
+    inside = starts + shingle_size <= ends[owner]
+    shingles = shingles[inside]
+    first = np.searchsorted(owner[inside], np.arange(len(encoded)))
+
+    signatures = np.empty((len(encoded), permutations), dtype=np.uint32)
+    shift = np.uint64(32)
+    for i in range(permutations):
+        hashed = (shingles * multipliers[i] + increments[i]) >> shift
+        signatures[:, i] = np.minimum.reduceat(hashed, first)
+    return signatures
+
+
+def find_duplicates(questions, threshold=DEFAULT_THRESHOLD,
+                    permutations=DEFAULT_PERMUTATIONS, workers=None,
+                    chunk_size=CHUNK_SIZE, scratch_dir=None):
+    """
+    Cluster near-duplicate questions.
+
+    Args:
+        questions: Iterable of (question text, options) in bank order
+        threshold: Estimated Jaccard similarity at which two questions
+            are duplicates
+        permutations: Signature length (longer is more accurate)
+        workers: Worker processes (CPU count if None, 1 runs inline)
+        chunk_size: Questions per worker job
+        scratch_dir: Directory for the spooled signatures (system
+            temporary directory if None)
+
+    Returns:
+        list: DuplicateCluster for every group of two or more, largest
+        first
+    """
+    bands, rows = lsh_bands(permutations, threshold)
+    with tempfile.TemporaryDirectory(dir=scratch_dir) as scratch:
+        path = os.path.join(scratch, "signatures")
+        count = 0
+        with open(path, "wb") as f:
+            for signatures in _signature_chunks(questions, permutations,
+                                                workers, chunk_size):
+                f.write(signatures.tobytes())
+                count += len(signatures)
+        if count < 2:
+            return []
+
+        signatures = np.memmap(path, dtype=np.uint32, mode="r",
+                               shape=(count, permutations))
+        parent = np.arange(count, dtype=np.int64)
+        for band in range(bands):
+            keys = _band_keys(signatures, band * rows, rows)
+            first, second = _candidate_pairs(keys)
+            _join(parent, signatures, first, second, threshold)
+
+        clusters = _clusters(parent)
+        result = [
+            DuplicateCluster(members.tolist(),
+                             _similarity(signatures, members))
+            for members in clusters
+        ]
+        del signatures
+    result.sort(key=lambda c: (-len(c.positions), c.positions[0]))
+    return result
+
+
+def _hash_parameters(permutations):
+    """Odd multipliers and increments of the per-permutation hashes."""
+    rng = np.random.default_rng(_SEED)
+    multipliers = rng.integers(0, 2 ** 63, permutations, dtype=np.uint64)
+    multipliers = multipliers * np.uint64(2) + np.uint64(1)
+    increments = rng.integers(0, 2 ** 63, permutations, dtype=np.uint64)
+    return multipliers, increments
+
+
+def _signature_job(job):
+    """Worker entry point: signatures for one chunk of questions."""
+    questions, permutations = job
+    texts = [question_text(question, options) for question, options in questions]
+    return minhash_signatures(texts, permutations)
+
+
+def _signature_chunks(questions, permutations, workers, chunk_size):
+    """
+    Yield signature arrays chunk by chunk, in input order.
+
+    At most two jobs per worker are in flight, so the input is read no
+    faster than it is hashed.
+    """
+    questions = iter(questions)
+    chunks = iter(lambda: list(itertools.islice(questions, chunk_size)), [])
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for chunk in chunks:
+            yield _signature_job((chunk, permutations))
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(_signature_job, (chunk, permutations)))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _band_keys(signatures, start, rows):
+    """One 64-bit hash per question of a band of signature rows."""
+    keys = np.empty(len(signatures), dtype=np.uint64)
+    for block in range(0, len(signatures), _BLOCK_ROWS):
+        band = signatures[block:block + _BLOCK_ROWS, start:start + rows]
+        key = np.zeros(len(band), dtype=np.uint64)
+        for column in band.T:
+            key = (key ^ column.astype(np.uint64)) * _GOLDEN
+        keys[block:block + len(band)] = key
+    return keys
+
+
+def _candidate_pairs(keys):
+    """
+    Pairs of questions sharing a band key.
+
+    Each bucket is linked both as a chain (neighbours in sorted order)
+    and as a star around its first member, so large buckets cost linear
+    rather than quadratic work.
+    """
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+    same = sorted_keys[1:] == sorted_keys[:-1]
+    if not same.any():
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty
+
+    chain = np.flatnonzero(same)
+    heads = np.maximum.accumulate(
+        np.where(np.concatenate(([True], ~same)), np.arange(len(order)), 0)
+    )
+    first = np.concatenate((order[chain], order[heads[chain + 1]]))
+    second = np.concatenate((order[chain + 1], order[chain + 1]))
+    distinct = first != second
+    return first[distinct], second[distinct]
+
+
+def _find(parent, positions):
+    """Roots of positions, compressing parent pointers on the way."""
+    while True:
+        grandparent = parent[parent]
+        if np.array_equal(grandparent, parent):
+            break
+        parent[:] = grandparent
+    return parent[positions]
+
+
+def _join(parent, signatures, first, second, threshold):
+    """Union the candidate pairs whose signatures agree enough."""
+    for block in range(0, len(first), _BLOCK_ROWS):
+        a = first[block:block + _BLOCK_ROWS]
+        b = second[block:block + _BLOCK_ROWS]
+        # Pairs already in one cluster need no check
+        apart = _find(parent, a) != _find(parent, b)
+        a, b = a[apart], b[apart]
+        if not len(a):
+            continue
+        agree = (signatures[a] == signatures[b]).mean(axis=1)
+        a, b = a[agree >= threshold], b[agree >= threshold]
+
+        # Hook the larger root under the smaller until every pair shares
+        # a root; conflicting writes are resolved by the next round
+        while len(a):
+            root_a, root_b = _find(parent, a), _find(parent, b)
+            apart = root_a != root_b
+            a, b = a[apart], b[apart]
+            root_a, root_b = root_a[apart], root_b[apart]
+            parent[np.maximum(root_a, root_b)] = np.minimum(root_a, root_b)
+
+
+def _clusters(parent):
+    """Groups of two or more positions sharing a root."""
+    roots = _find(parent, slice(None))
+    order = np.argsort(roots, kind="stable")
+    sorted_roots = roots[order]
+    splits = np.flatnonzero(sorted_roots[1:] != sorted_roots[:-1]) + 1
+    return [group for group in np.split(order, splits) if len(group) > 1]
+
+
+def _similarity(signatures, members):
+    """Mean estimated similarity of a cluster's members to its first."""
+    sample = members[:_BLOCK_ROWS]
+    rows = signatures[sample]
+    return float((rows[1:] == rows[0]).mean())
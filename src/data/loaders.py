@@ -0,0 +1,639 @@
+"""
+External question bank loaders for Movie Mania.
+
+Streams questions from JSON lines, CSV or SQLite files and validates
+each record as it is read. open_bank() gives a lazy bank that keeps only
+each question's location, difficulty, genre and text hash in memory and
+reads a question from disk when the game asks for it.
+
+File formats (one question per line or row):
+    .jsonl   {"question": ..., "options": [...], "answer": ...,
+              "audience": [...], "genre": ..., "difficulty": ...}
+    .csv     header row with the same columns; options and audience
+             are separated by "|" (quoted fields may span lines)
+    .sqlite  table "questions" with the same columns; options and
+             audience hold JSON arrays
+
+Lazy banks keep a small binary index file next to the bank (".idx")
+so reopening an unchanged bank does not rescan it.
+"""
+
+import array
+import csv
+import functools
+import io
+import json
+import os
+import sqlite3
+from src.data.records import Question, question_hash
+
+DIFFICULTIES = ('easy', 'medium', 'hard')
+MAX_OPTIONS = 4
+CSV_SEPARATOR = "|"
+SQLITE_TABLE = "questions"
+INDEX_SUFFIX = ".idx"
+INDEX_VERSION = 3
+
+
+class QuestionFormatError(ValueError):
+    """Raised when a question record is missing fields or malformed."""
+
+
+def validate_question(record, where="?"):
+    """
+    Check one question record and return it in the game's dict form.
+
+    Args:
+        record: Dictionary read from a bank
+        where: Location for error messages (e.g. "bank.jsonl:12")
+
+    Returns:
+        dict: Question with exactly the fields the game uses
+
+    Raises:
+        QuestionFormatError: If a field is missing or invalid
+    """
+    def fail(message):
+        raise QuestionFormatError(f"{where}: {message}")
+
+    if not isinstance(record, dict):
+        fail("record is not an object")
+    for field in ('question', 'options', 'answer', 'audience',
+                  'genre', 'difficulty'):
+        if field not in record:
+            fail(f"missing field {field!r}")
+
+    question = record['question']
+    options = record['options']
+    answer = record['answer']
+    audience = record['audience']
+    genre = record['genre']
+    difficulty = record['difficulty']
+
+    if not isinstance(question, str) or not question.strip():
+        fail("question must be a non-empty string")
+    if (not isinstance(options, list) or not 2 <= len(options) <= MAX_OPTIONS
+            or not all(isinstance(o, str) and o for o in options)):
+        fail(f"options must be 2-{MAX_OPTIONS} non-empty strings")
+    if len(set(options)) != len(options):
+        fail("options must be distinct")
+    if answer not in options:
+        fail(f"answer {answer!r} is not one of the options")
+    if (not isinstance(audience, list) or len(audience) != len(options)
+            or not all(isinstance(p, (int, float)) and p >= 0 for p in audience)):
+        fail("audience must give a non-negative percentage per option")
+    if not isinstance(genre, str) or not genre:
+        fail("genre must be a non-empty string")
+    if difficulty not in DIFFICULTIES:
+        fail(f"difficulty must be one of {', '.join(DIFFICULTIES)}")
+
+    return {
+        "question": question, "options": options, "answer": answer,
+        "audience": audience, "genre": genre, "difficulty": difficulty,
+    }
+
+
+# Streaming readers: yield validated questions one at a time
+
+def iter_jsonl(path):
+    """
+    Stream questions from a JSON lines file.
+
+    Args:
+        path: File to read
+
+    Yields:
+        dict: Validated question
+    """
+    with open(path, encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            if line.strip():
+                yield _parse_json_line(line, f"{path}:{line_number}")
+
+
+def iter_csv(path):
+    """
+    Stream questions from a CSV file with a header row.
+
+    Args:
+        path: File to read
+
+    Yields:
+        dict: Validated question
+    """
+    with open(path, encoding="utf-8", newline="") as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            yield _from_csv_row(row, f"{path}:{reader.line_num}")
+
+
+def iter_sqlite(path, table=SQLITE_TABLE):
+    """
+    Stream questions from a SQLite database.
+
+    Args:
+        path: Database file
+        table: Table holding the questions
+
+    Yields:
+        dict: Validated question
+    """
+    connection = _connect(path)
+    try:
+        cursor = connection.execute(f"SELECT rowid, * FROM {table} ORDER BY rowid")
+        for row in cursor:
+            yield _from_sqlite_row(row, f"{path}:{table}:{row['rowid']}")
+    finally:
+        connection.close()
+
+
+# Lazy banks: index on open, fetch on demand
+
+class LazyQuestionBank:
+    """
+    Read-only sequence of questions fetched from disk on demand.
+
+    Only each question's location, difficulty, genre and text hash are
+    held in memory; recently fetched questions are cached.
+    """
+
+    def __init__(self, path, locations, difficulties, genres, hashes, fetch,
+                 cache_size=256):
+        """
+        Create a lazy bank. Use open_bank() rather than calling this.
+
+        Args:
+            path: Bank file, for error messages
+            locations: array of byte offsets or row IDs, one per question
+            difficulties: bytes of indices into DIFFICULTIES
+            genres: (genre names list, array of indices into it)
+            hashes: array of question_hash() of each question's text
+            fetch: Function(location) returning a validated question
+                dictionary
+            cache_size: Number of fetched questions to keep
+        """
+        self.path = path
+        self.locations = locations
+        self.difficulties = difficulties
+        self.genre_names, self.genre_codes = genres
+        self.hashes = hashes
+        self._read = fetch
+        self._fetch = functools.lru_cache(maxsize=cache_size)(self._record)
+
+    def __len__(self):
+        return len(self.locations)
+
+    def __getitem__(self, position):
+        """Fetch the Question record at a position."""
+        return self._fetch(self.locations[position], position)
+
+    def __iter__(self):
+        for position in range(len(self)):
+            yield self[position]
+
+    def _record(self, location, position):
+        """Read and convert one question."""
+        return Question.from_dict(self._read(location), position)
+
+    def index_keys(self):
+        """
+        Yield (difficulty, genre) for every question without fetching it.
+
+        Used by QuestionIndex so building an index reads no questions.
+        """
+        names = self.genre_names
+        for difficulty, genre in zip(self.difficulties, self.genre_codes):
+            yield DIFFICULTIES[difficulty], names[genre]
+
+    def question_hashes(self):
+        """question_hash() of every question, by position, without fetching."""
+        return self.hashes
+
+    def close(self):
+        """Release the file or database handle."""
+        self._fetch.cache_clear()
+        closer = getattr(self._read, "close", None)
+        if closer is not None:
+            closer()
+
+
+def scan_jsonl(path):
+    """
+    Find each question's byte offset, difficulty and genre in a JSON
+    lines bank, validating every question so a bad one fails the open
+    rather than a game.
+
+    Args:
+        path: File to scan
+
+    Returns:
+        tuple: (offsets, difficulties, genres, hashes) for LazyQuestionBank
+
+    Raises:
+        QuestionFormatError: If a line is not a valid question
+    """
+    offsets = array.array('q')
+    keys = _KeyCollector()
+    with open(path, "rb") as f:
+        offset = 0
+        for line_number, line in enumerate(f, 1):
+            if line.strip():
+                keys.add(_parse_json_line(line, f"{path}:{line_number}"))
+                offsets.append(offset)
+            offset += len(line)
+    return (offsets,) + keys.result()
+
+
+def scan_csv(path):
+    """
+    Find each question's byte offset, difficulty and genre in a CSV
+    bank, validating every question.
+
+    Args:
+        path: File to scan
+
+    Returns:
+        tuple: (offsets, difficulties, genres, hashes) for LazyQuestionBank
+
+    Raises:
+        QuestionFormatError: If a row is not a valid question
+    """
+    offsets = array.array('q')
+    keys = _KeyCollector()
+    with open(path, "rb") as f:
+        header = f.readline()
+        fieldnames = _csv_fieldnames(header)
+        offset = len(header)
+        line_number = 2
+        while True:
+            record, values = _read_csv_record(f)
+            if not record:
+                break
+            if record.strip():
+                keys.add(_from_csv_row(dict(zip(fieldnames, values)),
+                                       f"{path}:{line_number}"))
+                offsets.append(offset)
+            offset += len(record)
+            line_number += record.count(b"\n")
+    return (offsets,) + keys.result()
+
+
+def scan_sqlite(path, table=SQLITE_TABLE):
+    """
+    Read each question's row ID, difficulty and genre from a SQLite
+    bank, validating every question.
+
+    Args:
+        path: Database file
+        table: Table holding the questions
+
+    Returns:
+        tuple: (rowids, difficulties, genres, hashes) for LazyQuestionBank
+
+    Raises:
+        QuestionFormatError: If a row is not a valid question
+    """
+    rowids = array.array('q')
+    keys = _KeyCollector()
+    connection = _connect(path)
+    try:
+        cursor = connection.execute(f"SELECT rowid, * FROM {table} ORDER BY rowid")
+        for row in cursor:
+            keys.add(_from_sqlite_row(row, f"{path}:{table}:{row['rowid']}"))
+            rowids.append(row['rowid'])
+    finally:
+        connection.close()
+    return (rowids,) + keys.result()
+
+
+# Loader registry: file extension -> (streaming reader, scanner, fetcher)
+
+LOADERS = {}
+
+
+def register_loader(extensions, iterate, scan, fetcher):
+    """
+    Add support for another bank format.
+
+    Args:
+        extensions: File extensions handled, e.g. (".jsonl",)
+        iterate: Function(path) yielding validated questions
+        scan: Function(path) returning (locations, difficulties,
+            genres, hashes)
+        fetcher: Function(path) returning a callable(location) that
+            reads one validated question
+    """
+    for extension in extensions:
+        LOADERS[extension.lower()] = (iterate, scan, fetcher)
+
+
+register_loader((".jsonl", ".ndjson"), iter_jsonl, scan_jsonl,
+                lambda path: _LineFetcher(path, _parse_json_line))
+register_loader((".csv",), iter_csv, scan_csv,
+                lambda path: _LineFetcher(path, _csv_line_parser(path),
+                                          read=lambda f: _read_csv_record(f)[0]))
+register_loader((".sqlite", ".sqlite3", ".db"), iter_sqlite, scan_sqlite,
+                lambda path: _RowFetcher(path, SQLITE_TABLE))
+
+
+def iter_questions(path):
+    """
+    Stream validated questions from a bank of any registered format.
+
+    Args:
+        path: Bank file
+
+    Yields:
+        dict: Validated question
+    """
+    return _loader_for(path)[0](path)
+
+
+def open_bank(path, use_index_file=True):
+    """
+    Open a bank of any registered format for lazy access.
+
+    The first open scans the bank and saves the result next to it
+    (path + ".idx"); later opens of the unchanged bank read that file
+    instead, so startup does not depend on the bank's size.
+
+    Args:
+        path: Bank file
+        use_index_file: Read and write the ".idx" file
+
+    Returns:
+        LazyQuestionBank: Bank fetching questions on demand
+    """
+    _, scan, fetcher = _loader_for(path)
+    columns = _read_index_file(path) if use_index_file else None
+    if columns is None:
+        columns = scan(path)
+        if use_index_file:
+            _write_index_file(path, columns)
+    return LazyQuestionBank(path, *columns, fetch=fetcher(path))
+
+
+def write_bank(path, questions, table=SQLITE_TABLE):
+    """
+    Write questions to a bank file, choosing the format by extension.
+
+    Args:
+        path: Output .jsonl, .csv or .sqlite file
+        questions: Iterable of question dictionaries or Question records
+        table: Table name for SQLite banks
+
+    Returns:
+        int: Number of questions written
+    """
+    fields = ('question', 'options', 'answer', 'audience', 'genre', 'difficulty')
+    questions = (
+        q.to_dict() if isinstance(q, Question) else q for q in questions
+    )
+    extension = os.path.splitext(path)[1].lower()
+    count = 0
+    if LOADERS.get(extension, (None,))[0] is iter_jsonl:
+        with open(path, "w", encoding="utf-8") as f:
+            for q in questions:
+                f.write(json.dumps({k: q[k] for k in fields}, ensure_ascii=False) + "\n")
+                count += 1
+    elif LOADERS.get(extension, (None,))[0] is iter_csv:
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(fields)
+            for q in questions:
+                writer.writerow([
+                    q['question'], CSV_SEPARATOR.join(q['options']), q['answer'],
+                    CSV_SEPARATOR.join(str(p) for p in q['audience']),
+                    q['genre'], q['difficulty'],
+                ])
+                count += 1
+    elif LOADERS.get(extension, (None,))[0] is iter_sqlite:
+        connection = sqlite3.connect(path)
+        with connection:
+            connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} (question TEXT, options TEXT, "
+                "answer TEXT, audience TEXT, genre TEXT, difficulty TEXT)"
+            )
+            rows = (
+                (q['question'], json.dumps(q['options']), q['answer'],
+                 json.dumps(q['audience']), q['genre'], q['difficulty'])
+                for q in questions
+            )
+            cursor = connection.executemany(
+                f"INSERT INTO {table} VALUES (?, ?, ?, ?, ?, ?)", rows
+            )
+            count = cursor.rowcount
+        connection.close()
+    else:
+        _loader_for(path)
+        raise ValueError(f"No writer for {extension!r} banks")
+    return count
+
+
+def _read_index_file(path):
+    """Load a bank's saved scan if it matches the bank on disk."""
+    try:
+        with open(path + INDEX_SUFFIX, "rb") as f:
+            header = json.loads(f.readline())
+            stat = os.stat(path)
+            if (header.get("version") != INDEX_VERSION
+                    or header["size"] != stat.st_size
+                    or header["mtime_ns"] != stat.st_mtime_ns):
+                return None
+            count = header["count"]
+            locations = array.array('q')
+            locations.fromfile(f, count)
+            difficulties = f.read(count)
+            genre_codes = array.array('H')
+            genre_codes.fromfile(f, count)
+            hashes = array.array('Q')
+            hashes.fromfile(f, count)
+    except (OSError, ValueError, KeyError, EOFError):
+        return None
+    if len(difficulties) != count:
+        return None
+    return locations, difficulties, (header["genres"], genre_codes), hashes
+
+
+def _write_index_file(path, columns):
+    """Save a bank's scan next to it; failures only cost a rescan."""
+    locations, difficulties, (genre_names, genre_codes), hashes = columns
+    stat = os.stat(path)
+    header = {
+        "version": INDEX_VERSION, "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns, "count": len(locations),
+        "genres": genre_names,
+    }
+    temporary = path + INDEX_SUFFIX + ".tmp"
+    try:
+        with open(temporary, "wb") as f:
+            f.write(json.dumps(header).encode() + b"\n")
+            locations.tofile(f)
+            f.write(difficulties)
+            genre_codes.tofile(f)
+            hashes.tofile(f)
+        os.replace(temporary, path + INDEX_SUFFIX)
+    except OSError as e:
+        print(f"Error saving question bank index: {e}")
+
+
+def _loader_for(path):
+    """Look up the loader for a file's extension."""
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in LOADERS:
+        raise ValueError(
+            f"Unknown question bank format {extension!r} "
+            f"(expected one of {', '.join(sorted(LOADERS))})"
+        )
+    return LOADERS[extension]
+
+
+def _parse_json_line(line, where):
+    """Decode and validate one JSON line."""
+    try:
+        record = json.loads(line)
+    except ValueError as e:
+        raise QuestionFormatError(f"{where}: invalid JSON ({e})") from None
+    return validate_question(record, where)
+
+
+def _parse_csv_line(line, fieldnames, where):
+    """Decode and validate one CSV record (one line or more)."""
+    if isinstance(line, bytes):
+        line = line.decode("utf-8")
+    values = next(csv.reader(io.StringIO(line)))
+    return _from_csv_row(dict(zip(fieldnames, values)), where)
+
+
+def _read_csv_record(f):
+    """
+    Read one CSV record from a binary file: a line, or several when a
+    quoted field spans lines. The csv module reads one line at a time
+    until the record is complete, so it decides where the record ends.
+
+    Returns:
+        tuple: (raw bytes, field values; both empty at end of file)
+    """
+    lines = []
+
+    def read():
+        for line in iter(f.readline, b""):
+            lines.append(line)
+            yield line.decode("utf-8")
+
+    values = next(csv.reader(read()), [])
+    return b"".join(lines), values
+
+
+def _csv_fieldnames(header):
+    """Column names from a CSV header line."""
+    return next(csv.reader([header.decode("utf-8-sig")]))
+
+
+def _csv_line_parser(path):
+    """Parser for single CSV lines of a bank, using its header."""
+    with open(path, "rb") as f:
+        fieldnames = _csv_fieldnames(f.readline())
+
+    def parse(line, where):
+        return _parse_csv_line(line, fieldnames, where)
+
+    return parse
+
+
+def _from_csv_row(row, where):
+    """Convert a CSV row's "|"-separated fields and validate it."""
+    record = dict(row)
+    if record.get('options') is not None:
+        record['options'] = record['options'].split(CSV_SEPARATOR)
+    if record.get('audience') is not None:
+        try:
+            record['audience'] = [
+                float(p) if "." in p else int(p)
+                for p in record['audience'].split(CSV_SEPARATOR)
+            ]
+        except ValueError:
+            raise QuestionFormatError(f"{where}: audience must be numbers") from None
+    return validate_question(record, where)
+
+
+def _from_sqlite_row(row, where):
+    """Convert a SQLite row's JSON columns and validate it."""
+    record = {key: row[key] for key in row.keys() if key != 'rowid'}
+    for field in ('options', 'audience'):
+        if isinstance(record.get(field), str):
+            try:
+                record[field] = json.loads(record[field])
+            except ValueError:
+                raise QuestionFormatError(f"{where}: {field} is not JSON") from None
+    return validate_question(record, where)
+
+
+def _connect(path):
+    """Open a bank database read-only."""
+    if not os.path.exists(path):
+        raise FileNotFoundError(path)
+    connection = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    connection.row_factory = sqlite3.Row
+    return connection
+
+
+class _KeyCollector:
+    """Builds the compact difficulty, genre and hash columns of a lazy bank."""
+
+    def __init__(self):
+        self.difficulties = bytearray()
+        self.genre_codes = array.array('H')
+        self.hashes = array.array('Q')
+        self.genre_names = []
+        self.genre_lookup = {}
+
+    def add(self, record):
+        """Append a validated question's difficulty, genre and hash."""
+        difficulty = record['difficulty']
+        genre = record['genre']
+        code = self.genre_lookup.get(genre)
+        if code is None:
+            code = self.genre_lookup[genre] = len(self.genre_names)
+            self.genre_names.append(genre)
+        self.difficulties.append(DIFFICULTIES.index(difficulty))
+        self.genre_codes.append(code)
+        self.hashes.append(question_hash(record['question']))
+
+    def result(self):
+        """Return (difficulties, (genre_names, genre_codes), hashes)."""
+        return (bytes(self.difficulties), (self.genre_names, self.genre_codes),
+                self.hashes)
+
+
+class _LineFetcher:
+    """Reads and parses the record starting at a byte offset."""
+
+    def __init__(self, path, parse, read=None):
+        self.path = path
+        self.parse = parse
+        self.read = read or (lambda f: f.readline())
+        self.file = open(path, "rb")
+
+    def __call__(self, offset):
+        self.file.seek(offset)
+        return self.parse(self.read(self.file), f"{self.path}@{offset}")
+
+    def close(self):
+        self.file.close()
+
+
+class _RowFetcher:
+    """Reads one question row by row ID."""
+
+    def __init__(self, path, table):
+        self.connection = _connect(path)
+        self.where = f"{path}:{table}"
+        self.query = f"SELECT * FROM {table} WHERE rowid = ?"
+
+    def __call__(self, rowid):
+        row = self.connection.execute(self.query, (rowid,)).fetchone()
+        return _from_sqlite_row(row, f"{self.where}:{rowid}")
+
+    def close(self):
+        self.connection.close()
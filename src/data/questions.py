@@ -96,7 +96,7 @@ QUESTIONS = [
     {"question": "Kurosawa's first color film?", "options": ["Dodes'ka-den", "Kagemusha", "Dreams"], "answer": "Dodes'ka-den", "audience": [35, 30, 20], "genre": "Drama", "difficulty": "hard"},
     {"question": "Editor of 'Citizen Kane'?", "options": ["Robert Wise", "Hal Ashby", "Dede Allen"], "answer": "Robert Wise", "audience": [45, 25, 20], "genre": "Drama", "difficulty": "hard"},
     {"question": "Bergman’s Oscar-winning foreign film?", "options": ["Virgin Spring", "Seventh Seal", "Wild Strawberries"], "answer": "Virgin Spring", "audience": [40, 30, 20], "genre": "Drama", "difficulty": "hard"},
-    {"question": "Budget for 'Blair Witch Project'?", "options": ["$60,000", "$200,000", "$500,000"], "answer": "60,000", "audience": [50, 25, 15], "genre": "Horror", "difficulty": "hard"},
+    {"question": "Budget for 'Blair Witch Project'?", "options": ["$60,000", "$200,000", "$500,000"], "answer": "$60,000", "audience": [50, 25, 15], "genre": "Horror", "difficulty": "hard"},
     {"question": "Composer for 'Vertigo' score?", "options": ["Bernard Herrmann", "Miklós Rózsa", "Franz Waxman"], "answer": "Bernard Herrmann", "audience": [55, 20, 15], "genre": "Thriller", "difficulty": "hard"},
     {"question": "Eisenstein’s technique in 'Battleship Potemkin'?", "options": ["Montage editing", "Deep focus", "Handheld camera"], "answer": "Montage editing", "audience": [60, 20, 15], "genre": "Drama", "difficulty": "hard"},
     {"question": "Golden Bear winner, Berlin 2020?", "options": ["There Is No Evil", "Bacurau", "The Assistant"], "answer": "There Is No Evil", "audience": [35, 25, 25], "genre": "Drama", "difficulty": "hard"},
@@ -0,0 +1,103 @@
+"""
+Question record type for Movie Mania.
+
+Questions are immutable tuples with named fields. The correct answer is
+stored as an option index, so shuffling is a single pass over a
+permutation and never looks options up by value.
+"""
+
+import hashlib
+from collections import namedtuple
+
+_QuestionFields = namedtuple('Question', [
+    'qid',           # Position in the question bank
+    'question',      # Question text
+    'options',       # Tuple of option strings
+    'answer_index',  # Index of the correct option in options
+    'audience',      # Tuple of audience poll percentages, one per option
+    'genre',
+    'difficulty',    # 'easy', 'medium' or 'hard'
+    'order',         # Bank position of each shown option (None if unshuffled)
+])
+
+
+def question_hash(text):
+    """
+    Identity of a question across bank edits, reloads and restarts,
+    where its bank position may change.
+
+    Args:
+        text: Question text
+
+    Returns:
+        int: 64-bit BLAKE2b digest of the text (a 32-bit hash would
+        merge dozens of question pairs in a bank of half a million)
+    """
+    digest = hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+class Question(_QuestionFields):
+    """A single trivia question."""
+
+    __slots__ = ()
+
+    @classmethod
+    def from_dict(cls, data, qid=None):
+        """
+        Build a question from its dictionary form.
+
+        Args:
+            data: Dictionary with question, options, answer, audience,
+                genre and difficulty (as in src/data/questions.py)
+            qid: Position of the question in its bank
+
+        Returns:
+            Question: The record
+        """
+        options = tuple(data['options'])
+        return cls(
+            qid, data['question'], options, options.index(data['answer']),
+            tuple(data['audience']), data['genre'], data['difficulty'], None
+        )
+
+    @property
+    def answer(self):
+        """Text of the correct option."""
+        return self.options[self.answer_index]
+
+    @property
+    def answer_letter(self):
+        """Letter (A-D) of the correct option."""
+        return chr(ord('A') + self.answer_index)
+
+    def shuffled(self, permutation):
+        """
+        Return the question with its options reordered.
+
+        Args:
+            permutation: New position i shows current option permutation[i]
+
+        Returns:
+            Question: Reordered copy; order records the bank positions
+        """
+        options = self.options
+        audience = self.audience
+        order = self.order
+        return Question(
+            self.qid, self.question,
+            tuple([options[i] for i in permutation]),
+            permutation.index(self.answer_index),
+            tuple([audience[i] for i in permutation]),
+            self.genre, self.difficulty,
+            tuple(permutation) if order is None
+            else tuple([order[i] for i in permutation])
+        )
+
+    def to_dict(self):
+        """Return the question in its dictionary form."""
+        return {
+            "question": self.question, "options": list(self.options),
+            "answer": self.answer, "audience": list(self.audience),
+            "genre": self.genre, "difficulty": self.difficulty,
+        }
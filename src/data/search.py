@@ -0,0 +1,574 @@
+"""
+Full-text search over Movie Mania question banks.
+
+An inverted index maps every term to the sorted bank positions of the
+questions containing it. Terms are tokens of one field, written as
+"<field>:<token>":
+
+    q   question text       a   answer
+    o   options (any)       g   genre
+    d   difficulty
+
+The index file holds one or more segments. A full build writes a single
+segment; update() re-reads the bank, compares a fingerprint of every
+question with the indexed one and appends a segment holding only the
+new and changed questions (and the positions that disappeared). Later
+segments override earlier ones; once MAX_SEGMENTS pile up the next
+update rebuilds the file as one segment.
+
+Segments are memory-mapped. Opening an index reads only the headers and
+term lists, and a query touches just the posting lists of its terms.
+
+Query syntax (words are ANDed):
+    joker knight            both words, in the question or options
+    joker OR riddler        either word
+    -sequel, NOT sequel     exclude
+    nol*                    prefix
+    answer:ledger           one field: question, option, answer,
+    genre:"sci-fi"          genre or difficulty
+    (a OR b) c              grouping
+"""
+
+import array
+import bisect
+import itertools
+import mmap
+import os
+import re
+import struct
+import zlib
+
+SEARCH_SUFFIX = ".search"
+SEARCH_VERSION = 1
+
+# Segments an index may hold before update() rebuilds it as one
+MAX_SEGMENTS = 8
+
+FIELDS = {
+    'question': 'q', 'option': 'o', 'options': 'o', 'answer': 'a',
+    'genre': 'g', 'difficulty': 'd',
+}
+
+# Fields searched by words without a field name
+DEFAULT_FIELDS = ('q', 'o')
+
+_TOKEN = re.compile(r"\w+")
+_QUERY_TOKEN = re.compile(
+    r'\s*(?:(\()|(\))|(-)?(?:(\w+):)?(?:"([^"]*)"|([^\s()"]+)))'
+)
+
+# magic, version, reserved, segment bytes, bank size, source size,
+# source mtime_ns, doc count, removed count, term count, postings
+# count, terms bytes; followed by the term offsets (u64), docs,
+# fingerprints, removed and postings (u32) and the term list
+_MAGIC = b"MMSI"
+_HEADER = struct.Struct("<4sHHQQQQQQQQQ")
+
+
+class QuerySyntaxError(ValueError):
+    """Raised when a search query cannot be parsed."""
+
+
+def tokenize(text):
+    """
+    Split text into lowercase word tokens.
+
+    Args:
+        text: Any string
+
+    Returns:
+        list: Tokens in order
+    """
+    return _TOKEN.findall(text.casefold())
+
+
+def question_terms(question):
+    """
+    Index terms of a question.
+
+    Args:
+        question: Question record
+
+    Returns:
+        set: "<field>:<token>" strings
+    """
+    terms = {"q:" + t for t in tokenize(question.question)}
+    for option in question.options:
+        terms.update("o:" + t for t in tokenize(option))
+    terms.update("a:" + t for t in tokenize(question.answer))
+    terms.update("g:" + t for t in tokenize(question.genre))
+    terms.add("d:" + question.difficulty.casefold())
+    return terms
+
+
+def parse_query(query):
+    """
+    Parse a query into a tree of tuples.
+
+    Nodes are ('term', fields, tokens, prefix), ('and', [nodes]),
+    ('or', [nodes]) and ('not', node).
+
+    Args:
+        query: Query string (see the module docstring)
+
+    Returns:
+        tuple: Root node
+
+    Raises:
+        QuerySyntaxError: If the query is malformed
+    """
+    tokens = _lex(query)
+    node, end = _parse_or(tokens, 0)
+    if end != len(tokens):
+        raise QuerySyntaxError("unbalanced ')'")
+    return node
+
+
+class SearchIndex:
+    """Segmented inverted index file for one question bank."""
+
+    def __init__(self, path):
+        """
+        Open an index (an empty one if the file does not exist).
+
+        Args:
+            path: Index file, conventionally bank path + SEARCH_SUFFIX
+        """
+        self.path = path
+        self.segments = []
+        self._file = None
+        self._map = None
+        self._open()
+
+    def __len__(self):
+        """Number of questions in the bank when last indexed."""
+        return self.segments[-1].bank_size if self.segments else 0
+
+    def stale(self, source_stat=None):
+        """
+        Whether the bank has changed since it was last indexed.
+
+        Args:
+            source_stat: os.stat_result of the bank file, or None for
+                banks that are not files
+
+        Returns:
+            bool: True if update() has work to do
+        """
+        if not self.segments:
+            return True
+        return self.segments[-1].source != _source_key(source_stat)
+
+    def postings(self, term):
+        """
+        Bank positions containing a term.
+
+        Args:
+            term: "<field>:<token>" string
+
+        Returns:
+            Sequence of ascending positions
+        """
+        return self._merge(segment.postings(term) for segment in self.segments)
+
+    def prefix_postings(self, prefix):
+        """Bank positions containing any term that starts with a prefix."""
+        return self._merge(
+            _union([segment.postings(t) for t in segment.terms_with_prefix(prefix)])
+            for segment in self.segments
+        )
+
+    def search(self, query):
+        """
+        Run a query.
+
+        Args:
+            query: Query string (see the module docstring)
+
+        Returns:
+            list: Ascending bank positions of matching questions
+
+        Raises:
+            QuerySyntaxError: If the query is malformed
+        """
+        return list(self._evaluate(parse_query(query)))
+
+    def update(self, questions, source_stat=None):
+        """
+        Bring the index up to date with a bank.
+
+        Only new and changed questions are tokenized; they go into a new
+        segment appended to the file. A missing index, or one that has
+        reached MAX_SEGMENTS, is rebuilt as a single segment instead.
+
+        Args:
+            questions: Iterable of Question records in bank order
+            source_stat: os.stat_result of the bank file, or None
+
+        Returns:
+            tuple: (questions indexed, positions removed)
+        """
+        rebuild = not self.segments or len(self.segments) >= MAX_SEGMENTS
+        fingerprints, live = (None, None) if rebuild else self._fingerprints()
+        known = len(live) if live is not None else 0
+
+        builder = _SegmentBuilder()
+        size = 0
+        for position, question in enumerate(questions):
+            fingerprint = _fingerprint(question)
+            size = position + 1
+            if (position < known and live[position]
+                    and fingerprints[position] == fingerprint):
+                continue
+            builder.add(position, fingerprint, question)
+        removed = [p for p in range(size, known) if live[p]]
+
+        source = _source_key(source_stat)
+        if not rebuild and not builder.docs and not removed:
+            if source == self.segments[-1].source:
+                return 0, 0
+        data = builder.segment(size, source, removed)
+
+        self.close()
+        if rebuild:
+            temporary = self.path + ".tmp"
+            with open(temporary, "wb") as f:
+                f.write(data)
+            os.replace(temporary, self.path)
+        else:
+            with open(self.path, "ab") as f:
+                f.write(data)
+        self._open()
+        return len(builder.docs), len(removed)
+
+    def close(self):
+        """Unmap the index file."""
+        for segment in self.segments:
+            segment.release()
+        self.segments = []
+        if self._map is not None:
+            self._map.close()
+            self._file.close()
+        self._map = self._file = None
+
+    def _open(self):
+        """Map the file and read its complete segments."""
+        try:
+            self._file = open(self.path, "rb")
+        except FileNotFoundError:
+            return
+        if os.fstat(self._file.fileno()).st_size == 0:
+            self._file.close()
+            self._file = None
+            return
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        offset = 0
+        while offset + _HEADER.size <= len(self._map):
+            segment = _Segment.read(self._map, offset)
+            # A segment cut short by an interrupted append is ignored
+            if segment is None:
+                break
+            self.segments.append(segment)
+            offset += segment.length
+
+        # Positions re-indexed or removed by a later segment, or beyond
+        # the current bank, are masked out of earlier segments
+        size = len(self)
+        overridden = set()
+        for segment in reversed(self.segments):
+            segment.mask = {p for p in overridden if p < segment.bank_size}
+            if size < segment.bank_size:
+                segment.mask.update(range(size, segment.bank_size))
+            overridden.update(segment.docs)
+            overridden.update(segment.removed)
+
+    def _fingerprints(self):
+        """Current fingerprint and liveness of every indexed position."""
+        size = len(self)
+        fingerprints = array.array('I', bytes(4 * size))
+        live = bytearray(size)
+        for segment in self.segments:
+            for position in segment.removed:
+                if position < size:
+                    live[position] = 0
+            for position, fingerprint in zip(segment.docs, segment.fingerprints):
+                if position < size:
+                    live[position] = 1
+                    fingerprints[position] = fingerprint
+        return fingerprints, live
+
+    def _merge(self, lists):
+        """Combine per-segment position lists (disjoint after masking)."""
+        lists = [p for p in lists if len(p)]
+        if not lists:
+            return ()
+        if len(lists) == 1:
+            return lists[0]
+        return sorted(itertools.chain.from_iterable(lists))
+
+    def _evaluate(self, node):
+        """Positions matching a query tree node."""
+        kind = node[0]
+        if kind == 'term':
+            _, fields, tokens, prefix = node
+            results = []
+            for i, token in enumerate(tokens):
+                use_prefix = prefix and i == len(tokens) - 1
+                results.append(_union([
+                    self.prefix_postings(f"{field}:{token}") if use_prefix
+                    else self.postings(f"{field}:{token}")
+                    for field in fields
+                ]))
+            return _intersect(results)
+        if kind == 'or':
+            return _union([self._evaluate(child) for child in node[1]])
+        if kind == 'not':
+            return _difference(range(len(self)), self._evaluate(node[1]))
+
+        included = [self._evaluate(c) for c in node[1] if c[0] != 'not']
+        excluded = [self._evaluate(c[1]) for c in node[1] if c[0] == 'not']
+        matches = _intersect(included) if included else range(len(self))
+        return _difference(matches, _union(excluded)) if excluded else matches
+
+
+class _Segment:
+    """One mapped segment of an index file."""
+
+    @classmethod
+    def read(cls, data, offset):
+        """Parse the segment at an offset, or None if it is incomplete."""
+        (magic, version, _, length, bank_size, source_size, source_mtime,
+         doc_count, removed_count, term_count, postings_count,
+         terms_bytes) = _HEADER.unpack_from(data, offset)
+        if (magic != _MAGIC or version != SEARCH_VERSION
+                or offset + length > len(data)):
+            return None
+
+        segment = cls()
+        segment.length = length
+        segment.bank_size = bank_size
+        segment.source = (source_size, source_mtime)
+        view = memoryview(data)[offset:offset + length]
+        at = _HEADER.size
+        segment.offsets = view[at:at + 8 * (term_count + 1)].cast('Q')
+        at += 8 * (term_count + 1)
+        columns = []
+        for count in (doc_count, doc_count, removed_count, postings_count):
+            columns.append(view[at:at + 4 * count].cast('I'))
+            at += 4 * count
+        segment.docs, segment.fingerprints, segment.removed, segment.posting_data = columns
+        at = _align(at)
+        text = bytes(view[at:at + terms_bytes]).decode("utf-8")
+        segment.terms = text.split("\n") if term_count else []
+        segment.mask = set()
+        segment._views = [segment.offsets] + columns + [view]
+        return segment
+
+    def postings(self, term):
+        """Positions of a term in this segment, minus masked ones."""
+        i = bisect.bisect_left(self.terms, term)
+        if i == len(self.terms) or self.terms[i] != term:
+            return ()
+        positions = self.posting_data[self.offsets[i]:self.offsets[i + 1]]
+        if self.mask:
+            return [p for p in positions if p not in self.mask]
+        return positions
+
+    def terms_with_prefix(self, prefix):
+        """Terms of this segment starting with a prefix."""
+        start = bisect.bisect_left(self.terms, prefix)
+        end = bisect.bisect_left(self.terms, prefix + "\U0010ffff", start)
+        return self.terms[start:end]
+
+    def release(self):
+        """Release the views into the mapped file."""
+        for view in self._views:
+            view.release()
+        self._views = []
+
+
+class _SegmentBuilder:
+    """Collects postings for the questions of a new segment."""
+
+    def __init__(self):
+        self.docs = array.array('I')
+        self.fingerprints = array.array('I')
+        self.postings = {}
+
+    def add(self, position, fingerprint, question):
+        """Index one question (positions must be added in order)."""
+        self.docs.append(position)
+        self.fingerprints.append(fingerprint)
+        postings = self.postings
+        for term in question_terms(question):
+            positions = postings.get(term)
+            if positions is None:
+                positions = postings[term] = array.array('I')
+            positions.append(position)
+
+    def segment(self, bank_size, source, removed):
+        """Serialized segment bytes."""
+        terms = sorted(self.postings)
+        offsets = array.array('Q', [0])
+        posting_data = array.array('I')
+        for term in terms:
+            posting_data.extend(self.postings[term])
+            offsets.append(len(posting_data))
+        text = "\n".join(terms).encode("utf-8")
+
+        body = [
+            offsets.tobytes(), self.docs.tobytes(),
+            self.fingerprints.tobytes(), array.array('I', removed).tobytes(),
+            posting_data.tobytes(),
+        ]
+        columns = _HEADER.size + sum(len(part) for part in body)
+        padding = _align(columns) - columns
+        length = _align(columns + padding + len(text))
+        header = _HEADER.pack(
+            _MAGIC, SEARCH_VERSION, 0, length, bank_size, source[0], source[1],
+            len(self.docs), len(removed), len(terms), len(posting_data), len(text)
+        )
+        tail = length - (columns + padding + len(text))
+        return b"".join([header] + body + [bytes(padding), text, bytes(tail)])
+
+
+def _fingerprint(question):
+    """Checksum of everything a question is indexed by."""
+    parts = [question.question, question.answer, question.genre,
+             question.difficulty] + list(question.options)
+    return zlib.crc32("\x1f".join(parts).encode("utf-8"))
+
+
+def _source_key(source_stat):
+    """(size, mtime_ns) identifying a version of the bank file."""
+    if source_stat is None:
+        return (0, 0)
+    return (source_stat.st_size, source_stat.st_mtime_ns)
+
+
+def _align(position):
+    """Round a file position up to a multiple of 8."""
+    return (position + 7) & ~7
+
+
+def _union(lists):
+    """Ascending union of ascending position lists."""
+    lists = [p for p in lists if len(p)]
+    if len(lists) <= 1:
+        return lists[0] if lists else ()
+    merged = set(lists[0])
+    for positions in lists[1:]:
+        merged.update(positions)
+    return sorted(merged)
+
+
+def _intersect(lists):
+    """
+    Ascending intersection of ascending position lists.
+
+    Starts from the shortest list; each longer list is probed by binary
+    search when it is much longer, or through a set otherwise.
+    """
+    lists = sorted(lists, key=len)
+    result = lists[0]
+    for positions in lists[1:]:
+        if not len(result):
+            break
+        if len(result) * 16 < len(positions):
+            result = [p for p in result if _contains(positions, p)]
+        else:
+            members = set(positions)
+            result = [p for p in result if p in members]
+    return result
+
+
+def _difference(positions, excluded):
+    """Positions not in excluded."""
+    if not len(excluded):
+        return positions
+    excluded = set(excluded)
+    return [p for p in positions if p not in excluded]
+
+
+def _contains(positions, position):
+    """Binary search an ascending sequence."""
+    i = bisect.bisect_left(positions, position)
+    return i < len(positions) and positions[i] == position
+
+
+def _lex(query):
+    """Split a query into ('(' | ')' | 'OR' | 'NOT' | term) tokens."""
+    tokens = []
+    position = 0
+    query = query.strip()
+    while position < len(query):
+        match = _QUERY_TOKEN.match(query, position)
+        if match is None or match.end() == position:
+            raise QuerySyntaxError(f"cannot parse {query[position:]!r}")
+        position = match.end()
+        opening, closing, negated, field, phrase, word = match.groups()
+        if opening or closing:
+            tokens.append(opening or closing)
+            continue
+        if word in ("AND", "OR", "NOT") and not field and not negated:
+            if word != "AND":
+                tokens.append(word)
+            continue
+        if negated:
+            tokens.append("NOT")
+        tokens.append(_term(field, phrase if phrase is not None else word))
+    return tokens
+
+
+def _term(field, text):
+    """Build a term node from a field name and its text."""
+    if field is None:
+        fields = DEFAULT_FIELDS
+    elif field.casefold() in FIELDS:
+        fields = (FIELDS[field.casefold()],)
+    else:
+        raise QuerySyntaxError(
+            f"unknown field {field!r} (expected one of {', '.join(sorted(FIELDS))})"
+        )
+    prefix = text.endswith("*")
+    tokens = tokenize(text)
+    if not tokens:
+        raise QuerySyntaxError(f"nothing to search for in {text!r}")
+    return ('term', fields, tokens, prefix)
+
+
+def _parse_or(tokens, i):
+    """or := and ('OR' and)*"""
+    node, i = _parse_and(tokens, i)
+    children = [node]
+    while i < len(tokens) and tokens[i] == "OR":
+        node, i = _parse_and(tokens, i + 1)
+        children.append(node)
+    return (children[0] if len(children) == 1 else ('or', children)), i
+
+
+def _parse_and(tokens, i):
+    """and := unary unary*"""
+    children = []
+    while i < len(tokens) and tokens[i] not in ("OR", ")"):
+        node, i = _parse_unary(tokens, i)
+        children.append(node)
+    if not children:
+        raise QuerySyntaxError("expected a search term")
+    return (children[0] if len(children) == 1 else ('and', children)), i
+
+
+def _parse_unary(tokens, i):
+    """unary := 'NOT' unary | '(' or ')' | term"""
+    token = tokens[i]
+    if token == "NOT":
+        if i + 1 == len(tokens):
+            raise QuerySyntaxError("NOT needs a term")
+        node, i = _parse_unary(tokens, i + 1)
+        return ('not', node), i
+    if token == "(":
+        node, i = _parse_or(tokens, i + 1)
+        if i == len(tokens) or tokens[i] != ")":
+            raise QuerySyntaxError("missing ')'")
+        return node, i + 1
+    return token, i + 1
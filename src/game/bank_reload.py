@@ -0,0 +1,144 @@
+"""
+Hot reloading of the question bank for Movie Mania.
+
+A background thread polls the bank file's size and modification time.
+When it changes, and has stayed the same for one more poll (so a file
+still being copied is not read half-written), the thread opens and
+indexes the new bank. The game thread installs it with swap() between
+games, so a game in progress always plays the questions it started
+with, and loading never runs on the game thread.
+
+Push updates by writing the new bank next to the old one and renaming
+it into place; a lazily read bank keeps reading the old file until the
+swap. Without QUESTION_BANK the built-in src/data/questions.py module
+is watched and re-imported.
+"""
+
+import importlib
+import os
+import random
+import threading
+from src.config import QUESTION_BANK, BANK_RELOAD_INTERVAL
+from src.data import questions as builtin_questions
+from src.game.question_index import load_index, set_default_index
+from src.game.questions import select_game_questions
+
+
+class BankReloader:
+    """Watches the question bank and prepares reloaded indexes."""
+
+    def __init__(self, bank=QUESTION_BANK, interval=BANK_RELOAD_INTERVAL):
+        """
+        Create a reloader (call start() to begin watching).
+
+        Args:
+            bank: Bank file or .mmqb store, or None for the built-in
+                questions
+            interval: Seconds between checks of the file
+        """
+        self.bank = bank
+        self.path = bank or builtin_questions.__file__
+        self.interval = interval
+        self.loaded = self._stat()
+        self._pending = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Start the watcher thread."""
+        self._thread = threading.Thread(
+            target=self._run, name="bank-reload", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """Stop the watcher thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def swap(self, genre=None):
+        """
+        Install a reloaded bank, if one is ready. Call between games.
+
+        A bank that cannot fill a game (for the themed genre, if any) is
+        rejected and the current one kept.
+
+        Args:
+            genre: Optional genre name, or list of genres, being played
+
+        Returns:
+            QuestionIndex or None: The new index, or None if nothing
+            was swapped
+        """
+        with self._lock:
+            index, self._pending = self._pending, None
+        if index is None:
+            return None
+        try:
+            select_game_questions(genre, index=index, rng=random.Random())
+        except ValueError:
+            print(f"Reloaded question bank {self.path} cannot fill a game; "
+                  f"keeping the current one")
+            _close(index)
+            return None
+        _close(set_default_index(index))
+        return index
+
+    def _run(self):
+        """Poll the bank file until stopped."""
+        previous = self.loaded
+        while not self._stop.wait(self.interval):
+            current = self._stat()
+            if current is not None and current == previous != self.loaded:
+                self._load(current)
+            previous = current
+
+    def _load(self, stat):
+        """Open and index the changed bank."""
+        self.loaded = stat
+        try:
+            if self.bank is None:
+                importlib.reload(builtin_questions)
+            index = load_index(self.bank)
+            # Hash the questions here, not on the game thread at swap time
+            index.question_hashes()
+        except Exception as e:
+            # A broken update must not take the kiosk down
+            print(f"Error reloading question bank {self.path}: {e}")
+            return
+        with self._lock:
+            replaced, self._pending = self._pending, index
+        _close(replaced)
+
+    def _stat(self):
+        """(size, mtime_ns) of the bank file, or None if it is missing."""
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return (stat.st_size, stat.st_mtime_ns)
+
+
+def _close(index):
+    """Close the bank behind an index that is no longer used."""
+    if index is not None and hasattr(index.questions, 'close'):
+        index.questions.close()
+
+
+_default_reloader = None
+
+
+def default_reloader():
+    """
+    Shared reloader for the configured bank, started on first use.
+
+    Returns:
+        BankReloader or None: None when BANK_RELOAD_INTERVAL is disabled
+    """
+    global _default_reloader
+    if _default_reloader is None and BANK_RELOAD_INTERVAL:
+        _default_reloader = BankReloader()
+        _default_reloader.start()
+    return _default_reloader
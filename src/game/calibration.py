@@ -0,0 +1,295 @@
+"""
+Online difficulty calibration for Movie Mania.
+
+Each question's difficulty and each player's skill live on one logit
+scale. The chance of a correct answer is a guessing floor plus a
+logistic curve in (skill - difficulty), the one-parameter IRT model
+with guessing. After every answer both estimates take one Elo-style
+step in O(1), with step sizes that shrink as evidence builds up.
+
+Difficulties are stored as offsets from the hand-assigned label's prior
+(DIFFICULTY_PRIORS), so a question nobody has answered keeps its label.
+Estimates are kept by bank position together with each question's text
+hash, and follow their questions by hash when the bank is edited,
+reordered or reloaded.
+"""
+
+import array
+import atexit
+import json
+import math
+import os
+import struct
+import time
+from src.config import (
+    CALIBRATION_FILE, CALIBRATION_STEP, CALIBRATION_SAVE_INTERVAL
+)
+
+DIFFICULTIES = ('easy', 'medium', 'hard')
+
+# Starting difficulty (logits) for each hand-assigned label
+DIFFICULTY_PRIORS = {'easy': -1.0, 'medium': 0.0, 'hard': 1.0}
+
+# Answers after which a step is half its starting size
+HALF_STEP_ANSWERS = 20
+
+_MAGIC = b"MMCAL"
+_VERSION = 2
+# magic, version, bank size; then per question its hash, offset and count
+_HEADER = struct.Struct("<5sHQ")
+_MAX_COUNT = 0xFFFF
+
+
+class Calibration:
+    """Per-question difficulty and per-player skill estimates."""
+
+    def __init__(self, hashes, step=CALIBRATION_STEP):
+        """
+        Create an empty calibration (every question at its prior).
+
+        Args:
+            hashes: question_hash() of every bank question, by position
+            step: Starting step size for both kinds of estimate
+        """
+        self.step = step
+        self.hashes = array.array('Q', hashes)
+        self.offsets = array.array('f', bytes(4 * len(self.hashes)))
+        self.counts = array.array('H', bytes(2 * len(self.hashes)))
+        self.players = {}
+        self.updates = 0
+        self.saved_at = time.monotonic()
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def difficulty(self, qid, label):
+        """
+        Current difficulty estimate of a question.
+
+        Args:
+            qid: Bank position of the question
+            label: Its hand-assigned difficulty label
+
+        Returns:
+            float: Difficulty in logits
+        """
+        return DIFFICULTY_PRIORS[label] + self.offsets[qid]
+
+    def skill(self, player):
+        """Current skill estimate of a player (0.0 if unknown)."""
+        entry = self.players.get(_player_key(player))
+        return entry[0] if entry else 0.0
+
+    def record(self, question, correct, player=None):
+        """
+        Update the estimates with one answer.
+
+        Args:
+            question: Question record that was answered
+            correct: Whether the answer was correct (timeouts are not)
+            player: Player name, or None to update the question only
+        """
+        qid = question.qid
+        key = _player_key(player) if player else None
+        entry = self.players.get(key) if key else None
+        skill = entry[0] if entry else 0.0
+        difficulty = self.difficulty(qid, question.difficulty)
+
+        # Gradient of the log-likelihood with respect to (skill - difficulty)
+        guess = 1.0 / len(question.options)
+        curve = 1.0 / (1.0 + math.exp(difficulty - skill))
+        p = guess + (1.0 - guess) * curve
+        gradient = ((1.0 if correct else 0.0) - p) * (1.0 - guess) * curve * (1.0 - curve)
+        gradient /= p * (1.0 - p)
+
+        count = self.counts[qid]
+        self.offsets[qid] -= self._step(count) * gradient
+        self.counts[qid] = min(count + 1, _MAX_COUNT)
+        if key:
+            answers = entry[1] if entry else 0
+            self.players[key] = [skill + self._step(answers) * gradient, answers + 1]
+        self.updates += 1
+
+    def subscribe(self, session, player=None):
+        """
+        Update the estimates as a session's questions are answered.
+
+        Args:
+            session: GameSession being played
+            player: Player name, or None
+        """
+        def on_transition(transition):
+            if transition.event in ("correct", "wrong", "timeout"):
+                question = session.questions[transition.index]
+                self.record(question, transition.event == "correct", player)
+
+        session.subscribe(on_transition)
+
+    def difficulty_labels(self, index):
+        """
+        Re-band questions by estimated difficulty.
+
+        Questions are ranked by their estimate and split into easy,
+        medium and hard bands of the same sizes as the hand labels.
+
+        Args:
+            index: QuestionIndex (its questions are matched to the
+                estimates by hash if it is another bank)
+
+        Returns:
+            list: Difficulty label for every bank position
+        """
+        hashes = index.question_hashes()
+        offsets = self.offsets if hashes == self.hashes else self._aligned(hashes)[0]
+        estimates = [0.0] * len(index)
+        for label, positions in index.by_difficulty.items():
+            prior = DIFFICULTY_PRIORS[label]
+            for position in positions:
+                estimates[position] = prior + offsets[position]
+        ranked = sorted(range(len(estimates)), key=estimates.__getitem__)
+
+        labels = [None] * len(estimates)
+        start = 0
+        for label in DIFFICULTIES:
+            size = len(index.by_difficulty.get(label, ()))
+            for position in ranked[start:start + size]:
+                labels[position] = label
+            start += size
+        return labels
+
+    def remap(self, hashes):
+        """
+        Follow a reloaded or edited bank.
+
+        Each estimate moves to its question's new position, matched by
+        text hash, so an edit that keeps the bank's size cannot leave
+        estimates on other questions. New questions start at their
+        prior; player skills are kept.
+
+        Args:
+            hashes: question_hash() of every question in the new bank
+        """
+        if hashes != self.hashes:
+            self.offsets, self.counts = self._aligned(hashes)
+            self.hashes = array.array('Q', hashes)
+            self.updates += 1
+
+    def _aligned(self, hashes):
+        """Offsets and counts rearranged to follow another bank's hashes."""
+        positions = {h: p for p, h in enumerate(self.hashes)}
+        offsets = array.array('f', bytes(4 * len(hashes)))
+        counts = array.array('H', bytes(2 * len(hashes)))
+        for position, h in enumerate(hashes):
+            previous = positions.get(h)
+            if previous is not None:
+                offsets[position] = self.offsets[previous]
+                counts[position] = self.counts[previous]
+        return offsets, counts
+
+    def save(self, path=CALIBRATION_FILE):
+        """
+        Write the estimates atomically.
+
+        Args:
+            path: Output file
+        """
+        temporary = path + ".tmp"
+        try:
+            with open(temporary, "wb") as f:
+                f.write(_HEADER.pack(_MAGIC, _VERSION, len(self)))
+                self.hashes.tofile(f)
+                self.offsets.tofile(f)
+                self.counts.tofile(f)
+                f.write(json.dumps(self.players, separators=(",", ":")).encode("utf-8"))
+            os.replace(temporary, path)
+            self.saved_at = time.monotonic()
+        except OSError as e:
+            print(f"Error saving calibration: {e}")
+
+    def save_if_due(self, path=CALIBRATION_FILE,
+                    interval=CALIBRATION_SAVE_INTERVAL):
+        """
+        Save if the last save is older than an interval.
+
+        Args:
+            path: Output file
+            interval: Minimum seconds between saves
+        """
+        if time.monotonic() - self.saved_at >= interval:
+            self.save(path)
+
+    @classmethod
+    def load(cls, hashes, path=CALIBRATION_FILE):
+        """
+        Read saved estimates for a bank.
+
+        Args:
+            hashes: question_hash() of every question in the current bank
+            path: File written by save()
+
+        Returns:
+            Calibration: Saved estimates remapped to the current bank,
+            or a fresh calibration if the file is missing, unreadable or
+            of another version
+        """
+        calibration = cls(hashes)
+        try:
+            with open(path, "rb") as f:
+                magic, version, size = _HEADER.unpack(f.read(_HEADER.size))
+                if magic != _MAGIC or version != _VERSION:
+                    return calibration
+                saved = array.array('Q')
+                saved.fromfile(f, size)
+                offsets = array.array('f')
+                offsets.fromfile(f, size)
+                counts = array.array('H')
+                counts.fromfile(f, size)
+                players = json.loads(f.read() or b"{}")
+        except FileNotFoundError:
+            return calibration
+        except (OSError, ValueError, EOFError, struct.error) as e:
+            print(f"Error loading calibration: {e}")
+            return calibration
+        calibration.hashes = saved
+        calibration.offsets = offsets
+        calibration.counts = counts
+        calibration.players = players
+        calibration.remap(hashes)
+        return calibration
+
+    def _step(self, answers):
+        """Step size after a number of previous answers."""
+        return self.step / (1.0 + answers / HALF_STEP_ANSWERS)
+
+
+_default_calibration = None
+
+
+def default_calibration(index):
+    """
+    Shared calibration loaded from CALIBRATION_FILE on first use and
+    saved again at exit.
+
+    Args:
+        index: QuestionIndex of the configured bank (its question
+            hashes are only read when calibration is enabled)
+
+    Returns:
+        Calibration or None: None when calibration is disabled
+    """
+    global _default_calibration
+    if _default_calibration is None and CALIBRATION_FILE:
+        _default_calibration = Calibration.load(index.question_hashes())
+        atexit.register(_save_at_exit, _default_calibration)
+    return _default_calibration
+
+
+def _save_at_exit(calibration):
+    """Save a calibration that has changed since it was loaded."""
+    if calibration.updates:
+        calibration.save()
+
+
+def _player_key(player):
+    """Normalized player name."""
+    return player.strip().casefold()
@@ -0,0 +1,190 @@
+"""
+Batch re-fit of question difficulty and player skill for Movie Mania.
+
+Fits the same model as src/game/calibration.py to every logged answer
+at once with NumPy: alternating diagonal Newton steps over all
+questions and all players, each a handful of vectorized passes over
+the answer arrays. Millions of answers fit in seconds.
+
+Answers are keyed by the hash of the question text, not the bank
+position the question had when it was played, so a log spanning bank
+edits and reloads is credited to the right questions; answers to
+questions no longer in the bank still inform the players' skills.
+
+Requires NumPy (only the calibration tools need it, not the game).
+"""
+
+import array
+import json
+from collections import namedtuple
+import numpy as np
+from src.data.records import question_hash
+from src.game.calibration import DIFFICULTY_PRIORS, Calibration
+
+# One entry per logged answer, plus per-player names
+# hashes: question_hash() of the question answered
+# players: index into player_names
+# correct: 1 for a correct answer, 0 for wrong or timed out
+# options: number of options shown
+# priors: prior difficulty of the question's label
+AnswerLog = namedtuple(
+    'AnswerLog', ['hashes', 'players', 'correct', 'options', 'priors', 'player_names']
+)
+
+
+def load_answers(paths):
+    """
+    Read answers from telemetry JSON lines files.
+
+    Games without a player name are fitted as their own player.
+
+    Args:
+        paths: Telemetry files (current and rotated)
+
+    Returns:
+        AnswerLog: Answers as NumPy arrays
+    """
+    hashes = array.array('Q')
+    players = array.array('l')
+    correct = bytearray()
+    options = bytearray()
+    priors = array.array('d')
+    player_ids = {}
+    game_players = {}
+    questions = {}
+
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    continue
+                kind = event.get("type")
+                game = event.get("game")
+                if kind == "game_start":
+                    name = (event.get("player") or f"game:{game}").strip().casefold()
+                    game_players[game] = player_ids.setdefault(name, len(player_ids))
+                elif kind == "question" and event.get("text") is not None:
+                    questions[game, event["index"]] = event
+                elif kind == "answer":
+                    question = questions.pop((game, event["index"]), None)
+                    if question is None or game not in game_players:
+                        continue
+                    hashes.append(question_hash(question["text"]))
+                    players.append(game_players[game])
+                    correct.append(event["outcome"] == "correct")
+                    options.append(question.get("options") or 4)
+                    priors.append(DIFFICULTY_PRIORS[question["difficulty"]])
+
+    names = [None] * len(player_ids)
+    for name, i in player_ids.items():
+        names[i] = name
+    return AnswerLog(
+        np.asarray(hashes, dtype=np.uint64),
+        np.asarray(players, dtype=np.int64),
+        np.asarray(correct, dtype=np.float64),
+        np.asarray(options, dtype=np.float64),
+        np.asarray(priors, dtype=np.float64),
+        names,
+    )
+
+
+def refit(log, hashes, epochs=30, l2=1.0):
+    """
+    Fit every question's difficulty and every player's skill.
+
+    Args:
+        log: AnswerLog to fit
+        hashes: question_hash() of every bank question, by position
+        epochs: Newton sweeps over questions and players
+        l2: Pull towards the label prior (questions) and 0 (players)
+
+    Returns:
+        Calibration: Fitted estimates for the bank; unanswered questions
+        keep their label prior
+    """
+    answered, question_of = np.unique(log.hashes, return_inverse=True)
+    n_questions = len(answered)
+    n_players = len(log.player_names)
+    prior = np.zeros(n_questions)
+    prior[question_of] = log.priors
+    guess = 1.0 / log.options
+    y = log.correct
+
+    difficulty = prior.copy()
+    skill = np.zeros(n_players)
+    for _ in range(epochs):
+        gradient, information = _gradients(skill[log.players] - difficulty[question_of], guess, y)
+        difficulty += (
+            -np.bincount(question_of, gradient, n_questions) - l2 * (difficulty - prior)
+        ) / (np.bincount(question_of, information, n_questions) + l2)
+
+        gradient, information = _gradients(skill[log.players] - difficulty[question_of], guess, y)
+        skill += (
+            np.bincount(log.players, gradient, n_players) - l2 * skill
+        ) / (np.bincount(log.players, information, n_players) + l2)
+
+    calibration = Calibration(hashes)
+    positions = _positions(answered, calibration.hashes)
+    in_bank = positions >= 0
+    offsets = np.frombuffer(calibration.offsets, dtype=np.float32)
+    offsets[positions[in_bank]] = (difficulty - prior)[in_bank]
+    counts = np.frombuffer(calibration.counts, dtype=np.uint16)
+    counts[positions[in_bank]] = np.minimum(
+        np.bincount(question_of, minlength=n_questions), 0xFFFF
+    )[in_bank]
+    answers = np.bincount(log.players, minlength=n_players)
+    calibration.players = {
+        name: [float(skill[i]), int(answers[i])]
+        for i, name in enumerate(log.player_names)
+        if not name.startswith("game:")
+    }
+    calibration.updates = len(log.hashes)
+    return calibration
+
+
+def log_loss(log, calibration):
+    """
+    Mean log loss of a calibration's predictions for logged answers
+    (questions it does not hold are predicted from their label).
+
+    Args:
+        log: AnswerLog to score
+        calibration: Calibration to score
+
+    Returns:
+        float: Mean negative log-likelihood per answer
+    """
+    positions = _positions(log.hashes, calibration.hashes)
+    # Position -1 (not in the bank) picks the appended 0.0
+    offsets = np.append(np.frombuffer(calibration.offsets, dtype=np.float32), 0.0)
+    skills = np.array([
+        calibration.players.get(name, [0.0])[0] for name in log.player_names
+    ])
+    z = skills[log.players] - (log.priors + offsets[positions])
+    guess = 1.0 / log.options
+    p = guess + (1.0 - guess) / (1.0 + np.exp(-z))
+    p = np.clip(p, 1e-9, 1 - 1e-9)
+    return float(-np.mean(log.correct * np.log(p) + (1 - log.correct) * np.log(1 - p)))
+
+
+def _positions(keys, hashes):
+    """Bank position of each question hash in keys, -1 if not in the bank."""
+    hashes = np.frombuffer(hashes, dtype=np.uint64)
+    keys = np.asarray(keys, dtype=np.uint64)
+    if not len(hashes):
+        return np.full(len(keys), -1, dtype=np.int64)
+    order = np.argsort(hashes)
+    found = np.minimum(np.searchsorted(hashes, keys, sorter=order), len(hashes) - 1)
+    positions = order[found]
+    return np.where(hashes[positions] == keys, positions, -1)
+
+
+def _gradients(z, guess, y):
+    """Log-likelihood gradient and Fisher information per answer."""
+    curve = 1.0 / (1.0 + np.exp(-z))
+    p = guess + (1.0 - guess) * curve
+    slope = (1.0 - guess) * curve * (1.0 - curve)
+    variance = p * (1.0 - p)
+    return (y - p) * slope / variance, slope * slope / variance
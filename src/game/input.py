@@ -2,11 +2,11 @@
 Player input handling for Movie Mania game.
 """
 
-import time
 from src.config import (
     WIDTH, HEIGHT, MAX_NAME_LENGTH, GLOW_COLOR, 
     TEXT_COLOR, QUESTION_FONT
 )
+from src.ui.pacing import pause, idle
 from src.ui.graphics import create_cinematic_background
 from src.ui.animations import animate_text
 
@@ -50,7 +50,7 @@ def _name_input_loop(canvas, name_id):
             key_normalized = key.upper()
             
             if key_normalized in ["RETURN", "ENTER"] and name.strip():
-                time.sleep(0.5)
+                pause(0.5)
                 return name.strip() or "Player"
             elif key_normalized == "BACKSPACE" and len(name) > 0:
                 name = name[:-1]
@@ -58,8 +58,9 @@ def _name_input_loop(canvas, name_id):
                 name += key
             
             canvas.change_text(name_id, name)
+            canvas.responded()
         
-        time.sleep(0.005)
+        idle(0.005)
 
 
 def wait_for_answer_or_lifeline(canvas, lifelines_available):
@@ -120,8 +121,9 @@ def highlight_selected_answer(canvas, letter):
         x-178, y-33, x+178, y+33, 
         outline="rgba(0,183,183,0.6)"
     )
+    canvas.responded()
     
-    time.sleep(0.25)
+    pause(0.25)
     return rect_id
 
 
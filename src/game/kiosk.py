@@ -0,0 +1,126 @@
+"""
+Game flow for Movie Mania: a single game, or kiosk mode that plays
+games back to back in one process on one canvas.
+"""
+
+from src.config import PRIZE_VALUES, TOTAL_QUESTIONS, LEADERBOARD_WINDOW
+from src.ui.screens import show_splash_screen, show_attract_screen
+from src.game.input import get_player_name
+from src.game.questions import select_game_questions, shuffle_question_options
+from src.game.quiz import run_quiz_game
+from src.game.session import GameSession
+from src.game.telemetry import GameTelemetry, default_sink
+from src.game.results import default_results
+from src.game.leaderboard import (
+    save_to_leaderboard, display_leaderboard, display_rank
+)
+
+
+def play_game(canvas, always_show_leaderboard=False, recording=None,
+              genre=None, scheduler=None, calibration=None,
+              window=LEADERBOARD_WINDOW, persist=True):
+    """
+    Play one game from name entry to the final screen.
+    
+    Args:
+        canvas: Canvas object
+        always_show_leaderboard: Show the leaderboard after every game,
+            not only after a win
+        recording: Optional GameRecorder or GameReplayer that captures or
+            supplies the prepared questions
+        genre: Optional genre name, or list of genres, for a themed game
+        scheduler: Optional SeenScheduler that avoids repeating questions
+            for the same player
+        calibration: Optional Calibration updated with every answer
+        window: Leaderboard standings shown: "day", "week" or "all"
+        persist: Save the result to the leaderboard, results store and
+            telemetry (False for a replay, which shows the standings
+            without adding to them)
+    
+    Returns:
+        tuple: (player_name, final_score)
+    """
+    # Get player name
+    player_name = get_player_name(canvas)
+    
+    # Show splash screen
+    show_splash_screen(canvas, player_name)
+    
+    # Select and prepare questions
+    if scheduler is not None:
+        selected_questions = scheduler.select(player_name, genre)
+    else:
+        selected_questions = select_game_questions(genre)
+    prepared_questions = [
+        shuffle_question_options(q) for q in selected_questions
+    ]
+    if recording is not None:
+        prepared_questions = recording.prepare_questions(
+            selected_questions, prepared_questions
+        )
+    
+    # Run the quiz game
+    session = GameSession(prepared_questions)
+    if calibration is not None:
+        calibration.subscribe(session, player_name)
+    results = default_results() if persist else None
+    if results is not None:
+        results.subscribe(session)
+    final_score = run_quiz_game(
+        canvas, prepared_questions, session=session,
+        telemetry=GameTelemetry(default_sink() if persist else None, player_name)
+    )
+    if calibration is not None:
+        calibration.save_if_due()
+    
+    if not persist:
+        display_leaderboard(canvas, None, window)
+        return player_name, final_score
+    
+    # Handle game completion: every result is ranked, winners also see
+    # the leaderboard
+    placed = save_to_leaderboard(player_name, PRIZE_VALUES[final_score])
+    if final_score == TOTAL_QUESTIONS or always_show_leaderboard:
+        display_leaderboard(canvas, placed, window)
+    else:
+        display_rank(canvas, placed)
+    
+    return player_name, final_score
+
+
+def run_kiosk(canvas, max_games=None, on_game_end=None, genre=None,
+              scheduler=None, calibration=None, reloader=None,
+              window=LEADERBOARD_WINDOW):
+    """
+    Loop name entry, game, leaderboard and attract screen forever.
+    
+    Args:
+        canvas: Canvas object reused for every game
+        max_games: Stop after this many games (None runs forever)
+        on_game_end: Optional callback(games_played, player_name, score)
+        genre: Optional genre name, or list of genres, for themed games
+        scheduler: Optional SeenScheduler shared by every game
+        calibration: Optional Calibration updated by every game
+        reloader: Optional BankReloader whose updated banks are swapped
+            in before each game
+        window: Leaderboard standings shown: "day", "week" or "all"
+    
+    Returns:
+        int: Number of games played
+    """
+    games = 0
+    while max_games is None or games < max_games:
+        if reloader is not None:
+            index = reloader.swap(genre)
+            if index is not None and calibration is not None:
+                calibration.remap(index.question_hashes())
+        player_name, score = play_game(
+            canvas, always_show_leaderboard=True, genre=genre,
+            scheduler=scheduler, calibration=calibration, window=window
+        )
+        games += 1
+        if on_game_end is not None:
+            on_game_end(games, player_name, score)
+        if max_games is None or games < max_games:
+            show_attract_screen(canvas)
+    return games
@@ -2,52 +2,65 @@
 Leaderboard management for Movie Mania game.
 """
 
-import json
-import os
+import atexit
+from collections import deque
 from datetime import datetime
 from src.config import (
-    LEADERBOARD_FILE, LEADERBOARD_TOP_N, LEADERBOARD_DISPLAY_N,
+    LEADERBOARD_TOP_N, LEADERBOARD_DISPLAY_N, LEADERBOARD_WINDOW,
     WIDTH, HEIGHT, PANEL_COLOR, GLOW_COLOR, ACCENT_COLOR, 
     TEXT_COLOR, QUESTION_FONT
 )
+from src.game.leaderboard_cache import LeaderboardCache
+from src.game.leaderboard_rank import LeaderboardRanks
+from src.game.leaderboard_store import default_leaderboard
+from src.game.leaderboard_windows import WINDOWS
+from src.game.leaderboard_writer import LeaderboardWriter
 from src.ui.graphics import create_cinematic_background
 from src.ui.animations import animate_text
 
+# Results shown either side of the player's on the rank screen
+RANK_NEIGHBOURS = 2
+
 
 def save_to_leaderboard(name, score):
     """
-    Save winner's name, score, and timestamp to leaderboard.
+    Save a player's name, score, and timestamp to leaderboard.
+    
+    The result is queued for the background writer and shown from
+    memory, so this returns without touching the disk.
     
     Args:
         name: Player name
         score: Final score/prize amount
-    """
-    leaderboard = _load_leaderboard()
-    
-    # Add new entry with timestamp
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    leaderboard.append({
-        "name": name, 
-        "score": score, 
-        "timestamp": timestamp
-    })
     
-    # Sort by score (descending) and keep top entries
-    leaderboard.sort(key=lambda x: x['score'], reverse=True)
-    leaderboard = leaderboard[:LEADERBOARD_TOP_N]
-    
-    # Save updated leaderboard
-    _save_leaderboard(leaderboard)
+    Returns:
+        tuple: (rank, total results) where the score placed
+    """
+    entry = {
+        "name": name, "score": score,
+        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    }
+    report_save_errors()
+    ranks = default_ranks()
+    writer = default_writer()
+    if writer.idle():
+        ranks.refresh()
+    _default_cache().insert(entry)
+    writer.submit(entry)
+    return ranks.placed(entry)
 
 
-def display_leaderboard(canvas):
+def display_leaderboard(canvas, placed=None, window=LEADERBOARD_WINDOW):
     """
     Display top leaderboard scores with timestamps.
     
     Args:
         canvas: Canvas object
+        placed: Optional (rank, total) of the game just played
+        window: "day", "week" or "all" (all-time) standings
     """
-    leaderboard = _load_leaderboard()
+    report_save_errors()
+    leaderboard = _load_leaderboard(LEADERBOARD_DISPLAY_N, window)
     
     canvas.clear()
     create_cinematic_background(canvas)
@@ -60,9 +73,14 @@ def display_leaderboard(canvas):
     
     # Title
     animate_text(
-        canvas, "Leaderboard - Top 5", WIDTH//2, HEIGHT//4+50, 
+        canvas, f"{WINDOWS[window]} {LEADERBOARD_DISPLAY_N}", WIDTH//2, HEIGHT//4+50, 
         QUESTION_FONT, 36, ACCENT_COLOR, delay=0.03
     )
+    if placed is not None:
+        animate_text(
+            canvas, _placed_text(placed), WIDTH//2, HEIGHT//4+100,
+            QUESTION_FONT, 20, GLOW_COLOR, delay=0.02
+        )
     
     # Display entries
     _show_leaderboard_entries(canvas, leaderboard)
@@ -75,11 +93,53 @@ def display_leaderboard(canvas):
     canvas.wait_for_click()
 
 
+def display_rank(canvas, placed):
+    """
+    Display where a game placed among all results, with its neighbours.
+    
+    Args:
+        canvas: Canvas object
+        placed: (rank, total) from save_to_leaderboard()
+    """
+    rank, _ = placed
+    
+    canvas.clear()
+    create_cinematic_background(canvas)
+    canvas.create_rectangle(
+        WIDTH//4, HEIGHT//4, 3*WIDTH//4, 3*HEIGHT//4, 
+        color=PANEL_COLOR, outline=GLOW_COLOR
+    )
+    animate_text(
+        canvas, _placed_text(placed), WIDTH//2, HEIGHT//4+50, 
+        QUESTION_FONT, 30, ACCENT_COLOR, delay=0.03
+    )
+    
+    # Results just above and below the player's
+    for i, (r, entry) in enumerate(default_ranks().around(rank, RANK_NEIGHBOURS)):
+        animate_text(
+            canvas, f"#{r:,} {entry['name']}: ${entry['score']:,}",
+            WIDTH//2, HEIGHT//2-80+i*40, QUESTION_FONT, 20,
+            ACCENT_COLOR if r == rank else TEXT_COLOR, delay=0.02
+        )
+    
+    animate_text(
+        canvas, "Click to continue", WIDTH//2, 3*HEIGHT//4-50, 
+        QUESTION_FONT, 18, GLOW_COLOR, delay=0.02
+    )
+    canvas.wait_for_click()
+
+
+def _placed_text(placed):
+    """'You placed #N of M' for a (rank, total) pair."""
+    rank, total = placed
+    return f"You placed #{rank:,} of {total:,}"
+
+
 def _show_leaderboard_entries(canvas, leaderboard):
     """Display leaderboard entries or empty message."""
     if not leaderboard:
         animate_text(
-            canvas, "No winners yet!", WIDTH//2, HEIGHT//2, 
+            canvas, "No games played yet!", WIDTH//2, HEIGHT//2, 
             QUESTION_FONT, 24, TEXT_COLOR, delay=0.03
         )
     else:
@@ -94,23 +154,83 @@ def _show_leaderboard_entries(canvas, leaderboard):
             )
 
 
-def _load_leaderboard():
-    """Load leaderboard from file."""
-    if not os.path.exists(LEADERBOARD_FILE):
-        return []
-    
-    try:
-        with open(LEADERBOARD_FILE, 'r') as f:
-            return json.load(f)
-    except (json.JSONDecodeError, IOError) as e:
-        print(f"Error loading leaderboard: {e}")
-        return []
-
-
-def _save_leaderboard(leaderboard):
-    """Save leaderboard to file."""
-    try:
-        with open(LEADERBOARD_FILE, 'w') as f:
-            json.dump(leaderboard, f, indent=2)
-    except IOError as e:
-        print(f"Error saving leaderboard: {e}")
+_default_ranks = None
+
+
+def default_ranks():
+    """
+    Rank index over the leaderboard, built on first use.
+
+    Returns:
+        LeaderboardRanks: Shared rank index
+    """
+    global _default_ranks
+    if _default_ranks is None:
+        _default_ranks = LeaderboardRanks(default_leaderboard())
+    return _default_ranks
+
+
+_cache = None
+_writer = None
+# Failed saves reported by the writer thread, printed by the game thread
+_save_errors = deque()
+
+
+def default_writer():
+    """
+    Background writer for the shared leaderboard, started on first use
+    and drained at exit.
+
+    Returns:
+        LeaderboardWriter: Shared writer
+    """
+    global _writer
+    if _writer is None:
+        _writer = LeaderboardWriter(
+            default_leaderboard(), on_saved=_saved, on_error=_save_failed
+        )
+        # Registered after the store's close, so they run before it:
+        # drain the writer, then report anything its last saves hit
+        atexit.register(report_save_errors)
+        atexit.register(_writer.close)
+    return _writer
+
+
+def _saved(entries, keys, before, after):
+    """Writer callback: merge saved results into the cache and ranks."""
+    _default_cache().saved(entries, before, after)
+    default_ranks().saved(keys)
+
+
+def _save_failed(error, entries):
+    """Writer callback: stop showing a failed save and queue its error."""
+    _default_cache().discard(entries)
+    _save_errors.append(error)
+
+
+def report_save_errors():
+    """Print the errors of background saves that failed since last call."""
+    while _save_errors:
+        print(f"Error saving leaderboard: {_save_errors.popleft()}")
+
+
+def _default_cache():
+    """Cached top entries of the shared leaderboard."""
+    global _cache
+    if _cache is None:
+        _cache = LeaderboardCache(default_leaderboard())
+    return _cache
+
+
+def _load_leaderboard(limit=LEADERBOARD_TOP_N, window="all"):
+    """
+    Load the best leaderboard entries (cached until the store changes).
+
+    Args:
+        limit: Number of entries
+        window: "day", "week" or "all"
+
+    Returns:
+        list: Entry dicts with name, score and timestamp, best first
+    """
+    return _default_cache().top(limit, window)
@@ -0,0 +1,156 @@
+"""
+Cached leaderboard standings for Movie Mania.
+
+Kiosk mode shows the leaderboard after every game, and each display
+used to re-read the store. LeaderboardCache keeps the top entries of
+every time window (see src.game.leaderboard_windows) and re-reads them
+only when the store's version() token changes: a stat of the file for
+the JSON and log backends, SQLite's data_version for the database.
+
+Results this process saves are shown from memory straight away, while
+the background writer is still saving them, and are pushed into the
+window buckets once saved, so the display after a save reads nothing.
+A display can also re-read the store after a save has committed but
+before the writer reports it, so saved() skips entries that bucket
+already holds.
+A save by another process that lands in the same instant as one of
+ours can be picked up one change late.
+"""
+
+import threading
+from datetime import datetime
+from src.config import LEADERBOARD_TOP_N
+from src.game.leaderboard_windows import WINDOWS, TopK, period, period_start
+
+
+class LeaderboardCache:
+    """Top entries of a leaderboard store, re-read only after changes."""
+
+    def __init__(self, store, size=LEADERBOARD_TOP_N):
+        """
+        Create a cache (the entries are read on first use).
+
+        Args:
+            store: Leaderboard backend from src.game.leaderboard_store
+            size: Entries to keep per window
+        """
+        self.store = store
+        self.size = size
+        self._windows = None  # Window name -> TopK for its current period
+        self._version = None
+        self._pending = []
+        # saved() and discard() run on the writer thread
+        self._lock = threading.Lock()
+
+    def insert(self, entry):
+        """
+        Show a result that has been queued for saving.
+
+        Args:
+            entry: Entry dict with name, score and timestamp
+        """
+        with self._lock:
+            self._pending.append(entry)
+
+    def saved(self, entries, before, after):
+        """
+        Push results into the window buckets once the store has saved
+        them.
+
+        Args:
+            entries: The entry dicts that were saved
+            before: Store version() just before the save
+            after: Store version() just after it
+        """
+        with self._lock:
+            self._forget(entries)
+            if self._windows is None or before != self._version:
+                return
+            for entry in entries:
+                self._push(entry)
+            self._version = after
+
+    def discard(self, entries):
+        """
+        Stop showing results whose save failed.
+
+        Args:
+            entries: The entry dicts that were not saved
+        """
+        with self._lock:
+            self._forget(entries)
+
+    def top(self, n, window="all"):
+        """
+        Best entries of a window, from the cache unless the store has
+        changed.
+
+        Args:
+            n: Number of entries
+            window: "day", "week" or "all"
+
+        Returns:
+            list: Entry dicts with name, score and timestamp
+        """
+        if window not in WINDOWS:
+            raise ValueError(f"Unknown leaderboard window {window!r}")
+        with self._lock:
+            if n > self.size:
+                self.size = n
+                self._windows = None
+            version = self.store.version()
+            if self._windows is None or version != self._version:
+                self._load()
+                self._version = version
+            current = period(window, datetime.now())
+            cached = self._bucket(window, current).ranked()
+            bucket = TopK(n, current)
+            for entry in cached:
+                bucket.push(entry)
+            for entry in self._pending:
+                # A save can land between the store read and saved()
+                if period(window, entry['timestamp']) == current and entry not in cached:
+                    bucket.push(entry)
+        return [dict(entry) for entry in bucket.ranked()]
+
+    def _load(self):
+        """Read every window from the store."""
+        now = datetime.now()
+        self._windows = {
+            window: TopK(self.size, period(window, now)) for window in WINDOWS
+        }
+        for entry in self.store.top(self.size):
+            self._windows["all"].push(entry)
+        # Today is always inside this week
+        for entry in self.store.since(period_start("week", now)):
+            for window in ("day", "week"):
+                if period(window, entry['timestamp']) == self._windows[window].period:
+                    self._windows[window].push(entry)
+
+    def _push(self, entry):
+        """
+        Add a saved entry to each window bucket its timestamp is in,
+        unless a re-read of the store has already put it there.
+        """
+        for window in WINDOWS:
+            current = period(window, entry['timestamp'])
+            if current is not None and current >= self._windows[window].period:
+                bucket = self._bucket(window, current)
+                if entry not in bucket.ranked():
+                    bucket.push(entry)
+
+    def _bucket(self, window, current):
+        """
+        A window's bucket for a period no earlier than its own; when the
+        day or week has rolled over, the old bucket is dropped for an
+        empty one.
+        """
+        bucket = self._windows[window]
+        if bucket.period != current:
+            bucket = self._windows[window] = TopK(self.size, current)
+        return bucket
+
+    def _forget(self, entries):
+        """Drop entries (by identity) from the pending list."""
+        done = {id(entry) for entry in entries}
+        self._pending = [e for e in self._pending if id(e) not in done]
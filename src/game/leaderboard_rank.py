@@ -0,0 +1,225 @@
+"""
+Leaderboard rank index for Movie Mania.
+
+Answers "where did this result place?" and "who is around rank R?"
+without sorting the score history. Results are grouped into one bucket
+per distinct score, best score first; a Fenwick tree over the bucket
+sizes gives the number of results above any bucket, and each bucket
+lists its results' store keys in leaderboard order (earlier first).
+Both queries take O(log B) for B distinct scores, however many results
+there are.
+"""
+
+import bisect
+
+
+class ScoreRanks:
+    """Order-statistic index over (key, score) results."""
+
+    def __init__(self, ranked=()):
+        """
+        Build the index.
+
+        Args:
+            ranked: Iterable of (key, score) in leaderboard order
+        """
+        self.scores = []    # Distinct scores, highest first
+        self.buckets = []   # Keys per score, in leaderboard order
+        self._negated = []  # -score for each bucket, ascending, to bisect
+        self.tree = [0]     # Fenwick tree over bucket sizes (1-based)
+        self._bucket_of = {}
+        for key, score in ranked:
+            self._bucket(score).append(key)
+        self._rebuild_tree()
+
+    def __len__(self):
+        return self._prefix(len(self.buckets))
+
+    def add(self, key, score):
+        """
+        Add a result placed after every earlier result with its score.
+
+        Args:
+            key: Store key of the result
+            score: Its score
+
+        Returns:
+            int: Its 1-based rank
+        """
+        known = len(self.scores)
+        bucket = self._bucket(score)
+        bucket.append(key)
+        i = self._bucket_of[score]
+        if len(self.scores) != known:
+            self._rebuild_tree()
+        else:
+            self._update(i + 1, 1)
+        return self._prefix(i) + len(bucket)
+
+    def rank(self, score):
+        """
+        Best rank a result with a score would have (ties share it).
+
+        Args:
+            score: Score to place
+
+        Returns:
+            int: 1 + number of results with a higher score
+        """
+        i = bisect.bisect_left(self._negated, -score)
+        return self._prefix(i) + 1
+
+    def around(self, rank, radius=2):
+        """
+        Results at ranks rank - radius to rank + radius.
+
+        Args:
+            rank: 1-based centre rank
+            radius: Ranks either side
+
+        Returns:
+            list: (rank, key, score) tuples, best first
+        """
+        first = max(1, rank - radius)
+        last = min(len(self), rank + radius)
+        if first > last:
+            return []
+        i = self._find(first)
+        offset = first - self._prefix(i) - 1
+        results = []
+        for r in range(first, last + 1):
+            while offset >= len(self.buckets[i]):
+                i += 1
+                offset = 0
+            results.append((r, self.buckets[i][offset], self.scores[i]))
+            offset += 1
+        return results
+
+    def _bucket(self, score):
+        """Key list for a score, inserting a new bucket if needed."""
+        i = self._bucket_of.get(score)
+        if i is None:
+            i = bisect.bisect_left(self._negated, -score)
+            self._negated.insert(i, -score)
+            self.scores.insert(i, score)
+            self.buckets.insert(i, [])
+            self._bucket_of = {s: j for j, s in enumerate(self.scores)}
+        return self.buckets[i]
+
+    def _rebuild_tree(self):
+        """Rebuild the Fenwick tree after the buckets changed shape."""
+        tree = [0] + [len(b) for b in self.buckets]
+        for i in range(1, len(tree)):
+            parent = i + (i & -i)
+            if parent < len(tree):
+                tree[parent] += tree[i]
+        self.tree = tree
+
+    def _update(self, i, delta):
+        """Add delta to bucket i (1-based)."""
+        while i < len(self.tree):
+            self.tree[i] += delta
+            i += i & -i
+
+    def _prefix(self, i):
+        """Number of results in the first i buckets."""
+        total = 0
+        while i > 0:
+            total += self.tree[i]
+            i -= i & -i
+        return total
+
+    def _find(self, rank):
+        """0-based index of the bucket holding a 1-based rank."""
+        i = 0
+        step = 1 << (len(self.tree) - 1).bit_length()
+        while step:
+            if i + step < len(self.tree) and self.tree[i + step] < rank:
+                i += step
+                rank -= self.tree[i]
+            step >>= 1
+        return i
+
+
+class LeaderboardRanks:
+    """A ScoreRanks index kept in step with a leaderboard store."""
+
+    def __init__(self, store):
+        """
+        Create the index (it is built from the store on first use).
+
+        Args:
+            store: Leaderboard backend from src.game.leaderboard_store
+        """
+        self.store = store
+        self.ranks = None
+        self._seen = 0
+        self._own = set()
+
+    def refresh(self):
+        """
+        Build the index, or add results other processes have saved since.
+
+        Only stores with ranked_since() (SQLite) report other processes'
+        results; the others are tracked from this process's saves.
+        """
+        if self.ranks is None:
+            self.ranks = ScoreRanks(self._track(self.store.ranked()))
+        elif hasattr(self.store, 'ranked_since'):
+            for key, score in self._track(self.store.ranked_since(self._seen)):
+                if key not in self._own:
+                    self.ranks.add(key, score)
+            self._own = {k for k in self._own if k > self._seen}
+
+    def placed(self, entry):
+        """
+        Add a result this process is saving.
+
+        Call refresh() before submitting it, while no saves of this
+        process are in flight, so it is not also counted as another
+        process's.
+
+        Args:
+            entry: Entry dict with name, score and timestamp
+
+        Returns:
+            tuple: (rank, total results)
+        """
+        if self.ranks is None:
+            self.refresh()
+        return self.ranks.add(entry, entry['score']), len(self.ranks)
+
+    def saved(self, keys):
+        """
+        Note the store keys of results placed() here, once saved, so
+        refresh() does not add them again.
+
+        Args:
+            keys: Store keys returned by the store's add_many()
+        """
+        if hasattr(self.store, 'ranked_since'):
+            self._own.update(keys)
+
+    def around(self, rank, radius=2):
+        """
+        Entries at ranks around a rank.
+
+        Args:
+            rank: 1-based centre rank
+            radius: Ranks either side
+
+        Returns:
+            list: (rank, entry dict) tuples, best first
+        """
+        if self.ranks is None:
+            self.refresh()
+        nearby = self.ranks.around(rank, radius)
+        entries = self.store.entries([key for _, key, _ in nearby])
+        return [(r, entry) for (r, _, _), entry in zip(nearby, entries)]
+
+    def _track(self, ranked):
+        """Pass (key, score) pairs through, remembering the newest row id."""
+        for key, score in ranked:
+            if isinstance(key, int) and key > self._seen:
+                self._seen = key
+            yield key, score
@@ -0,0 +1,756 @@
+"""
+Leaderboard storage backends for Movie Mania.
+
+Every backend stores (name, score, timestamp) entries and returns the
+best ones ordered by score (highest first), earlier entries first on a
+tie. LEADERBOARD_BACKEND picks the one the game uses:
+
+    json     leaderboard.json, rewritten atomically and truncated to
+             LEADERBOARD_TOP_N entries
+    sqlite   leaderboard.sqlite in WAL mode; keeps every entry, inserts
+             in O(log n) and reads the top N through an index, and is
+             safe for several game processes on one host to share
+    log      append-only checksummed record log plus a sorted snapshot
+             that a background compactor rewrites; keeps every entry,
+             saves are one O(1) append and a power cut can at worst
+             lose the record being written
+"""
+
+import atexit
+import io
+import json
+import os
+import sqlite3
+import threading
+import zlib
+from src.config import (
+    LEADERBOARD_BACKEND, LEADERBOARD_FILE, LEADERBOARD_DB, LEADERBOARD_TOP_N,
+    LEADERBOARD_LOG, LEADERBOARD_SNAPSHOT, LEADERBOARD_COMPACT_BYTES
+)
+from src.game.leaderboard_windows import period_start
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process locking
+    fcntl = None
+
+# Seconds a writer waits for another process's transaction to finish
+SQLITE_BUSY_TIMEOUT = 5.0
+
+
+class JsonLeaderboard:
+    """Top entries kept in a small JSON file."""
+
+    def __init__(self, path=LEADERBOARD_FILE, keep=LEADERBOARD_TOP_N):
+        """
+        Create a JSON leaderboard.
+
+        Args:
+            path: JSON file
+            keep: Entries to keep
+        """
+        self.path = path
+        self.keep = keep
+
+    def add(self, name, score, timestamp):
+        """
+        Add an entry.
+
+        Args:
+            name: Player name
+            score: Prize amount
+            timestamp: "YYYY-MM-DD HH:MM:SS" string
+
+        Returns:
+            dict or None: The entry, which is also its key (None if it
+            was not saved)
+        """
+        entry = {"name": name, "score": score, "timestamp": timestamp}
+        try:
+            return self.add_many([entry])[0]
+        except OSError as e:
+            print(f"Error saving leaderboard: {e}")
+            return None
+
+    def add_many(self, entries):
+        """
+        Add entries, oldest first, with one rewrite of the file.
+
+        Args:
+            entries: Entry dicts with name, score and timestamp
+
+        Returns:
+            list: The entries, which are also their keys
+
+        Raises:
+            OSError: If the file cannot be written
+        """
+        leaderboard = self._read() + list(entries)
+        # Stable sort keeps earlier entries ahead on a tie
+        leaderboard.sort(key=lambda x: x['score'], reverse=True)
+        self._write(leaderboard[:self.keep])
+        return list(entries)
+
+    def top(self, n):
+        """
+        Best entries.
+
+        Args:
+            n: Number of entries
+
+        Returns:
+            list: Entry dicts with name, score and timestamp
+        """
+        return self._read()[:n]
+
+    def ranked(self):
+        """Yield (key, score) for every entry, best first."""
+        for entry in self._read():
+            yield entry, entry['score']
+
+    def since(self, timestamp):
+        """
+        Kept entries saved at or after a time, oldest first (older
+        results outside the top entries are already gone).
+
+        Args:
+            timestamp: "YYYY-MM-DD HH:MM:SS" string
+
+        Returns:
+            list: Entry dicts with name, score and timestamp
+        """
+        return _since(self._read(), timestamp)
+
+    def entries(self, keys):
+        """Entry dicts for keys from ranked() or add()."""
+        return list(keys)
+
+    def version(self):
+        """Change token: the file's identity, size and mtime (one stat)."""
+        return _stat_token(self.path)
+
+    def close(self):
+        """Nothing to release."""
+
+    def _read(self):
+        """Load all entries from the file."""
+        if not os.path.exists(self.path):
+            return []
+        try:
+            with open(self.path, 'r') as f:
+                return json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            print(f"Error loading leaderboard: {e}")
+            return []
+
+    def _write(self, leaderboard):
+        """Replace the file atomically, so a crash cannot truncate it."""
+        temporary = self.path + ".tmp"
+        with open(temporary, 'w') as f:
+            json.dump(leaderboard, f, indent=2)
+        os.replace(temporary, self.path)
+
+
+class SqliteLeaderboard:
+    """
+    Full score history in a SQLite database in WAL mode.
+
+    One connection is shared by every thread (a background writer saves
+    while the game thread reads), serialised by a lock; in WAL mode with
+    synchronous=NORMAL a commit does not wait for the disk, so readers
+    are held up only briefly.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS scores (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            score INTEGER NOT NULL,
+            timestamp TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS scores_rank
+            ON scores (score DESC, timestamp, id);
+        CREATE INDEX IF NOT EXISTS scores_time ON scores (timestamp);
+    """
+
+    def __init__(self, path=LEADERBOARD_DB, import_from=LEADERBOARD_FILE):
+        """
+        Create a SQLite leaderboard (the database opens on first use).
+
+        Args:
+            path: Database file
+            import_from: JSON leaderboard copied into a new database, so
+                switching backends keeps existing winners (None to skip)
+        """
+        self.path = path
+        self.import_from = import_from
+        self._connection = None
+        self._lock = threading.RLock()
+
+    def add(self, name, score, timestamp):
+        """
+        Add an entry.
+
+        Args:
+            name: Player name
+            score: Prize amount
+            timestamp: "YYYY-MM-DD HH:MM:SS" string
+
+        Returns:
+            int or None: Row id of the entry (None if it was not saved)
+        """
+        entry = {"name": name, "score": score, "timestamp": timestamp}
+        try:
+            return self.add_many([entry])[0]
+        except sqlite3.Error as e:
+            print(f"Error saving leaderboard: {e}")
+            return None
+
+    def add_many(self, entries):
+        """
+        Add entries, oldest first, in one transaction.
+
+        Args:
+            entries: Entry dicts with name, score and timestamp
+
+        Returns:
+            list: Row ids of the entries
+
+        Raises:
+            sqlite3.Error: If the database cannot be written
+        """
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                return [
+                    connection.execute(
+                        "INSERT INTO scores (name, score, timestamp) VALUES (?, ?, ?)",
+                        (e['name'], e['score'], e['timestamp'])
+                    ).lastrowid
+                    for e in entries
+                ]
+
+    def top(self, n):
+        """
+        Best entries, read through the score index.
+
+        Args:
+            n: Number of entries
+
+        Returns:
+            list: Entry dicts with name, score and timestamp
+        """
+        try:
+            with self._lock:
+                rows = self._connect().execute(
+                    "SELECT name, score, timestamp FROM scores "
+                    "ORDER BY score DESC, timestamp, id LIMIT ?", (n,)
+                ).fetchall()
+        except sqlite3.Error as e:
+            print(f"Error loading leaderboard: {e}")
+            return []
+        return [{"name": name, "score": score, "timestamp": timestamp}
+                for name, score, timestamp in rows]
+
+    def ranked(self):
+        """(row id, score) for every entry, best first, by index scan."""
+        return self._query(
+            "SELECT id, score FROM scores ORDER BY score DESC, timestamp, id"
+        )
+
+    def ranked_since(self, row_id):
+        """(row id, score) for entries added after a row id, oldest first."""
+        return self._query(
+            "SELECT id, score FROM scores WHERE id > ? ORDER BY id", (row_id,)
+        )
+
+    def since(self, timestamp):
+        """
+        Entries saved at or after a time, oldest first, read through the
+        timestamp index.
+
+        Args:
+            timestamp: "YYYY-MM-DD HH:MM:SS" string
+
+        Returns:
+            list: Entry dicts with name, score and timestamp
+        """
+        rows = self._query(
+            "SELECT name, score, timestamp FROM scores "
+            "WHERE timestamp >= ? ORDER BY timestamp, id", (timestamp,)
+        )
+        return [{"name": name, "score": score, "timestamp": timestamp}
+                for name, score, timestamp in rows]
+
+    def entries(self, keys):
+        """
+        Entry dicts for keys, in the order given: row ids are looked up,
+        entry dicts (results not yet written) are passed through.
+        """
+        keys = list(keys)
+        ids = [key for key in keys if isinstance(key, int)]
+        rows = self._query(
+            "SELECT id, name, score, timestamp FROM scores WHERE id IN "
+            f"({', '.join('?' * len(ids))})", ids
+        )
+        found = {row[0]: {"name": row[1], "score": row[2], "timestamp": row[3]}
+                 for row in rows}
+        return [key if isinstance(key, dict) else
+                found.get(key, {"name": "?", "score": 0, "timestamp": ""})
+                for key in keys]
+
+    def version(self):
+        """
+        Change token: SQLite's data_version, which moves when another
+        connection commits (but not for this connection's own saves).
+        """
+        rows = self._query("PRAGMA data_version")
+        return rows[0][0] if rows else None
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _query(self, sql, parameters=()):
+        """Rows of a read query ([] after printing an error)."""
+        try:
+            with self._lock:
+                return self._connect().execute(sql, parameters).fetchall()
+        except sqlite3.Error as e:
+            print(f"Error loading leaderboard: {e}")
+            return []
+
+    def _connect(self):
+        """Open the database on first use, creating the schema."""
+        if self._connection is None:
+            connection = sqlite3.connect(
+                self.path, timeout=SQLITE_BUSY_TIMEOUT, check_same_thread=False
+            )
+            try:
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.execute("PRAGMA synchronous=NORMAL")
+                connection.executescript(self.SCHEMA)
+                with connection:
+                    # Lock first, so two processes cannot both import
+                    connection.execute("BEGIN IMMEDIATE")
+                    self._import_json(connection)
+            except sqlite3.Error:
+                connection.close()
+                raise
+            self._connection = connection
+        return self._connection
+
+    def _import_json(self, connection):
+        """Copy the JSON leaderboard into an empty database."""
+        if not self.import_from or not os.path.exists(self.import_from):
+            return
+        if connection.execute("SELECT 1 FROM scores LIMIT 1").fetchone():
+            return
+        entries = JsonLeaderboard(self.import_from).top(None)
+        connection.executemany(
+            "INSERT INTO scores (name, score, timestamp) VALUES (?, ?, ?)",
+            [(e['name'], e['score'], e.get('timestamp', '')) for e in entries]
+        )
+
+
+class LogLeaderboard:
+    """
+    Leaderboard kept as an append-only log and a sorted snapshot.
+
+    Every record is one line, "<crc32> <json>", so a line torn by a
+    crash fails its checksum and is skipped. Compaction renames the log
+    aside, merges it into a new snapshot written to a temporary file and
+    renamed into place, then deletes the old log. The snapshot header
+    names the log it merged, so a compaction interrupted at any point is
+    neither lost nor counted twice.
+
+    After the score-sorted entries the snapshot repeats those of the
+    week it was written in, oldest first, and the header gives the byte
+    offset of that section, so since() for this week reads it and the
+    log tail rather than the whole leaderboard.
+    """
+
+    def __init__(self, path=LEADERBOARD_LOG, snapshot=LEADERBOARD_SNAPSHOT,
+                 compact_bytes=LEADERBOARD_COMPACT_BYTES,
+                 import_from=LEADERBOARD_FILE):
+        """
+        Create a log leaderboard.
+
+        Args:
+            path: Log file that new results are appended to
+            snapshot: Sorted snapshot file
+            compact_bytes: Log size that triggers a background compaction
+            import_from: JSON leaderboard copied into a new leaderboard,
+                so switching backends keeps existing winners (None to skip)
+        """
+        self.path = path
+        self.snapshot = snapshot
+        self.compacting = path + ".compacting"
+        self.compact_bytes = compact_bytes
+        self.import_from = import_from
+        self._compactor = None
+        self._lock = threading.Lock()
+
+    def add(self, name, score, timestamp):
+        """
+        Append an entry with one write and fsync.
+
+        Args:
+            name: Player name
+            score: Prize amount
+            timestamp: "YYYY-MM-DD HH:MM:SS" string
+
+        Returns:
+            dict or None: The entry, which is also its key (None if it
+            was not saved)
+        """
+        entry = {"name": name, "score": score, "timestamp": timestamp}
+        try:
+            return self.add_many([entry])[0]
+        except OSError as e:
+            print(f"Error saving leaderboard: {e}")
+            return None
+
+    def add_many(self, entries):
+        """
+        Append entries, oldest first, with one write and fsync.
+
+        Args:
+            entries: Entry dicts with name, score and timestamp
+
+        Returns:
+            list: The entries, which are also their keys
+
+        Raises:
+            OSError: If the log cannot be written
+        """
+        self._import_json()
+        records = "".join(_encode_record(entry) for entry in entries)
+        with self._file_lock():
+            size = self._append(self.path, records)
+        if size >= self.compact_bytes:
+            self.compact_in_background()
+        return list(entries)
+
+    def top(self, n):
+        """
+        Best entries: the head of the snapshot merged with the log tail.
+
+        Args:
+            n: Number of entries (None for all)
+
+        Returns:
+            list: Entry dicts with name, score and timestamp
+        """
+        self._import_json()
+        try:
+            with self._file_lock():
+                entries, merged = self._read_snapshot(n)
+                entries += self._read_tail(merged)
+        except OSError as e:
+            print(f"Error loading leaderboard: {e}")
+            return []
+        # Stable sort: snapshot entries were added before the tail's
+        entries.sort(key=lambda x: x['score'], reverse=True)
+        return entries[:n]
+
+    def ranked(self):
+        """Yield (key, score) for every entry, best first."""
+        for entry in self.top(None):
+            yield entry, entry['score']
+
+    def since(self, timestamp):
+        """
+        Entries saved at or after a time, oldest first: the snapshot's
+        recent section and the log tail, or the whole leaderboard for a
+        time before the section starts.
+
+        Args:
+            timestamp: "YYYY-MM-DD HH:MM:SS" string
+
+        Returns:
+            list: Entry dicts with name, score and timestamp
+        """
+        self._import_json()
+        try:
+            with self._file_lock():
+                recent = self._read_recent(timestamp)
+                if recent is not None:
+                    entries, merged = recent
+                    entries += self._read_tail(merged)
+        except OSError as e:
+            print(f"Error loading leaderboard: {e}")
+            return []
+        if recent is None:
+            return _since(self.top(None), timestamp)
+        return _since(entries, timestamp)
+
+    def entries(self, keys):
+        """Entry dicts for keys from ranked() or add()."""
+        return list(keys)
+
+    def version(self):
+        """Change token: stats of the snapshot and both log files."""
+        return tuple(_stat_token(path) for path in
+                     (self.snapshot, self.compacting, self.path))
+
+    def compact(self):
+        """
+        Merge the log into a new sorted snapshot.
+
+        Holds the file lock throughout, so other processes' saves wait
+        for it rather than racing it.
+        """
+        with self._lock:
+            try:
+                with self._file_lock():
+                    if not os.path.exists(self.compacting) and os.path.exists(self.path):
+                        os.replace(self.path, self.compacting)
+                    self._merge_compacting()
+            except OSError as e:
+                print(f"Error compacting leaderboard: {e}")
+
+    def compact_in_background(self):
+        """Start a compaction on a daemon thread unless one is running."""
+        if self._compactor is not None and self._compactor.is_alive():
+            return
+        self._compactor = threading.Thread(
+            target=self.compact, name="leaderboard-compactor", daemon=True
+        )
+        self._compactor.start()
+
+    def close(self):
+        """Wait for a running compaction to finish."""
+        if self._compactor is not None:
+            self._compactor.join()
+
+    def _merge_compacting(self):
+        """Fold the renamed-aside log into the snapshot, then delete it."""
+        if not os.path.exists(self.compacting):
+            return
+        entries, merged = self._read_snapshot(None)
+        marker = _file_marker(self.compacting)
+        if merged != marker:
+            entries += _read_records(self.compacting)
+            entries.sort(key=lambda x: x['score'], reverse=True)
+            self._write_snapshot(entries, marker)
+        os.remove(self.compacting)
+
+    def _read_snapshot(self, n):
+        """
+        First n snapshot entries (all if None) and the merged-log marker.
+        """
+        try:
+            f = open(self.snapshot, encoding="utf-8")
+        except FileNotFoundError:
+            return [], None
+        with f:
+            header = json.loads(f.readline() or "{}")
+            count = header.get("entries")
+            if count is not None and (n is None or n > count):
+                n = count
+            entries = _read_records(f, n)
+        merged = header.get("merged")
+        return entries, tuple(merged) if merged else None
+
+    def _read_recent(self, timestamp):
+        """
+        Snapshot entries in its recent section and the merged-log
+        marker, or None if the section does not cover timestamp.
+        """
+        try:
+            f = open(self.snapshot, "rb")
+        except FileNotFoundError:
+            return [], None
+        with f:
+            header = json.loads(f.readline() or b"{}")
+            if header.get("since") is None or timestamp < header["since"]:
+                return None
+            f.seek(header["recent"], os.SEEK_CUR)
+            entries = _read_records(io.TextIOWrapper(f, encoding="utf-8", errors="replace"))
+        merged = header.get("merged")
+        return entries, tuple(merged) if merged else None
+
+    def _read_tail(self, merged):
+        """Entries not yet in the snapshot (merged: its merged-log marker)."""
+        entries = []
+        for path in (self.compacting, self.path):
+            if path == self.compacting and merged == _file_marker(path):
+                continue
+            entries += _read_records(path)
+        return entries
+
+    def _write_snapshot(self, entries, merged):
+        """
+        Replace the snapshot atomically and durably: entries (best
+        first), then this week's entries oldest first.
+        """
+        since = period_start("week")
+        ranked = "".join(_encode_record(entry) for entry in entries).encode("utf-8")
+        recent = _since(entries, since)
+        header = {"version": 2, "merged": merged, "entries": len(entries),
+                  "since": since, "recent": len(ranked)}
+        temporary = self.snapshot + ".tmp"
+        with open(temporary, "wb") as f:
+            f.write(json.dumps(header).encode("utf-8") + b"\n")
+            f.write(ranked)
+            for entry in recent:
+                f.write(_encode_record(entry).encode("utf-8"))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporary, self.snapshot)
+        _fsync_directory(self.snapshot)
+
+    def _append(self, path, record):
+        """Append records durably; returns the new file size."""
+        fd = os.open(path, os.O_RDWR | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            size = os.fstat(fd).st_size
+            data = record.encode("utf-8")
+            # Start a fresh line after a record torn by a crash
+            if size:
+                os.lseek(fd, size - 1, os.SEEK_SET)
+                if os.read(fd, 1) != b"\n":
+                    data = b"\n" + data
+            os.write(fd, data)
+            os.fsync(fd)
+            return size + len(data)
+        finally:
+            os.close(fd)
+
+    def _import_json(self):
+        """Start a new leaderboard from the JSON one, once."""
+        if not self.import_from or not os.path.exists(self.import_from):
+            return
+        try:
+            with self._file_lock():
+                if any(os.path.exists(p) for p in
+                       (self.snapshot, self.path, self.compacting)):
+                    return
+                self._write_snapshot(JsonLeaderboard(self.import_from).top(None), None)
+        except OSError as e:
+            print(f"Error importing leaderboard: {e}")
+        self.import_from = None
+
+    def _file_lock(self):
+        """Exclusive lock shared by every process using this log."""
+        return _FileLock(self.path + ".lock")
+
+
+class _FileLock:
+    """Context manager holding an flock on a lock file (no-op without fcntl)."""
+
+    def __init__(self, path):
+        self.path = path
+        self._fd = None
+
+    def __enter__(self):
+        if fcntl is not None:
+            self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc):
+        if self._fd is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+            os.close(self._fd)
+            self._fd = None
+
+
+def _encode_record(entry):
+    """One checksummed log line."""
+    payload = json.dumps(entry, ensure_ascii=False, separators=(",", ":"))
+    return f"{zlib.crc32(payload.encode('utf-8')):08x} {payload}\n"
+
+
+def _read_records(source, n=None):
+    """
+    Entries from a record file (path or open file), skipping torn or
+    corrupt lines; stops after n entries if n is not None.
+    """
+    if isinstance(source, str):
+        try:
+            f = open(source, encoding="utf-8", errors="replace")
+        except FileNotFoundError:
+            return []
+        with f:
+            return _read_records(f, n)
+    entries = []
+    for line in source:
+        if n is not None and len(entries) >= n:
+            break
+        checksum, _, payload = line.rstrip("\n").partition(" ")
+        if (not line.endswith("\n")
+                or checksum != f"{zlib.crc32(payload.encode('utf-8')):08x}"):
+            continue
+        entries.append(json.loads(payload))
+    return entries
+
+
+def _since(entries, timestamp):
+    """Entries at or after a timestamp, oldest first (stable on ties)."""
+    recent = [e for e in entries if e.get('timestamp', '') >= timestamp]
+    recent.sort(key=lambda e: e['timestamp'])
+    return recent
+
+
+def _stat_token(path):
+    """(inode, size, mtime_ns) of a file, or None if it is missing."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+
+def _file_marker(path):
+    """(size, crc32) identifying a file's contents, or None if missing."""
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except FileNotFoundError:
+        return None
+    return (len(data), zlib.crc32(data))
+
+
+def _fsync_directory(path):
+    """Make a rename in a file's directory durable (POSIX only)."""
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+BACKENDS = {
+    "json": JsonLeaderboard,
+    "sqlite": SqliteLeaderboard,
+    "log": LogLeaderboard,
+}
+
+_default_leaderboard = None
+
+
+def default_leaderboard():
+    """
+    Shared leaderboard for LEADERBOARD_BACKEND, opened on first use and
+    closed at exit.
+
+    Returns:
+        JsonLeaderboard, SqliteLeaderboard or LogLeaderboard
+    """
+    global _default_leaderboard
+    if _default_leaderboard is None:
+        if LEADERBOARD_BACKEND not in BACKENDS:
+            raise ValueError(
+                f"Unknown LEADERBOARD_BACKEND {LEADERBOARD_BACKEND!r} "
+                f"(expected one of {', '.join(sorted(BACKENDS))})"
+            )
+        _default_leaderboard = BACKENDS[LEADERBOARD_BACKEND]()
+        atexit.register(_default_leaderboard.close)
+    return _default_leaderboard
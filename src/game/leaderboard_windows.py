@@ -0,0 +1,102 @@
+"""
+Time-windowed leaderboards for Movie Mania: today, this week (Monday
+to Sunday) and all time.
+
+Each window keeps one bucket, a bounded top-K heap, for the period it
+currently covers. A result is pushed into the bucket of every window
+whose period its timestamp falls in, in O(log K). When the day or week
+rolls over, the old bucket is dropped and an empty one started, without
+rescanning history.
+"""
+
+import heapq
+from datetime import datetime, timedelta
+
+# Window names and their leaderboard titles
+WINDOWS = {
+    "day": "Today's Top",
+    "week": "This Week's Top",
+    "all": "Leaderboard - Top",
+}
+
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+class TopK:
+    """The K best entries pushed so far, earlier entries first on a tie."""
+
+    def __init__(self, k, period=None):
+        """
+        Create an empty bucket.
+
+        Args:
+            k: Entries to keep
+            period: Period the bucket covers (from period())
+        """
+        self.k = k
+        self.period = period
+        self._heap = []  # Min-heap of (score, -sequence, entry)
+        self._sequence = 0
+
+    def push(self, entry):
+        """
+        Add an entry that is newer than every entry pushed before it.
+
+        Args:
+            entry: Entry dict with name, score and timestamp
+        """
+        self._sequence += 1
+        item = (entry['score'], -self._sequence, entry)
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, item)
+        elif item[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, item)
+
+    def ranked(self):
+        """
+        Returns:
+            list: Entry dicts, best first
+        """
+        return [entry for *_, entry in sorted(
+            self._heap, key=lambda item: item[:2], reverse=True
+        )]
+
+
+def period(window, timestamp):
+    """
+    Period of a window that a timestamp falls in.
+
+    Args:
+        window: "day", "week" or "all"
+        timestamp: "YYYY-MM-DD HH:MM:SS" string or datetime
+
+    Returns:
+        The date for "day", the week's Monday for "week", "all" for
+        "all", or None if the timestamp cannot be read
+    """
+    if window == "all":
+        return "all"
+    if isinstance(timestamp, str):
+        try:
+            timestamp = datetime.strptime(timestamp, TIMESTAMP_FORMAT)
+        except ValueError:
+            return None
+    day = timestamp.date()
+    if window == "day":
+        return day
+    return day - timedelta(days=day.weekday())
+
+
+def period_start(window, now=None):
+    """
+    First timestamp of a window's current period.
+
+    Args:
+        window: "day" or "week"
+        now: Current time (default: now)
+
+    Returns:
+        str: "YYYY-MM-DD 00:00:00"
+    """
+    start = period(window, now or datetime.now())
+    return f"{start.isoformat()} 00:00:00"
@@ -0,0 +1,102 @@
+"""
+Background leaderboard writer for Movie Mania.
+
+Saving a result can take hundreds of milliseconds on an SD card, so the
+game thread only queues it; a writer thread saves it while the
+leaderboard screen is already showing the result from memory. Results
+queued while a save is running are written together in the next one
+(one file rewrite, fsync or transaction for the whole burst). close()
+writes everything still queued before it returns, and runs at exit for
+the shared writer.
+"""
+
+import queue
+import threading
+
+# Queued in place of a result to stop the writer thread
+_STOP = object()
+
+
+class LeaderboardWriter:
+    """Saves queued results to a leaderboard store on a background thread."""
+
+    def __init__(self, store, on_saved=None, on_error=None):
+        """
+        Create a writer and start its thread.
+
+        Args:
+            store: Leaderboard backend from src.game.leaderboard_store
+            on_saved: Optional callback(entries, keys, before, after),
+                called on the writer thread after each save with the
+                store's version() before and after it
+            on_error: Optional callback(error, entries) for a save that
+                failed; the entries are dropped
+        """
+        self.store = store
+        self.on_saved = on_saved
+        self.on_error = on_error
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(
+            target=self._run, name="leaderboard-writer", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, entry):
+        """
+        Queue a result for saving and return at once.
+
+        Args:
+            entry: Entry dict with name, score and timestamp
+        """
+        self._queue.put(entry)
+
+    def idle(self):
+        """
+        Whether every submitted result has been saved (or failed) and
+        its callbacks have run.
+        """
+        return self._queue.unfinished_tasks == 0
+
+    def flush(self):
+        """Wait until every submitted result has been saved."""
+        self._queue.join()
+
+    def close(self):
+        """Save everything still queued, then stop the thread."""
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+
+    def _run(self):
+        """Save queued results in batches until stopped."""
+        while True:
+            batch = [self._queue.get()]
+            # Take the rest of a burst without waiting
+            while batch[-1] is not _STOP:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            entries = [entry for entry in batch if entry is not _STOP]
+            try:
+                if entries:
+                    self._save(entries)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            if batch[-1] is _STOP:
+                return
+
+    def _save(self, entries):
+        """Save one batch and report the outcome."""
+        try:
+            before = self.store.version()
+            keys = self.store.add_many(entries)
+            after = self.store.version()
+        except Exception as e:
+            # Whatever went wrong, the writer must keep running
+            if self.on_error is not None:
+                self.on_error(e, entries)
+            return
+        if self.on_saved is not None:
+            self.on_saved(entries, keys, before, after)
@@ -0,0 +1,205 @@
+"""
+Batched, seedable lifeline outcomes for Movie Mania.
+Generates 50/50, phone-a-friend and audience poll results for many
+questions at once from an explicit NumPy generator, so games can be
+reproduced from a seed and simulations and servers can draw outcomes
+in bulk.
+
+Requires NumPy (only the batch tools need it, not the game).
+"""
+
+from collections import namedtuple
+import numpy as np
+
+# Chance that the friend names the correct answer
+FRIEND_ACCURACY = 0.8
+
+# Chance that the correct answer polls highest
+AUDIENCE_ACCURACY = 0.9
+
+# eliminated: (N, 2) option indices removed by the 50/50
+# friend: (N,) option index suggested by the friend
+# audience: (N, 4) poll percentages (unused slots are 0)
+LifelineOutcomes = namedtuple(
+    'LifelineOutcomes', ['eliminated', 'friend', 'audience']
+)
+
+
+def build_alias_table(weights):
+    """
+    Build a Walker/Vose alias table for a discrete distribution.
+
+    Args:
+        weights: Sequence of non-negative weights
+
+    Returns:
+        tuple: (prob, alias) arrays for constant time sampling
+    """
+    n = len(weights)
+    total = float(sum(weights))
+    scaled = [w * n / total for w in weights]
+    prob = np.ones(n)
+    alias = np.arange(n)
+    small = [i for i, p in enumerate(scaled) if p < 1.0]
+    large = [i for i, p in enumerate(scaled) if p >= 1.0]
+    while small and large:
+        s = small.pop()
+        l = large.pop()
+        prob[s] = scaled[s]
+        alias[s] = l
+        scaled[l] -= 1.0 - scaled[s]
+        (small if scaled[l] < 1.0 else large).append(l)
+    return prob, alias
+
+
+def _friend_weights(num_options):
+    """Friend weights with the correct answer in slot 0."""
+    wrong = (1.0 - FRIEND_ACCURACY) / (num_options - 1)
+    return [FRIEND_ACCURACY] + [wrong] * (num_options - 1)
+
+
+# Alias tables for 3 and 4 options, indexed by option count
+_FRIEND_TABLES = {n: build_alias_table(_friend_weights(n)) for n in (3, 4)}
+_FRIEND_PROB = np.zeros((5, 4))
+_FRIEND_ALIAS = np.zeros((5, 4), dtype=np.int64)
+for _n, (_prob, _alias) in _FRIEND_TABLES.items():
+    _FRIEND_PROB[_n, :_n] = _prob
+    _FRIEND_ALIAS[_n, :_n] = _alias
+
+
+class LifelineGenerator:
+    """
+    Draws lifeline outcomes for arrays of questions.
+
+    Every method takes the option count and correct option index of each
+    question as int arrays (or scalars, broadcast to size) and returns
+    arrays with one row per question.
+    """
+
+    def __init__(self, seed=None):
+        """
+        Create a generator.
+
+        Args:
+            seed: Seed, SeedSequence or numpy.random.Generator
+        """
+        if isinstance(seed, np.random.Generator):
+            self.rng = seed
+        else:
+            self.rng = np.random.default_rng(seed)
+
+    def eliminations(self, num_options, correct_index, size=None):
+        """
+        Pick the two wrong answers removed by each 50/50.
+
+        Returns:
+            numpy.ndarray: (N, 2) eliminated option indices
+        """
+        num_options, correct_index = _broadcast(
+            num_options, correct_index, size
+        )
+        n = len(correct_index)
+        keys = self.rng.random((n, 4))
+        slots = np.arange(4)
+        keep = (
+            (slots >= num_options[:, None]) |
+            (slots == correct_index[:, None])
+        )
+        keys[keep] = 2.0
+        return np.argsort(keys, axis=1)[:, :2]
+
+    def friend_picks(self, num_options, correct_index, size=None):
+        """
+        Pick the friend's suggestion for each question by alias sampling.
+
+        Returns:
+            numpy.ndarray: (N,) suggested option indices
+        """
+        num_options, correct_index = _broadcast(
+            num_options, correct_index, size
+        )
+        n = len(correct_index)
+        column = self.rng.integers(0, num_options)
+        accept = self.rng.random(n) < _FRIEND_PROB[num_options, column]
+        slot = np.where(accept, column, _FRIEND_ALIAS[num_options, column])
+        # Slot 0 is the correct answer, slot k the k-th wrong answer
+        wrong = slot - 1
+        return np.where(
+            slot == 0, correct_index, wrong + (wrong >= correct_index)
+        )
+
+    def audience(self, num_options, correct_index, size=None):
+        """
+        Generate audience poll percentages for each question.
+
+        Same distribution as lifelines._generate_audience_data: the correct
+        answer polls highest 90% of the time and each row sums to 100.
+
+        Returns:
+            numpy.ndarray: (N, 4) int percentages (unused slots are 0)
+        """
+        num_options, correct = _broadcast(num_options, correct_index, size)
+        rng = self.rng
+        n = len(correct)
+        rows = np.arange(n)
+        data = np.zeros((n, 4), dtype=np.int64)
+
+        correct_highest = rng.random(n) < AUDIENCE_ACCURACY
+        pick = rng.integers(0, num_options - 1)
+        misled = pick + (pick >= correct)
+        top = np.where(correct_highest, correct, misled)
+        top_value = np.where(
+            correct_highest, rng.integers(60, 81, n), rng.integers(50, 71, n)
+        )
+        data[rows, top] = top_value
+        remaining = 100 - top_value
+
+        # When misled, the correct answer still gets 20-40%
+        correct_value = rng.integers(20, np.minimum(40, remaining) + 1)
+        correct_value = np.where(correct_highest, 0, correct_value)
+        data[rows, correct] += correct_value
+        remaining -= correct_value
+
+        # Remaining options draw small shares in order; the last takes the rest
+        cap = np.where(correct_highest, 20, 15)
+        last = np.full(n, -1)
+        for j in range(3, -1, -1):
+            free = (last < 0) & (j < num_options) & (j != top) & (j != correct)
+            last[free] = j
+        for j in range(4):
+            free = (j < num_options) & (j != top) & (j != correct)
+            value = rng.integers(0, np.minimum(cap, remaining) + 1)
+            drawn = free & (j != last)
+            data[:, j] = np.where(
+                drawn, value, np.where(free, remaining, data[:, j])
+            )
+            remaining -= np.where(drawn, value, 0)
+        return data
+
+    def outcomes(self, num_options, correct_index, size=None):
+        """
+        Draw all three lifeline outcomes for each question.
+
+        Returns:
+            LifelineOutcomes: eliminated, friend and audience arrays
+        """
+        num_options, correct_index = _broadcast(
+            num_options, correct_index, size
+        )
+        return LifelineOutcomes(
+            self.eliminations(num_options, correct_index),
+            self.friend_picks(num_options, correct_index),
+            self.audience(num_options, correct_index),
+        )
+
+
+def _broadcast(num_options, correct_index, size):
+    """Turn scalar or array arguments into matching int arrays."""
+    shape = size if size is not None else np.broadcast(
+        np.asarray(num_options), np.asarray(correct_index)
+    ).shape
+    num_options = np.broadcast_to(np.asarray(num_options, dtype=np.int64), shape)
+    correct_index = np.broadcast_to(
+        np.asarray(correct_index, dtype=np.int64), shape
+    )
+    return num_options.reshape(-1), correct_index.reshape(-1)
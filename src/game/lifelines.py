@@ -11,7 +11,7 @@ from src.config import (
 from src.ui.animations import animate_text, fade_out_text
 
 
-def use_50_50_lifeline(canvas, correct_letter, answer_ids):
+def use_50_50_lifeline(canvas, correct_letter, answer_ids, eliminated=None):
     """
     Implement 50/50 lifeline - eliminate two wrong answers.
     
@@ -19,11 +19,13 @@ def use_50_50_lifeline(canvas, correct_letter, answer_ids):
         canvas: Canvas object
         correct_letter: Letter of correct answer
         answer_ids: Dictionary mapping letters to text IDs
+        eliminated: Letters to eliminate (picked at random if None)
     """
-    # Only use letters that actually exist in answer_ids
-    available_letters = list(answer_ids.keys())
-    wrong_choices = [c for c in available_letters if c != correct_letter]
-    eliminated = random.sample(wrong_choices, min(2, len(wrong_choices)))
+    if eliminated is None:
+        # Only use letters that actually exist in answer_ids
+        eliminated = pick_eliminated_letters(
+            list(answer_ids.keys()), correct_letter
+        )
     
     for letter in eliminated:
         # Instant elimination - no animation
@@ -31,26 +33,57 @@ def use_50_50_lifeline(canvas, correct_letter, answer_ids):
         canvas.set_color(answer_ids[letter], "gray")
 
 
-def use_phone_friend_lifeline(canvas, question):
+def pick_eliminated_letters(letters, correct_letter, rng=random):
     """
-    Implement phone a friend lifeline - show friend's suggestion.
+    Pick the wrong answers removed by the 50/50 lifeline.
     
     Args:
-        canvas: Canvas object
-        question: Question dictionary with options and answer
+        letters: Answer letters on screen
+        correct_letter: Letter of correct answer
+        rng: Random source (module or random.Random instance)
     
     Returns:
-        text_id: ID of the displayed message
+        list: Up to two eliminated letters
     """
-    choices = question["options"]
-    correct_answer = question["answer"]
+    wrong_choices = [c for c in letters if c != correct_letter]
+    return rng.sample(wrong_choices, min(2, len(wrong_choices)))
+
+
+def pick_friend_choice(choices, correct_answer, rng=random):
+    """
+    Pick the option suggested by the friend (80% chance of being correct).
+    
+    Args:
+        choices: List of answer options
+        correct_answer: Correct option text
+        rng: Random source (module or random.Random instance)
     
-    # Friend has 80% chance of being correct
+    Returns:
+        str: Option suggested by the friend
+    """
     weights = [
         0.8 if choice == correct_answer else 0.2/(len(choices)-1) 
         for choice in choices
     ]
-    friend_choice = random.choices(choices, weights=weights, k=1)[0]
+    return rng.choices(choices, weights=weights, k=1)[0]
+
+
+def use_phone_friend_lifeline(canvas, question, friend_choice=None):
+    """
+    Implement phone a friend lifeline - show friend's suggestion.
+    
+    Args:
+        canvas: Canvas object
+        question: Question record
+        friend_choice: Option the friend suggests (picked at random if None)
+    
+    Returns:
+        text_id: ID of the displayed message
+    """
+    if friend_choice is None:
+        friend_choice = pick_friend_choice(
+            question.options, question.answer
+        )
     
     # Display panel
     _draw_phone_panel(canvas)
@@ -81,14 +114,16 @@ def _draw_phone_panel(canvas):
     )
 
 
-def use_audience_poll_lifeline(canvas, question, correct_letter):
+def use_audience_poll_lifeline(canvas, question, correct_letter, 
+                               audience_data=None):
     """
     Implement audience poll lifeline - show poll results.
     
     Args:
         canvas: Canvas object
-        question: Question dictionary
+        question: Question record
         correct_letter: Letter of correct answer
+        audience_data: Poll percentages (generated if None)
     
     Returns:
         tuple: (bar_ids, text_ids, title_id)
@@ -96,43 +131,44 @@ def use_audience_poll_lifeline(canvas, question, correct_letter):
     letters = ['A', 'B', 'C', 'D']
     correct_index = ord(correct_letter) - ord('A')
     
-    # Generate audience poll data (90% chance correct answer is highest)
-    audience_data = _generate_audience_data(
-        len(question["options"]), 
-        correct_index
-    )
+    if audience_data is None:
+        # Generate audience poll data (90% chance correct answer is highest)
+        audience_data = _generate_audience_data(
+            len(question.options), 
+            correct_index
+        )
     
     # Display poll results
     return _draw_audience_poll(canvas, audience_data, letters)
 
 
-def _generate_audience_data(num_options, correct_index):
+def _generate_audience_data(num_options, correct_index, rng=random):
     """Generate realistic audience poll percentages."""
-    correct_highest = random.random() < 0.9
+    correct_highest = rng.random() < 0.9
     audience_data = [0] * num_options
     
     if correct_highest:
-        audience_data[correct_index] = random.randint(60, 80)
+        audience_data[correct_index] = rng.randint(60, 80)
         remaining = 100 - audience_data[correct_index]
         non_correct = [i for i in range(num_options) if i != correct_index]
         for i in non_correct[:-1]:
-            audience_data[i] = random.randint(0, min(20, remaining))
+            audience_data[i] = rng.randint(0, min(20, remaining))
             remaining -= audience_data[i]
         audience_data[non_correct[-1]] = remaining
     else:
-        incorrect_index = random.choice(
+        incorrect_index = rng.choice(
             [i for i in range(num_options) if i != correct_index]
         )
-        audience_data[incorrect_index] = random.randint(50, 70)
+        audience_data[incorrect_index] = rng.randint(50, 70)
         remaining = 100 - audience_data[incorrect_index]
-        audience_data[correct_index] = random.randint(20, min(40, remaining))
+        audience_data[correct_index] = rng.randint(20, min(40, remaining))
         remaining -= audience_data[correct_index]
         other_indices = [
             i for i in range(num_options) 
             if i not in [correct_index, incorrect_index]
         ]
         for i in other_indices[:-1]:
-            audience_data[i] = random.randint(0, min(15, remaining))
+            audience_data[i] = rng.randint(0, min(15, remaining))
             remaining -= audience_data[i]
         if other_indices:
             audience_data[other_indices[-1]] = remaining
@@ -0,0 +1,307 @@
+"""
+Question index for Movie Mania.
+
+Buckets question positions by difficulty, by genre and by both, once,
+so picking a game's questions never scans the whole bank. Samples are
+drawn from a bucket, or a union of buckets, without copying any of them.
+"""
+
+import array
+import bisect
+import itertools
+import random
+from src.config import QUESTION_BANK, CALIBRATED_DIFFICULTY
+from src.data.binary_store import BinaryQuestionStore, STORE_SUFFIX
+from src.data.loaders import open_bank
+from src.data import questions as builtin_questions
+from src.data.records import Question, question_hash
+from src.game.calibration import default_calibration
+
+
+class QuestionIndex:
+    """Question positions bucketed by difficulty and genre."""
+
+    def __init__(self, questions=None):
+        """
+        Build the index in one pass over the bank.
+
+        Args:
+            questions: List of Question records, a lazy bank from
+                src.data.loaders or a BinaryQuestionStore to index
+                (the built-in questions if None)
+        """
+        if questions is None:
+            questions = [
+                Question.from_dict(q, qid)
+                for qid, q in enumerate(builtin_questions.QUESTIONS)
+            ]
+        self.questions = questions
+        self.by_difficulty = {}
+        self.by_genre = {}
+        self.by_both = {}
+        self._hashes = None
+        if hasattr(questions, 'index_buckets'):
+            # Binary stores are sorted into contiguous bucket ranges
+            self._use_ranges(questions.index_buckets())
+            return
+        if hasattr(questions, 'index_keys'):
+            # Lazy banks report keys without fetching each question
+            keys = questions.index_keys()
+        else:
+            keys = ((q.difficulty, q.genre) for q in questions)
+        for position, (difficulty, genre) in enumerate(keys):
+            for buckets, key in ((self.by_difficulty, difficulty),
+                                 (self.by_genre, genre),
+                                 (self.by_both, (difficulty, genre))):
+                bucket = buckets.get(key)
+                if bucket is None:
+                    bucket = buckets[key] = array.array('l')
+                bucket.append(position)
+
+    def __len__(self):
+        return len(self.questions)
+
+    def question_hashes(self):
+        """
+        question_hash() of every question's text, by bank position.
+
+        State kept about questions (calibration, seen questions) is
+        matched to a reloaded bank by these, since an edited bank can
+        hold other questions at the same positions.
+        Computed on first use; lazy banks supply them from their scan.
+
+        Returns:
+            array or memoryview: 64-bit hashes (shared, do not modify)
+        """
+        if self._hashes is None:
+            if hasattr(self.questions, 'question_hashes'):
+                self._hashes = self.questions.question_hashes()
+            else:
+                self._hashes = array.array(
+                    'Q', (question_hash(q.question) for q in self.questions)
+                )
+        return self._hashes
+
+    def _use_ranges(self, ranges):
+        """Build the buckets from (difficulty, genre) -> range of positions."""
+        by_difficulty = {}
+        by_genre = {}
+        for (difficulty, genre), positions in sorted(
+                ranges.items(), key=lambda item: item[1].start):
+            self.by_both[(difficulty, genre)] = positions
+            by_difficulty.setdefault(difficulty, []).append(positions)
+            by_genre.setdefault(genre, []).append(positions)
+        self.by_difficulty = {d: _Chain(p) for d, p in by_difficulty.items()}
+        self.by_genre = {g: _Chain(p) for g, p in by_genre.items()}
+
+    def relabeled(self, difficulties):
+        """
+        Index of the same bank with different difficulty labels.
+
+        Args:
+            difficulties: Difficulty label for every bank position
+
+        Returns:
+            QuestionIndex: New index sharing the bank and genre buckets
+        """
+        index = QuestionIndex.__new__(QuestionIndex)
+        index.questions = self.questions
+        index._hashes = self._hashes
+        index.by_genre = self.by_genre
+        index.by_difficulty = {}
+        index.by_both = {}
+        for genre, positions in self.by_genre.items():
+            for position in positions:
+                difficulty = difficulties[position]
+                for buckets, key in ((index.by_difficulty, difficulty),
+                                     (index.by_both, (difficulty, genre))):
+                    bucket = buckets.get(key)
+                    if bucket is None:
+                        bucket = buckets[key] = array.array('l')
+                    bucket.append(position)
+        return index
+
+    def genres(self):
+        """Return the genres in the bank, sorted."""
+        return sorted(self.by_genre)
+
+    def bucket(self, difficulty=None, genre=None):
+        """
+        Positions of the questions matching a difficulty and/or genre.
+
+        Args:
+            difficulty: 'easy', 'medium', 'hard' or None for any
+            genre: Genre name or None for any
+
+        Returns:
+            sequence: Matching positions (shared, do not modify)
+        """
+        if difficulty is None and genre is None:
+            return range(len(self.questions))
+        if difficulty is None:
+            return self.by_genre.get(genre, [])
+        if genre is None:
+            return self.by_difficulty.get(difficulty, [])
+        return self.by_both.get((difficulty, genre), [])
+
+    def buckets(self, difficulty=None, genres=None):
+        """
+        Buckets for a difficulty across several genres.
+
+        Args:
+            difficulty: Difficulty name or None for any
+            genres: Genre name, list of genre names, or None for any
+
+        Returns:
+            list: Position sequences whose union matches (a genre named
+            twice is used once, so no question can be picked twice)
+        """
+        if genres is None or isinstance(genres, str):
+            return [self.bucket(difficulty, genres)]
+        return [self.bucket(difficulty, genre) for genre in dict.fromkeys(genres)]
+
+    def count(self, difficulty=None, genres=None):
+        """Number of questions matching a difficulty and genre(s)."""
+        return sum(len(b) for b in self.buckets(difficulty, genres))
+
+    def sample(self, k, difficulty=None, genres=None, rng=random):
+        """
+        Pick k distinct questions matching a difficulty and genre(s).
+
+        Args:
+            k: Number of questions to pick
+            difficulty: Difficulty name or None for any
+            genres: Genre name, list of genre names, or None for any
+            rng: random.Random (or the random module) to draw with
+
+        Returns:
+            list: k Question records
+
+        Raises:
+            ValueError: If fewer than k questions match
+        """
+        questions = self.questions
+        return [
+            questions[p]
+            for p in self.sample_positions(k, difficulty, genres, rng)
+        ]
+
+    def sample_positions(self, k, difficulty=None, genres=None, rng=random):
+        """
+        Pick k distinct bank positions matching a difficulty and genre(s).
+
+        Draws k offsets into the concatenation of the matching buckets
+        and maps each back to its bucket with a binary search, so the
+        cost depends on k and the number of buckets, not the bank size.
+
+        Args:
+            k: Number of positions to pick
+            difficulty: Difficulty name or None for any
+            genres: Genre name, list of genre names, or None for any
+            rng: random.Random (or the random module) to draw with
+
+        Returns:
+            list: k positions in the bank
+
+        Raises:
+            ValueError: If fewer than k questions match
+        """
+        buckets = [b for b in self.buckets(difficulty, genres) if b]
+        ends = []
+        total = 0
+        for b in buckets:
+            total += len(b)
+            ends.append(total)
+        if total < k:
+            raise ValueError(
+                f"Only {total} {difficulty or 'any'} questions for "
+                f"genre {genres or 'any'}, need {k}"
+            )
+
+        picked = []
+        for offset in rng.sample(range(total), k):
+            i = bisect.bisect_right(ends, offset)
+            start = ends[i - 1] if i else 0
+            picked.append(buckets[i][offset - start])
+        return picked
+
+
+class _Chain:
+    """Read-only sequence made of several ranges laid end to end."""
+
+    def __init__(self, parts):
+        self.parts = parts
+        self.ends = list(itertools.accumulate(len(p) for p in parts))
+
+    def __len__(self):
+        return self.ends[-1] if self.ends else 0
+
+    def __getitem__(self, i):
+        part = bisect.bisect_right(self.ends, i)
+        start = self.ends[part - 1] if part else 0
+        return self.parts[part][i - start]
+
+
+_default_index = None
+
+
+def load_index(bank=QUESTION_BANK):
+    """
+    Open a question bank and index it.
+
+    With CALIBRATED_DIFFICULTY, questions are banded by their calibrated
+    difficulty instead of their labels (estimates are matched to the
+    bank's questions by text hash).
+
+    Args:
+        bank: Path to a bank file or .mmqb store, or None for the
+            built-in questions
+
+    Returns:
+        QuestionIndex: New index over the bank
+    """
+    if bank and bank.endswith(STORE_SUFFIX):
+        index = QuestionIndex(BinaryQuestionStore(bank))
+    elif bank:
+        index = QuestionIndex(open_bank(bank))
+    else:
+        index = QuestionIndex()
+    if CALIBRATED_DIFFICULTY:
+        calibration = default_calibration(index)
+        if calibration is not None:
+            index = index.relabeled(calibration.difficulty_labels(index))
+    return index
+
+
+def default_index():
+    """
+    Index of the configured question bank, built on first use.
+
+    Uses the file named by QUESTION_BANK if set, otherwise the built-in
+    questions.
+
+    Returns:
+        QuestionIndex: Shared index over the question bank
+    """
+    global _default_index
+    if _default_index is None:
+        _default_index = load_index()
+    return _default_index
+
+
+def set_default_index(index):
+    """
+    Replace the shared index, e.g. with a reloaded bank.
+
+    Games pick their questions up front, so a game in progress keeps
+    the questions it started with.
+
+    Args:
+        index: New QuestionIndex
+
+    Returns:
+        QuestionIndex or None: The index it replaces
+    """
+    global _default_index
+    previous, _default_index = _default_index, index
+    return previous
@@ -2,75 +2,65 @@
 Question management for Movie Mania game.
 """
 
+import itertools
 import random
-from src.data.questions import QUESTIONS
+from src.data.loaders import MAX_OPTIONS
+from src.game.question_index import default_index
 from src.config import (
     EASY_QUESTIONS_COUNT, MEDIUM_QUESTIONS_COUNT, 
     HARD_QUESTIONS_COUNT
 )
 
 
-def select_game_questions():
+# Every ordering of 1-4 options, so a shuffle is one random draw
+_PERMUTATIONS = {
+    n: tuple(itertools.permutations(range(n))) for n in range(1, MAX_OPTIONS + 1)
+}
+
+
+def select_game_questions(genre=None, index=None, rng=random):
     """
     Select questions for a game session.
     Selects 2 easy, 3 medium, 3 hard questions, ordered by difficulty.
     
+    Args:
+        genre: Optional genre name, or list of genres, for a themed game
+        index: QuestionIndex to pick from (built-in bank if None)
+        rng: random.Random (or the random module) to pick with
+    
     Returns:
         list: Selected questions ordered by difficulty
     
     Raises:
         ValueError: If insufficient questions in any category
     """
-    easy = [q for q in QUESTIONS if q['difficulty'] == 'easy']
-    medium = [q for q in QUESTIONS if q['difficulty'] == 'medium']
-    hard = [q for q in QUESTIONS if q['difficulty'] == 'hard']
-    
-    if (len(easy) < EASY_QUESTIONS_COUNT or 
-        len(medium) < MEDIUM_QUESTIONS_COUNT or 
-        len(hard) < HARD_QUESTIONS_COUNT):
-        raise ValueError("Insufficient questions in one or more categories")
+    if index is None:
+        index = default_index()
     
-    selected = (
-        random.sample(easy, EASY_QUESTIONS_COUNT) +
-        random.sample(medium, MEDIUM_QUESTIONS_COUNT) +
-        random.sample(hard, HARD_QUESTIONS_COUNT)
-    )
-    
-    # Sort by difficulty
-    difficulty_order = {'easy': 1, 'medium': 2, 'hard': 3}
-    selected.sort(key=lambda x: difficulty_order[x['difficulty']])
+    selected = []
+    for difficulty, count in (('easy', EASY_QUESTIONS_COUNT),
+                              ('medium', MEDIUM_QUESTIONS_COUNT),
+                              ('hard', HARD_QUESTIONS_COUNT)):
+        if index.count(difficulty, genre) < count:
+            raise ValueError("Insufficient questions in one or more categories")
+        selected += index.sample(count, difficulty, genre, rng)
     
     return selected
 
 
-def shuffle_question_options(question):
+def shuffle_question_options(question, rng=random):
     """
-    Shuffle answer options and update answer letter accordingly.
+    Shuffle answer options; the answer index moves with its option.
     
     Args:
-        question: Question dictionary to shuffle
+        question: Question record to shuffle
+        rng: random.Random (or the random module) to shuffle with
     
     Returns:
-        dict: Question with shuffled options and updated answer_letter
+        Question: New record with shuffled options and audience data
     """
-    # Keep original options before shuffling
-    original_options = question["options"].copy()
-    options = question["options"].copy()
-    random.shuffle(options)
-    
-    # Find new position of correct answer
-    new_answer_index = options.index(question["answer"])
-    question["options"] = options
-    question["answer_letter"] = chr(ord('A') + new_answer_index)
-    
-    # Rearrange audience poll data to match new order
-    new_audience = [0] * len(options)
-    for i, opt in enumerate(options):
-        old_index = original_options.index(opt)
-        new_audience[i] = question["audience"][old_index]
-    question["audience"] = new_audience
-    
-    return question
+    permutations = _PERMUTATIONS[len(question.options)]
+    return question.shuffled(permutations[int(rng.random() * len(permutations))])
 
 
 def get_prize_text(question_num):
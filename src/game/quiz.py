@@ -2,12 +2,12 @@
 Main quiz game loop for Movie Mania.
 """
 
-import time
 from graphics import Canvas
 from src.config import (
-    WIDTH, HEIGHT, TIMER_DURATION, PRIZE_VALUES, 
+    WIDTH, HEIGHT, PRIZE_VALUES, 
     QUESTION_FONT, TEXT_COLOR, GLOW_COLOR, BLINK_DURATION
 )
+from src.ui.pacing import pause, idle, now
 from src.ui.graphics import (
     create_cinematic_background, draw_progress_bar, 
     draw_title_with_shadow, draw_answer_options
@@ -26,78 +26,80 @@ from src.game.input import (
     show_correct_answer_effect
 )
 from src.game.questions import get_prize_text
+from src.game.session import (
+    GameSession, READY, PLAYING, WON, ANSWER_LETTERS
+)
+from src.game.telemetry import GameTelemetry, default_sink
 
 
-def run_quiz_game(canvas, selected_questions):
+def run_quiz_game(canvas, selected_questions, session=None, telemetry=None):
     """
     Run the main quiz game loop.
     
+    The game rules live in a GameSession; this window is just one
+    subscriber that draws each transition the session reports.
+    
     Args:
         canvas: Canvas object
         selected_questions: List of questions for the game
+        session: Optional GameSession to drive (created if None)
+        telemetry: Optional GameTelemetry (default sink if None)
     
     Returns:
         int: Final score (number of correct answers)
     """
-    lifelines = {"5050": False, "phone": False, "audience": False}
-    score = 0
+    if session is None:
+        session = GameSession(selected_questions)
+    if telemetry is None:
+        telemetry = GameTelemetry(default_sink())
+    telemetry.subscribe(session)
+    view = {}
+    session.subscribe(
+        lambda transition: _render_transition(canvas, view, transition)
+    )
     
-    for i, question in enumerate(selected_questions):
-        result = play_question(canvas, question, i, lifelines)
-        
-        if result == "correct":
-            score += 1
-            # No extra wait - already waited in _handle_answer
-        elif result == "wrong":
-            # Show prize for partial completion
-            prize_text = get_prize_text(score)
-            show_prize_screen(canvas, score, prize_text, game_over=True, 
-                            correct_answer=question['answer'])
-            canvas.wait_for_click()
-            return score
-        elif result == "timeout":
-            # Show prize for partial completion
-            prize_text = get_prize_text(score)
-            show_prize_screen(canvas, score, prize_text, game_over=True, 
-                            correct_answer=question['answer'])
-            canvas.wait_for_click()
-            return score
-    
-    # All questions answered correctly - WINNER!
-    prize_text = get_prize_text(score)
-    show_prize_screen(canvas, score, prize_text, game_over=False)
-    return score
-
-
-def play_question(canvas, question, question_index, lifelines):
+    telemetry.game_started(selected_questions)
+    while session.state == READY:
+        play_question(canvas, session, view)
+    telemetry.game_finished(session)
+    
+    prize_text = get_prize_text(session.score)
+    if session.state == WON:
+        # All questions answered correctly - WINNER!
+        show_prize_screen(canvas, session.score, prize_text, game_over=False)
+    else:
+        # Wrong answer or timeout - show prize for partial completion
+        show_prize_screen(canvas, session.score, prize_text, game_over=True, 
+                        correct_answer=session.question.answer)
+        canvas.wait_for_click()
+    return session.score
+
+
+def play_question(canvas, session, view):
     """
-    Display and handle a single question.
+    Display and handle the session's current question.
     
     Args:
         canvas: Canvas object
-        question: Question dictionary
-        question_index: Index of current question
-        lifelines: Dictionary of lifeline usage status
+        session: GameSession being played
+        view: Dictionary holding canvas IDs for the question screen
     
     Returns:
-        str: Result - "correct", "wrong", or "timeout"
+        str: Session state after the question
     """
-    # Setup display
-    correct_letter = question['answer_letter']
-    correct_answer = question['answer']
-    time_left_id = create_timer_display(canvas)
-    audience_elements = ([], [], None)
-    phone_text_id = None
-    
-    # Draw question UI
-    answer_ids = _draw_question_ui(canvas, question, question_index, lifelines)
-    
-    # Question loop
-    return _question_loop(
-        canvas, question, correct_letter, correct_answer,
-        answer_ids, lifelines, time_left_id, 
-        False, audience_elements, phone_text_id
+    question = session.question
+    view["question"] = question
+    view["audience_elements"] = ([], [], None)
+    view["phone_text_id"] = None
+    
+    # Draw question UI, then the timer on top of it
+    view["answer_ids"] = _draw_question_ui(
+        canvas, question, session.index, session.lifelines
     )
+    view["time_left_id"] = create_timer_display(canvas)
+    
+    session.begin(now())
+    return _question_loop(canvas, session)
 
 
 def _draw_question_ui(canvas, question, question_index, lifelines):
@@ -108,19 +110,19 @@ def _draw_question_ui(canvas, question, question_index, lifelines):
     draw_title_with_shadow(canvas, "MOVIE MANIA", WIDTH//2, 80)
     
     canvas.create_text(
-        WIDTH//2, 120, text=f"Genre: {question['genre']}", 
+        WIDTH//2, 120, text=f"Genre: {question.genre}", 
         font=QUESTION_FONT, font_size=20, 
         color=TEXT_COLOR, anchor="center"
     )
     
     # Display question instantly - no animation
     canvas.create_text(
-        WIDTH//2, 180, text=f"Q{question_index+1}: {question['question']}", 
+        WIDTH//2, 180, text=f"Q{question_index+1}: {question.question}", 
         font=QUESTION_FONT, font_size=24, 
         color=TEXT_COLOR, anchor="center"
     )
     
-    answer_ids = draw_answer_options(canvas, question["options"])
+    answer_ids = draw_answer_options(canvas, question.options)
     _draw_lifeline_menu(canvas, lifelines)
     
     return answer_ids
@@ -146,70 +148,69 @@ def _draw_lifeline_menu(canvas, lifelines):
     return lifeline_id
 
 
-def _question_loop(canvas, question, correct_letter, correct_answer,
-                   answer_ids, lifelines, time_left_id, 
-                   audience_active, audience_elements, phone_text_id):
+def _question_loop(canvas, session):
     """Main question timing and input loop."""
-    time_left = TIMER_DURATION
-    start_time = time.time()
-    
-    while time_left > 0:
+    while session.state == PLAYING:
         # Check for input
-        key = wait_for_answer_or_lifeline(canvas, lifelines)
+        key = wait_for_answer_or_lifeline(canvas, session.lifelines)
         
-        if key in ['A', 'B', 'C', 'D']:
-            return _handle_answer(
-                canvas, key, correct_letter, correct_answer,
-                audience_elements, phone_text_id
-            )
+        if key in ANSWER_LETTERS:
+            session.answer(key, now())
         elif key in ['1', '2', '3']:
-            audience_active, audience_elements, phone_text_id = _handle_lifeline(
-                canvas, key, question, correct_letter, 
-                answer_ids, lifelines, audience_elements, phone_text_id
-            )
+            session.use_lifeline(int(key))
         
         # Update timer
-        time_left = max(0, TIMER_DURATION - int(time.time() - start_time))
-        update_timer_display(canvas, time_left_id, time_left)
-        time.sleep(0.005)
-    
-    # Timeout
-    _cleanup_lifeline_displays(canvas, audience_elements, phone_text_id)
-    flash_timer_timeout(canvas, time_left_id)
-    return "timeout"
+        if session.state == PLAYING:
+            session.tick(now())
+            idle(0.005)
+    
+    return session.state
+
+
+def _render_transition(canvas, view, transition):
+    """Draw a single session transition on the canvas."""
+    event = transition.event
+    if event == "tick":
+        update_timer_display(canvas, view["time_left_id"], transition.data)
+    elif event == "lifeline":
+        _handle_lifeline(canvas, view, *transition.data)
+    elif event in ("correct", "wrong"):
+        _handle_answer(canvas, view, transition)
+    elif event == "timeout":
+        _cleanup_lifeline_displays(
+            canvas, view["audience_elements"], view["phone_text_id"]
+        )
+        flash_timer_timeout(canvas, view["time_left_id"])
 
 
-def _handle_answer(canvas, key, correct_letter, correct_answer,
-                   audience_elements, phone_text_id):
+def _handle_answer(canvas, view, transition):
     """Handle answer selection."""
-    highlight_selected_answer(canvas, key)
-    _cleanup_lifeline_displays(canvas, audience_elements, phone_text_id)
+    highlight_selected_answer(canvas, transition.data)
+    _cleanup_lifeline_displays(
+        canvas, view["audience_elements"], view["phone_text_id"]
+    )
     
-    if key == correct_letter:
+    if transition.event == "correct":
         show_correct_answer_effect(canvas)
-        time.sleep(0.3)  # Very brief pause to see correct answer
-        return "correct"
-    else:
-        return "wrong"
+        pause(0.3)  # Very brief pause to see correct answer
 
 
-def _handle_lifeline(canvas, key, question, correct_letter, 
-                     answer_ids, lifelines, audience_elements, phone_text_id):
+def _handle_lifeline(canvas, view, name, outcome):
     """Handle lifeline usage."""
-    if key == '1':
-        use_50_50_lifeline(canvas, correct_letter, answer_ids)
-        lifelines["5050"] = True
-    elif key == '2':
-        phone_text_id = use_phone_friend_lifeline(canvas, question)
-        lifelines["phone"] = True
-    elif key == '3':
-        audience_elements = use_audience_poll_lifeline(
-            canvas, question, correct_letter
+    question = view["question"]
+    correct_letter = question.answer_letter
+    if name == "5050":
+        use_50_50_lifeline(
+            canvas, correct_letter, view["answer_ids"], eliminated=outcome
+        )
+    elif name == "phone":
+        view["phone_text_id"] = use_phone_friend_lifeline(
+            canvas, question, friend_choice=outcome
+        )
+    elif name == "audience":
+        view["audience_elements"] = use_audience_poll_lifeline(
+            canvas, question, correct_letter, audience_data=outcome
         )
-        lifelines["audience"] = True
-        return True, audience_elements, phone_text_id
-    
-    return False, audience_elements, phone_text_id
 
 
 def _cleanup_lifeline_displays(canvas, audience_elements, phone_text_id):
@@ -0,0 +1,240 @@
+"""
+Recording and replay of whole games.
+
+A recording holds the RNG seed, the selected questions with their
+option shuffles, and every key press and click with its time since the
+screen it happened on was drawn. Replaying it feeds the same input back
+into the game at real time, N times faster or without any delays.
+"""
+
+import gzip
+import json
+import random
+from src.data.records import question_hash
+from src.game.question_index import default_index
+from src.ui.pacing import now
+
+# Version 2 reseeds random once the questions are prepared, so lifeline
+# outcomes do not depend on how many draws question selection took.
+# Version 3 adds each question's hash, so a replay finds its questions
+# after the bank has changed, or refuses to run if they are gone.
+RECORDING_VERSION = 3
+SUPPORTED_VERSIONS = (1, 2, 3)
+
+
+class ReplayFinished(Exception):
+    """Raised when a replayed game asks for input the recording lacks."""
+
+
+class GameRecorder:
+    """
+    Records a game as it is played.
+
+    Attach as the canvas input_observer, and pass to play_game so the
+    prepared questions are captured.
+    """
+
+    def __init__(self, seed):
+        """
+        Create a recorder.
+
+        Args:
+            seed: Seed the global random module was seeded with
+        """
+        self.seed = seed
+        self.questions = []
+        self.hashes = []
+        self.permutations = []
+        self.events = []
+        self.screen = -1
+        self.screen_start = now()
+
+    def on_clear(self):
+        """Canvas was cleared: a new screen starts."""
+        self.screen += 1
+        self.screen_start = now()
+
+    def on_keys(self, keys):
+        """Canvas delivered key presses to the game."""
+        offset = self._offset()
+        for key in keys:
+            self.events.append([self.screen, offset, key])
+
+    def on_click(self):
+        """Canvas delivered a mouse click to the game."""
+        self.events.append([self.screen, self._offset(), None])
+
+    def prepare_questions(self, selected, prepared):
+        """
+        Capture the questions chosen for the game.
+
+        Args:
+            selected: Questions as picked from the bank
+            prepared: The same questions with shuffled options (each
+                record's qid and order say where it came from)
+
+        Returns:
+            list: prepared, unchanged (random is reseeded)
+        """
+        for question in prepared:
+            self.questions.append(question.qid)
+            self.hashes.append(question_hash(question.question))
+            self.permutations.append(list(question.order))
+        random.seed(self.seed)
+        return prepared
+
+    def save(self, path):
+        """
+        Write the recording as gzip-compressed JSON.
+
+        Args:
+            path: Output file path
+        """
+        data = {
+            "version": RECORDING_VERSION,
+            "seed": self.seed,
+            "questions": self.questions,
+            "hashes": self.hashes,
+            "permutations": self.permutations,
+            "screens": self.screen + 1,
+            "events": self.events,
+        }
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+
+    def _offset(self):
+        """Milliseconds since the current screen started."""
+        return int((now() - self.screen_start) * 1000)
+
+
+class GameReplayer:
+    """
+    Replays a recorded game.
+
+    Attach as both the canvas input_script and input_observer, and pass
+    to play_game so the recorded questions are used.
+    """
+
+    def __init__(self, data):
+        """
+        Create a replayer from loaded recording data.
+
+        Args:
+            data: Dictionary read by load()
+        """
+        self.version = data.get("version")
+        if self.version not in SUPPORTED_VERSIONS:
+            raise ValueError(f"Unsupported recording version: {self.version}")
+        self.seed = data["seed"]
+        self.questions = data["questions"]
+        # Question hashes (version 3 on; older recordings trust the qids)
+        self.hashes = data.get("hashes")
+        self.permutations = data["permutations"]
+        self.screens = data["screens"]
+        self.events = data["events"]
+        self.position = 0
+        self.screen = -1
+        self.screen_start = now()
+
+    @classmethod
+    def load(cls, path):
+        """
+        Read a recording file.
+
+        Args:
+            path: Recording file path
+
+        Returns:
+            GameReplayer: Replayer for the recording
+        """
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def on_clear(self):
+        """Canvas was cleared: a new screen starts."""
+        self.screen += 1
+        self.screen_start = now()
+
+    def on_keys(self, keys):
+        """Replayed keys need no recording."""
+
+    def on_click(self):
+        """Replayed clicks need no recording."""
+
+    def next_keys(self):
+        """Recorded keys that are due on the current screen."""
+        keys = []
+        while self._due() and self.events[self.position][2] is not None:
+            keys.append(self.events[self.position][2])
+            self.position += 1
+        if not keys:
+            self._check_finished()
+        return keys
+
+    def next_click(self):
+        """Whether a recorded click is due on the current screen."""
+        if self._due() and self.events[self.position][2] is None:
+            self.position += 1
+            return True
+        self._check_finished()
+        return False
+
+    def _check_finished(self):
+        """Stop the replay once the recorded input has run out."""
+        if self.position >= len(self.events) and self.screen >= self.screens - 1:
+            raise ReplayFinished("Recording ends here")
+
+    def prepare_questions(self, selected, prepared):
+        """
+        Swap in the recorded questions and shuffles.
+
+        Args:
+            selected: Questions picked in this run (ignored)
+            prepared: Shuffled questions from this run (ignored)
+
+        Returns:
+            list: Recorded questions with recorded option order
+        """
+        index = default_index()
+        questions = [
+            index.questions[i].shuffled(permutation)
+            for i, permutation in zip(self.bank_positions(index), self.permutations)
+        ]
+        if self.version >= 2:
+            random.seed(self.seed)
+        return questions
+
+    def bank_positions(self, index=None):
+        """
+        Where the recorded questions are in the current bank.
+
+        Args:
+            index: QuestionIndex to look in (default: the shared index)
+
+        Returns:
+            list: Bank position of each recorded question
+
+        Raises:
+            ValueError: If a recorded question is no longer in the bank
+        """
+        if self.hashes is None:
+            return self.questions
+        index = index or default_index()
+        positions = {h: i for i, h in enumerate(index.question_hashes())}
+        missing = sum(h not in positions for h in self.hashes)
+        if missing:
+            raise ValueError(
+                f"{missing} recorded question(s) are no longer in the question bank"
+            )
+        return [positions[h] for h in self.hashes]
+
+    def _due(self):
+        """Whether the next event belongs to this screen and is due."""
+        if self.position >= len(self.events):
+            return False
+        screen, offset, _ = self.events[self.position]
+        if screen < self.screen:
+            # Screen already gone in this run: drop the stale event
+            self.position += 1
+            return self._due()
+        return screen == self.screen and (now() - self.screen_start) * 1000 >= offset
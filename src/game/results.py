@@ -0,0 +1,417 @@
+"""
+Game results store for Movie Mania.
+
+Every finished game is kept for content tuning: when it was played, its
+score, prize, outcome, duration and lifelines, and for each question
+asked its outcome, lifelines and answer time. Games are stored by
+column in blocks, so a query reads and decompresses only the columns
+it needs:
+
+    header   b"MMRS" and the format version ("<4sH")
+    block    "<4sIII": b"MMRB", games, questions and the length of the
+             JSON metadata that follows (byte length and CRC-32 of each
+             column, genre and difficulty names, the tail it sealed),
+             then every column as a zlib-compressed little-endian array
+
+Finished games are first appended to a checksummed JSON lines tail
+file by a background thread. Every RESULTS_BLOCK_GAMES games the tail
+is renamed aside, sealed into one block and deleted; a block names the
+tail it was built from, so a seal interrupted at any point is neither
+lost nor stored twice. Only one game process should write a store.
+
+Writing needs only the standard library; reading and aggregating the
+store is in src/game/results_query.py, which needs NumPy.
+"""
+
+import atexit
+import collections
+import json
+import os
+import struct
+import threading
+import time
+import zlib
+from src.config import RESULTS_FILE, RESULTS_BLOCK_GAMES
+from src.data.records import question_hash
+from src.ui.pacing import now
+
+MAGIC = b"MMRS"
+VERSION = 2
+FILE_HEADER = struct.Struct("<4sH")
+BLOCK_MAGIC = b"MMRB"
+BLOCK_HEADER = struct.Struct("<4sIII")
+
+# Column name and struct type code; one value per game...
+GAME_COLUMNS = (
+    ("time", "I"),          # Unix time the game finished
+    ("score", "B"),         # Questions answered correctly
+    ("prize", "I"),         # Prize amount won
+    ("state", "B"),         # Index into STATES
+    ("duration_ms", "I"),   # Game time from first question to the end
+    ("lifelines", "B"),     # LIFELINE_BITS of the lifelines used
+    ("questions", "B"),     # Questions asked (rows in the q_ columns)
+)
+# ...and one per question asked, game by game
+QUESTION_COLUMNS = (
+    ("q_hash", "Q"),        # question_hash() of the question text
+    ("q_genre", "H"),       # Index into the block's genre names
+    ("q_difficulty", "B"),  # Index into the block's difficulty names
+    ("q_outcome", "B"),     # Index into OUTCOMES
+    ("q_lifelines", "B"),   # LIFELINE_BITS used on the question
+    ("q_ms", "I"),          # Milliseconds until answered or timed out
+)
+COLUMNS = dict(GAME_COLUMNS + QUESTION_COLUMNS)
+
+STATES = ("won", "lost", "timeout")
+OUTCOMES = ("correct", "wrong", "timeout")
+LIFELINE_BITS = {"5050": 1, "phone": 2, "audience": 4}
+
+
+def lifeline_bits(names):
+    """Bit mask of lifeline names."""
+    bits = 0
+    for name in names:
+        bits |= LIFELINE_BITS[name]
+    return bits
+
+
+class ResultsStore:
+    """Appends finished games to the results store from a background thread."""
+
+    def __init__(self, path=RESULTS_FILE, block_games=RESULTS_BLOCK_GAMES):
+        """
+        Create a store and start its writer thread.
+
+        Args:
+            path: Results file (the tail is path + ".tail")
+            block_games: Games per compressed block
+        """
+        self.path = path
+        self.tail = path + ".tail"
+        self.sealing = path + ".sealing"
+        self.block_games = block_games
+        self._pending = collections.deque()
+        self._wakeup = threading.Event()
+        self._closed = False
+        self._tail_games = None
+        self._thread = threading.Thread(
+            target=self._run, name="results-writer", daemon=True
+        )
+        self._thread.start()
+
+    def subscribe(self, session):
+        """
+        Record a session's game when it finishes.
+
+        Args:
+            session: GameSession being played
+        """
+        session.subscribe(_GameRecord(self, session))
+
+    def append(self, game):
+        """
+        Queue a finished game; returns immediately.
+
+        Args:
+            game: Game dict as built by subscribe()
+        """
+        self._pending.append(game)
+        self._wakeup.set()
+
+    def close(self):
+        """Write everything still queued, then stop the thread."""
+        self._closed = True
+        self._wakeup.set()
+        self._thread.join()
+
+    def _run(self):
+        """Write queued games until closed."""
+        try:
+            self._recover()
+        except (OSError, ValueError) as e:
+            print(f"Error recovering results store: {e}")
+        while True:
+            self._wakeup.wait()
+            self._wakeup.clear()
+            try:
+                self._flush()
+            except (OSError, ValueError) as e:
+                print(f"Error saving game results: {e}")
+            if self._closed and not self._pending:
+                return
+
+    def _flush(self):
+        """Append queued games to the tail, sealing it when full."""
+        lines = []
+        while self._pending:
+            lines.append(encode_record(self._pending.popleft()))
+        if not lines:
+            return
+        with open(self.tail, "a", encoding="utf-8") as f:
+            f.writelines(lines)
+        self._tail_games += len(lines)
+        if self._tail_games >= self.block_games:
+            os.replace(self.tail, self.sealing)
+            self._tail_games = 0
+            self._seal()
+
+    def _recover(self):
+        """
+        Finish an interrupted seal, end a line torn by a crash and count
+        the games in the tail.
+        """
+        self._tail_games = 0
+        if os.path.exists(self.sealing):
+            if last_sealed(self.path) == _file_marker(self.sealing):
+                os.remove(self.sealing)
+            else:
+                self._seal()
+        if not os.path.exists(self.tail):
+            return
+        with open(self.tail, "rb+") as f:
+            if f.seek(0, os.SEEK_END):
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    f.write(b"\n")
+        self._tail_games = len(read_records(self.tail))
+
+    def _seal(self):
+        """Turn the renamed-aside tail into a block, then delete it."""
+        games = read_records(self.sealing)
+        if games:
+            block = build_block(games, sealed=_file_marker(self.sealing))
+            _append_block(self.path, block)
+        os.remove(self.sealing)
+
+
+class _GameRecord:
+    """Session listener collecting one game's results."""
+
+    def __init__(self, store, session):
+        self.store = store
+        self.session = session
+        self.start = None
+        self.question_start = None
+        self.question_lifelines = []
+        self.lifelines = []
+        self.questions = []
+
+    def __call__(self, transition):
+        event = transition.event
+        if event == "question":
+            self.question_start = now()
+            self.question_lifelines = []
+            if self.start is None:
+                self.start = self.question_start
+        elif event == "lifeline":
+            self.question_lifelines.append(transition.data[0])
+            self.lifelines.append(transition.data[0])
+        elif event in OUTCOMES:
+            question = self.session.questions[transition.index]
+            self.questions.append([
+                question_hash(question.question), question.genre,
+                question.difficulty, event, self.question_lifelines,
+                int((now() - self.question_start) * 1000)
+            ])
+            if self.session.finished:
+                self._finished()
+
+    def _finished(self):
+        """Queue the finished game on the store."""
+        session = self.session
+        self.store.append({
+            "time": int(time.time()), "score": session.score,
+            "prize": session.prize, "state": session.state,
+            "duration_ms": int((now() - self.start) * 1000),
+            "lifelines": self.lifelines, "questions": self.questions,
+        })
+
+
+def build_block(games, sealed=None):
+    """
+    Encode games as one compressed block.
+
+    Args:
+        games: Game dicts
+        sealed: Marker of the tail file the games came from
+
+    Returns:
+        bytes: The block
+    """
+    columns, genres, difficulties = encode_columns(games)
+    payloads = [zlib.compress(data, 6) for data in columns.values()]
+    meta = json.dumps({
+        "columns": [[name, len(payload), zlib.crc32(payload)]
+                    for name, payload in zip(columns, payloads)],
+        "genres": genres, "difficulties": difficulties, "sealed": sealed,
+    }).encode("utf-8")
+    questions = sum(len(game["questions"]) for game in games)
+    header = BLOCK_HEADER.pack(BLOCK_MAGIC, len(games), questions, len(meta))
+    return b"".join([header, meta] + payloads)
+
+
+def encode_columns(games):
+    """
+    Split games into column arrays.
+
+    Args:
+        games: Game dicts
+
+    Returns:
+        tuple: (column name -> little-endian bytes, genre names,
+        difficulty names)
+    """
+    genres = {}
+    difficulties = {}
+    values = {name: [] for name in COLUMNS}
+    for game in games:
+        values["time"].append(game["time"])
+        values["score"].append(game["score"])
+        values["prize"].append(game["prize"])
+        values["state"].append(STATES.index(game["state"]))
+        values["duration_ms"].append(game["duration_ms"])
+        values["lifelines"].append(lifeline_bits(game["lifelines"]))
+        values["questions"].append(len(game["questions"]))
+        for q_hash, genre, difficulty, outcome, lifelines, ms in game["questions"]:
+            values["q_hash"].append(q_hash)
+            values["q_genre"].append(genres.setdefault(genre, len(genres)))
+            values["q_difficulty"].append(
+                difficulties.setdefault(difficulty, len(difficulties))
+            )
+            values["q_outcome"].append(OUTCOMES.index(outcome))
+            values["q_lifelines"].append(lifeline_bits(lifelines))
+            values["q_ms"].append(ms)
+    columns = {
+        name: struct.pack(f"<{len(values[name])}{code}", *values[name])
+        for name, code in COLUMNS.items()
+    }
+    return columns, list(genres), list(difficulties)
+
+
+def iter_blocks(path):
+    """
+    Yield (offset, games, questions, metadata) for each complete block,
+    stopping at a block torn by a crash.
+
+    Args:
+        path: Results file
+    """
+    try:
+        f = open(path, "rb")
+    except FileNotFoundError:
+        return
+    with f:
+        size = os.fstat(f.fileno()).st_size
+        magic, version = FILE_HEADER.unpack(f.read(FILE_HEADER.size))
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} results file")
+        offset = FILE_HEADER.size
+        while offset + BLOCK_HEADER.size <= size:
+            f.seek(offset)
+            magic, games, questions, meta_length = BLOCK_HEADER.unpack(
+                f.read(BLOCK_HEADER.size)
+            )
+            if magic != BLOCK_MAGIC:
+                return
+            try:
+                meta = json.loads(f.read(meta_length))
+            except ValueError:
+                return
+            end = (offset + BLOCK_HEADER.size + meta_length
+                   + sum(length for _, length, _ in meta["columns"]))
+            if end > size:
+                return
+            yield offset + BLOCK_HEADER.size + meta_length, games, questions, meta
+            offset = end
+
+
+def last_sealed(path):
+    """Tail marker of the last complete block, or None."""
+    sealed = None
+    for *_, meta in iter_blocks(path):
+        sealed = meta.get("sealed")
+    return sealed
+
+
+def _append_block(path, block):
+    """Append a block durably, cutting off any block torn by a crash."""
+    end = None
+    for offset, _, _, meta in iter_blocks(path):
+        end = offset + sum(length for _, length, _ in meta["columns"])
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        if end is None:
+            os.ftruncate(fd, 0)
+            block = FILE_HEADER.pack(MAGIC, VERSION) + block
+            end = 0
+        os.ftruncate(fd, end)
+        os.lseek(fd, end, os.SEEK_SET)
+        os.write(fd, block)
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def encode_record(game):
+    """One checksummed tail line."""
+    payload = json.dumps(game, ensure_ascii=False, separators=(",", ":"))
+    return f"{zlib.crc32(payload.encode('utf-8')):08x} {payload}\n"
+
+
+def read_records(path):
+    """Games in a tail file, skipping torn or corrupt lines."""
+    try:
+        f = open(path, encoding="utf-8", errors="replace")
+    except FileNotFoundError:
+        return []
+    games = []
+    with f:
+        for line in f:
+            checksum, _, payload = line.rstrip("\n").partition(" ")
+            if (line.endswith("\n")
+                    and checksum == f"{zlib.crc32(payload.encode('utf-8')):08x}"):
+                games.append(json.loads(payload))
+    return games
+
+
+def pending_games(path):
+    """
+    Games not yet in a block: those of a seal that did not finish, then
+    the tail's.
+
+    Args:
+        path: Results file
+
+    Returns:
+        list: Game dicts, oldest first
+    """
+    games = []
+    sealing = path + ".sealing"
+    if os.path.exists(sealing) and last_sealed(path) != _file_marker(sealing):
+        games += read_records(sealing)
+    return games + read_records(path + ".tail")
+
+
+def _file_marker(path):
+    """[size, crc32] identifying a file's contents."""
+    with open(path, "rb") as f:
+        data = f.read()
+    return [len(data), zlib.crc32(data)]
+
+
+_default_store = None
+
+
+def default_results():
+    """
+    Shared store for RESULTS_FILE, created on first use and drained at
+    exit.
+
+    Returns:
+        ResultsStore or None: None when results are disabled
+    """
+    global _default_store
+    if _default_store is None and RESULTS_FILE:
+        _default_store = ResultsStore(RESULTS_FILE)
+        atexit.register(_default_store.close)
+    return _default_store
@@ -0,0 +1,251 @@
+"""
+Aggregate queries over the game results store (src/game/results.py).
+
+Each query streams the store block by block, decompressing only the
+columns it uses into NumPy arrays, and reduces every block with a few
+vectorized passes (bincount, unique) before merging the partial
+results, so memory stays at one block however many games are stored.
+Tens of millions of games take seconds.
+
+Requires NumPy (only the results tools need it, not the game).
+"""
+
+import zlib
+from collections import namedtuple
+import numpy as np
+from src.config import RESULTS_FILE
+from src.game.results import (
+    COLUMNS, STATES, OUTCOMES, LIFELINE_BITS, encode_columns, iter_blocks,
+    pending_games
+)
+
+DTYPES = {"B": "<u1", "H": "<u2", "I": "<u4", "Q": "<u8"}
+
+# Answers grouped per sort in question_stats() (about 160 MB of arrays)
+_BATCH_ROWS = 8 * 1024 * 1024
+_MS_MASK = (1 << 30) - 1
+
+# Columns of one block as NumPy arrays, plus its genre and difficulty names
+ResultsBlock = namedtuple('ResultsBlock', ['columns', 'genres', 'difficulties'])
+
+# Per-question totals, one entry per distinct question hash
+QuestionStats = namedtuple(
+    'QuestionStats', ['hashes', 'asked', 'correct', 'timeouts', 'mean_ms']
+)
+
+
+class ResultsReader:
+    """Reads a results store column by column."""
+
+    def __init__(self, path=RESULTS_FILE):
+        """
+        Open a results store for reading.
+
+        Args:
+            path: Results file (its tail and sealing files are read too)
+        """
+        self.path = path
+
+    def blocks(self, columns):
+        """
+        Yield every block, oldest first, with only some columns read.
+
+        Games still in the tail are yielded last, as one block.
+
+        Args:
+            columns: Column names to read
+
+        Yields:
+            ResultsBlock
+        """
+        try:
+            f = open(self.path, "rb")
+        except FileNotFoundError:
+            f = None
+        if f is not None:
+            with f:
+                for offset, _, _, meta in iter_blocks(self.path):
+                    yield self._read_block(f, offset, meta, columns)
+        games = pending_games(self.path)
+        if games:
+            data, genres, difficulties = encode_columns(games)
+            yield ResultsBlock(
+                {name: np.frombuffer(data[name], DTYPES[COLUMNS[name]])
+                 for name in columns},
+                genres, difficulties
+            )
+
+    def _read_block(self, f, offset, meta, columns):
+        """Read and decompress the wanted columns of one sealed block."""
+        arrays = {}
+        for name, length, crc in meta["columns"]:
+            if name in columns:
+                f.seek(offset)
+                payload = f.read(length)
+                if zlib.crc32(payload) != crc:
+                    raise ValueError(f"{self.path}: column {name} is corrupt")
+                arrays[name] = np.frombuffer(
+                    zlib.decompress(payload), DTYPES[COLUMNS[name]]
+                )
+            offset += length
+        return ResultsBlock(arrays, meta["genres"], meta["difficulties"])
+
+
+def summary(reader):
+    """
+    Games played, outcomes, average prize and duration, lifeline use.
+
+    Args:
+        reader: ResultsReader
+
+    Returns:
+        dict: games, states (name -> games), mean_prize, mean_duration_ms,
+        lifelines (name -> games that used it)
+    """
+    games = 0
+    states = np.zeros(len(STATES), np.int64)
+    lifelines = np.zeros(len(LIFELINE_BITS), np.int64)
+    prize = duration = 0
+    for block in reader.blocks(("state", "prize", "duration_ms", "lifelines")):
+        columns = block.columns
+        games += len(columns["state"])
+        states += np.bincount(columns["state"], minlength=len(STATES))
+        prize += int(columns["prize"].sum(dtype=np.int64))
+        duration += int(columns["duration_ms"].sum(dtype=np.int64))
+        for i, bit in enumerate(LIFELINE_BITS.values()):
+            lifelines[i] += np.count_nonzero(columns["lifelines"] & bit)
+    return {
+        "games": games,
+        "states": dict(zip(STATES, states.tolist())),
+        "mean_prize": prize / games if games else 0.0,
+        "mean_duration_ms": duration / games if games else 0.0,
+        "lifelines": dict(zip(LIFELINE_BITS, lifelines.tolist())),
+    }
+
+
+def score_histogram(reader):
+    """
+    Number of games ending on each score.
+
+    Args:
+        reader: ResultsReader
+
+    Returns:
+        ndarray: Games per score (questions answered correctly)
+    """
+    counts = np.zeros(0, np.int64)
+    for block in reader.blocks(("score",)):
+        block_counts = np.bincount(block.columns["score"])
+        if len(block_counts) > len(counts):
+            counts = np.pad(counts, (0, len(block_counts) - len(counts)))
+        counts[:len(block_counts)] += block_counts
+    return counts
+
+
+def question_stats(reader):
+    """
+    Times asked, answered correctly and timed out, and mean answer
+    time, per question.
+
+    Each answer's correct and timeout bits and milliseconds are packed
+    into one uint32, so grouping by question is one argsort of the
+    hashes, one gather and a few reduceat passes. Batches of answers are
+    reduced to per-question totals as they fill.
+
+    Args:
+        reader: ResultsReader
+
+    Returns:
+        QuestionStats: Arrays ordered by question hash
+    """
+    totals = None
+    hashes = []
+    answers = []
+    rows = 0
+    for block in reader.blocks(("q_hash", "q_outcome", "q_ms")):
+        hashes.append(block.columns["q_hash"])
+        answers.append(_pack_answers(block.columns))
+        rows += len(hashes[-1])
+        if rows >= _BATCH_ROWS:
+            totals = _merge_totals(totals, _reduce_answers(hashes, answers))
+            hashes = []
+            answers = []
+            rows = 0
+    if hashes:
+        totals = _merge_totals(totals, _reduce_answers(hashes, answers))
+    if totals is None:
+        empty = np.zeros(0, np.int64)
+        return QuestionStats(empty.astype(np.uint64), empty, empty, empty,
+                             empty.astype(float))
+    hashes, asked, correct, timeouts, total_ms = totals
+    return QuestionStats(hashes, asked, correct, timeouts, total_ms / asked)
+
+
+def _pack_answers(columns):
+    """uint32 per answer: correct << 31 | timeout << 30 | ms."""
+    outcome = columns["q_outcome"]
+    packed = (outcome == OUTCOMES.index("correct")).astype(np.uint32) << np.uint32(31)
+    packed |= (outcome == OUTCOMES.index("timeout")).astype(np.uint32) << np.uint32(30)
+    packed |= np.minimum(columns["q_ms"], _MS_MASK).astype(np.uint32)
+    return packed
+
+
+def _reduce_answers(hashes, answers):
+    """Per-question (hashes, asked, correct, timeouts, total ms)."""
+    hashes = np.concatenate(hashes)
+    order = np.argsort(hashes)
+    hashes = hashes[order]
+    answers = np.concatenate(answers)[order]
+    starts = _group_starts(hashes)
+    one = np.uint32(1)
+    return (
+        hashes[starts],
+        np.diff(np.append(starts, len(hashes))),
+        np.add.reduceat((answers >> np.uint32(31)) & one, starts, dtype=np.int64),
+        np.add.reduceat((answers >> np.uint32(30)) & one, starts, dtype=np.int64),
+        np.add.reduceat(answers & np.uint32(_MS_MASK), starts, dtype=np.int64),
+    )
+
+
+def _merge_totals(totals, part):
+    """Add two sets of per-question totals."""
+    if totals is None:
+        return part
+    merged = [np.concatenate(pair) for pair in zip(totals, part)]
+    order = np.argsort(merged[0], kind="stable")
+    hashes = merged[0][order]
+    starts = _group_starts(hashes)
+    return (hashes[starts],) + tuple(
+        np.add.reduceat(column[order], starts) for column in merged[1:]
+    )
+
+
+def _group_starts(sorted_values):
+    """Index of the first element of each run of equal values."""
+    return np.flatnonzero(
+        np.concatenate(([True], sorted_values[1:] != sorted_values[:-1]))
+    )
+
+
+def genre_timeouts(reader):
+    """
+    Questions asked and timed out per genre.
+
+    Args:
+        reader: ResultsReader
+
+    Returns:
+        dict: Genre name -> (asked, timeouts)
+    """
+    totals = {}
+    timeout = OUTCOMES.index("timeout")
+    for block in reader.blocks(("q_genre", "q_outcome")):
+        genre = block.columns["q_genre"]
+        size = len(block.genres)
+        asked = np.bincount(genre, minlength=size)
+        timeouts = np.bincount(genre, block.columns["q_outcome"] == timeout, size)
+        for i, name in enumerate(block.genres):
+            previous = totals.get(name, (0, 0))
+            totals[name] = (previous[0] + int(asked[i]),
+                            previous[1] + int(timeouts[i]))
+    return totals
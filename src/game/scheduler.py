@@ -0,0 +1,217 @@
+"""
+Non-repeating question scheduler for Movie Mania.
+
+Remembers which questions each player has been asked, across games and
+restarts, and prefers unseen questions when picking a game. Each
+player's record is a Bloom filter in a dbm file keyed by player name.
+The filter is probed with the question's text hash rather than its bank
+position, so a player's history survives questions being added,
+removed or reordered. It is sized for the bank and SEEN_EXPECTED_GAMES
+games at a SEEN_FALSE_POSITIVES rate, and starts over once it is full.
+"""
+
+import dbm
+import math
+import random
+import struct
+from src.config import (
+    EASY_QUESTIONS_COUNT, MEDIUM_QUESTIONS_COUNT, HARD_QUESTIONS_COUNT,
+    TOTAL_QUESTIONS, SEEN_FILE, SEEN_EXPECTED_GAMES, SEEN_FALSE_POSITIVES
+)
+from src.game.question_index import default_index
+
+# Record header: kind, probes per question
+_HEADER = struct.Struct("<cB")
+
+# Candidates drawn per wanted question before falling back to seen ones
+_OVERSAMPLE = 8
+
+
+class SeenBloom:
+    """
+    Approximate set of seen questions, by question_hash(), in a fixed
+    number of bytes.
+
+    May report an unseen question as seen (never the reverse); cleared
+    once half its bits are set, when false positives start to climb.
+    """
+
+    KIND = b"H"
+    __slots__ = ('bits', 'hashes')
+
+    def __init__(self, size_bytes, hashes, data=None):
+        self.bits = bytearray(data) if data else bytearray(size_bytes)
+        self.hashes = hashes
+
+    @classmethod
+    def sized(cls, questions, false_positives):
+        """
+        An empty filter holding questions entries at a false positive
+        rate; half its bits are set when it is that full.
+
+        Args:
+            questions: Entries it should hold
+            false_positives: Rate of unseen questions reported as seen
+
+        Returns:
+            SeenBloom: Empty filter
+        """
+        questions = max(questions, 1)
+        bits = -questions * math.log(false_positives) / math.log(2) ** 2
+        size_bytes = max(1, math.ceil(bits / 8))
+        hashes = max(1, round(size_bytes * 8 / questions * math.log(2)))
+        return cls(size_bytes, hashes)
+
+    def _probes(self, key):
+        """Bit numbers for a 64-bit question hash, by double hashing."""
+        h1 = key & 0xFFFFFFFF
+        h2 = (key >> 32) | 1
+        size = len(self.bits) * 8
+        return [(h1 + i * h2) % size for i in range(self.hashes)]
+
+    def __contains__(self, key):
+        bits = self.bits
+        return all(bits[b >> 3] >> (b & 7) & 1 for b in self._probes(key))
+
+    def add(self, key):
+        for b in self._probes(key):
+            self.bits[b >> 3] |= 1 << (b & 7)
+
+    def clear(self):
+        """Bloom filters cannot drop members, so start over."""
+        self.bits = bytearray(len(self.bits))
+
+    def saturated(self):
+        """Whether half or more of the bits are set."""
+        set_bits = bin(int.from_bytes(self.bits, "little")).count("1")
+        return set_bits * 2 >= len(self.bits) * 8
+
+
+class SeenScheduler:
+    """Picks game questions, preferring ones the player has not seen."""
+
+    def __init__(self, path=SEEN_FILE, index=None,
+                 expected_games=SEEN_EXPECTED_GAMES,
+                 false_positives=SEEN_FALSE_POSITIVES, rng=None):
+        """
+        Create a scheduler.
+
+        Args:
+            path: dbm file holding the per-player records
+            index: QuestionIndex to pick from (configured bank if None)
+            expected_games: Games a player's record should remember
+                before it starts over
+            false_positives: Rate of unseen questions taken for seen
+            rng: random.Random to pick with (a private one if None, so
+                the global random stream is left alone)
+        """
+        self.path = path
+        self._index = index
+        self.expected_games = expected_games
+        self.false_positives = false_positives
+        self.rng = rng or random.Random()
+
+    @property
+    def index(self):
+        # Follow the shared index, which a bank reload may replace
+        return self._index if self._index is not None else default_index()
+
+    def select(self, player, genre=None):
+        """
+        Select a game's questions for a player and remember them.
+
+        Args:
+            player: Player name (case and surrounding spaces ignored)
+            genre: Optional genre name, or list of genres
+
+        Returns:
+            list: Question records ordered by difficulty
+
+        Raises:
+            ValueError: If insufficient questions in any category
+        """
+        index = self.index
+        hashes = index.question_hashes()
+        seen = self._load(player)
+        if seen.saturated():
+            seen = self._new_record()
+        positions = []
+        for difficulty, count in (('easy', EASY_QUESTIONS_COUNT),
+                                  ('medium', MEDIUM_QUESTIONS_COUNT),
+                                  ('hard', HARD_QUESTIONS_COUNT)):
+            positions += self._pick(seen, hashes, count, difficulty, genre)
+        for position in positions:
+            seen.add(hashes[position])
+        self._store(player, seen)
+        return [index.questions[p] for p in positions]
+
+    def _pick(self, seen, hashes, k, difficulty, genre):
+        """Pick k positions from a bucket, unseen ones first."""
+        index = self.index
+        total = index.count(difficulty, genre)
+        draws = min(total, max(k * _OVERSAMPLE, 32))
+        unseen = []
+        fallback = []
+        for position in index.sample_positions(draws, difficulty, genre, self.rng):
+            if hashes[position] in seen:
+                fallback.append(position)
+            else:
+                unseen.append(position)
+                if len(unseen) == k:
+                    return unseen
+
+        if draws == total:
+            # Every question in the bucket has been seen: start afresh
+            seen.clear()
+        return unseen + fallback[:k - len(unseen)]
+
+    def _new_record(self):
+        """Empty filter sized for the bank and the expected games."""
+        questions = min(len(self.index), self.expected_games * TOTAL_QUESTIONS)
+        return SeenBloom.sized(questions, self.false_positives)
+
+    def _load(self, player):
+        """Read a player's filter, or a fresh one."""
+        try:
+            with dbm.open(self.path, "c") as db:
+                data = db.get(_player_key(player))
+        except OSError as e:
+            print(f"Error reading seen questions: {e}")
+            data = None
+        if data and len(data) > _HEADER.size:
+            kind, hashes = _HEADER.unpack_from(data)
+            payload = data[_HEADER.size:]
+            # Records of other kinds hold bank positions: start over
+            if kind == SeenBloom.KIND and hashes:
+                return SeenBloom(len(payload), hashes, payload)
+        return self._new_record()
+
+    def _store(self, player, seen):
+        """Write a player's filter."""
+        data = _HEADER.pack(seen.KIND, seen.hashes) + bytes(seen.bits)
+        try:
+            with dbm.open(self.path, "c") as db:
+                db[_player_key(player)] = data
+        except OSError as e:
+            print(f"Error saving seen questions: {e}")
+
+
+def _player_key(player):
+    """dbm key for a player name."""
+    return player.strip().casefold().encode("utf-8")
+
+
+_default_scheduler = None
+
+
+def default_scheduler():
+    """
+    Shared scheduler for SEEN_FILE, created on first use.
+
+    Returns:
+        SeenScheduler or None: None when SEEN_FILE is disabled
+    """
+    global _default_scheduler
+    if _default_scheduler is None and SEEN_FILE:
+        _default_scheduler = SeenScheduler()
+    return _default_scheduler
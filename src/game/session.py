@@ -0,0 +1,205 @@
+"""
+Headless game session for Movie Mania.
+Holds the rules of one game - scoring, lifelines, timer and prizes -
+as a small state machine with no drawing, so the same rules can drive
+the Tk window, simulations, servers and tests.
+"""
+
+import random
+from collections import namedtuple
+from src.config import TIMER_DURATION, PRIZE_VALUES
+from src.game.lifelines import (
+    pick_eliminated_letters, pick_friend_choice, _generate_audience_data
+)
+
+# Session states
+READY = "ready"          # Waiting for the next question to begin
+PLAYING = "playing"      # Question on screen, timer running
+WON = "won"              # All questions answered correctly
+LOST = "lost"            # Wrong answer given
+TIMED_OUT = "timeout"    # Timer ran out
+
+ANSWER_LETTERS = ('A', 'B', 'C', 'D')
+LIFELINE_NAMES = {1: "5050", 2: "phone", 3: "audience"}
+
+# A single state change reported by the session.
+# event: "question", "tick", "lifeline", "correct", "wrong" or "timeout"
+# state: session state after the event
+# index: question index the event belongs to
+# data: event payload (see GameSession methods)
+Transition = namedtuple('Transition', ['event', 'state', 'index', 'data'])
+
+
+class GameSession:
+    """
+    State machine for a single game.
+
+    Every event method returns the Transition it caused (or None if the
+    event was ignored) and passes it to all subscribed listeners.
+    """
+
+    __slots__ = (
+        'questions', 'timer_duration', 'rng', 'index', 'score', 'state',
+        'lifelines', 'deadline', 'time_left', '_listeners'
+    )
+
+    def __init__(self, questions, timer_duration=TIMER_DURATION, rng=random):
+        """
+        Create a new game session.
+
+        Args:
+            questions: Prepared Question records
+            timer_duration: Seconds allowed per question
+            rng: Random source for lifelines (module or random.Random)
+        """
+        self.questions = questions
+        self.timer_duration = timer_duration
+        self.rng = rng
+        self.index = 0
+        self.score = 0
+        self.state = READY
+        self.lifelines = {"5050": False, "phone": False, "audience": False}
+        self.deadline = None
+        self.time_left = timer_duration
+        self._listeners = []
+
+    @property
+    def question(self):
+        """Question currently in play (or the last one played)."""
+        return self.questions[min(self.index, len(self.questions) - 1)]
+
+    @property
+    def prize(self):
+        """Prize amount earned so far."""
+        return PRIZE_VALUES.get(self.score, 0)
+
+    @property
+    def finished(self):
+        """Whether the game is over."""
+        return self.state in (WON, LOST, TIMED_OUT)
+
+    def subscribe(self, listener):
+        """
+        Register a callable that receives every Transition.
+
+        Args:
+            listener: Function taking a single Transition argument
+        """
+        self._listeners.append(listener)
+
+    def begin(self, now):
+        """
+        Start the timer for the current question.
+
+        Args:
+            now: Current time in seconds
+
+        Returns:
+            Transition: "question" event with the question as data
+        """
+        if self.state != READY:
+            return None
+        self.state = PLAYING
+        self.deadline = now + self.timer_duration
+        self.time_left = self.timer_duration
+        return self._emit("question", self.question)
+
+    def answer(self, letter, now=None):
+        """
+        Submit an answer for the current question.
+
+        Args:
+            letter: Selected answer letter (A-D)
+            now: Current time; answers after the deadline time out
+
+        Returns:
+            Transition: "correct", "wrong" or "timeout" with letter as data
+
+        Raises:
+            ValueError: If letter is not A-D
+        """
+        if letter not in ANSWER_LETTERS:
+            raise ValueError(f"Invalid answer letter: {letter!r}")
+        if self.state != PLAYING:
+            return None
+        if now is not None and now >= self.deadline:
+            return self._time_out()
+
+        if letter == self.question.answer_letter:
+            self.score += 1
+            self.index += 1
+            self.state = WON if self.index == len(self.questions) else READY
+            return self._emit("correct", letter, self.index - 1)
+
+        self.state = LOST
+        return self._emit("wrong", letter)
+
+    def use_lifeline(self, number):
+        """
+        Use a lifeline on the current question.
+
+        Args:
+            number: Lifeline number (1: 50/50, 2: phone, 3: audience)
+
+        Returns:
+            Transition: "lifeline" event with (name, outcome) as data, where
+            outcome is the eliminated letters, the friend's pick or the
+            audience percentages. None if unavailable.
+        """
+        name = LIFELINE_NAMES.get(number)
+        if self.state != PLAYING or name is None or self.lifelines[name]:
+            return None
+        self.lifelines[name] = True
+
+        question = self.question
+        correct_letter = question.answer_letter
+        options = question.options
+        if name == "5050":
+            letters = ANSWER_LETTERS[:len(options)]
+            outcome = pick_eliminated_letters(letters, correct_letter, self.rng)
+        elif name == "phone":
+            outcome = pick_friend_choice(options, question.answer, self.rng)
+        else:
+            outcome = _generate_audience_data(
+                len(options), question.answer_index, self.rng
+            )
+        return self._emit("lifeline", (name, outcome))
+
+    def tick(self, now):
+        """
+        Advance the question timer.
+
+        Args:
+            now: Current time in seconds
+
+        Returns:
+            Transition: "timeout" when time runs out, "tick" with the
+            seconds left whenever the whole-second count changes, else None
+        """
+        if self.state != PLAYING:
+            return None
+        if now >= self.deadline:
+            return self._time_out()
+
+        time_left = min(
+            self.timer_duration, int(self.deadline - now + 0.999999)
+        )
+        if time_left == self.time_left:
+            return None
+        self.time_left = time_left
+        return self._emit("tick", time_left)
+
+    def _time_out(self):
+        """Move to the timed-out state."""
+        self.state = TIMED_OUT
+        self.time_left = 0
+        return self._emit("timeout", None)
+
+    def _emit(self, event, data, index=None):
+        """Build a transition and notify listeners."""
+        transition = Transition(
+            event, self.state, self.index if index is None else index, data
+        )
+        for listener in self._listeners:
+            listener(transition)
+        return transition
@@ -0,0 +1,235 @@
+"""
+Monte Carlo simulation of Movie Mania games.
+Plays millions of games at once with NumPy to estimate prize and score
+distributions and how much each lifeline is worth to a player.
+
+Requires NumPy (only the simulation tools need it, not the game).
+"""
+
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+import os
+import numpy as np
+from src.config import (
+    PRIZE_VALUES, TOTAL_QUESTIONS, EASY_QUESTIONS_COUNT,
+    MEDIUM_QUESTIONS_COUNT, HARD_QUESTIONS_COUNT
+)
+from src.data.questions import QUESTIONS
+from src.game.lifeline_batch import LifelineGenerator
+
+DIFFICULTIES = ('easy', 'medium', 'hard')
+LIFELINES = ('5050', 'phone', 'audience')
+
+# Difficulty of each question in a game, as indices into DIFFICULTIES
+DEFAULT_LADDER = (
+    (0,) * EASY_QUESTIONS_COUNT + (1,) * MEDIUM_QUESTIONS_COUNT +
+    (2,) * HARD_QUESTIONS_COUNT
+)
+
+# skill: chance of knowing the answer for each difficulty
+# timeout_rate: chance of running out of time for each difficulty
+PlayerModel = namedtuple('PlayerModel', ['skill', 'timeout_rate'])
+
+# order: lifelines to try (one per question) when the answer is unknown
+# from_question: first question index where lifelines may be used
+LifelinePolicy = namedtuple('LifelinePolicy', ['order', 'from_question'])
+
+POLICIES = {
+    "none": LifelinePolicy((), 0),
+    "greedy": LifelinePolicy(('5050', 'phone', 'audience'), 0),
+    "audience-first": LifelinePolicy(('audience', 'phone', '5050'), 0),
+    "save-for-hard": LifelinePolicy(
+        ('5050', 'phone', 'audience'),
+        EASY_QUESTIONS_COUNT + MEDIUM_QUESTIONS_COUNT
+    ),
+}
+
+SimulationResult = namedtuple('SimulationResult', [
+    'games', 'score_counts', 'lifeline_uses', 'mean_score', 'mean_prize'
+])
+
+
+def four_option_shares(questions=QUESTIONS):
+    """
+    Share of four-option questions for each difficulty in a bank.
+
+    Args:
+        questions: Iterable of question dictionaries
+
+    Returns:
+        tuple: Share per difficulty, in DIFFICULTIES order
+    """
+    totals = [0, 0, 0]
+    fours = [0, 0, 0]
+    for q in questions:
+        d = DIFFICULTIES.index(q['difficulty'])
+        totals[d] += 1
+        fours[d] += len(q['options']) == 4
+    return tuple(f / t if t else 1.0 for f, t in zip(fours, totals))
+
+
+def simulate_games(rng, games, player, policy, ladder=DEFAULT_LADDER,
+                   four_share=None):
+    """
+    Simulate a batch of games in one process.
+
+    Runs with the same seed and different policies share their random
+    numbers, so their results can be compared game for game.
+    Players who use a lifeline follow it: they guess among the options the
+    50/50 leaves, take the friend's pick or go with the top poll answer.
+
+    Args:
+        rng: numpy.random.Generator
+        games: Number of games to play
+        player: PlayerModel
+        policy: LifelinePolicy
+        ladder: Difficulty index of each question
+        four_share: Share of four-option questions per difficulty
+
+    Returns:
+        tuple: (score_counts, lifeline_uses) int arrays
+    """
+    if four_share is None:
+        four_share = four_option_shares()
+    skill = np.asarray(player.skill, dtype=float)
+    timeout_rate = np.asarray(player.timeout_rate, dtype=float)
+    order = [LIFELINES.index(name) for name in policy.order]
+    lifelines = LifelineGenerator(rng)
+
+    alive = np.ones(games, dtype=bool)
+    score = np.zeros(games, dtype=np.int64)
+    available = np.ones((games, len(LIFELINES)), dtype=bool)
+    uses = np.zeros(len(LIFELINES), dtype=np.int64)
+
+    for stage, d in enumerate(ladder):
+        num_options = np.where(rng.random(games) < four_share[d], 4, 3)
+        correct = rng.integers(0, num_options)
+        knows = rng.random(games) < skill[d]
+        timed_out = rng.random(games) < timeout_rate[d]
+        guess = rng.integers(0, num_options)
+        fifty_guess = rng.integers(0, num_options - np.minimum(2, num_options - 1))
+        phone_right = lifelines.friend_picks(num_options, correct) == correct
+        # Polls are only generated for games that take one, from their
+        # own stream so the draws above stay aligned across policies
+        polls = LifelineGenerator(rng.integers(2**63))
+
+        right = knows | (guess == correct)
+        need = alive & ~knows
+        if stage >= policy.from_question:
+            for lifeline in order:
+                use = need & available[:, lifeline]
+                if lifeline == 0:
+                    # Guess among what the 50/50 leaves (correct is slot 0)
+                    outcome = fifty_guess == 0
+                elif lifeline == 1:
+                    outcome = phone_right
+                else:
+                    outcome = np.zeros(games, dtype=bool)
+                    poll = polls.audience(num_options[use], correct[use])
+                    outcome[use] = np.argmax(poll, axis=1) == correct[use]
+                right = np.where(use, outcome, right)
+                available[use, lifeline] = False
+                uses[lifeline] += np.count_nonzero(use)
+                need &= ~use
+
+        alive &= right & ~timed_out
+        score += alive
+
+    return np.bincount(score, minlength=len(ladder) + 1), uses
+
+
+def _run_shard(args):
+    """Process pool entry point: simulate one shard."""
+    seed, games, player, policy, ladder, four_share = args
+    rng = np.random.default_rng(seed)
+    return simulate_games(rng, games, player, policy, ladder, four_share)
+
+
+def simulate(games, player, policy, seed=None, workers=None,
+             shard_size=1_000_000, ladder=DEFAULT_LADDER, four_share=None):
+    """
+    Simulate many games, sharded across a process pool.
+
+    Args:
+        games: Total number of games
+        player: PlayerModel
+        policy: LifelinePolicy
+        seed: Seed for reproducible runs (random if None)
+        workers: Worker processes (CPU count if None, 1 runs inline)
+        shard_size: Games per shard
+        ladder: Difficulty index of each question
+        four_share: Share of four-option questions per difficulty
+
+    Returns:
+        SimulationResult: Aggregated distributions
+    """
+    if four_share is None:
+        four_share = four_option_shares()
+    sizes = [shard_size] * (games // shard_size)
+    if games % shard_size:
+        sizes.append(games % shard_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    jobs = [
+        (s, size, player, policy, ladder, four_share)
+        for s, size in zip(seeds, sizes)
+    ]
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(jobs) == 1:
+        results = [_run_shard(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_run_shard, jobs))
+
+    score_counts = np.zeros(len(ladder) + 1, dtype=np.int64)
+    lifeline_uses = np.zeros(len(LIFELINES), dtype=np.int64)
+    for counts, uses in results:
+        score_counts += counts
+        lifeline_uses += uses
+
+    prizes = prize_table(len(ladder))
+    total = max(games, 1)
+    return SimulationResult(
+        games, score_counts, lifeline_uses,
+        float(np.dot(np.arange(len(ladder) + 1), score_counts) / total),
+        float(np.dot(prizes, score_counts) / total)
+    )
+
+
+def lifeline_values(games, player, policy, seed=0, **kwargs):
+    """
+    Estimate what each lifeline in a policy is worth.
+
+    Each lifeline is removed from the policy in turn and the run repeated
+    with the same seed; the drop in mean prize is its value.
+
+    Args:
+        games: Games per run
+        player: PlayerModel
+        policy: LifelinePolicy
+        seed: Seed shared by all runs (one is drawn if None)
+        **kwargs: Passed on to simulate()
+
+    Returns:
+        tuple: (baseline SimulationResult, dict of lifeline -> prize value)
+    """
+    if seed is None:
+        # Fix one seed so every run still sees the same random numbers
+        seed = np.random.SeedSequence().entropy
+    baseline = simulate(games, player, policy, seed=seed, **kwargs)
+    values = {}
+    for name in policy.order:
+        reduced = policy._replace(
+            order=tuple(n for n in policy.order if n != name)
+        )
+        result = simulate(games, player, reduced, seed=seed, **kwargs)
+        values[name] = baseline.mean_prize - result.mean_prize
+    return baseline, values
+
+
+def prize_table(total_questions=TOTAL_QUESTIONS):
+    """Prize for each final score as a float array."""
+    return np.array(
+        [PRIZE_VALUES.get(i, 0) for i in range(total_questions + 1)],
+        dtype=float
+    )
@@ -0,0 +1,248 @@
+"""
+Per-game telemetry for Movie Mania.
+
+Records reaction time, time remaining, lifelines and outcome for every
+question, plus how much wall time went to blocking animations versus
+waiting for the player. Events are queued in memory and written as
+JSON lines by a background thread, never from the game loop.
+"""
+
+import atexit
+import collections
+import itertools
+import json
+import os
+import threading
+import time
+from src.config import (
+    TELEMETRY_FILE, TELEMETRY_MAX_BYTES, TELEMETRY_BACKUPS,
+    TELEMETRY_FLUSH_INTERVAL
+)
+from src.ui.pacing import now, blocked_time
+
+
+class TelemetrySink:
+    """Buffered JSON lines file written by a background thread."""
+
+    def __init__(self, path, max_bytes=TELEMETRY_MAX_BYTES,
+                 backups=TELEMETRY_BACKUPS,
+                 flush_interval=TELEMETRY_FLUSH_INTERVAL):
+        """
+        Create a sink and start its writer thread.
+
+        Args:
+            path: JSON lines file to append to
+            max_bytes: Rotate the file once it grows past this size
+            backups: Number of rotated files to keep (path.1, path.2, ...)
+            flush_interval: Seconds between background writes
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.flush_interval = flush_interval
+        self._pending = collections.deque()
+        self._wakeup = threading.Event()
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name="telemetry-writer", daemon=True
+        )
+        self._thread.start()
+
+    def emit(self, event):
+        """
+        Queue an event; returns immediately.
+
+        Args:
+            event: JSON-serializable dictionary
+        """
+        self._pending.append(event)
+
+    def close(self):
+        """Write everything still queued and stop the writer thread."""
+        if self._closed:
+            return
+        self._closed = True
+        self._wakeup.set()
+        self._thread.join()
+
+    def _run(self):
+        """Writer thread: flush queued events in batches."""
+        while not self._closed:
+            self._wakeup.wait(self.flush_interval)
+            self._flush()
+        self._flush()
+
+    def _flush(self):
+        """Write all queued events in one append."""
+        batch = []
+        while self._pending:
+            batch.append(self._pending.popleft())
+        if not batch:
+            return
+        lines = "".join(
+            json.dumps(event, separators=(",", ":")) + "\n" for event in batch
+        )
+        try:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(lines)
+                size = f.tell()
+            if size >= self.max_bytes:
+                self._rotate()
+        except OSError as e:
+            print(f"Error writing telemetry: {e}")
+
+    def _rotate(self):
+        """Shift path -> path.1 -> path.2 ..., dropping the oldest."""
+        for i in range(self.backups - 1, 0, -1):
+            older = f"{self.path}.{i}"
+            if os.path.exists(older):
+                os.replace(older, f"{self.path}.{i + 1}")
+        if self.backups > 0:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+
+
+class GameTelemetry:
+    """Collects the telemetry events for one game."""
+
+    _game_ids = itertools.count(1)
+
+    def __init__(self, sink, player=None):
+        """
+        Create telemetry for a new game.
+
+        Args:
+            sink: TelemetrySink, or None to record nothing
+            player: Player name, if known
+        """
+        self.sink = sink
+        self.player = player
+        self.game = f"{os.getpid()}-{int(time.time())}-{next(self._game_ids)}"
+        self.session = None
+        self.game_start = None
+        self.question_start = None
+        self.question_lifelines = []
+        self.lifelines_used = []
+
+    def game_started(self, questions):
+        """Called when the first question is about to be drawn."""
+        self.game_start = _Clock()
+        self._emit("game_start", questions=len(questions), player=self.player)
+
+    def subscribe(self, session):
+        """
+        Follow a session's transitions.
+
+        Subscribe before any renderer, so answers are timed when they
+        arrive rather than after their animations.
+
+        Args:
+            session: GameSession being played
+        """
+        self.session = session
+        session.subscribe(self._on_transition)
+
+    def _on_transition(self, transition):
+        """Record the telemetry for one session transition."""
+        event = transition.event
+        if event == "question":
+            self._question_shown(transition)
+        elif event == "lifeline":
+            self._lifeline_used(transition)
+        elif event in ("correct", "wrong", "timeout"):
+            self._question_finished(transition)
+
+    def _question_shown(self, transition):
+        """A question's timer started."""
+        self.question_start = _Clock()
+        self.question_lifelines = []
+        question = transition.data
+        self._emit(
+            "question", index=transition.index,
+            qid=question.qid, options=len(question.options), genre=question.genre,
+            difficulty=question.difficulty, text=question.question
+        )
+
+    def _lifeline_used(self, transition):
+        """A lifeline was used on the current question."""
+        name = transition.data[0]
+        self.question_lifelines.append(name)
+        self.lifelines_used.append(name)
+        self._emit(
+            "lifeline", index=transition.index, lifeline=name,
+            at_ms=self.question_start.elapsed_ms()
+        )
+
+    def _question_finished(self, transition):
+        """A question was answered or timed out."""
+        self._emit(
+            "answer", index=transition.index, outcome=transition.event,
+            letter=transition.data,
+            reaction_ms=self.question_start.elapsed_ms(),
+            time_left=max(0.0, round(self.session.deadline - now(), 3)),
+            lifelines=self.question_lifelines,
+            **self.question_start.split()
+        )
+
+    def game_finished(self, session):
+        """Called when the game is over."""
+        self._emit(
+            "game_end", state=session.state, score=session.score,
+            prize=session.prize, lifelines=self.lifelines_used,
+            **self.game_start.split()
+        )
+
+    def _emit(self, event_type, **fields):
+        """Queue one event on the sink."""
+        if self.sink is None:
+            return
+        fields["type"] = event_type
+        fields["game"] = self.game
+        fields["t"] = round(time.time(), 3)
+        self.sink.emit(fields)
+
+
+class _Clock:
+    """Start point for measuring game time and wall-time split."""
+
+    __slots__ = ('game_time', 'wall', 'blocked')
+
+    def __init__(self):
+        self.game_time = now()
+        self.wall = time.perf_counter()
+        self.blocked = blocked_time()
+
+    def elapsed_ms(self):
+        """Game-clock milliseconds since the start point."""
+        return int((now() - self.game_time) * 1000)
+
+    def split(self):
+        """Wall milliseconds since start: total, animation and waiting."""
+        wall = time.perf_counter() - self.wall
+        animation, waiting = blocked_time()
+        animation -= self.blocked[0]
+        waiting -= self.blocked[1]
+        return {
+            "wall_ms": int(wall * 1000),
+            "animation_ms": int(animation * 1000),
+            "waiting_ms": int(waiting * 1000),
+            "other_ms": int(max(0.0, wall - animation - waiting) * 1000),
+        }
+
+
+_default_sink = None
+
+
+def default_sink():
+    """
+    Shared sink for TELEMETRY_FILE, created on first use.
+
+    Returns:
+        TelemetrySink or None: None when telemetry is disabled
+    """
+    global _default_sink
+    if _default_sink is None and TELEMETRY_FILE:
+        _default_sink = TelemetrySink(TELEMETRY_FILE)
+        atexit.register(_default_sink.close)
+    return _default_sink
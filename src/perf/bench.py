@@ -0,0 +1,204 @@
+"""
+Benchmark runner for Movie Mania.
+
+A benchmark is a name and a setup: a context manager factory that
+prepares its data, yields the callable to time and cleans up after.
+Each benchmark is timed in samples of enough calls to last at least
+MIN_SAMPLE_SECONDS (with the garbage collector off, as timeit does),
+and summarised per call by min, quartiles, median, mean, standard
+deviation and 95th percentile. Results are saved as JSON with the raw
+samples, so a later run can be compared with a saved baseline.
+"""
+
+import gc
+import json
+import os
+import platform
+import statistics
+import time
+from collections import namedtuple
+from datetime import datetime
+
+FORMAT_VERSION = 1
+MIN_SAMPLE_SECONDS = 0.02
+DEFAULT_SAMPLES = 15
+# Stop taking samples of one benchmark after this long (3 at least)
+MAX_BENCHMARK_SECONDS = 5.0
+# Relative slowdown of the median that counts as a regression
+DEFAULT_THRESHOLD = 0.10
+
+Benchmark = namedtuple('Benchmark', ['name', 'setup'])
+
+# One benchmark in a comparison; verdict is "slower", "faster" or "same"
+Comparison = namedtuple(
+    'Comparison', ['name', 'baseline', 'current', 'ratio', 'verdict']
+)
+
+
+def run_benchmark(benchmark, samples=DEFAULT_SAMPLES,
+                  max_seconds=MAX_BENCHMARK_SECONDS):
+    """
+    Time one benchmark.
+
+    Args:
+        benchmark: Benchmark to run
+        samples: Samples to take
+        max_seconds: Time budget after which fewer samples are taken
+
+    Returns:
+        dict: loops per sample, per-call samples (seconds) and stats
+    """
+    with benchmark.setup() as function:
+        loops = _calibrate(function)
+        timings = []
+        started = time.perf_counter()
+        while len(timings) < samples:
+            timings.append(_time(function, loops) / loops)
+            if len(timings) >= 3 and time.perf_counter() - started > max_seconds:
+                break
+    return {"loops": loops, "samples": timings, "stats": summarize(timings)}
+
+
+def run_suite(benchmarks, samples=DEFAULT_SAMPLES, progress=None):
+    """
+    Time benchmarks and collect the results with details of the machine.
+
+    Args:
+        benchmarks: Benchmarks to run
+        samples: Samples per benchmark
+        progress: Optional callback(name, result) after each benchmark
+
+    Returns:
+        dict: Results document, as saved by save_results()
+    """
+    results = {}
+    for benchmark in benchmarks:
+        results[benchmark.name] = run_benchmark(benchmark, samples)
+        if progress is not None:
+            progress(benchmark.name, results[benchmark.name])
+    return {
+        "version": FORMAT_VERSION,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "benchmarks": results,
+    }
+
+
+def summarize(timings):
+    """
+    Summary statistics of per-call timings.
+
+    Args:
+        timings: Per-call seconds, one per sample
+
+    Returns:
+        dict: min, q1, median, q3, p95, max, mean and stdev in seconds
+    """
+    ordered = sorted(timings)
+    return {
+        "min": ordered[0],
+        "q1": _percentile(ordered, 0.25),
+        "median": _percentile(ordered, 0.5),
+        "q3": _percentile(ordered, 0.75),
+        "p95": _percentile(ordered, 0.95),
+        "max": ordered[-1],
+        "mean": statistics.fmean(ordered),
+        "stdev": statistics.stdev(ordered) if len(ordered) > 1 else 0.0,
+    }
+
+
+def compare(baseline, current, threshold=DEFAULT_THRESHOLD):
+    """
+    Compare two results documents benchmark by benchmark.
+
+    A benchmark is slower (or faster) only when its median moved by
+    more than the threshold and the interquartile ranges of the two
+    runs do not overlap, so noise alone is not reported.
+
+    Args:
+        baseline: Results document of the reference run
+        current: Results document of the run to check
+        threshold: Relative change of the median that counts
+
+    Returns:
+        list: Comparison for every benchmark in both runs
+    """
+    rows = []
+    for name, result in current["benchmarks"].items():
+        reference = baseline["benchmarks"].get(name)
+        if reference is None:
+            continue
+        before, after = reference["stats"], result["stats"]
+        ratio = after["median"] / before["median"]
+        if ratio > 1 + threshold and after["q1"] > before["q3"]:
+            verdict = "slower"
+        elif ratio < 1 / (1 + threshold) and after["q3"] < before["q1"]:
+            verdict = "faster"
+        else:
+            verdict = "same"
+        rows.append(Comparison(name, before["median"], after["median"], ratio, verdict))
+    return rows
+
+
+def save_results(results, path):
+    """Write a results document as JSON."""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+
+
+def load_results(path):
+    """
+    Read a results document.
+
+    Raises:
+        ValueError: If the file is not a benchmark results document
+    """
+    with open(path, encoding="utf-8") as f:
+        results = json.load(f)
+    if results.get("version") != FORMAT_VERSION or "benchmarks" not in results:
+        raise ValueError(f"{path} is not a version {FORMAT_VERSION} benchmark file")
+    return results
+
+
+def format_seconds(seconds):
+    """Short human-readable duration ("1.23 ms")."""
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3g} {unit}"
+    return f"{seconds / 1e-9:.3g} ns"
+
+
+def _calibrate(function):
+    """Calls per sample so that a sample lasts MIN_SAMPLE_SECONDS."""
+    loops = 1
+    while True:
+        elapsed = _time(function, loops)
+        if elapsed >= MIN_SAMPLE_SECONDS:
+            return loops
+        # Aim a little past the target, at most 10x per step
+        loops *= max(2, min(10, int(MIN_SAMPLE_SECONDS * 1.2 / max(elapsed, 1e-9))))
+
+
+def _time(function, loops):
+    """Seconds taken by loops calls, with the garbage collector off."""
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        for _ in range(loops):
+            function()
+        return time.perf_counter() - start
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _percentile(ordered, fraction):
+    """Linearly interpolated percentile of sorted values."""
+    position = (len(ordered) - 1) * fraction
+    low = int(position)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (position - low)
@@ -0,0 +1,198 @@
+"""
+The Movie Mania benchmark suite, run by src/tools/bench.py.
+
+Covers question selection and shuffling, the audience poll, colour
+conversion, leaderboard saves and loads on every backend at 10, 10k
+and 1M entries, and full screen builds drawn on a HeadlessCanvas so no
+display is needed. Every benchmark seeds its own random source and
+works on temporary files, so runs are repeatable and leave no trace.
+"""
+
+import random
+import tempfile
+from contextlib import contextmanager
+from functools import partial
+from graphics import HeadlessCanvas
+from graphics.utils import convert_rgba_to_rgb
+from src.config import WIDTH, HEIGHT, LEADERBOARD_TOP_N, PRIZE_VALUES
+from src.game.leaderboard_store import (
+    JsonLeaderboard, SqliteLeaderboard, LogLeaderboard
+)
+from src.game.lifelines import _generate_audience_data
+from src.game.question_index import default_index
+from src.game.questions import (
+    select_game_questions, shuffle_question_options, get_prize_text
+)
+from src.game import quiz
+from src.perf.bench import Benchmark
+from src.ui import screens
+from src.ui.graphics import create_cinematic_background
+from src.ui.pacing import set_speed, get_speed
+
+SEED = 1234
+LEADERBOARD_SIZES = (("10", 10), ("10k", 10_000), ("1M", 1_000_000))
+LEADERBOARD_BACKENDS = ("json", "sqlite", "log")
+
+_COLOR = "rgba(230,184,0,0.3)"
+
+
+def all_benchmarks():
+    """
+    Every benchmark in the suite.
+
+    Returns:
+        list: Benchmark records, in run order
+    """
+    benchmarks = [
+        Benchmark("questions.select", _select_questions),
+        Benchmark("questions.shuffle", _shuffle_options),
+        Benchmark("lifelines.audience_data", _audience_data),
+        Benchmark("graphics.rgba_to_rgb", partial(_call, convert_rgba_to_rgb, _COLOR)),
+        Benchmark("graphics.rgba_to_rgb_uncached",
+                  partial(_call, convert_rgba_to_rgb.__wrapped__, _COLOR)),
+    ]
+    for backend in LEADERBOARD_BACKENDS:
+        for label, size in LEADERBOARD_SIZES:
+            benchmarks.append(Benchmark(
+                f"leaderboard.save[{backend},{label}]",
+                partial(_leaderboard_save, backend, size)
+            ))
+            benchmarks.append(Benchmark(
+                f"leaderboard.load[{backend},{label}]",
+                partial(_leaderboard_load, backend, size)
+            ))
+    benchmarks += [
+        Benchmark("screen.background", _background_screen),
+        Benchmark("screen.question", _question_screen),
+        Benchmark("screen.prize", _prize_screen),
+    ]
+    return benchmarks
+
+
+@contextmanager
+def _call(function, *args):
+    """Time function(*args)."""
+    yield partial(function, *args)
+
+
+@contextmanager
+def _select_questions():
+    """Pick the questions of one game from the built-in bank."""
+    index = default_index()
+    rng = random.Random(SEED)
+    yield lambda: select_game_questions(index=index, rng=rng)
+
+
+@contextmanager
+def _shuffle_options():
+    """Shuffle the options of one question."""
+    question = default_index().questions[0]
+    rng = random.Random(SEED)
+    yield lambda: shuffle_question_options(question, rng)
+
+
+@contextmanager
+def _audience_data():
+    """Generate one audience poll."""
+    rng = random.Random(SEED)
+    yield lambda: _generate_audience_data(4, 2, rng)
+
+
+@contextmanager
+def _leaderboard_save(backend, size):
+    """Save one result to a leaderboard already holding size entries."""
+    with _filled_leaderboard(backend, size) as store:
+        rng = random.Random(SEED)
+        scores = list(PRIZE_VALUES.values())
+        yield lambda: store.add("Bench", rng.choice(scores), "2026-01-02 12:00:00")
+
+
+@contextmanager
+def _leaderboard_load(backend, size):
+    """Read the top entries of a leaderboard holding size entries."""
+    with _filled_leaderboard(backend, size) as store:
+        yield lambda: store.top(LEADERBOARD_TOP_N)
+
+
+@contextmanager
+def _filled_leaderboard(backend, size):
+    """
+    A leaderboard of one backend in a temporary directory, filled with
+    size entries (the log backend compacted into its snapshot).
+
+    The log backend never compacts during the benchmark, so its saves
+    time the append alone, not a background compaction.
+    """
+    with tempfile.TemporaryDirectory(prefix="mm-bench-") as directory:
+        if backend == "json":
+            store = JsonLeaderboard(f"{directory}/leaderboard.json", keep=size)
+        elif backend == "sqlite":
+            store = SqliteLeaderboard(f"{directory}/leaderboard.sqlite",
+                                      import_from=None)
+        else:
+            store = LogLeaderboard(f"{directory}/leaderboard.log",
+                                   f"{directory}/leaderboard.snapshot",
+                                   compact_bytes=float("inf"), import_from=None)
+        store.add_many(_entries(size))
+        if backend == "log":
+            store.compact()
+        try:
+            yield store
+        finally:
+            store.close()
+
+
+def _entries(count):
+    """Entry dicts with varied scores, names and times (seeded)."""
+    rng = random.Random(SEED)
+    scores = list(PRIZE_VALUES.values())
+    names = [f"Player {i}" for i in range(1000)]
+    times = [f"2026-01-{day:02d} {hour:02d}:00:00"
+             for day in range(1, 29) for hour in range(24)]
+    return [
+        {"name": rng.choice(names), "score": rng.choice(scores),
+         "timestamp": rng.choice(times)}
+        for _ in range(count)
+    ]
+
+
+@contextmanager
+def _screen():
+    """A headless canvas, with animation delays skipped."""
+    speed = get_speed()
+    set_speed(0)
+    canvas = HeadlessCanvas(WIDTH, HEIGHT)
+    try:
+        yield canvas
+    finally:
+        canvas.close()
+        set_speed(speed)
+
+
+@contextmanager
+def _background_screen():
+    """Draw the cinematic background."""
+    with _screen() as canvas:
+        def build():
+            canvas.clear()
+            create_cinematic_background(canvas)
+        yield build
+
+
+@contextmanager
+def _question_screen():
+    """Draw a whole question screen."""
+    question = default_index().questions[0]
+    lifelines = {"5050": False, "phone": True, "audience": False}
+    with _screen() as canvas:
+        yield lambda: quiz._draw_question_ui(canvas, question, 3, lifelines)
+
+
+@contextmanager
+def _prize_screen():
+    """Draw the prize screen after a game over on question 4."""
+    with _screen() as canvas:
+        yield lambda: screens.show_prize_screen(
+            canvas, 3, get_prize_text(3), game_over=True,
+            correct_answer="Casablanca"
+        )
@@ -0,0 +1,188 @@
+"""
+Input-to-display latency probe.
+
+The Canvas tells the probe when each key event is dispatched and
+Canvas.responded() tells it when the game's visible response to the
+keys it read has been flushed to the display. Tk only dispatches events
+inside update(), so a key pressed while the game sleeps between polls
+waits in the event queue first. That wait is estimated from the X
+server's event timestamps: the smallest gap seen between an event's
+server time and our clock is taken as the clock offset, and any larger
+gap as time queued.
+
+Latencies go into HDR-style histograms, which keep values within 1% at
+any magnitude in about 20 kilobytes up to a minute, so a probe can stay
+on for a whole kiosk day.
+"""
+
+import time
+
+# log2 of the sub-buckets: each power of two above 2**8 us is split into
+# 2**7 linear steps, so a bucket is at most 1/128 (0.8%) of its values
+SUB_BUCKET_BITS = 8
+
+
+class LatencyHistogram:
+    """
+    Counts of latencies in microsecond buckets whose width grows with
+    the value (log-linear, as in HdrHistogram).
+    """
+
+    def __init__(self, sub_bucket_bits=SUB_BUCKET_BITS):
+        """
+        Create an empty histogram.
+
+        Args:
+            sub_bucket_bits: log2 of the linear steps per power of two
+                (more bits, finer buckets)
+        """
+        self.sub_bucket_bits = sub_bucket_bits
+        self.sub_buckets = 1 << sub_bucket_bits
+        self.counts = []
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds):
+        """
+        Add one latency.
+
+        Args:
+            seconds: Latency in seconds (negative values count as 0)
+        """
+        seconds = max(seconds, 0.0)
+        index = self._index(int(seconds * 1e6))
+        if index >= len(self.counts):
+            self.counts.extend([0] * (index + 1 - len(self.counts)))
+        self.counts[index] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def percentile(self, percent):
+        """
+        Latency that percent of the recorded values do not exceed.
+
+        Args:
+            percent: 0 to 100
+
+        Returns:
+            float: Upper edge of the bucket holding it, in seconds (no
+            more than the largest value recorded; 0.0 if empty)
+        """
+        if not self.count:
+            return 0.0
+        wanted = max(1, -(-self.count * percent // 100))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= wanted:
+                return min(self._highest(index) / 1e6, self.max)
+        return self.max
+
+    def summary(self):
+        """
+        Count, mean, p50, p90, p99, p99.9 and max.
+
+        Returns:
+            dict: Count, and the rest in seconds
+        """
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "p99.9": self.percentile(99.9),
+            "max": self.max,
+        }
+
+    def _index(self, micros):
+        """Bucket of a value in microseconds."""
+        if micros < self.sub_buckets:
+            return micros
+        shift = micros.bit_length() - self.sub_bucket_bits
+        half = self.sub_buckets // 2
+        return self.sub_buckets + (shift - 1) * half + (micros >> shift) - half
+
+    def _highest(self, index):
+        """Largest value in microseconds that falls in a bucket."""
+        if index < self.sub_buckets:
+            return index
+        half = self.sub_buckets // 2
+        shift, step = divmod(index - self.sub_buckets, half)
+        return ((half + step + 1) << (shift + 1)) - 1
+
+
+class LatencyProbe:
+    """
+    Measures the time from a key press to the game's response being on
+    screen.
+
+    Keys read by the game together are one batch, timed from its first
+    key. A batch the game shows no response to before it reads the next
+    one (an ignored key) is dropped.
+    """
+
+    def __init__(self):
+        """Create a probe with empty histograms."""
+        # Key press to response flushed, and the part spent queued
+        self.total = LatencyHistogram()
+        self.queued = LatencyHistogram()
+        self._offset = None
+        self._arrived = None
+        self._delivered = None
+
+    def key_arrived(self, event_time=None):
+        """
+        Note a key event as Tk dispatches it.
+
+        Args:
+            event_time: The event's X server time in milliseconds (None
+                or 0 if unknown, so no queueing is estimated)
+        """
+        now = time.perf_counter()
+        queued = 0.0
+        if event_time:
+            gap = now * 1000 - event_time
+            if self._offset is None or gap < self._offset:
+                self._offset = gap
+            queued = (gap - self._offset) / 1000
+        if self._arrived is None:
+            self._arrived = (now - queued, queued)
+
+    def keys_delivered(self):
+        """Note that the game read the keys that have arrived."""
+        if self._arrived is not None:
+            self._delivered = self._arrived
+            self._arrived = None
+
+    def responded(self):
+        """Note that the response to the last keys read is on screen."""
+        if self._delivered is None:
+            return
+        pressed, queued = self._delivered
+        self._delivered = None
+        self.total.record(time.perf_counter() - pressed)
+        self.queued.record(queued)
+
+    def report(self):
+        """
+        A short text report of the latencies so far.
+
+        Returns:
+            str: Key press to screen and time queued, p50/p99/max
+        """
+        total = self.total.summary()
+        queued = self.queued.summary()
+        return (
+            f"Input latency over {total['count']} responses: "
+            f"p50 {_ms(total['p50'])}, p99 {_ms(total['p99'])}, "
+            f"max {_ms(total['max'])} "
+            f"(queued p50 {_ms(queued['p50'])}, p99 {_ms(queued['p99'])})"
+        )
+
+
+def _ms(seconds):
+    """Seconds as milliseconds text ("4.20 ms")."""
+    return f"{seconds * 1000:.2f} ms"
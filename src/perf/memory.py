@@ -0,0 +1,34 @@
+"""
+Memory measurement helpers.
+"""
+
+import os
+
+
+def rss_bytes(pid=None):
+    """
+    Resident memory of a process.
+    
+    Args:
+        pid: Process ID (current process if None)
+    
+    Returns:
+        int or None: Resident set size in bytes, None if unavailable
+    """
+    path = f"/proc/{pid or 'self'}/statm"
+    try:
+        with open(path) as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return _max_rss_bytes() if pid is None else None
+
+
+def _max_rss_bytes():
+    """Peak resident memory of this process where /proc is missing."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if os.uname().sysname == "Darwin" else peak * 1024
@@ -0,0 +1,65 @@
+"""
+Command line entry point for the game server.
+
+Usage:
+    python -m src.server serve --port 8765
+    python -m src.server bots --bots 2000 --games 5
+"""
+
+import argparse
+import asyncio
+import json
+from src.server.game_server import GameServer
+from src.server.bots import run_load, run_local, raise_file_limit
+
+
+def main(argv=None):
+    """
+    Run the server or the bot load generator.
+
+    Args:
+        argv: Command line arguments (defaults to sys.argv)
+    """
+    parser = argparse.ArgumentParser(description="Movie Mania game server")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve = commands.add_parser("serve", help="host games over TCP")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8765)
+    serve.add_argument("--seed", type=int, default=None)
+
+    bots = commands.add_parser("bots", help="run scripted players")
+    bots.add_argument("--bots", type=int, default=1000)
+    bots.add_argument("--games", type=int, default=5, help="games per bot")
+    bots.add_argument("--host", default=None,
+                      help="existing server (default: start a local one)")
+    bots.add_argument("--port", type=int, default=8765)
+    bots.add_argument("--seed", type=int, default=None)
+
+    args = parser.parse_args(argv)
+    if args.command == "serve":
+        asyncio.run(_serve(args.host, args.port, args.seed))
+    elif args.host:
+        raise_file_limit()
+        report = asyncio.run(
+            run_load(args.host, args.port, args.bots, args.games, args.seed)
+        )
+        print(json.dumps(report, indent=2))
+    else:
+        print(json.dumps(run_local(args.bots, args.games, args.seed), indent=2))
+
+
+async def _serve(host, port, seed):
+    """Start the server and announce its address."""
+    raise_file_limit()
+    server = GameServer(host, port, seed=seed)
+    await server.start()
+    print(f"listening on {host}:{server.port}", flush=True)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,189 @@
+"""
+Bot load generator for the Movie Mania game server.
+Runs thousands of scripted players against a server and reports
+sessions per second, answer latency percentiles and server memory
+per session.
+"""
+
+import asyncio
+import json
+import random
+import subprocess
+import sys
+import time
+from src.perf.memory import rss_bytes
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+
+async def run_bot(host, port, name, games, rng, latencies, started):
+    """
+    Play a number of games over one connection.
+
+    Args:
+        host, port: Server address
+        name: Player name sent to the server
+        games: Games to play
+        rng: random.Random used to pick answers and lifelines
+        latencies: List collecting answer round-trip times (seconds)
+        started: asyncio.Event set when every bot has connected
+
+    Returns:
+        int: Number of games finished
+    """
+    reader, writer = await asyncio.open_connection(host, port, limit=2**16)
+    finished = 0
+    for game in range(games):
+        await _send(writer, {"op": "start", "name": name})
+        message = await _receive(reader)
+        if game == 0:
+            started.set_one()
+            await started.wait()
+        while message["event"] == "question":
+            if rng.random() < 0.2:
+                await _send(writer, {"op": "lifeline", "number": rng.randint(1, 3)})
+                await _receive(reader)
+            letter = rng.choice("ABCD"[:len(message["options"])])
+            sent = time.perf_counter()
+            await _send(writer, {"op": "answer", "letter": letter})
+            result = await _receive(reader)
+            latencies.append(time.perf_counter() - sent)
+            # An error is the server's only reply to the answer
+            if result["event"] == "error":
+                break
+            message = await _receive(reader)
+        finished += message["event"] == "game_over"
+    await _send(writer, {"op": "quit"})
+    writer.close()
+    return finished
+
+
+async def run_load(host, port, bots, games_per_bot, seed=None, server_pid=None):
+    """
+    Run many bots concurrently and collect statistics.
+
+    Args:
+        host, port: Server address
+        bots: Number of concurrent players
+        games_per_bot: Games each bot plays
+        seed: Seed for the bots' choices
+        server_pid: Server process ID, for memory measurements
+
+    Returns:
+        dict: Load test report
+    """
+    rng = random.Random(seed)
+    latencies = []
+    started = _Countdown(bots)
+    baseline_rss = rss_bytes(server_pid)
+
+    begin = time.perf_counter()
+    tasks = [
+        asyncio.ensure_future(run_bot(
+            host, port, f"bot{i}", games_per_bot,
+            random.Random(rng.random()), latencies, started
+        ))
+        for i in range(bots)
+    ]
+    await started.wait()
+    peak_rss = rss_bytes(server_pid)
+    results = await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - begin
+
+    latencies.sort()
+    sessions = sum(results)
+    report = {
+        "bots": bots,
+        "sessions": sessions,
+        "seconds": round(elapsed, 3),
+        "sessions_per_sec": round(sessions / elapsed, 1),
+        "answers": len(latencies),
+        "p50_ms": _percentile(latencies, 50) * 1000,
+        "p99_ms": _percentile(latencies, 99) * 1000,
+        "max_ms": (latencies[-1] if latencies else 0.0) * 1000,
+    }
+    if server_pid and baseline_rss is not None and peak_rss is not None:
+        report["bytes_per_session"] = (peak_rss - baseline_rss) // bots
+    return report
+
+
+def run_local(bots, games_per_bot, seed=None):
+    """
+    Start a server subprocess on a free port and run the bots against it.
+
+    Args:
+        bots: Number of concurrent players
+        games_per_bot: Games each bot plays
+        seed: Seed for server and bots
+
+    Returns:
+        dict: Load test report
+    """
+    raise_file_limit()
+    command = [sys.executable, "-m", "src.server", "serve", "--port", "0"]
+    if seed is not None:
+        command += ["--seed", str(seed)]
+    server = subprocess.Popen(command, stdout=subprocess.PIPE, text=True)
+    try:
+        # Server prints "listening on HOST:PORT" once ready
+        address = server.stdout.readline().rsplit(" ", 1)[-1].strip()
+        host, port = address.rsplit(":", 1)
+        return asyncio.run(
+            run_load(host, int(port), bots, games_per_bot, seed, server.pid)
+        )
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def raise_file_limit():
+    """Raise the open file limit so thousands of sockets fit."""
+    if resource is None:
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if hard == resource.RLIM_INFINITY or hard > soft:
+        target = 65536 if hard == resource.RLIM_INFINITY else hard
+        resource.setrlimit(resource.RLIMIT_NOFILE, (target, hard))
+
+
+class _Countdown:
+    """Event that is set after a fixed number of set_one() calls."""
+
+    def __init__(self, count):
+        self.count = count
+        self.event = asyncio.Event()
+        if count <= 0:
+            self.event.set()
+
+    def set_one(self):
+        self.count -= 1
+        if self.count <= 0:
+            self.event.set()
+
+    async def wait(self):
+        await self.event.wait()
+
+
+async def _send(writer, message):
+    """Send one JSON message."""
+    writer.write(json.dumps(message).encode() + b"\n")
+    await writer.drain()
+
+
+async def _receive(reader):
+    """Read one JSON message."""
+    line = await reader.readline()
+    if not line:
+        raise ConnectionError("Server closed the connection")
+    return json.loads(line)
+
+
+def _percentile(sorted_values, percent):
+    """Nearest-rank percentile of a sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, -(-len(sorted_values) * percent // 100) - 1)
+    return sorted_values[int(rank)]
@@ -0,0 +1,206 @@
+"""
+Asyncio game server for Movie Mania.
+Hosts many concurrent games over newline-delimited JSON on TCP, each
+driven by a GameSession with the same rules as the Tk game.
+
+Client messages:
+    {"op": "start", "name": "Ann"}        start a new game
+    {"op": "answer", "letter": "B"}       answer the current question
+    {"op": "lifeline", "number": 2}       use a lifeline (1-3)
+    {"op": "quit"}                        close the connection
+
+Server messages carry an "event" field: "question", "correct", "wrong",
+"timeout", "lifeline", "game_over" or "error".
+"""
+
+import asyncio
+import json
+import random
+from src.config import TIMER_DURATION
+from src.game.questions import select_game_questions, shuffle_question_options
+from src.game.session import GameSession, READY, PLAYING
+from src.server.timer_wheel import TimerWheel
+
+TIMER_RESOLUTION = 0.1  # seconds per timer wheel tick
+
+
+class GameServer:
+    """Hosts game sessions for many TCP connections."""
+
+    def __init__(self, host="127.0.0.1", port=8765,
+                 timer_duration=TIMER_DURATION, seed=None):
+        """
+        Create a game server.
+
+        Args:
+            host: Interface to listen on
+            port: TCP port (0 picks a free port)
+            timer_duration: Seconds allowed per question
+            seed: Seed for question selection and lifelines
+        """
+        self.host = host
+        self.port = port
+        self.timer_duration = timer_duration
+        self.rng = random.Random(seed)
+        self.connections = 0
+        self.games_started = 0
+        self.games_finished = 0
+        self.wheel = None
+        self._server = None
+        self._wheel_task = None
+
+    async def start(self):
+        """Start listening and return the bound port."""
+        loop = asyncio.get_running_loop()
+        self.wheel = TimerWheel(loop.time(), TIMER_RESOLUTION)
+        self._server = await asyncio.start_server(
+            self._handle_client, self.host, self.port
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._wheel_task = asyncio.ensure_future(self._run_wheel())
+        return self.port
+
+    async def close(self):
+        """Stop accepting clients and stop the timer wheel."""
+        if self._wheel_task:
+            self._wheel_task.cancel()
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def _run_wheel(self):
+        """Single task that fires every session deadline."""
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(TIMER_RESOLUTION)
+            self.wheel.advance(loop.time())
+
+    async def _handle_client(self, reader, writer):
+        """Serve one connection until it closes."""
+        connection = _Connection(self, writer)
+        self.connections += 1
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    message = json.loads(line)
+                    if connection.handle(message) is False:
+                        break
+                except (ValueError, KeyError, TypeError) as e:
+                    connection.send({"event": "error", "message": str(e)})
+                if writer.transport.get_write_buffer_size() > 65536:
+                    await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            connection.end_game()
+            self.connections -= 1
+            writer.close()
+
+    def new_session(self):
+        """Create a GameSession with freshly selected questions."""
+        questions = [
+            shuffle_question_options(q, self.rng)
+            for q in select_game_questions(rng=self.rng)
+        ]
+        self.games_started += 1
+        return GameSession(questions, self.timer_duration, self.rng)
+
+
+class _Connection:
+    """Protocol state for one client."""
+
+    __slots__ = ('server', 'writer', 'session', 'timer', 'name')
+
+    def __init__(self, server, writer):
+        self.server = server
+        self.writer = writer
+        self.session = None
+        self.timer = None
+        self.name = None
+
+    def handle(self, message):
+        """Dispatch one client message; returns False to disconnect."""
+        op = message["op"]
+        now = asyncio.get_running_loop().time()
+        if op == "start":
+            self.end_game()
+            self.name = str(message.get("name", "Player"))
+            self.session = self.server.new_session()
+            self.session.subscribe(self._on_transition)
+            self.session.begin(now)
+        elif op == "answer":
+            if self._require_playing():
+                self.session.answer(str(message["letter"]).upper(), now)
+        elif op == "lifeline":
+            if (self._require_playing() and
+                    self.session.use_lifeline(int(message["number"])) is None):
+                self.send({"event": "error", "message": "Lifeline not available"})
+        elif op == "quit":
+            return False
+        else:
+            raise ValueError(f"Unknown op: {op!r}")
+        return True
+
+    def end_game(self):
+        """Drop the current session and its deadline."""
+        if self.timer:
+            self.timer.cancel()
+            self.timer = None
+        self.session = None
+
+    def send(self, message):
+        """Queue a message for the client."""
+        if not self.writer.is_closing():
+            self.writer.write(json.dumps(message).encode() + b"\n")
+
+    def _require_playing(self):
+        """Check a question is open, reporting an error if not."""
+        if self.session is not None and self.session.state == PLAYING:
+            return True
+        self.send({"event": "error", "message": "No question in play"})
+        return False
+
+    def _on_transition(self, transition):
+        """Translate a session transition into protocol messages."""
+        session = self.session
+        event = transition.event
+        if event == "question":
+            question = transition.data
+            self.timer = self.server.wheel.schedule(
+                session.deadline, session.tick
+            )
+            self.send({
+                "event": "question", "index": transition.index,
+                "question": question.question,
+                "options": question.options,
+                "genre": question.genre,
+                "time_left": session.timer_duration,
+            })
+            return
+        if event == "lifeline":
+            name, outcome = transition.data
+            self.send({"event": "lifeline", "name": name, "outcome": outcome})
+            return
+        if event == "tick":
+            return
+
+        # Answer or timeout closes the question
+        if self.timer:
+            self.timer.cancel()
+            self.timer = None
+        message = {"event": event, "index": transition.index}
+        if event != "correct":
+            message["answer"] = session.questions[transition.index].answer
+        self.send(message)
+
+        if session.state == READY:
+            session.begin(asyncio.get_running_loop().time())
+        elif session.finished:
+            self.server.games_finished += 1
+            self.send({
+                "event": "game_over", "state": session.state,
+                "score": session.score, "prize": session.prize,
+            })
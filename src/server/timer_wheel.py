@@ -0,0 +1,99 @@
+"""
+Hashed timer wheel for the game server.
+Keeps every session deadline in one structure that a single task
+advances, instead of running a timer task per session.
+"""
+
+import math
+
+
+class TimerHandle:
+    """A scheduled callback that can be cancelled."""
+
+    __slots__ = ('tick', 'callback', 'cancelled')
+
+    def __init__(self, tick, callback):
+        self.tick = tick
+        self.callback = callback
+        self.cancelled = False
+
+    def cancel(self):
+        """Stop the callback from firing."""
+        self.cancelled = True
+
+
+class TimerWheel:
+    """
+    Timer wheel with fixed resolution.
+
+    Deadlines are bucketed into slots by tick number; timers further away
+    than one turn of the wheel simply stay in their slot for extra turns.
+    Scheduling and cancelling are O(1), advancing is O(expired + slots).
+    """
+
+    def __init__(self, start, resolution=0.1, slots=512):
+        """
+        Create a timer wheel.
+
+        Args:
+            start: Current time in seconds
+            resolution: Length of one tick in seconds
+            slots: Number of buckets in the wheel
+        """
+        self.resolution = resolution
+        self.slots = [[] for _ in range(slots)]
+        self.origin = start
+        self.current_tick = 0
+        self.pending = 0
+
+    def schedule(self, deadline, callback):
+        """
+        Call callback(now) once deadline has passed.
+
+        Args:
+            deadline: Time in seconds
+            callback: Function taking the current time
+
+        Returns:
+            TimerHandle: Handle for cancelling the timer
+        """
+        tick = max(
+            self.current_tick + 1,
+            math.ceil((deadline - self.origin) / self.resolution)
+        )
+        handle = TimerHandle(tick, callback)
+        self.slots[tick % len(self.slots)].append(handle)
+        self.pending += 1
+        return handle
+
+    def advance(self, now):
+        """
+        Fire every timer whose deadline is at or before now.
+
+        Args:
+            now: Current time in seconds
+
+        Returns:
+            int: Number of callbacks fired
+        """
+        target = math.floor((now - self.origin) / self.resolution)
+        fired = 0
+        # Never walk more than one full turn; later ticks share the slots
+        first = max(self.current_tick + 1, target - len(self.slots) + 1)
+        for tick in range(first, target + 1):
+            slot = self.slots[tick % len(self.slots)]
+            if not slot:
+                continue
+            keep = []
+            for handle in slot:
+                if handle.cancelled:
+                    self.pending -= 1
+                elif handle.tick <= target:
+                    self.pending -= 1
+                    handle.callback(now)
+                    fired += 1
+                else:
+                    keep.append(handle)
+            slot[:] = keep
+        self.current_tick = max(self.current_tick, target)
+        return fired
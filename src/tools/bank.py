@@ -0,0 +1,90 @@
+"""
+Command line tools for external question banks.
+
+Usage:
+    python -m src.tools.bank export questions.jsonl
+    python -m src.tools.bank export big.sqlite --copies 5000
+    python -m src.tools.bank check questions.csv
+    python -m src.tools.bank compile big.sqlite big.mmqb
+"""
+
+import argparse
+import itertools
+import sys
+import time
+from src.data.binary_store import compile_store
+from src.data.loaders import (
+    QuestionFormatError, iter_questions, open_bank, write_bank
+)
+from src.data.questions import QUESTIONS
+
+
+def main(argv=None):
+    """
+    Export the built-in questions, validate a bank or compile a bank
+    into a binary store.
+
+    Args:
+        argv: Command line arguments (defaults to sys.argv)
+    """
+    args = _parse_args(argv)
+    if args.command == "export":
+        count = write_bank(args.path, _copies(QUESTIONS, args.copies))
+        print(f"Wrote {count} questions to {args.path}")
+    elif args.command == "compile":
+        source = QUESTIONS if args.source == "builtin" else iter_questions(args.source)
+        start = time.perf_counter()
+        count = compile_store(source, args.path)
+        print(f"Compiled {count} questions into {args.path} "
+              f"in {time.perf_counter() - start:.2f}s")
+    else:
+        sys.exit(_check(args.path))
+
+
+def _parse_args(argv):
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Manage Movie Mania question banks")
+    commands = parser.add_subparsers(dest="command", required=True)
+    export = commands.add_parser("export", help="write the built-in questions")
+    export.add_argument("path", help="output .jsonl, .csv or .sqlite file")
+    export.add_argument("--copies", type=int, default=1,
+                        help="repeat the questions to build a large test bank")
+    check = commands.add_parser("check", help="validate every question in a bank")
+    check.add_argument("path")
+    compile_ = commands.add_parser("compile", help="build a binary .mmqb store")
+    compile_.add_argument("source", help="bank file, or 'builtin'")
+    compile_.add_argument("path", help="output .mmqb file")
+    return parser.parse_args(argv)
+
+
+def _copies(questions, copies):
+    """Yield the questions repeated, numbering the repeats."""
+    for copy, q in itertools.product(range(copies), questions):
+        if copy:
+            q = dict(q, question=f"{q['question']} (#{copy + 1})")
+        yield q
+
+
+def _check(path):
+    """Stream-validate a bank and time a lazy open; returns an exit code."""
+    start = time.perf_counter()
+    count = 0
+    try:
+        for _ in iter_questions(path):
+            count += 1
+    except QuestionFormatError as e:
+        print(f"Invalid question: {e}")
+        return 1
+    streamed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    bank = open_bank(path)
+    opened = time.perf_counter() - start
+    bank.close()
+    print(f"{count} valid questions; streamed in {streamed:.2f}s, "
+          f"indexed for lazy access in {opened:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Run the benchmark suite and compare runs.
+
+Usage:
+    python -m src.tools.bench list
+    python -m src.tools.bench run --out baseline.json
+    python -m src.tools.bench run --filter leaderboard --filter screen
+    python -m src.tools.bench run --baseline baseline.json --out current.json
+    python -m src.tools.bench compare baseline.json current.json
+
+run and compare exit with status 1 when a benchmark got slower than
+the baseline, so they can gate a change in CI.
+"""
+
+import argparse
+import sys
+from src.perf.bench import (
+    DEFAULT_SAMPLES, DEFAULT_THRESHOLD, run_suite, compare, save_results,
+    load_results, format_seconds
+)
+from src.perf.benchmarks import all_benchmarks
+
+
+def main(argv=None):
+    """
+    Run, list or compare benchmarks.
+
+    Args:
+        argv: Command line arguments (defaults to sys.argv)
+
+    Returns:
+        int: Exit status, 1 if a benchmark regressed, 2 if a results
+        file cannot be read
+    """
+    args = _parse_args(argv)
+    benchmarks = [
+        b for b in all_benchmarks()
+        if not args.filter or any(f in b.name for f in args.filter)
+    ]
+    if args.command == "list":
+        for benchmark in benchmarks:
+            print(benchmark.name)
+        return 0
+
+    try:
+        baseline = load_results(args.baseline) if args.baseline else None
+        if args.command == "compare":
+            current = load_results(args.current)
+    except (OSError, ValueError) as e:
+        print(f"Error reading benchmark results: {e}")
+        return 2
+
+    if args.command == "run":
+        print(f"  {'benchmark':<34} {'median':>10} {'p95':>10} {'spread':>8}")
+        current = run_suite(benchmarks, args.samples, _print_result)
+        if args.out:
+            save_results(current, args.out)
+            print(f"Saved {args.out}")
+        if baseline is None:
+            return 0
+    return _print_comparison(compare(baseline, current, args.threshold))
+
+
+def _parse_args(argv):
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Movie Mania benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+    for name in ("list", "run"):
+        command = commands.add_parser(name)
+        command.add_argument("--filter", action="append",
+                             help="only benchmarks whose name contains this "
+                                  "(repeat for several)")
+    run = commands.choices["run"]
+    run.add_argument("--out", help="save the results as JSON")
+    run.add_argument("--samples", type=int, default=DEFAULT_SAMPLES,
+                     help="samples per benchmark")
+    run.add_argument("--baseline", help="results to compare against")
+    run.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                     help="median slowdown that counts as a regression")
+    compare_command = commands.add_parser("compare")
+    compare_command.add_argument("baseline")
+    compare_command.add_argument("current")
+    compare_command.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    compare_command.set_defaults(filter=None)
+    return parser.parse_args(argv)
+
+
+def _print_result(name, result):
+    """Print one benchmark's summary as it finishes."""
+    stats = result["stats"]
+    print(f"  {name:<34} {format_seconds(stats['median']):>10} "
+          f"{format_seconds(stats['p95']):>10} "
+          f"{stats['stdev'] / stats['mean']:>8.1%}", flush=True)
+
+
+def _print_comparison(rows):
+    """Print a comparison table; return 1 if anything got slower."""
+    print(f"\n  {'benchmark':<34} {'baseline':>10} {'current':>10} {'change':>8}")
+    for row in rows:
+        flag = {"slower": "  SLOWER", "faster": "  faster"}.get(row.verdict, "")
+        print(f"  {row.name:<34} {format_seconds(row.baseline):>10} "
+              f"{format_seconds(row.current):>10} {row.ratio - 1:>+8.1%}{flag}")
+    slower = [row.name for row in rows if row.verdict == "slower"]
+    if slower:
+        print(f"\n{len(slower)} benchmark(s) regressed: {', '.join(slower)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,82 @@
+"""
+Command line batch re-fit of question difficulties from telemetry.
+
+Usage:
+    python -m src.tools.calibrate telemetry.jsonl telemetry.jsonl.1
+    python -m src.tools.calibrate telemetry.jsonl* --report 20
+"""
+
+import argparse
+import time
+from src.config import CALIBRATION_FILE
+from src.game.calibration import DIFFICULTY_PRIORS, Calibration
+from src.game.calibration_fit import load_answers, refit, log_loss
+from src.game.question_index import default_index
+
+
+def main(argv=None):
+    """
+    Re-fit the calibration from logged answers and save it.
+
+    Args:
+        argv: Command line arguments (defaults to sys.argv)
+    """
+    args = _parse_args(argv)
+    index = default_index()
+
+    start = time.perf_counter()
+    log = load_answers(args.telemetry)
+    loaded = time.perf_counter() - start
+    print(f"{len(log.hashes)} answers from {len(log.player_names)} players "
+          f"read in {loaded:.2f}s")
+    if not len(log.hashes):
+        return
+
+    previous = Calibration.load(index.question_hashes(), args.out)
+    start = time.perf_counter()
+    calibration = refit(log, index.question_hashes(), epochs=args.epochs, l2=args.l2)
+    fitted = time.perf_counter() - start
+    print(f"Fitted in {fitted:.2f}s; log loss {log_loss(log, previous):.4f} "
+          f"(saved) -> {log_loss(log, calibration):.4f} (re-fit)")
+
+    if args.report:
+        _print_report(calibration, index, args.report)
+    if not args.dry_run:
+        calibration.save(args.out)
+        print(f"Saved {args.out}")
+
+
+def _parse_args(argv):
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Re-fit Movie Mania question difficulties")
+    parser.add_argument("telemetry", nargs="+", help="telemetry JSON lines files")
+    parser.add_argument("--out", default=CALIBRATION_FILE)
+    parser.add_argument("--epochs", type=int, default=30)
+    parser.add_argument("--l2", type=float, default=1.0,
+                        help="pull towards the label priors")
+    parser.add_argument("--report", type=int, default=0, metavar="N",
+                        help="list the N questions whose band differs most from their label")
+    parser.add_argument("--dry-run", action="store_true", help="do not save")
+    return parser.parse_args(argv)
+
+
+def _print_report(calibration, index, limit):
+    """Print questions whose calibrated band disagrees with their label."""
+    labels = calibration.difficulty_labels(index)
+    moved = []
+    for label, positions in index.by_difficulty.items():
+        for position in positions:
+            if labels[position] != label and calibration.counts[position]:
+                shift = calibration.offsets[position]
+                moved.append((abs(shift), position, label, labels[position]))
+    moved.sort(reverse=True)
+    print(f"\n{len(moved)} answered questions change band")
+    for _, position, label, band in moved[:limit]:
+        question = index.questions[position]
+        estimate = DIFFICULTY_PRIORS[label] + calibration.offsets[position]
+        print(f"  {label:>6} -> {band:<6} {estimate:+.2f} "
+              f"({calibration.counts[position]} answers)  {question.question}")
+
+
+if __name__ == "__main__":
+    main()
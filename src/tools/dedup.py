@@ -0,0 +1,97 @@
+"""
+Command line near-duplicate check for question banks.
+
+Usage:
+    python -m src.tools.dedup bank.jsonl
+    python -m src.tools.dedup big.mmqb --threshold 0.8 --show 20 --out dups.jsonl
+"""
+
+import argparse
+import json
+import time
+from src.data.binary_store import BinaryQuestionStore, STORE_SUFFIX
+from src.data.dedup import (
+    DEFAULT_PERMUTATIONS, DEFAULT_THRESHOLD, find_duplicates
+)
+from src.data.loaders import iter_questions
+from src.data.questions import QUESTIONS
+
+
+def main(argv=None):
+    """
+    Find clusters of near-duplicate questions in a bank and report them.
+
+    Args:
+        argv: Command line arguments (defaults to sys.argv)
+    """
+    args = _parse_args(argv)
+    start = time.perf_counter()
+    clusters = find_duplicates(
+        _read(args.bank), threshold=args.threshold,
+        permutations=args.permutations, workers=args.workers
+    )
+    elapsed = time.perf_counter() - start
+
+    duplicates = sum(len(c.positions) - 1 for c in clusters)
+    print(f"{len(clusters)} clusters of near-duplicates; {duplicates} "
+          f"questions could be dropped ({elapsed:.2f}s)")
+
+    shown = clusters[:args.show]
+    wanted = {p for c in shown for p in c.positions[:args.members]}
+    texts = {
+        position: q for position, (q, _) in enumerate(_read(args.bank))
+        if position in wanted
+    } if wanted else {}
+    for cluster in shown:
+        print(f"\n{len(cluster.positions)} questions, "
+              f"similarity ~{cluster.similarity:.2f}")
+        for position in cluster.positions[:args.members]:
+            print(f"  #{position:<8} {texts[position]}")
+        if len(cluster.positions) > args.members:
+            print(f"  ... and {len(cluster.positions) - args.members} more")
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            for cluster in clusters:
+                f.write(json.dumps(cluster._asdict()) + "\n")
+        print(f"\nWrote {len(clusters)} clusters to {args.out}")
+
+
+def _parse_args(argv):
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Find near-duplicate questions")
+    parser.add_argument("bank", help="bank file, .mmqb store, or 'builtin'")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="estimated similarity of duplicates (0-1)")
+    parser.add_argument("--permutations", type=int, default=DEFAULT_PERMUTATIONS,
+                        help="MinHash signature length")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="worker processes (default: CPU count)")
+    parser.add_argument("--show", type=int, default=10,
+                        help="largest clusters to print")
+    parser.add_argument("--members", type=int, default=5,
+                        help="questions to print per cluster")
+    parser.add_argument("--out", help="write every cluster as JSON lines")
+    return parser.parse_args(argv)
+
+
+def _read(bank):
+    """Yield (question, options) for every question in bank order."""
+    if bank == "builtin":
+        for q in QUESTIONS:
+            yield q['question'], q['options']
+    elif bank.endswith(STORE_SUFFIX):
+        store = BinaryQuestionStore(bank)
+        try:
+            for position in range(len(store)):
+                strings = store.strings(position)
+                yield strings[0], strings[1:]
+        finally:
+            store.close()
+    else:
+        for q in iter_questions(bank):
+            yield q['question'], q['options']
+
+
+if __name__ == "__main__":
+    main()
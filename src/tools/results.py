@@ -0,0 +1,121 @@
+"""
+Command line reports over the game results store.
+
+Usage:
+    python -m src.tools.results summary
+    python -m src.tools.results scores
+    python -m src.tools.results questions --limit 20 --min-asked 50
+    python -m src.tools.results questions --sort timeouts
+    python -m src.tools.results genres --file results.mmrs
+"""
+
+import argparse
+import time
+import numpy as np
+from src.config import RESULTS_FILE, PRIZE_VALUES
+from src.data.records import question_hash
+from src.game.question_index import default_index
+from src.game.results_query import (
+    ResultsReader, summary, score_histogram, question_stats, genre_timeouts
+)
+
+
+def main(argv=None):
+    """
+    Print a report over the stored game results.
+
+    Args:
+        argv: Command line arguments (defaults to sys.argv)
+    """
+    args = _parse_args(argv)
+    reader = ResultsReader(args.file)
+    start = time.perf_counter()
+    if args.report == "summary":
+        _print_summary(summary(reader))
+    elif args.report == "scores":
+        _print_scores(score_histogram(reader))
+    elif args.report == "questions":
+        _print_questions(question_stats(reader), args.sort, args.limit, args.min_asked)
+    else:
+        _print_genres(genre_timeouts(reader))
+    print(f"\n({time.perf_counter() - start:.2f}s)")
+
+
+def _parse_args(argv):
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Movie Mania game results reports")
+    parser.add_argument("report", choices=("summary", "scores", "questions", "genres"))
+    parser.add_argument("--file", default=RESULTS_FILE, help="results store")
+    parser.add_argument("--sort", choices=("hardest", "easiest", "timeouts"),
+                        default="hardest", help="question order (questions report)")
+    parser.add_argument("--limit", type=int, default=20,
+                        help="questions to list (questions report)")
+    parser.add_argument("--min-asked", type=int, default=10,
+                        help="skip questions asked fewer times (questions report)")
+    return parser.parse_args(argv)
+
+
+def _print_summary(totals):
+    """Print games, outcomes, averages and lifeline use."""
+    games = totals["games"]
+    print(f"{games:,} games")
+    for state, count in totals["states"].items():
+        print(f"  {state:<8} {count:>12,} {_percent(count, games)}")
+    print(f"Average prize ${totals['mean_prize']:,.0f}, "
+          f"average game {totals['mean_duration_ms'] / 1000:.1f}s")
+    print("Lifelines used:")
+    for name, count in totals["lifelines"].items():
+        print(f"  {name:<8} {count:>12,} {_percent(count, games)}")
+
+
+def _print_scores(counts):
+    """Print a histogram of final scores."""
+    games = int(counts.sum())
+    print(f"{games:,} games")
+    widest = int(counts.max()) if games else 1
+    for score, count in enumerate(counts.tolist()):
+        bar = "#" * round(40 * count / widest)
+        print(f"  {score:>2} ${PRIZE_VALUES.get(score, 0):>9,} "
+              f"{count:>12,} {_percent(count, games)} {bar}")
+
+
+def _print_questions(stats, order, limit, min_asked):
+    """Print the questions with the lowest or highest correct rate."""
+    asked = stats.asked
+    keep = asked >= max(min_asked, 1)
+    correct_rate = stats.correct[keep] / asked[keep]
+    timeout_rate = stats.timeouts[keep] / asked[keep]
+    if order == "hardest":
+        ranked = np.argsort(correct_rate, kind="stable")
+    elif order == "easiest":
+        ranked = np.argsort(-correct_rate, kind="stable")
+    else:
+        ranked = np.argsort(-timeout_rate, kind="stable")
+    texts = {question_hash(q.question): q.question for q in default_index().questions}
+    hashes = stats.hashes[keep]
+    kept_asked = asked[keep]
+    mean_ms = stats.mean_ms[keep]
+    print(f"{len(stats.hashes):,} questions asked, {int(keep.sum()):,} "
+          f"at least {max(min_asked, 1)} times")
+    print(f"  {'correct':>7} {'timeout':>7} {'asked':>9} {'answer':>6}")
+    for i in ranked[:limit].tolist():
+        text = texts.get(int(hashes[i]), "(not in the current bank)")
+        print(f"  {correct_rate[i]:>7.1%} {timeout_rate[i]:>7.1%} "
+              f"{int(kept_asked[i]):>9,} {mean_ms[i] / 1000:>5.1f}s  {text}")
+
+
+def _print_genres(totals):
+    """Print the timeout rate of every genre."""
+    print(f"  {'genre':<20} {'asked':>12} {'timeouts':>10}")
+    for genre, (asked, timeouts) in sorted(
+            totals.items(), key=lambda item: -item[1][1] / max(item[1][0], 1)):
+        print(f"  {genre:<20} {asked:>12,} {_percent(timeouts, asked)}")
+
+
+def _percent(count, total):
+    """Share of a total as a right-aligned percentage."""
+    return f"{count / total if total else 0.0:>9.1%}"
+
+
+if __name__ == "__main__":
+    main()
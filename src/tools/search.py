@@ -0,0 +1,132 @@
+"""
+Command line search over question banks.
+
+Usage:
+    python -m src.tools.search index bank.jsonl
+    python -m src.tools.search query bank.jsonl 'joker genre:action'
+    python -m src.tools.search query builtin 'nol* OR answer:"heath ledger"' --limit 5
+"""
+
+import argparse
+import os
+import sys
+import time
+from src.data.binary_store import BinaryQuestionStore, STORE_SUFFIX
+from src.data.loaders import iter_questions, open_bank
+from src.data.questions import QUESTIONS
+from src.data.records import Question
+from src.data.search import SEARCH_SUFFIX, QuerySyntaxError, SearchIndex
+
+# Index file used for the built-in questions
+BUILTIN_INDEX = "questions" + SEARCH_SUFFIX
+
+
+def main(argv=None):
+    """
+    Build or update a bank's search index, or run a query against it.
+
+    Args:
+        argv: Command line arguments (defaults to sys.argv)
+    """
+    args = _parse_args(argv)
+    index = SearchIndex(args.index or _index_path(args.bank))
+    try:
+        if args.command == "index":
+            _update(index, args.bank)
+        else:
+            sys.exit(_query(index, args))
+    finally:
+        index.close()
+
+
+def _parse_args(argv):
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Search Movie Mania question banks")
+    commands = parser.add_subparsers(dest="command", required=True)
+    index = commands.add_parser("index", help="build or update a bank's index")
+    index.add_argument("bank", help="bank file, .mmqb store, or 'builtin'")
+    query = commands.add_parser("query", help="search a bank")
+    query.add_argument("bank", help="bank file, .mmqb store, or 'builtin'")
+    query.add_argument("query", help="search query, e.g. 'joker -genre:drama'")
+    query.add_argument("--limit", type=int, default=20,
+                       help="matches to print (0 prints only the count)")
+    for command in (index, query):
+        command.add_argument("--index", help=f"index file (default: bank + {SEARCH_SUFFIX})")
+    return parser.parse_args(argv)
+
+
+def _update(index, bank):
+    """Bring an index up to date with its bank and report the work done."""
+    start = time.perf_counter()
+    indexed, removed = index.update(_read_questions(bank), _stat(bank))
+    elapsed = time.perf_counter() - start
+    print(f"Indexed {indexed} new or changed questions, removed {removed} "
+          f"({len(index)} total, {len(index.segments)} segments) "
+          f"in {elapsed:.2f}s")
+
+
+def _query(index, args):
+    """Run a query and print the matches; returns an exit code."""
+    if not index.segments:
+        print(f"No index yet: run 'python -m src.tools.search index {args.bank}'")
+        return 1
+    if index.stale(_stat(args.bank)):
+        print("Warning: the bank has changed since it was indexed")
+
+    start = time.perf_counter()
+    try:
+        matches = index.search(args.query)
+    except QuerySyntaxError as e:
+        print(f"Invalid query: {e}")
+        return 2
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"{len(matches)} matches in {elapsed:.1f} ms")
+
+    if args.limit and matches:
+        lookup, close = _open(args.bank)
+        try:
+            for position in matches[:args.limit]:
+                q = lookup(position)
+                print(f"  #{position:<8} [{q.difficulty}/{q.genre}] "
+                      f"{q.question}  ({q.answer})")
+        finally:
+            close()
+    return 0
+
+
+def _index_path(bank):
+    """Default index file for a bank."""
+    return BUILTIN_INDEX if bank == "builtin" else bank + SEARCH_SUFFIX
+
+
+def _stat(bank):
+    """os.stat_result of a bank file (None for the built-in questions)."""
+    return None if bank == "builtin" else os.stat(bank)
+
+
+def _read_questions(bank):
+    """Yield every question of a bank as a Question record, in bank order."""
+    if bank == "builtin":
+        for position, q in enumerate(QUESTIONS):
+            yield Question.from_dict(q, position)
+    elif bank.endswith(STORE_SUFFIX):
+        store = BinaryQuestionStore(bank)
+        try:
+            yield from store
+        finally:
+            store.close()
+    else:
+        for position, q in enumerate(iter_questions(bank)):
+            yield Question.from_dict(q, position)
+
+
+def _open(bank):
+    """Return (position -> Question, close function) for a bank."""
+    if bank == "builtin":
+        return (lambda p: Question.from_dict(QUESTIONS[p], p)), (lambda: None)
+    source = BinaryQuestionStore(bank) if bank.endswith(STORE_SUFFIX) else open_bank(bank)
+    return source.__getitem__, source.close
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Command line front end for the Monte Carlo simulator.
+
+Usage:
+    python -m src.tools.simulate --games 10000000 --skill 0.9 0.7 0.4
+"""
+
+import argparse
+import json
+import time
+from src.config import PRIZE_VALUES
+from src.game.simulation import (
+    POLICIES, PlayerModel, simulate, lifeline_values
+)
+
+
+def main(argv=None):
+    """
+    Run a simulation and print prize, score and lifeline statistics.
+    
+    Args:
+        argv: Command line arguments (defaults to sys.argv)
+    """
+    args = _parse_args(argv)
+    player = PlayerModel(tuple(args.skill), tuple(args.timeout_rate))
+    policy = POLICIES[args.policy]
+    options = {"workers": args.workers, "shard_size": args.shard_size}
+    
+    start = time.perf_counter()
+    if args.lifeline_values:
+        result, values = lifeline_values(
+            args.games, player, policy, seed=args.seed, **options
+        )
+    else:
+        result = simulate(args.games, player, policy, seed=args.seed, **options)
+        values = {}
+    elapsed = time.perf_counter() - start
+    
+    report = _build_report(result, values, elapsed)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        _print_report(report)
+
+
+def _parse_args(argv):
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Simulate Movie Mania games")
+    parser.add_argument("--games", type=int, default=1_000_000)
+    parser.add_argument("--skill", type=float, nargs=3, default=[0.9, 0.7, 0.4],
+                        metavar=("EASY", "MEDIUM", "HARD"),
+                        help="chance of knowing the answer per difficulty")
+    parser.add_argument("--timeout-rate", type=float, nargs=3,
+                        default=[0.0, 0.0, 0.0],
+                        metavar=("EASY", "MEDIUM", "HARD"))
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="greedy")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--shard-size", type=int, default=1_000_000)
+    parser.add_argument("--lifeline-values", action="store_true",
+                        help="also estimate the prize value of each lifeline")
+    parser.add_argument("--json", action="store_true")
+    return parser.parse_args(argv)
+
+
+def _build_report(result, values, elapsed):
+    """Collect simulation results into a JSON-friendly dictionary."""
+    games = max(result.games, 1)
+    return {
+        "games": result.games,
+        "seconds": round(elapsed, 3),
+        "mean_score": result.mean_score,
+        "mean_prize": result.mean_prize,
+        "scores": {
+            str(score): int(count)
+            for score, count in enumerate(result.score_counts)
+        },
+        "prizes": {
+            str(PRIZE_VALUES.get(score, 0)): int(count) / games
+            for score, count in enumerate(result.score_counts)
+        },
+        "lifeline_use_rate": {
+            name: int(count) / games
+            for name, count in zip(("5050", "phone", "audience"),
+                                   result.lifeline_uses)
+        },
+        "lifeline_values": values,
+    }
+
+
+def _print_report(report):
+    """Print a human readable report."""
+    print(f"{report['games']:,} games in {report['seconds']}s")
+    print(f"Mean score: {report['mean_score']:.3f}")
+    print(f"Mean prize: ${report['mean_prize']:,.2f}")
+    print("\nPrize distribution:")
+    for prize, share in report["prizes"].items():
+        print(f"  ${int(prize):>9,}  {share:8.4%}")
+    print("\nLifeline use per game:")
+    for name, rate in report["lifeline_use_rate"].items():
+        print(f"  {name:<9} {rate:.4f}")
+    if report["lifeline_values"]:
+        print("\nLifeline value (mean prize drop without it):")
+        for name, value in report["lifeline_values"].items():
+            print(f"  {name:<9} ${value:,.2f}")
+
+
+if __name__ == '__main__':
+    main()
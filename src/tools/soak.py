@@ -0,0 +1,148 @@
+"""
+Kiosk soak test: plays thousands of games back to back with scripted
+input and reports memory, Tk item count and per-game latency drift.
+
+Usage:
+    python -m src.tools.soak --games 2000 --report-every 100
+"""
+
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+from graphics import Canvas
+from src.config import WIDTH, HEIGHT
+from src.ui.pacing import set_speed
+from src.game.kiosk import run_kiosk
+from src.perf.memory import rss_bytes
+
+# Keys the scripted player presses at random
+SCRIPT_KEYS = ['A', 'B', 'C', 'D', '1', '2', '3', 'RETURN']
+
+
+class ScriptedPlayer:
+    """Random scripted input: a key every few polls and instant clicks."""
+    
+    def __init__(self, seed=None, key_every=3):
+        """
+        Create a scripted player.
+        
+        Args:
+            seed: Seed for the key choices
+            key_every: Press a key on every Nth input poll
+        """
+        self.rng = random.Random(seed)
+        self.key_every = key_every
+        self.polls = 0
+    
+    def next_keys(self):
+        """Keys pressed since the last poll."""
+        self.polls += 1
+        if self.polls % self.key_every:
+            return []
+        return [self.rng.choice(SCRIPT_KEYS)]
+    
+    def next_click(self):
+        """Whether the mouse was clicked."""
+        return True
+
+
+def main(argv=None):
+    """
+    Run the soak test and print periodic and final reports.
+    
+    Args:
+        argv: Command line arguments (defaults to sys.argv)
+    """
+    parser = argparse.ArgumentParser(description="Kiosk mode soak test")
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--report-every", type=int, default=50)
+    parser.add_argument("--speed", type=float, default=0,
+                        help="game speed (0 = no animation delays)")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+    
+    # Keep soak results out of the real leaderboard
+    os.chdir(tempfile.mkdtemp(prefix="movie_mania_soak_"))
+    random.seed(args.seed)
+    set_speed(args.speed)
+    
+    canvas = Canvas(WIDTH, HEIGHT, title="Movie Mania soak test")
+    canvas.input_script = ScriptedPlayer(args.seed)
+    samples = []
+    last = [time.perf_counter()]
+    
+    def on_game_end(games, player_name, score):
+        now = time.perf_counter()
+        samples.append({
+            "game": games,
+            "seconds": now - last[0],
+            "rss": rss_bytes(),
+            "items": canvas.item_count(),
+            "score": score,
+        })
+        last[0] = now
+        if games % args.report_every == 0:
+            _print_window(samples[-args.report_every:])
+    
+    run_kiosk(canvas, max_games=args.games, on_game_end=on_game_end)
+    canvas.close()
+    print(json.dumps(summarize(samples, args.report_every), indent=2))
+
+
+def summarize(samples, window):
+    """
+    Compare the first and last windows of a soak run.
+    
+    Args:
+        samples: Per-game measurements
+        window: Games per window
+    
+    Returns:
+        dict: Summary with latency drift and memory growth
+    """
+    if not samples:
+        return {"games": 0}
+    first = samples[:window]
+    last = samples[-window:]
+    first_latency = _mean(s["seconds"] for s in first)
+    last_latency = _mean(s["seconds"] for s in last)
+    rss = [s["rss"] for s in samples if s["rss"] is not None]
+    return {
+        "games": len(samples),
+        "first_window_game_seconds": first_latency,
+        "last_window_game_seconds": last_latency,
+        "latency_drift_pct": (
+            100 * (last_latency - first_latency) / first_latency
+            if first_latency else 0.0
+        ),
+        "rss_start": rss[0] if rss else None,
+        "rss_end": rss[-1] if rss else None,
+        "rss_growth": rss[-1] - rss[0] if rss else None,
+        "max_items": max(s["items"] for s in samples),
+    }
+
+
+def _print_window(window):
+    """Print one line summarizing a window of games."""
+    latest = window[-1]
+    rss = latest["rss"]
+    print(
+        f"game {latest['game']:>6}  "
+        f"mean {_mean(s['seconds'] for s in window):7.3f}s  "
+        f"rss {rss / 2**20 if rss else 0:8.1f} MiB  "
+        f"items {latest['items']:>5}",
+        flush=True
+    )
+
+
+def _mean(values):
+    """Average of an iterable of numbers."""
+    values = list(values)
+    return sum(values) / len(values) if values else 0.0
+
+
+if __name__ == '__main__':
+    main()
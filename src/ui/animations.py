@@ -3,8 +3,8 @@ Animation utilities for Movie Mania game.
 Contains text animation and visual effects.
 """
 
-import time
 from src.config import TEXT_ANIMATION_DELAY, BLINK_DURATION, FADE_STEP
+from src.ui.pacing import pause
 
 
 def animate_text(canvas, text, x, y, font, font_size, color, delay=TEXT_ANIMATION_DELAY):
@@ -31,7 +31,7 @@ def animate_text(canvas, text, x, y, font, font_size, color, delay=TEXT_ANIMATIO
     for char in text:
         current_text += char
         canvas.change_text(text_id, current_text)
-        time.sleep(delay)
+        pause(delay)
     return text_id
 
 
@@ -48,9 +48,9 @@ def blink_text(canvas, text_id, color1, color2, times=3):
     """
     for _ in range(times):
         canvas.set_color(text_id, color2)
-        time.sleep(BLINK_DURATION)
+        pause(BLINK_DURATION)
         canvas.set_color(text_id, color1)
-        time.sleep(BLINK_DURATION)
+        pause(BLINK_DURATION)
 
 
 def fade_out_text(canvas, text_id, base_color="240,240,240"):
@@ -64,7 +64,7 @@ def fade_out_text(canvas, text_id, base_color="240,240,240"):
     """
     for alpha in range(100, -1, -FADE_STEP):
         canvas.set_color(text_id, f"rgba({base_color},{alpha/100})")
-        time.sleep(0.15)  # Much slower fade
+        pause(0.15)  # Much slower fade
 
 
 def animate_progress_bar(canvas, x1, y1, x2, y2, target_width, color):
@@ -83,7 +83,7 @@ def animate_progress_bar(canvas, x1, y1, x2, y2, target_width, color):
         shade_val = min(w//5 + 180, 255)
         shade = f"#00{shade_val:02x}{shade_val:02x}"
         canvas.create_rectangle(x1, y1, x1+w, y2, color=shade)
-        time.sleep(0.03)  # Much slower progress bar
+        pause(0.03)  # Much slower progress bar
 
 
 def create_sparkle_effect(canvas, center_x, center_y, count=10):
@@ -101,4 +101,4 @@ def create_sparkle_effect(canvas, center_x, center_y, count=10):
         y = center_y + random.randint(-100, 100)
         canvas.create_oval(x-10, y-10, x+10, y+10, 
                           color="#00b7b7", outline="")
-        time.sleep(0.15)  # Much slower sparkle effect
+        pause(0.15)  # Much slower sparkle effect
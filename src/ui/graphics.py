@@ -3,13 +3,13 @@ Graphics utilities for Movie Mania game.
 Contains background, UI elements, and visual components.
 """
 
-import time
 import random
 from src.config import (
     WIDTH, HEIGHT, BACKGROUND_COLOR, GLOW_COLOR, PANEL_COLOR,
     BAR_COLOR, ACCENT_COLOR, TEXT_COLOR, QUESTION_FONT,
     TITLE_FONT_SIZE, QUESTION_FONT_SIZE, ANSWER_FONT_SIZE
 )
+from src.ui.pacing import pause
 from src.ui.animations import animate_text, animate_progress_bar
 
 
@@ -36,7 +36,7 @@ def create_cinematic_background(canvas):
             x-size, y-size, x+size, y+size, 
             color="rgba(255,255,255,0.5)", outline=""
         )
-        time.sleep(0.05)  # Much slower star animation
+        pause(0.05)  # Much slower star animation
     
     # Decorative elements
     canvas.create_rectangle(25, 25, WIDTH-25, 27, color=GLOW_COLOR)
@@ -92,12 +92,12 @@ def _add_bar_blink_effect(canvas, bar_width):
             50, 30, 50+bar_width, 50, 
             outline="rgba(0,183,183,0.5)"
         )
-        time.sleep(0.4)  # Slower blink
+        pause(0.4)  # Slower blink
         canvas.create_rectangle(
             50, 30, 50+bar_width, 50, 
             outline=GLOW_COLOR
         )
-        time.sleep(0.4)  # Slower blink
+        pause(0.4)  # Slower blink
 
 
 def draw_title_with_shadow(canvas, text, x, y):
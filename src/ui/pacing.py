@@ -0,0 +1,95 @@
+"""
+Pacing control for Movie Mania.
+All animation delays, input polling waits and the question clock go
+through here, so the whole game can run faster than real time for
+soak tests and replays.
+"""
+
+import time
+
+# Game speed: 1 is real time, N is N times faster, 0 is unthrottled
+_speed = 1.0
+_origin = time.time()
+_skipped = 0.0
+
+# Wall-clock seconds spent in animation delays and in input polling
+_animation_seconds = 0.0
+_waiting_seconds = 0.0
+
+
+def set_speed(speed):
+    """
+    Change the game speed.
+
+    Args:
+        speed: 1 for real time, N for N times faster, 0 for no delays
+    """
+    global _speed, _origin, _skipped
+    _skipped = now() - time.time()
+    _origin = time.time()
+    _speed = float(speed)
+
+
+def get_speed():
+    """Return the current game speed."""
+    return _speed
+
+
+def now():
+    """
+    Current game time in seconds.
+
+    Runs N times faster than the wall clock at speed N. When unthrottled,
+    skipped delays are added so timers still expire.
+
+    Returns:
+        float: Game clock reading
+    """
+    if _speed == 0:
+        return time.time() + _skipped
+    return _origin + _skipped + (time.time() - _origin) * _speed
+
+
+def pause(seconds):
+    """
+    Block for an animation delay.
+
+    Args:
+        seconds: Delay at real-time speed
+    """
+    global _animation_seconds
+    start = time.perf_counter()
+    _delay(seconds)
+    _animation_seconds += time.perf_counter() - start
+
+
+def idle(seconds):
+    """
+    Block while polling for player input.
+
+    Args:
+        seconds: Poll interval at real-time speed
+    """
+    global _waiting_seconds
+    start = time.perf_counter()
+    _delay(seconds)
+    _waiting_seconds += time.perf_counter() - start
+
+
+def blocked_time():
+    """
+    Wall-clock time spent blocked so far.
+
+    Returns:
+        tuple: (animation_seconds, waiting_seconds) since startup
+    """
+    return _animation_seconds, _waiting_seconds
+
+
+def _delay(seconds):
+    """Sleep for a delay scaled by the game speed."""
+    global _skipped
+    if _speed == 0:
+        _skipped += seconds
+    else:
+        time.sleep(seconds / _speed)
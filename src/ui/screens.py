@@ -2,11 +2,11 @@
 Screen display module for splash screens and end game screens.
 """
 
-import time
 from src.config import (
     WIDTH, HEIGHT, QUESTION_FONT, TITLE_FONT_SIZE,
     GLOW_COLOR, ACCENT_COLOR, TEXT_COLOR, PANEL_COLOR
 )
+from src.ui.pacing import pause, idle, now
 from src.ui.graphics import create_cinematic_background, draw_title_with_shadow
 from src.ui.animations import animate_text, blink_text
 
@@ -60,7 +60,7 @@ def _show_loading_dots(canvas):
             WIDTH//2-30+i*20, HEIGHT//2+220, 
             color="gray", outline=GLOW_COLOR
         )
-        time.sleep(0.25)  # Much slower dot animation
+        pause(0.25)  # Much slower dot animation
 
 
 def show_prize_screen(canvas, question_num, prize_text, game_over=False, 
@@ -138,7 +138,7 @@ def show_prize_screen(canvas, question_num, prize_text, game_over=False,
         color=GLOW_COLOR, anchor="center"
     )
     
-    time.sleep(0.5)
+    pause(0.5)
 
 
 def show_game_over_screen(canvas, correct_answer):
@@ -176,7 +176,27 @@ def show_game_over_screen(canvas, correct_answer):
         canvas, "Better luck next time!", WIDTH//2, 2*HEIGHT//3, 
         QUESTION_FONT, 20, GLOW_COLOR, delay=0.06
     )
-    time.sleep(3)
+    pause(3)
+
+
+def show_attract_screen(canvas, cycle_seconds=20):
+    """
+    Loop the kiosk attract screen until a key is pressed.
+    
+    Args:
+        canvas: Canvas object
+        cycle_seconds: Seconds before the screen is redrawn
+    """
+    while True:
+        canvas.clear()
+        create_cinematic_background(canvas)
+        _show_animated_title(canvas)
+        animate_text(
+            canvas, "Press any key to play", WIDTH//2, HEIGHT//2+120, 
+            QUESTION_FONT, 28, ACCENT_COLOR, delay=0.02
+        )
+        if _wait_for_key_with_timeout(canvas, timeout=cycle_seconds):
+            return
 
 
 def _wait_for_key_with_timeout(canvas, timeout=30):
@@ -186,13 +206,16 @@ def _wait_for_key_with_timeout(canvas, timeout=30):
     Args:
         canvas: Canvas object
         timeout: Timeout in seconds
+    
+    Returns:
+        bool: True if a key was pressed before the timeout
     """
-    start_time = time.time()
-    while time.time() - start_time < timeout:
+    start_time = now()
+    while now() - start_time < timeout:
         keys = canvas.get_new_key_presses()
         if keys:
-            time.sleep(0.5)
-            break
-        time.sleep(0.005)
-    else:
-        time.sleep(1)
+            pause(0.5)
+            return True
+        idle(0.005)
+    pause(1)
+    return False
@@ -2,11 +2,11 @@
 Timer display module for Movie Mania game.
 """
 
-import time
 from src.config import (
     WIDTH, BAR_COLOR, ACCENT_COLOR, GLOW_COLOR,
     TIMER_TEXT_COLOR, QUESTION_FONT, TIMER_FONT_SIZE, TIMER_DURATION
 )
+from src.ui.pacing import pause
 
 
 def create_timer_display(canvas):
@@ -83,6 +83,6 @@ def flash_timer_timeout(canvas, time_left_id):
     
     for _ in range(3):
         canvas.set_color(time_left_id, TIMER_TEXT_COLOR)
-        time.sleep(0.25)
+        pause(0.25)
         canvas.set_color(time_left_id, PANEL_COLOR)
-        time.sleep(0.25)
+        pause(0.25)
@@ -0,0 +1,98 @@
+"""
+Tests for hot reloading of the question bank.
+"""
+
+import os
+import time
+import pytest
+from src.data import questions as builtin_questions
+from src.data.binary_store import compile_store
+from src.data.loaders import write_bank
+from src.game import question_index
+from src.game.bank_reload import BankReloader
+
+
+@pytest.fixture(autouse=True)
+def default_index(monkeypatch):
+    """Keep the shared index of other tests out of reach."""
+    monkeypatch.setattr(question_index, "_default_index", None)
+
+
+def _write(path, questions):
+    """Write a bank and give it a new modification time."""
+    if path.endswith(".mmqb"):
+        compile_store(iter(questions), path)
+    else:
+        write_bank(path, questions)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+def _wait_for(condition, timeout=5):
+    """Poll until condition() holds."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+@pytest.mark.parametrize("suffix", [".jsonl", ".mmqb"])
+def test_changed_bank_swapped_in_between_games(tmp_path, suffix):
+    """A change is loaded in the background and installed by swap()."""
+    path = str(tmp_path / f"bank{suffix}")
+    _write(path, builtin_questions.QUESTIONS)
+    reloader = BankReloader(path, interval=0.01)
+    reloader.start()
+    try:
+        assert reloader.swap() is None
+        _write(path, builtin_questions.QUESTIONS[::2])
+        _wait_for(lambda: reloader._pending is not None)
+        index = reloader.swap()
+    finally:
+        reloader.stop()
+    count = len(builtin_questions.QUESTIONS[::2])
+    assert len(index) == count
+    assert question_index.default_index() is index
+    assert len(index.question_hashes()) == count
+    assert reloader.swap() is None
+
+
+def test_bank_that_cannot_fill_a_game_is_kept_out(tmp_path, capsys):
+    """A reloaded bank too small for a game is rejected at swap time."""
+    path = str(tmp_path / "bank.jsonl")
+    _write(path, builtin_questions.QUESTIONS)
+    reloader = BankReloader(path)
+    current = question_index.default_index()
+    _write(path, builtin_questions.QUESTIONS[:3])
+    reloader._load(reloader._stat())
+    assert reloader.swap() is None
+    assert question_index.default_index() is current
+    assert "cannot fill a game" in capsys.readouterr().out
+
+
+def test_broken_bank_is_reported(tmp_path, capsys):
+    """A bank that fails to load is reported and nothing is swapped."""
+    path = str(tmp_path / "bank.jsonl")
+    _write(path, builtin_questions.QUESTIONS)
+    reloader = BankReloader(path)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write("{not json\n")
+    reloader._load(reloader._stat())
+    assert capsys.readouterr().out.startswith("Error reloading question bank")
+    assert reloader.swap() is None
+
+
+def test_file_still_changing_is_not_loaded(tmp_path, monkeypatch):
+    """The bank is read only once it stays the same for a whole poll."""
+    path = str(tmp_path / "bank.jsonl")
+    _write(path, builtin_questions.QUESTIONS)
+    reloader = BankReloader(path)
+    stats = iter([(1, 1), (2, 2), (2, 2), (2, 2)])
+    loads = []
+    monkeypatch.setattr(reloader, "_stat", lambda: next(stats))
+    monkeypatch.setattr(reloader, "_load", lambda stat: loads.append(stat)
+                        or setattr(reloader, "loaded", stat))
+    waits = iter([False] * 4 + [True])
+    monkeypatch.setattr(reloader._stop, "wait", lambda timeout: next(waits))
+    reloader._run()
+    assert loads == [(2, 2)]
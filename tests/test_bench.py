@@ -0,0 +1,117 @@
+"""
+Tests for the benchmark runner and baseline comparison.
+"""
+
+import json
+from contextlib import contextmanager
+import pytest
+from src.perf import bench
+from src.perf.bench import (
+    Benchmark, compare, format_seconds, load_results, run_benchmark,
+    save_results, summarize
+)
+from src.tools import bench as bench_tool
+
+
+def _results(**timings):
+    """A results document with the given per-call samples per benchmark."""
+    return {
+        "version": bench.FORMAT_VERSION,
+        "benchmarks": {
+            name: {"loops": 1, "samples": samples, "stats": summarize(samples)}
+            for name, samples in timings.items()
+        },
+    }
+
+
+def test_summarize():
+    """Quartiles are interpolated between sorted samples."""
+    stats = summarize([5.0, 1.0, 4.0, 2.0, 3.0])
+    assert stats["min"] == 1.0 and stats["max"] == 5.0
+    assert (stats["q1"], stats["median"], stats["q3"]) == (2.0, 3.0, 4.0)
+    assert stats["p95"] == pytest.approx(4.8)
+    assert stats["mean"] == 3.0
+    assert summarize([2.0])["stdev"] == 0.0
+
+
+@pytest.mark.parametrize("after, verdict", [
+    ([1.3, 1.32, 1.35, 1.37, 1.4], "slower"),
+    ([0.7, 0.72, 0.75, 0.77, 0.8], "faster"),
+    ([1.01, 1.02, 1.03, 1.04, 1.05], "same"),
+    # Median well up, but the spread overlaps the baseline's
+    ([0.95, 1.0, 1.3, 1.4, 1.5], "same"),
+])
+def test_compare_verdicts(after, verdict):
+    """Only a large median change with separate quartiles counts."""
+    baseline = _results(game=[0.98, 0.99, 1.0, 1.01, 1.02])
+    [row] = compare(baseline, _results(game=after))
+    assert row.verdict == verdict
+    assert row.ratio == pytest.approx(row.current / row.baseline)
+
+
+def test_compare_threshold():
+    """A higher threshold tolerates a bigger slowdown."""
+    baseline = _results(game=[0.98, 0.99, 1.0, 1.01, 1.02])
+    current = _results(game=[1.13, 1.14, 1.15, 1.16, 1.17])
+    assert compare(baseline, current)[0].verdict == "slower"
+    assert compare(baseline, current, threshold=0.2)[0].verdict == "same"
+
+
+def test_compare_skips_new_benchmarks():
+    """Benchmarks missing from the baseline are left out."""
+    baseline = _results(old=[1.0, 1.0, 1.0])
+    current = _results(old=[1.0, 1.0, 1.0], new=[2.0, 2.0, 2.0])
+    assert [row.name for row in compare(baseline, current)] == ["old"]
+
+
+def test_run_benchmark_sets_up_and_cleans_up(monkeypatch):
+    """A benchmark is timed between its setup and clean-up."""
+    monkeypatch.setattr(bench, "MIN_SAMPLE_SECONDS", 0.001)
+    events = []
+
+    @contextmanager
+    def setup():
+        events.append("setup")
+        yield lambda: sum(range(100))
+        events.append("cleanup")
+
+    result = run_benchmark(Benchmark("sum", setup), samples=4)
+    assert events == ["setup", "cleanup"]
+    assert len(result["samples"]) == 4
+    assert result["loops"] >= 1
+    assert result["stats"]["min"] > 0
+
+
+def test_results_round_trip(tmp_path):
+    """Saved results load back; other files are rejected."""
+    path = tmp_path / "baseline.json"
+    results = _results(game=[1.0, 2.0])
+    save_results(results, path)
+    assert load_results(path) == results
+    path.write_text(json.dumps({"version": 99, "benchmarks": {}}))
+    with pytest.raises(ValueError):
+        load_results(path)
+
+
+@pytest.mark.parametrize("seconds, text", [
+    (2.5, "2.5 s"), (0.00123, "1.23 ms"), (4.2e-6, "4.2 us"), (5e-8, "50 ns"),
+])
+def test_format_seconds(seconds, text):
+    """Durations use the largest unit they reach."""
+    assert format_seconds(seconds) == text
+
+
+def test_compare_command_exit_status(tmp_path, capsys):
+    """compare exits 1 on a regression, 0 otherwise and 2 on a bad file."""
+    baseline = tmp_path / "baseline.json"
+    slower = tmp_path / "slower.json"
+    save_results(_results(game=[0.98, 0.99, 1.0, 1.01, 1.02]), baseline)
+    save_results(_results(game=[1.3, 1.32, 1.35, 1.37, 1.4]), slower)
+    assert bench_tool.main(["compare", str(baseline), str(slower)]) == 1
+    assert "regressed: game" in capsys.readouterr().out
+    assert bench_tool.main(["compare", str(slower), str(baseline)]) == 0
+    capsys.readouterr()
+    assert bench_tool.main(
+        ["compare", str(baseline), str(tmp_path / "missing.json")]) == 2
+    assert capsys.readouterr().out.startswith(
+        "Error reading benchmark results")
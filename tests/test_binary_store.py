@@ -0,0 +1,136 @@
+"""
+Tests for the memory-mapped binary question store.
+"""
+
+import random
+import pytest
+from src.data import questions as builtin_questions
+from src.data.binary_store import BinaryQuestionStore, compile_store
+from src.data.loaders import QuestionFormatError
+from src.data.records import question_hash
+from src.game import calibration as calibration_module
+from src.game.question_index import QuestionIndex
+
+
+@pytest.fixture
+def store(tmp_path):
+    """The built-in questions compiled to a store."""
+    path = str(tmp_path / "bank.mmqb")
+    compile_store(iter(builtin_questions.QUESTIONS), path)
+    store = BinaryQuestionStore(path)
+    yield store
+    store.close()
+
+
+def test_hashes_read_from_the_store(store):
+    """The stored hash of every position matches its question's text."""
+    hashes = store.question_hashes()
+    assert len(hashes) == len(store)
+    assert list(hashes) == [question_hash(q.question) for q in store]
+
+
+def test_older_store_version_is_rejected(tmp_path, store):
+    """A store without the hash column asks to be recompiled."""
+    path = str(tmp_path / "old.mmqb")
+    with open(store.path, "rb") as f:
+        data = bytearray(f.read())
+    data[4:6] = (1).to_bytes(2, "little")
+    with open(path, "wb") as f:
+        f.write(data)
+    with pytest.raises(ValueError, match="recompile"):
+        BinaryQuestionStore(path)
+
+
+def test_disabled_calibration_reads_no_hashes(monkeypatch):
+    """Startup does not hash the bank when calibration is off."""
+    class Index:
+        def question_hashes(self):
+            raise AssertionError("hashes read")
+    monkeypatch.setattr(calibration_module, "CALIBRATION_FILE", None)
+    monkeypatch.setattr(calibration_module, "_default_calibration", None)
+    assert calibration_module.default_calibration(Index()) is None
+
+
+def _question(text, genre, difficulty, options=("a", "b", "c", "d")):
+    """A question dictionary answered by its first option."""
+    return {
+        "question": text, "options": list(options), "answer": options[0],
+        "audience": [70, 10, 10, 10][:len(options)],
+        "genre": genre, "difficulty": difficulty,
+    }
+
+
+def test_round_trip_sorted_into_buckets(store):
+    """Every question comes back intact, grouped by difficulty and genre."""
+    by_text = {q["question"]: q for q in builtin_questions.QUESTIONS}
+    assert len(store) == len(by_text)
+    for record in store:
+        assert record.to_dict() == by_text[record.question]
+    keys = [(q.difficulty, q.genre) for q in store]
+    order = {d: i for i, d in enumerate(("easy", "medium", "hard"))}
+    assert [order[d] for d, _ in keys] == sorted(order[d] for d, _ in keys)
+
+
+def test_bucket_ranges_cover_the_store(store):
+    """Bucket ranges are contiguous, cover every position and match keys."""
+    ranges = sorted(store.index_buckets().items(), key=lambda kv: kv[1].start)
+    assert ranges[0][1].start == 0
+    assert ranges[-1][1].stop == len(store)
+    for (_, before), (_, after) in zip(ranges, ranges[1:]):
+        assert before.stop == after.start
+    for key, positions in ranges:
+        # First and last position of each bucket, either side of a boundary
+        assert store.key(positions.start) == key
+        assert store.key(positions.stop - 1) == key
+        assert store[positions.start].genre == key[1]
+
+
+def test_positions_out_of_range(store):
+    """Negative positions count from the end; others raise IndexError."""
+    assert store[-1] == store[len(store) - 1]
+    with pytest.raises(IndexError):
+        store[len(store)]
+    with pytest.raises(IndexError):
+        store[-len(store) - 1]
+
+
+def test_unicode_and_three_option_questions(tmp_path):
+    """Non-ASCII text and short option lists survive compilation."""
+    path = str(tmp_path / "bank.mmqb")
+    questions = [
+        _question("Qui a réalisé Amélie ?", "Cinéma", "easy"),
+        _question("映画のタイトルは?", "アニメ", "hard", ("一", "二", "三")),
+        _question("Plain?", "Cinéma", "easy"),
+    ]
+    assert compile_store(iter(questions), path) == 3
+    store = BinaryQuestionStore(path)
+    try:
+        stored = {q.question: q.to_dict() for q in store}
+        assert stored == {q["question"]: q for q in questions}
+        assert sorted(store.genre_names) == ["Cinéma", "アニメ"]
+    finally:
+        store.close()
+
+
+def test_separator_in_text_is_rejected(tmp_path):
+    """Text holding the string separator cannot be stored."""
+    path = tmp_path / "bank.mmqb"
+    bad = _question("Broken\x1fquestion", "Drama", "easy")
+    with pytest.raises(QuestionFormatError, match="separator"):
+        compile_store(iter([bad]), str(path))
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_index_over_store_uses_ranges(store):
+    """A QuestionIndex over a store samples from its bucket ranges."""
+    index = QuestionIndex(store)
+    for (difficulty, genre), positions in store.index_buckets().items():
+        assert list(index.bucket(difficulty, genre)) == list(positions)
+    for difficulty in ("easy", "medium", "hard"):
+        bucket = index.bucket(difficulty)
+        assert len(bucket) == sum(
+            1 for q in store if q.difficulty == difficulty
+        )
+        assert all(store[p].difficulty == difficulty for p in bucket)
+    picked = index.sample(5, "hard", rng=random.Random(1))
+    assert all(q.difficulty == "hard" for q in picked)
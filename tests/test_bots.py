@@ -0,0 +1,49 @@
+"""
+Tests for the bot load generator.
+"""
+
+import asyncio
+import json
+import random
+from src.server.bots import run_bot, _Countdown
+
+
+async def _serve_error_on_answer(reader, writer):
+    """A server that offers one question and rejects every answer."""
+    while True:
+        line = await reader.readline()
+        if not line:
+            break
+        op = json.loads(line)["op"]
+        if op == "start":
+            reply = {"event": "question", "index": 0, "options": ["a", "b", "c", "d"]}
+        elif op == "answer":
+            reply = {"event": "error", "message": "No question in play"}
+        else:
+            break
+        writer.write(json.dumps(reply).encode() + b"\n")
+        await writer.drain()
+    writer.close()
+
+
+def test_bot_stops_on_answer_error():
+    """An error reply to an answer ends the game instead of hanging."""
+    async def scenario():
+        server = await asyncio.start_server(_serve_error_on_answer, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        latencies = []
+        # No lifelines, so the only reply the bot waits for is the answer's
+        rng = random.Random(0)
+        rng.random = lambda: 1.0
+        try:
+            finished = await asyncio.wait_for(run_bot(
+                "127.0.0.1", port, "bot", 2, rng, latencies, _Countdown(1)
+            ), timeout=5)
+        finally:
+            server.close()
+            await server.wait_closed()
+        return finished, latencies
+
+    finished, latencies = asyncio.run(scenario())
+    assert finished == 0
+    assert len(latencies) == 2
@@ -0,0 +1,107 @@
+"""
+Tests for online difficulty calibration and the batch re-fit.
+"""
+
+import json
+import pytest
+from src.data.records import Question, question_hash
+from src.game.calibration import Calibration, DIFFICULTY_PRIORS
+
+np = pytest.importorskip("numpy")
+from src.game.calibration_fit import load_answers, refit, log_loss  # noqa: E402
+
+
+def _question(qid, text, difficulty="medium"):
+    return Question(qid, text, ("A", "B", "C", "D"), 0, (25, 25, 25, 25),
+                    "Drama", difficulty, None)
+
+
+def _telemetry(path, games):
+    """
+    Write a telemetry log.
+
+    Args:
+        path: Output file
+        games: List of (player, [(qid, text, correct), ...])
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        for number, (player, answers) in enumerate(games):
+            game = f"g{number}"
+            f.write(json.dumps({"type": "game_start", "game": game,
+                                "player": player}) + "\n")
+            for i, (qid, text, correct) in enumerate(answers):
+                f.write(json.dumps({
+                    "type": "question", "game": game, "index": i, "qid": qid,
+                    "options": 4, "genre": "Drama", "difficulty": "medium",
+                    "text": text,
+                }) + "\n")
+                f.write(json.dumps({
+                    "type": "answer", "game": game, "index": i,
+                    "outcome": "correct" if correct else "wrong",
+                }) + "\n")
+
+
+def _log(tmp_path):
+    """Answers to an easy-in-practice "Q1" and a hard-in-practice "Q2"."""
+    games = []
+    for player in range(20):
+        games.append((f"p{player}", [
+            (0, "Q1", True), (1, "Q2", player % 5 == 0), (500, "Gone", True),
+        ]))
+    path = tmp_path / "telemetry.jsonl"
+    _telemetry(path, games)
+    return load_answers([path])
+
+
+def test_refit_follows_questions_by_text(tmp_path):
+    """Answers are credited to questions by text, wherever they now are."""
+    log = _log(tmp_path)
+    # The bank has shrunk and been reordered since the games were played
+    hashes = [question_hash(t) for t in ("New", "Q2", "Q1")]
+    calibration = refit(log, hashes)
+    assert list(calibration.counts) == [0, 20, 20]
+    assert calibration.offsets[0] == 0.0
+    assert calibration.offsets[1] > 0.5
+    assert calibration.offsets[2] < -0.5
+    assert calibration.updates == 60
+    assert set(calibration.players) == {f"p{i}" for i in range(20)}
+
+
+def test_refit_on_a_bank_without_the_questions(tmp_path):
+    """A bank sharing no questions with the log is left at its priors."""
+    calibration = refit(_log(tmp_path), [question_hash("Other")])
+    assert list(calibration.offsets) == [0.0]
+    assert list(calibration.counts) == [0]
+
+
+def test_log_loss_improves_after_refit(tmp_path):
+    """The re-fit predicts the log better than an empty calibration."""
+    log = _log(tmp_path)
+    hashes = [question_hash("Q1"), question_hash("Q2")]
+    assert log_loss(log, refit(log, hashes)) < log_loss(log, Calibration(hashes))
+
+
+def test_record_moves_estimates():
+    """Wrong answers raise a question's difficulty, right ones lower it."""
+    calibration = Calibration([question_hash("Q1"), question_hash("Q2")])
+    for _ in range(10):
+        calibration.record(_question(0, "Q1"), False, "Ada")
+        calibration.record(_question(1, "Q2"), True, "Ada")
+    assert calibration.difficulty(0, "medium") > DIFFICULTY_PRIORS["medium"]
+    assert calibration.difficulty(1, "medium") < DIFFICULTY_PRIORS["medium"]
+    assert list(calibration.counts) == [10, 10]
+    assert calibration.skill("ADA ") == calibration.skill("ada")
+
+
+def test_remap_and_reload(tmp_path):
+    """Estimates follow their questions through a save, reload and edit."""
+    calibration = Calibration([question_hash(t) for t in ("Q1", "Q2", "Q3")])
+    calibration.record(_question(1, "Q2"), False, "Ada")
+    path = str(tmp_path / "calibration.bin")
+    calibration.save(path)
+
+    edited = [question_hash(t) for t in ("Q2", "Q4", "Q1")]
+    loaded = Calibration.load(edited, path)
+    assert list(loaded.counts) == [1, 0, 0]
+    assert loaded.offsets[0] == calibration.offsets[1]
+    assert loaded.skill("Ada") == calibration.skill("Ada")
@@ -0,0 +1,103 @@
+"""
+Tests for MinHash/LSH near-duplicate detection.
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.data import questions as builtin_questions
+from src.data.dedup import (
+    SHINGLE_SIZE, find_duplicates, lsh_bands, minhash_signatures,
+    question_text, _find
+)
+
+BANK = [(q["question"], q["options"]) for q in builtin_questions.QUESTIONS]
+
+
+def _shingles(text):
+    """Set of SHINGLE_SIZE-byte windows of a text."""
+    data = text.encode("utf-8")
+    return {data[i:i + SHINGLE_SIZE] for i in range(len(data) - SHINGLE_SIZE + 1)}
+
+
+def _reworded(question, options):
+    """A light rewording: different case, punctuation and option order."""
+    return question.upper().replace("?", " ?!"), list(reversed(options))
+
+
+def test_question_text_ignores_case_punctuation_and_order():
+    """Shuffled options, case and punctuation do not change the text."""
+    assert question_text("Who directed JAWS?", ["Lucas", "spielberg"]) == (
+        question_text("who directed jaws", ["Spielberg", "Lucas!"])
+    )
+
+
+def test_signatures_estimate_jaccard():
+    """Agreeing signature slots approximate shingle set similarity."""
+    a = question_text(*BANK[0])
+    b = question_text(BANK[0][0] + " in the original film", BANK[0][1])
+    signatures = minhash_signatures([a, b], permutations=1024)
+    estimate = (signatures[0] == signatures[1]).mean()
+    sa, sb = _shingles(a), _shingles(b)
+    assert estimate == pytest.approx(len(sa & sb) / len(sa | sb), abs=0.05)
+
+
+def test_signatures_are_stable():
+    """A text's signature does not depend on its batch."""
+    texts = [question_text(*q) for q in BANK[:5]] + ["ab"]
+    together = minhash_signatures(texts)
+    alone = np.vstack([minhash_signatures([t]) for t in texts])
+    assert (together == alone).all()
+
+
+@pytest.mark.parametrize("permutations, threshold", [
+    (128, 0.7), (64, 0.5), (256, 0.9), (16, 0.8),
+])
+def test_lsh_bands_fit_signature(permutations, threshold):
+    """Bands of rows fit in the signature and favour the threshold."""
+    bands, rows = lsh_bands(permutations, threshold)
+    assert bands * rows <= permutations
+    # The candidate curve crosses one half near the threshold
+    crossing = (1 / bands) ** (1 / rows)
+    assert crossing == pytest.approx(threshold, abs=0.15)
+
+
+def test_distinct_bank_has_no_duplicates():
+    """The built-in questions are all different."""
+    assert find_duplicates(BANK, workers=1) == []
+
+
+def test_rewordings_are_clustered():
+    """Reworded copies are grouped with their originals, largest first."""
+    bank = list(BANK)
+    bank.append(_reworded(*BANK[3]))
+    bank.append(_reworded(*BANK[10]))
+    bank.append(BANK[3])
+    clusters = find_duplicates(bank, workers=1)
+    n = len(BANK)
+    assert [c.positions for c in clusters] == [[3, n, n + 2], [10, n + 1]]
+    assert all(0.7 <= c.similarity <= 1.0 for c in clusters)
+
+
+def test_chunks_and_workers_agree():
+    """Chunking and process pools do not change the clusters."""
+    bank = list(BANK) + [_reworded(*q) for q in BANK[:20]]
+    inline = find_duplicates(bank, workers=1, chunk_size=4096)
+    chunked = find_duplicates(bank, workers=1, chunk_size=7)
+    pooled = find_duplicates(bank, workers=2, chunk_size=16)
+    assert inline == chunked == pooled
+    assert len(inline) == 20
+
+
+def test_small_inputs():
+    """Fewer than two questions cannot hold duplicates."""
+    assert find_duplicates([], workers=1) == []
+    assert find_duplicates(BANK[:1], workers=1) == []
+
+
+def test_find_compresses_paths():
+    """Roots are found through chains and every pointer is flattened."""
+    parent = np.array([0, 0, 1, 2, 3, 5, 5])
+    assert _find(parent, np.array([4, 6])).tolist() == [0, 5]
+    assert parent.tolist() == [0, 0, 0, 0, 0, 5, 5]
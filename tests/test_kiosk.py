@@ -0,0 +1,82 @@
+"""
+Tests for kiosk mode and the soak test summary.
+"""
+
+import random
+import pytest
+from graphics import HeadlessCanvas
+from src.game import kiosk
+from src.tools.soak import ScriptedPlayer, summarize
+from src.ui.pacing import set_speed, get_speed
+
+
+@pytest.fixture
+def headless():
+    """A headless canvas with delays skipped."""
+    speed = get_speed()
+    set_speed(0)
+    canvas = HeadlessCanvas(800, 600)
+    yield canvas
+    canvas.close()
+    set_speed(speed)
+
+
+@pytest.fixture
+def saved(monkeypatch):
+    """Results the kiosk saves, with every disk sink switched off."""
+    results = []
+    monkeypatch.setattr(kiosk, "save_to_leaderboard",
+                        lambda name, prize: results.append((name, prize)) or
+                        (len(results), len(results)))
+    monkeypatch.setattr(kiosk, "display_leaderboard", lambda *args: None)
+    monkeypatch.setattr(kiosk, "display_rank", lambda *args: None)
+    monkeypatch.setattr(kiosk, "default_results", lambda: None)
+    monkeypatch.setattr(kiosk, "default_sink", lambda: None)
+    return results
+
+
+def test_kiosk_plays_games_back_to_back(headless, saved):
+    """Every game is saved and reported, and the canvas does not fill up."""
+    headless.input_script = ScriptedPlayer(seed=5)
+    ends = []
+
+    def on_game_end(games, player_name, score):
+        ends.append((games, player_name, score, headless.item_count()))
+
+    assert kiosk.run_kiosk(headless, max_games=6, on_game_end=on_game_end) == 6
+    assert [end[0] for end in ends] == [1, 2, 3, 4, 5, 6]
+    assert len(saved) == 6
+    assert [name for name, _ in saved] == [end[1] for end in ends]
+    # Each game starts from a cleared canvas
+    items = [end[3] for end in ends]
+    assert max(items) <= 2 * min(items)
+
+
+def test_kiosk_same_seed_same_games(headless, saved):
+    """Scripted kiosks with the same seeds play the same games."""
+    runs = []
+    for _ in range(2):
+        random.seed(9)
+        headless.input_script = ScriptedPlayer(seed=9)
+        scores = []
+        kiosk.run_kiosk(headless, max_games=3,
+                        on_game_end=lambda g, name, score: scores.append(score))
+        runs.append(scores)
+    assert runs[0] == runs[1]
+
+
+def test_soak_summary():
+    """The summary compares the first and last windows of a run."""
+    samples = [
+        {"game": i + 1, "seconds": 1.0 if i < 2 else 1.5,
+         "rss": 1000 + i, "items": 40 + i, "score": 0}
+        for i in range(6)
+    ]
+    summary = summarize(samples, 2)
+    assert summary["games"] == 6
+    assert summary["first_window_game_seconds"] == 1.0
+    assert summary["last_window_game_seconds"] == 1.5
+    assert summary["latency_drift_pct"] == pytest.approx(50.0)
+    assert summary["rss_growth"] == 5
+    assert summary["max_items"] == 45
+    assert summarize([], 2) == {"games": 0}
@@ -0,0 +1,130 @@
+"""
+Tests for the latency histogram and the input latency probe.
+"""
+
+import random
+import pytest
+from src.perf import latency
+from src.perf.latency import LatencyHistogram, LatencyProbe
+
+# Values around every power of two up to a minute, in microseconds
+EDGES = sorted({max(0, (1 << bits) + delta)
+                for bits in range(27) for delta in (-2, -1, 0, 1, 2)})
+
+
+def test_small_values_are_exact():
+    """Below the sub-bucket count every microsecond has its own bucket."""
+    histogram = LatencyHistogram()
+    for micros in range(histogram.sub_buckets):
+        assert histogram._index(micros) == micros
+        assert histogram._highest(micros) == micros
+
+
+@pytest.mark.parametrize("bits", [2, 5, 8])
+def test_buckets_hold_their_values(bits):
+    """Each value falls in the one bucket whose range covers it."""
+    histogram = LatencyHistogram(bits)
+    for micros in EDGES + list(range(4 * histogram.sub_buckets)):
+        index = histogram._index(micros)
+        assert histogram._highest(index) >= micros
+        assert index == 0 or histogram._highest(index - 1) < micros
+        assert histogram._index(histogram._highest(index)) == index
+
+
+def test_buckets_are_within_one_percent():
+    """A bucket is never wider than 1% of the values in it."""
+    histogram = LatencyHistogram()
+    for micros in EDGES:
+        index = histogram._index(micros)
+        low = histogram._highest(index - 1) + 1 if index else 0
+        assert histogram._highest(index) - low < max(1, 0.01 * low)
+
+
+def test_a_minute_fits_in_about_20_kilobytes():
+    """Counts up to a minute stay small enough to keep on all day."""
+    histogram = LatencyHistogram()
+    histogram.record(60.0)
+    assert len(histogram.counts) * 8 < 21_000
+
+
+def test_percentiles_match_a_sort():
+    """Percentiles are within a bucket of the exact values."""
+    rng = random.Random(3)
+    values = [rng.lognormvariate(-4, 1.5) for _ in range(5000)]
+    histogram = LatencyHistogram()
+    for value in values:
+        histogram.record(value)
+    ordered = sorted(values)
+    for percent in (1, 50, 90, 99, 99.9, 100):
+        exact = ordered[int(max(1, -(-len(values) * percent // 100))) - 1]
+        assert histogram.percentile(percent) == pytest.approx(
+            exact, rel=0.01, abs=2e-6)
+    assert histogram.percentile(100) == max(values)
+    assert histogram.summary()["mean"] == pytest.approx(
+        sum(values) / len(values))
+
+
+def test_empty_and_negative():
+    """An empty histogram reports zeros; negative latencies count as 0."""
+    histogram = LatencyHistogram()
+    assert histogram.summary() == {
+        "count": 0, "mean": 0.0, "p50": 0.0, "p90": 0.0, "p99": 0.0,
+        "p99.9": 0.0, "max": 0.0,
+    }
+    histogram.record(-0.5)
+    assert histogram.counts == [1]
+    assert histogram.percentile(50) == 0.0
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """A perf_counter the test moves by hand."""
+    now = [100.0]
+    monkeypatch.setattr(latency.time, "perf_counter", lambda: now[0])
+    return now
+
+
+def test_probe_times_from_first_key(clock):
+    """A batch is timed from its first key to the response on screen."""
+    probe = LatencyProbe()
+    probe.key_arrived()
+    clock[0] += 0.005
+    probe.key_arrived()
+    probe.keys_delivered()
+    clock[0] += 0.010
+    probe.responded()
+    probe.responded()
+    assert probe.total.count == 1
+    assert probe.total.max == pytest.approx(0.015)
+    assert probe.queued.max == 0.0
+
+
+def test_ignored_keys_are_dropped(clock):
+    """Keys the game read but showed nothing for are not counted."""
+    probe = LatencyProbe()
+    probe.key_arrived()
+    probe.keys_delivered()
+    clock[0] += 0.5
+    probe.key_arrived()
+    probe.keys_delivered()
+    clock[0] += 0.002
+    probe.responded()
+    assert probe.total.count == 1
+    assert probe.total.max == pytest.approx(0.002)
+
+
+def test_queueing_estimated_from_event_times(clock):
+    """Time queued is the gap to the server clock beyond the smallest."""
+    probe = LatencyProbe()
+    probe.key_arrived(event_time=clock[0] * 1000 - 7)
+    probe.keys_delivered()
+    probe.responded()
+    clock[0] += 1.0
+    # Pressed 30 ms before dispatch, against a usual 7 ms offset
+    probe.key_arrived(event_time=clock[0] * 1000 - 37)
+    probe.keys_delivered()
+    clock[0] += 0.004
+    probe.responded()
+    assert probe.queued.max == pytest.approx(0.030)
+    assert probe.total.max == pytest.approx(0.034)
+    assert "over 2 responses" in probe.report()
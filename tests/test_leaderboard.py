@@ -0,0 +1,58 @@
+"""
+Tests for the shared leaderboard's save error reporting.
+"""
+
+import threading
+from datetime import datetime
+from src.game import leaderboard
+from src.game.leaderboard_cache import LeaderboardCache
+from src.game.leaderboard_store import JsonLeaderboard
+from src.game.leaderboard_writer import LeaderboardWriter
+
+
+class _BrokenStore:
+    """A store whose saves always fail."""
+
+    def version(self):
+        return 0
+
+    def add_many(self, entries):
+        raise OSError("disk full")
+
+
+def test_failed_save_reported_on_game_thread(tmp_path, monkeypatch):
+    """A writer error is printed by the next call on the game thread."""
+    store = JsonLeaderboard(str(tmp_path / "leaderboard.json"))
+    cache = LeaderboardCache(store)
+    monkeypatch.setattr(leaderboard, "_cache", cache)
+    threads = []
+    monkeypatch.setattr(
+        leaderboard, "print",
+        lambda *args: threads.append(threading.current_thread()),
+        raising=False
+    )
+    writer = LeaderboardWriter(_BrokenStore(),
+                               on_error=leaderboard._save_failed)
+    try:
+        entry = {"name": "me", "score": 1000,
+                 "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+        cache.insert(entry)
+        writer.submit(entry)
+        writer.flush()
+    finally:
+        writer.close()
+    # The failed result is no longer shown, and nothing printed yet
+    assert cache.top(10) == []
+    assert threads == []
+    leaderboard.report_save_errors()
+    assert threads == [threading.current_thread()]
+    leaderboard.report_save_errors()
+    assert len(threads) == 1
+
+
+def test_report_save_errors_message(monkeypatch, capsys):
+    """Queued errors are printed once, in the kiosk's error format."""
+    monkeypatch.setattr(leaderboard, "_save_errors",
+                        leaderboard.deque([OSError("disk full")]))
+    leaderboard.report_save_errors()
+    assert capsys.readouterr().out == "Error saving leaderboard: disk full\n"
@@ -0,0 +1,152 @@
+"""
+Tests for the leaderboard cache fed by the background writer.
+"""
+
+import threading
+from datetime import datetime
+import pytest
+from src.game.leaderboard_cache import LeaderboardCache
+from src.game.leaderboard_store import (
+    JsonLeaderboard, SqliteLeaderboard, LogLeaderboard
+)
+from src.game.leaderboard_writer import LeaderboardWriter
+
+
+def _store(backend, directory):
+    """An empty store of one backend in directory."""
+    if backend == "json":
+        return JsonLeaderboard(str(directory / "leaderboard.json"))
+    if backend == "sqlite":
+        return SqliteLeaderboard(str(directory / "leaderboard.sqlite"),
+                                 import_from=None)
+    return LogLeaderboard(str(directory / "leaderboard.log"),
+                          str(directory / "leaderboard.snapshot"),
+                          import_from=None)
+
+
+def _entry(name, score):
+    """An entry dict timestamped now."""
+    return {"name": name, "score": score,
+            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+
+
+@pytest.mark.parametrize("backend", ["json", "sqlite", "log"])
+@pytest.mark.parametrize("window", ["day", "week", "all"])
+def test_store_read_between_commit_and_callback(tmp_path, backend, window):
+    """A result the cache re-reads before saved() runs is shown once."""
+    store = _store(backend, tmp_path)
+    store.add_many([_entry("old", 100)])
+    cache = LeaderboardCache(store)
+    committed = threading.Event()
+    resume = threading.Event()
+
+    def on_saved(entries, keys, before, after):
+        committed.set()
+        assert resume.wait(5)
+        cache.saved(entries, before, after)
+
+    writer = LeaderboardWriter(store, on_saved=on_saved)
+    try:
+        entry = _entry("me", 1000)
+        cache.insert(entry)
+        writer.submit(entry)
+        assert committed.wait(5)
+        # The store already holds the result; the writer has not said so
+        assert [e["name"] for e in cache.top(10, window)] == ["me", "old"]
+        resume.set()
+        writer.flush()
+        assert [e["name"] for e in cache.top(10, window)] == ["me", "old"]
+    finally:
+        resume.set()
+        writer.close()
+        store.close()
+
+
+def test_saved_without_reread_shows_result(tmp_path):
+    """A save reported before any re-read is pushed into the buckets."""
+    store = _store("sqlite", tmp_path)
+    cache = LeaderboardCache(store)
+    assert cache.top(10) == []
+    writer = LeaderboardWriter(
+        store, on_saved=lambda entries, keys, before, after:
+        cache.saved(entries, before, after)
+    )
+    try:
+        entry = _entry("me", 1000)
+        cache.insert(entry)
+        writer.submit(entry)
+        writer.flush()
+        for window in ("day", "week", "all"):
+            assert cache.top(10, window) == [entry]
+    finally:
+        writer.close()
+        store.close()
+
+
+class _CountingStore:
+    """A store wrapper that counts the reads reaching it."""
+
+    def __init__(self, store):
+        self.store = store
+        self.reads = 0
+
+    def top(self, n):
+        self.reads += 1
+        return self.store.top(n)
+
+    def since(self, timestamp):
+        return self.store.since(timestamp)
+
+    def version(self):
+        return self.store.version()
+
+
+@pytest.mark.parametrize("backend", ["json", "sqlite", "log"])
+def test_store_read_only_after_changes(tmp_path, backend):
+    """Displays re-read the store only when another writer changed it."""
+    store = _store(backend, tmp_path)
+    store.add_many([_entry("old", 100)])
+    counting = _CountingStore(store)
+    cache = LeaderboardCache(counting)
+    for _ in range(3):
+        assert [e["name"] for e in cache.top(10)] == ["old"]
+    assert counting.reads == 1
+
+    # Another process saves: a different connection for SQLite
+    other = _store(backend, tmp_path)
+    other.add_many([_entry("other", 500)])
+    assert [e["name"] for e in cache.top(10)] == ["other", "old"]
+    assert counting.reads == 2
+    other.close()
+    store.close()
+
+
+def test_larger_request_reloads(tmp_path):
+    """Asking for more entries than are cached reads the store again."""
+    store = _store("json", tmp_path)
+    store.add_many([_entry(f"p{i}", i) for i in range(8)])
+    counting = _CountingStore(store)
+    cache = LeaderboardCache(counting, size=3)
+    assert len(cache.top(3)) == 3
+    assert len(cache.top(5)) == 5
+    assert counting.reads == 2
+    assert len(cache.top(4)) == 4
+    assert counting.reads == 2
+
+
+def test_discarded_result_no_longer_shown(tmp_path):
+    """A result whose save failed disappears from the standings."""
+    store = _store("json", tmp_path)
+    cache = LeaderboardCache(store)
+    entry = _entry("me", 1000)
+    cache.insert(entry)
+    assert cache.top(10) == [entry]
+    cache.discard([entry])
+    assert cache.top(10) == []
+
+
+def test_unknown_window_rejected(tmp_path):
+    """Only the day, week and all-time windows exist."""
+    cache = LeaderboardCache(_store("json", tmp_path))
+    with pytest.raises(ValueError, match="Unknown leaderboard window"):
+        cache.top(10, "month")
@@ -0,0 +1,107 @@
+"""
+Tests for the Fenwick rank index over leaderboard scores.
+"""
+
+import random
+import pytest
+from src.game.leaderboard_rank import LeaderboardRanks, ScoreRanks
+from src.game.leaderboard_store import SqliteLeaderboard
+
+
+def _sorted(results):
+    """(key, score) results in leaderboard order: best, then earliest."""
+    return sorted(results, key=lambda r: -r[1])
+
+
+def _check(ranks, results):
+    """The index agrees with a sort of every result."""
+    expected = _sorted(results)
+    assert len(ranks) == len(expected)
+    for r in range(1, len(expected) + 1):
+        key, score = expected[r - 1]
+        assert ranks.around(r, 0) == [(r, key, score)]
+    for score in {s for _, s in results} | {-1, 10**9}:
+        assert ranks.rank(score) == 1 + sum(s > score for _, s in results)
+
+
+@pytest.mark.parametrize("distinct", [1, 2, 3, 4, 7, 8, 9, 16, 100])
+def test_adds_match_a_full_sort(distinct):
+    """Ranks from add() match a stable sort, with ties placed last."""
+    rng = random.Random(distinct)
+    ranks = ScoreRanks()
+    results = []
+    for key in range(300):
+        score = rng.randrange(distinct) * 500
+        results.append((key, score))
+        expected = [k for k, _ in _sorted(results)].index(key) + 1
+        assert ranks.add(key, score) == expected
+    _check(ranks, results)
+
+
+@pytest.mark.parametrize("sizes", [
+    [1], [3, 1], [1, 1, 1, 1], [2, 5, 1, 4], [1] * 8, [4] * 8, [1] * 9,
+    [3, 1, 4, 1, 5, 9, 2, 6, 5, 3, 5, 8, 9, 7, 9, 3],
+])
+def test_find_at_bucket_boundaries(sizes):
+    """Every rank, including each bucket's first and last, finds its bucket."""
+    ranked = [(f"{i}-{j}", -i) for i, size in enumerate(sizes)
+              for j in range(size)]
+    ranks = ScoreRanks(ranked)
+    rank = 0
+    for i, size in enumerate(sizes):
+        for _ in range(size):
+            rank += 1
+            assert ranks._find(rank) == i
+    _check(ranks, ranked)
+
+
+def test_built_and_grown_index_agree():
+    """An index built in one go matches one grown result by result."""
+    rng = random.Random(5)
+    results = [(k, rng.choice([0, 500, 1000, 32000])) for k in range(200)]
+    grown = ScoreRanks()
+    for key, score in results:
+        grown.add(key, score)
+    built = ScoreRanks(_sorted(results))
+    assert built.tree == grown.tree
+    assert built.buckets == grown.buckets
+
+
+def test_ties_share_their_best_rank():
+    """Results with equal scores share rank() but get their own place."""
+    ranks = ScoreRanks([("a", 1000), ("b", 500), ("c", 500)])
+    assert ranks.rank(500) == 2
+    assert ranks.add("d", 500) == 4
+    assert ranks.rank(750) == 2
+    assert ranks.rank(0) == 5
+
+
+def test_around_clips_to_the_leaderboard():
+    """around() stops at the first and last rank."""
+    ranks = ScoreRanks([("a", 3), ("b", 2), ("c", 1)])
+    assert [r for r, _, _ in ranks.around(1)] == [1, 2, 3]
+    assert [r for r, _, _ in ranks.around(3, 1)] == [2, 3]
+    assert ScoreRanks().around(1) == []
+
+
+def test_ranks_follow_other_processes(tmp_path):
+    """refresh() adds other processes' results once and not our own twice."""
+    path = str(tmp_path / "leaderboard.sqlite")
+    ours = SqliteLeaderboard(path, import_from=None)
+    theirs = SqliteLeaderboard(path, import_from=None)
+    theirs.add_many([{"name": "x", "score": 500, "timestamp": "t"}])
+    ranks = LeaderboardRanks(ours)
+    ranks.refresh()
+
+    entry = {"name": "me", "score": 1000, "timestamp": "t"}
+    assert ranks.placed(entry) == (1, 2)
+    ranks.saved(ours.add_many([entry]))
+    theirs.add_many([{"name": "y", "score": 2000, "timestamp": "t"}])
+    ranks.refresh()
+    ranks.refresh()
+    assert len(ranks.ranks) == 3
+    assert [(r, e["name"]) for r, e in ranks.around(2, 1)] == [
+        (1, "y"), (2, "me"), (3, "x")
+    ]
+    ours.close()
+    theirs.close()
@@ -0,0 +1,208 @@
+"""
+Tests for the leaderboard storage backends.
+"""
+
+import os
+from datetime import datetime, timedelta
+from src.game.leaderboard_store import (
+    JsonLeaderboard, LogLeaderboard, SqliteLeaderboard, _encode_record,
+    _file_marker, _read_records, _since
+)
+from src.game.leaderboard_windows import period_start
+
+
+def _entries(count, now):
+    """Entries spread over the last three weeks, one every 30 minutes."""
+    return [
+        {"name": f"Player {i}", "score": (i * 7919) % 1000,
+         "timestamp": (now - timedelta(minutes=30 * i)).strftime("%Y-%m-%d %H:%M:%S")}
+        for i in range(count)
+    ][::-1]
+
+
+def test_log_since_reads_recent_section(tmp_path):
+    """since() on the snapshot's week section matches a full scan."""
+    store = LogLeaderboard(str(tmp_path / "leaderboard.log"),
+                           str(tmp_path / "leaderboard.snapshot"),
+                           compact_bytes=float("inf"), import_from=None)
+    now = datetime.now()
+    store.add_many(_entries(1000, now))
+    store.compact()
+    store.add_many(_entries(20, now))
+    for timestamp in (period_start("week", now), period_start("day", now),
+                      "2000-01-01 00:00:00"):
+        expected = _since(store.top(None), timestamp)
+        assert sorted(map(str, store.since(timestamp))) == sorted(map(str, expected))
+    # The section is not counted among the ranked entries
+    assert len(store.top(None)) == 1020
+    store.close()
+
+
+def _sqlite(tmp_path, import_from=None):
+    """A SQLite leaderboard in tmp_path."""
+    return SqliteLeaderboard(str(tmp_path / "leaderboard.sqlite"),
+                             import_from=import_from)
+
+
+def _entry(name, score, timestamp="2026-01-01 12:00:00"):
+    """An entry dict."""
+    return {"name": name, "score": score, "timestamp": timestamp}
+
+
+def test_sqlite_top_breaks_ties_by_time_then_order(tmp_path):
+    """Equal scores rank the earlier result first, then the first saved."""
+    store = _sqlite(tmp_path)
+    store.add_many([
+        _entry("late", 500, "2026-01-02 00:00:00"),
+        _entry("first", 500), _entry("second", 500),
+        _entry("best", 1000, "2026-01-03 00:00:00"), _entry("low", 0),
+    ])
+    assert [e["name"] for e in store.top(4)] == ["best", "first", "second", "late"]
+    ranked = store.ranked()
+    assert [score for _, score in ranked] == [1000, 500, 500, 500, 0]
+    assert [e["name"] for e in store.entries([k for k, _ in ranked[:2]])] == [
+        "best", "first"
+    ]
+    store.close()
+
+
+def test_sqlite_reads_use_indexes(tmp_path):
+    """Top-N and time-window reads are index scans, not sorts."""
+    store = _sqlite(tmp_path)
+    store.add_many([_entry("a", 1)])
+    plans = {
+        "top": "SELECT name, score, timestamp FROM scores "
+               "ORDER BY score DESC, timestamp, id LIMIT 10",
+        "since": "SELECT name, score, timestamp FROM scores "
+                 "WHERE timestamp >= '2026' ORDER BY timestamp, id",
+    }
+    for name, index in (("top", "scores_rank"), ("since", "scores_time")):
+        plan = " ".join(str(row) for row in
+                        store._query("EXPLAIN QUERY PLAN " + plans[name]))
+        assert index in plan
+        assert "TEMP B-TREE" not in plan
+    store.close()
+
+
+def test_sqlite_since_and_entries(tmp_path):
+    """since() is oldest first; entries() passes unsaved dicts through."""
+    store = _sqlite(tmp_path)
+    keys = store.add_many([
+        _entry("old", 5, "2025-12-01 00:00:00"),
+        _entry("b", 7, "2026-01-02 00:00:00"),
+        _entry("a", 9, "2026-01-01 00:00:00"),
+    ])
+    assert [e["name"] for e in store.since("2026-01-01 00:00:00")] == ["a", "b"]
+    pending = _entry("pending", 1)
+    assert [e["name"] for e in store.entries([keys[2], pending, 999])] == [
+        "a", "pending", "?"
+    ]
+    store.close()
+
+
+def test_sqlite_imports_json_once(tmp_path):
+    """A new database starts from the JSON leaderboard, only once."""
+    json_path = str(tmp_path / "leaderboard.json")
+    JsonLeaderboard(json_path).add_many([_entry("ann", 100), _entry("bob", 50)])
+    store = _sqlite(tmp_path, import_from=json_path)
+    assert [e["name"] for e in store.top(10)] == ["ann", "bob"]
+    store.close()
+    again = _sqlite(tmp_path, import_from=json_path)
+    assert len(again.top(10)) == 2
+    again.close()
+
+
+def test_sqlite_version_moves_on_other_connections_commits(tmp_path):
+    """data_version changes when another process saves."""
+    store = _sqlite(tmp_path)
+    other = _sqlite(tmp_path)
+    store.add_many([_entry("a", 1)])
+    before = store.version()
+    assert store.version() == before
+    other.add_many([_entry("b", 2)])
+    assert store.version() != before
+    assert len(store.top(10)) == 2
+    store.close()
+    other.close()
+
+
+def _log(tmp_path, **kwargs):
+    """A log leaderboard in tmp_path."""
+    kwargs.setdefault("compact_bytes", float("inf"))
+    kwargs.setdefault("import_from", None)
+    return LogLeaderboard(str(tmp_path / "leaderboard.log"),
+                          str(tmp_path / "leaderboard.snapshot"), **kwargs)
+
+
+def test_log_skips_torn_and_corrupt_lines(tmp_path):
+    """Torn or altered records are skipped; the next save starts a line."""
+    store = _log(tmp_path)
+    store.add_many([_entry("a", 10)])
+    with open(store.path, "a", encoding="utf-8") as f:
+        f.write(_encode_record(_entry("flipped", 20)).replace("20", "90"))
+        f.write(_encode_record(_entry("torn", 30))[:-8])
+    store.add_many([_entry("b", 40)])
+    assert [e["name"] for e in store.top(None)] == ["b", "a"]
+
+
+def test_log_compaction_keeps_every_entry(tmp_path):
+    """Compaction moves the log into the snapshot without loss or repeats."""
+    store = _log(tmp_path)
+    store.add_many([_entry(f"p{i}", i * 10) for i in range(5)])
+    before = store.top(None)
+    store.compact()
+    assert not os.path.exists(store.path)
+    assert not os.path.exists(store.compacting)
+    assert store.top(None) == before
+    store.add_many([_entry("new", 25)])
+    store.compact()
+    assert [e["score"] for e in store.top(None)] == [40, 30, 25, 20, 10, 0]
+    assert [e["name"] for e in store.top(2)] == ["p4", "p3"]
+
+
+def test_log_compaction_interrupted_before_snapshot(tmp_path):
+    """A log renamed aside but not yet merged is read and merged later."""
+    store = _log(tmp_path)
+    store.add_many([_entry("a", 10), _entry("b", 20)])
+    os.replace(store.path, store.compacting)
+    store.add_many([_entry("c", 30)])
+    assert [e["name"] for e in store.top(None)] == ["c", "b", "a"]
+    store.compact()
+    assert [e["name"] for e in store.top(None)] == ["c", "b", "a"]
+    assert not os.path.exists(store.compacting)
+
+
+def test_log_compaction_interrupted_after_snapshot(tmp_path):
+    """A merged log left behind by a crash is not counted twice."""
+    store = _log(tmp_path)
+    store.add_many([_entry("a", 10), _entry("b", 20)])
+    os.replace(store.path, store.compacting)
+    entries, _ = store._read_snapshot(None)
+    entries += _read_records(store.compacting)
+    entries.sort(key=lambda e: e["score"], reverse=True)
+    store._write_snapshot(entries, _file_marker(store.compacting))
+    # Crash here: the snapshot names the log, which still exists
+    assert [e["name"] for e in store.top(None)] == ["b", "a"]
+    store.compact()
+    assert [e["name"] for e in store.top(None)] == ["b", "a"]
+    assert not os.path.exists(store.compacting)
+
+
+def test_log_compacts_in_background_past_size(tmp_path):
+    """A save that grows the log past compact_bytes starts a compaction."""
+    store = _log(tmp_path, compact_bytes=200)
+    for i in range(10):
+        store.add_many([_entry(f"p{i}", i)])
+    store.close()
+    assert len(store.top(None)) == 10
+    assert os.path.exists(store.snapshot)
+
+
+def test_log_imports_json_once(tmp_path):
+    """A new log leaderboard starts from the JSON one, only once."""
+    json_path = str(tmp_path / "leaderboard.json")
+    JsonLeaderboard(json_path).add_many([_entry("ann", 100)])
+    store = _log(tmp_path, import_from=json_path)
+    store.add_many([_entry("bob", 50)])
+    again = _log(tmp_path, import_from=json_path)
+    assert [e["name"] for e in again.top(None)] == ["ann", "bob"]
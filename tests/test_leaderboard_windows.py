@@ -0,0 +1,81 @@
+"""
+Tests for the daily, weekly and all-time leaderboard windows.
+"""
+
+import random
+from datetime import date, datetime
+import pytest
+from src.game import leaderboard_cache
+from src.game.leaderboard_cache import LeaderboardCache
+from src.game.leaderboard_store import JsonLeaderboard
+from src.game.leaderboard_windows import TopK, period, period_start
+
+
+def test_topk_keeps_best_with_earlier_first_on_ties():
+    """A bucket keeps the K best and prefers earlier entries on a tie."""
+    rng = random.Random(1)
+    entries = [{"name": str(i), "score": rng.choice([0, 500, 1000])}
+               for i in range(200)]
+    bucket = TopK(10)
+    for entry in entries:
+        bucket.push(entry)
+    expected = sorted(entries, key=lambda e: -e["score"])[:10]
+    assert bucket.ranked() == expected
+
+
+def test_topk_smaller_than_k():
+    """A bucket with fewer than K entries ranks all of them."""
+    bucket = TopK(5)
+    bucket.push({"score": 1})
+    bucket.push({"score": 3})
+    assert [e["score"] for e in bucket.ranked()] == [3, 1]
+
+
+@pytest.mark.parametrize("timestamp, day, week", [
+    ("2026-10-19 00:00:00", date(2026, 10, 19), date(2026, 10, 19)),
+    ("2026-10-25 23:59:59", date(2026, 10, 25), date(2026, 10, 19)),
+    ("2026-10-26 00:00:00", date(2026, 10, 26), date(2026, 10, 26)),
+    ("2027-01-01 12:00:00", date(2027, 1, 1), date(2026, 12, 28)),
+])
+def test_periods_roll_over_at_midnight_and_monday(timestamp, day, week):
+    """Days start at midnight and weeks on Monday."""
+    assert period("day", timestamp) == day
+    assert period("week", timestamp) == week
+    assert period("all", timestamp) == "all"
+
+
+def test_unreadable_timestamp_has_no_period():
+    """Entries with a missing or malformed timestamp fall in no window."""
+    assert period("day", "") is None
+    assert period("week", "Unknown") is None
+    assert period("all", "") == "all"
+
+
+def test_period_start():
+    """Periods start at midnight of their first day."""
+    now = datetime(2026, 10, 22, 15, 30)
+    assert period_start("day", now) == "2026-10-22 00:00:00"
+    assert period_start("week", now) == "2026-10-19 00:00:00"
+
+
+def test_cached_windows_roll_over(tmp_path, monkeypatch):
+    """At midnight on Sunday the day and week windows start over."""
+    clock = [datetime(2026, 10, 25, 23, 59)]
+
+    class Clock(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return clock[0]
+
+    monkeypatch.setattr(leaderboard_cache, "datetime", Clock)
+    store = JsonLeaderboard(str(tmp_path / "leaderboard.json"))
+    store.add_many([{"name": "late", "score": 500,
+                     "timestamp": "2026-10-25 23:58:00"}])
+    cache = LeaderboardCache(store)
+    for window in ("day", "week", "all"):
+        assert [e["name"] for e in cache.top(10, window)] == ["late"]
+
+    clock[0] = datetime(2026, 10, 26, 0, 1)
+    assert cache.top(10, "day") == []
+    assert cache.top(10, "week") == []
+    assert [e["name"] for e in cache.top(10, "all")] == ["late"]
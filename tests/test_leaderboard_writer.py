@@ -0,0 +1,83 @@
+"""
+Tests for the background leaderboard writer.
+"""
+
+import threading
+from src.game.leaderboard_writer import LeaderboardWriter
+
+
+class _SlowStore:
+    """A store whose first save waits until the test lets it finish."""
+
+    def __init__(self, fail=False):
+        self.batches = []
+        self.fail = fail
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def version(self):
+        return len(self.batches)
+
+    def add_many(self, entries):
+        self.started.set()
+        self.release.wait(5)
+        if self.fail and not self.batches:
+            self.batches.append(None)
+            raise OSError("disk full")
+        self.batches.append([e["name"] for e in entries])
+        return list(range(len(entries)))
+
+
+def _entry(name):
+    """A result to save."""
+    return {"name": name, "score": 500, "timestamp": "2026-10-19 12:00:00"}
+
+
+def test_burst_saved_in_one_batch():
+    """Results queued during a save are written together in the next."""
+    store = _SlowStore()
+    saved = []
+    writer = LeaderboardWriter(
+        store, on_saved=lambda entries, keys, before, after:
+        saved.append((len(entries), keys, before, after))
+    )
+    writer.submit(_entry("a"))
+    assert store.started.wait(5)
+    for name in "bcd":
+        writer.submit(_entry(name))
+    assert not writer.idle()
+    store.release.set()
+    writer.flush()
+    assert writer.idle()
+    assert store.batches == [["a"], ["b", "c", "d"]]
+    assert saved == [(1, [0], 0, 1), (3, [0, 1, 2], 1, 2)]
+    writer.close()
+
+
+def test_close_saves_everything_queued():
+    """close() returns only once queued results are saved."""
+    store = _SlowStore()
+    store.release.set()
+    writer = LeaderboardWriter(store)
+    for name in "abc":
+        writer.submit(_entry(name))
+    writer.close()
+    assert [n for batch in store.batches for n in batch] == ["a", "b", "c"]
+    writer.close()
+
+
+def test_writer_survives_a_failed_save():
+    """A failed batch is reported and dropped, and later ones still save."""
+    store = _SlowStore(fail=True)
+    errors = []
+    writer = LeaderboardWriter(
+        store, on_error=lambda e, entries:
+        errors.append((str(e), [x["name"] for x in entries]))
+    )
+    writer.submit(_entry("a"))
+    assert store.started.wait(5)
+    writer.submit(_entry("b"))
+    store.release.set()
+    writer.close()
+    assert errors == [("disk full", ["a"])]
+    assert store.batches == [None, ["b"]]
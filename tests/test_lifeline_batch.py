@@ -0,0 +1,109 @@
+"""
+Tests for the batched, seedable lifeline generator.
+"""
+
+import random
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.game.lifeline_batch import (
+    AUDIENCE_ACCURACY, FRIEND_ACCURACY, LifelineGenerator, build_alias_table
+)
+from src.game.lifelines import _generate_audience_data
+
+N = 200_000
+
+
+def _alias_distribution(prob, alias):
+    """Exact outcome probabilities of an alias table."""
+    n = len(prob)
+    result = np.zeros(n)
+    for column in range(n):
+        result[column] += prob[column] / n
+        result[alias[column]] += (1 - prob[column]) / n
+    return result
+
+
+@pytest.mark.parametrize("weights", [
+    [0.8, 0.1, 0.1], [0.8, 0.2 / 3, 0.2 / 3, 0.2 / 3], [1, 2, 3, 4], [5],
+])
+def test_alias_table_exact(weights):
+    """An alias table reproduces its weights exactly."""
+    prob, alias = build_alias_table(weights)
+    expected = np.asarray(weights, dtype=float) / sum(weights)
+    assert _alias_distribution(prob, alias) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("num_options", [3, 4])
+def test_eliminations_remove_two_wrong_options(num_options):
+    """Each 50/50 removes two different wrong options that exist."""
+    rng = np.random.default_rng(1)
+    correct = rng.integers(0, num_options, 10_000)
+    eliminated = LifelineGenerator(2).eliminations(num_options, correct)
+    assert eliminated.shape == (10_000, 2)
+    assert (eliminated[:, 0] != eliminated[:, 1]).all()
+    assert (eliminated != correct[:, None]).all()
+    assert (eliminated < num_options).all()
+
+
+def test_eliminations_uniform_over_pairs():
+    """Every pair of wrong options is removed equally often."""
+    eliminated = LifelineGenerator(3).eliminations(4, 0, size=N)
+    pairs = np.sort(eliminated, axis=1)
+    _, counts = np.unique(pairs[:, 0] * 4 + pairs[:, 1], return_counts=True)
+    assert len(counts) == 3
+    assert counts / N == pytest.approx([1 / 3] * 3, abs=0.01)
+
+
+@pytest.mark.parametrize("num_options", [3, 4])
+def test_friend_accuracy(num_options):
+    """The friend is right 80% of the time and spreads the rest evenly."""
+    correct = np.full(N, num_options - 1)
+    picks = LifelineGenerator(4).friend_picks(num_options, correct)
+    shares = np.bincount(picks, minlength=num_options) / N
+    wrong = (1 - FRIEND_ACCURACY) / (num_options - 1)
+    expected = [wrong] * (num_options - 1) + [FRIEND_ACCURACY]
+    assert shares == pytest.approx(expected, abs=0.005)
+
+
+@pytest.mark.parametrize("num_options", [3, 4])
+def test_audience_rows(num_options):
+    """Polls sum to 100, leave unused slots empty and favour the answer."""
+    rng = np.random.default_rng(5)
+    correct = rng.integers(0, num_options, N)
+    data = LifelineGenerator(6).audience(num_options, correct)
+    assert data.shape == (N, 4)
+    assert (data.sum(axis=1) == 100).all()
+    assert (data >= 0).all()
+    assert (data[:, num_options:] == 0).all()
+    highest = (np.argmax(data, axis=1) == correct).mean()
+    assert highest == pytest.approx(AUDIENCE_ACCURACY, abs=0.005)
+
+
+def test_audience_matches_scalar_version():
+    """Batched polls follow the same distribution as the game's polls."""
+    batch = LifelineGenerator(7).audience(4, 1, size=N)
+    rng = random.Random(7)
+    scalar = np.array(
+        [_generate_audience_data(4, 1, rng) for _ in range(N // 4)]
+    )
+    assert batch.mean(axis=0) == pytest.approx(scalar.mean(axis=0), abs=0.2)
+    assert batch.std(axis=0) == pytest.approx(scalar.std(axis=0), abs=0.2)
+
+
+def test_same_seed_same_outcomes():
+    """Outcomes repeat for a seed; scalar arguments broadcast to size."""
+    first = LifelineGenerator(11).outcomes([3, 4, 4], [0, 2, 3])
+    again = LifelineGenerator(11).outcomes([3, 4, 4], [0, 2, 3])
+    other = LifelineGenerator(12).outcomes(4, 0, size=1000)
+    for a, b in zip(first, again):
+        assert (a == b).all()
+    assert other.friend.shape == (1000,)
+    assert first.eliminated.shape == (3, 2)
+
+
+def test_generator_accepted_as_seed():
+    """An existing Generator is used as is, not reseeded."""
+    rng = np.random.default_rng(0)
+    assert LifelineGenerator(rng).rng is rng
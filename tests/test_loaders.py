@@ -0,0 +1,150 @@
+"""
+Tests for the external question bank loaders.
+"""
+
+import json
+import os
+import sqlite3
+import pytest
+from src.data import loaders
+from src.data.loaders import (
+    QuestionFormatError, iter_questions, open_bank, write_bank, INDEX_SUFFIX
+)
+from src.data.records import question_hash
+
+QUESTIONS = [
+    {"question": "Who directed \"Jaws\"?", "options": ["Spielberg", "Lucas", "Scott"],
+     "answer": "Spielberg", "audience": [70, 20, 10], "genre": "Thriller",
+     "difficulty": "easy"},
+    {"question": "Which film has this line:\n\"Here's looking at you, kid\"?",
+     "options": ["Casablanca", "Vertigo", "Psycho", "Rebecca"],
+     "answer": "Casablanca", "audience": [55.5, 14.5, 20, 10], "genre": "Drama",
+     "difficulty": "medium"},
+    {"question": "Year of Metropolis, 1927 or 1931?", "options": ["1927", "1931"],
+     "answer": "1927", "audience": [60, 40], "genre": "Sci-Fi",
+     "difficulty": "hard"},
+]
+
+
+@pytest.fixture(params=["jsonl", "csv", "sqlite"])
+def bank_path(request, tmp_path):
+    """A bank of QUESTIONS in each format."""
+    path = str(tmp_path / f"bank.{request.param}")
+    assert write_bank(path, QUESTIONS) == len(QUESTIONS)
+    return path
+
+
+def test_round_trip(bank_path):
+    """Every format reads back what write_bank wrote, newlines included."""
+    assert list(iter_questions(bank_path)) == QUESTIONS
+
+
+def test_lazy_bank_matches_stream(bank_path):
+    """A lazy bank fetches the same questions, keys and hashes."""
+    bank = open_bank(bank_path)
+    try:
+        assert len(bank) == len(QUESTIONS)
+        assert [q.to_dict() for q in bank] == QUESTIONS
+        assert bank[1].qid == 1
+        assert list(bank.index_keys()) == [
+            (q["difficulty"], q["genre"]) for q in QUESTIONS
+        ]
+        assert list(bank.question_hashes()) == [
+            question_hash(q["question"]) for q in QUESTIONS
+        ]
+    finally:
+        bank.close()
+
+
+def test_index_file_reused_until_bank_changes(bank_path, monkeypatch):
+    """An unchanged bank is opened from its .idx file without a scan."""
+    open_bank(bank_path).close()
+    assert os.path.exists(bank_path + INDEX_SUFFIX)
+
+    def no_scan(path):
+        raise AssertionError("bank rescanned")
+    extension = os.path.splitext(bank_path)[1]
+    iterate, _, fetcher = loaders.LOADERS[extension]
+    monkeypatch.setitem(loaders.LOADERS, extension, (iterate, no_scan, fetcher))
+    bank = open_bank(bank_path)
+    assert [q.to_dict() for q in bank] == QUESTIONS
+    bank.close()
+
+    # A rewritten bank no longer matches its index
+    os.remove(bank_path)
+    write_bank(bank_path, QUESTIONS[:2])
+    with pytest.raises(AssertionError, match="rescanned"):
+        open_bank(bank_path)
+
+
+def test_stale_index_version_rescans(tmp_path):
+    """An index file of another version is ignored."""
+    path = str(tmp_path / "bank.jsonl")
+    write_bank(path, QUESTIONS)
+    open_bank(path).close()
+    with open(path + INDEX_SUFFIX, "rb") as f:
+        header, rest = f.read().split(b"\n", 1)
+    header = json.loads(header)
+    header["version"] -= 1
+    with open(path + INDEX_SUFFIX, "wb") as f:
+        f.write(json.dumps(header).encode() + b"\n" + rest)
+    assert loaders._read_index_file(path) is None
+
+
+@pytest.mark.parametrize("change, message", [
+    (lambda q: q.pop("genre"), "missing field 'genre'"),
+    (lambda q: q.update(answer="Nobody"), "is not one of the options"),
+    (lambda q: q.update(options=["A", "A", "B"]), "distinct"),
+    (lambda q: q.update(audience=[1, 2, 3]), "audience"),
+    (lambda q: q.update(difficulty="brutal"), "difficulty"),
+    (lambda q: q.update(question=7), "question must be"),
+])
+def test_scan_rejects_bad_records(tmp_path, change, message):
+    """Opening a bank validates every record and names its location."""
+    bad = [dict(q) for q in QUESTIONS]
+    change(bad[2])
+    path = tmp_path / "bank.jsonl"
+    path.write_text("".join(json.dumps(q) + "\n" for q in bad), encoding="utf-8")
+    with pytest.raises(QuestionFormatError, match=f"bank.jsonl:3: .*{message}"):
+        open_bank(str(path), use_index_file=False)
+
+
+def test_sqlite_bad_json_column(tmp_path):
+    """A SQLite options column that is not JSON is reported by row."""
+    path = str(tmp_path / "bank.sqlite")
+    write_bank(path, QUESTIONS)
+    connection = sqlite3.connect(path)
+    with connection:
+        connection.execute("UPDATE questions SET options = 'A|B' WHERE rowid = 2")
+    connection.close()
+    with pytest.raises(QuestionFormatError, match=r"questions:2: options is not JSON"):
+        open_bank(path, use_index_file=False)
+
+
+def test_csv_audience_must_be_numbers(tmp_path):
+    """CSV audience fields that are not numbers are reported by line."""
+    path = tmp_path / "bank.csv"
+    path.write_text(
+        "question,options,answer,audience,genre,difficulty\n"
+        "Q?,A|B,A,50|lots,Drama,easy\n", encoding="utf-8"
+    )
+    with pytest.raises(QuestionFormatError, match=r"bank.csv:2: audience"):
+        open_bank(str(path), use_index_file=False)
+
+
+def test_csv_line_numbers_count_multiline_records(tmp_path):
+    """Errors after a multi-line record point at the right line."""
+    path = str(tmp_path / "bank.csv")
+    bad = [dict(q) for q in QUESTIONS]
+    bad[2]["difficulty"] = "brutal"
+    write_bank(path, bad)
+    with pytest.raises(QuestionFormatError, match=r"bank.csv:5:"):
+        open_bank(path, use_index_file=False)
+
+
+def test_jsonl_invalid_json(tmp_path):
+    """A line that is not JSON is reported by line number."""
+    path = tmp_path / "bank.jsonl"
+    path.write_text(json.dumps(QUESTIONS[0]) + "\n\n{oops\n", encoding="utf-8")
+    with pytest.raises(QuestionFormatError, match=r"bank.jsonl:3: invalid JSON"):
+        open_bank(str(path), use_index_file=False)
@@ -0,0 +1,106 @@
+"""
+Tests for the bucketed question index.
+"""
+
+import random
+from collections import Counter
+import pytest
+from src.config import TOTAL_QUESTIONS
+from src.game.question_index import QuestionIndex, _Chain
+from src.game.questions import select_game_questions
+
+
+@pytest.fixture(scope="module")
+def index():
+    """Index over the built-in questions."""
+    return QuestionIndex()
+
+
+def test_buckets_match_a_scan(index):
+    """Every bucket holds exactly the positions a full scan would find."""
+    questions = index.questions
+    for difficulty in ("easy", "medium", "hard"):
+        for genre in index.genres():
+            expected = [
+                p for p, q in enumerate(questions)
+                if q.difficulty == difficulty and q.genre == genre
+            ]
+            assert list(index.bucket(difficulty, genre)) == expected
+        assert list(index.bucket(difficulty)) == [
+            p for p, q in enumerate(questions) if q.difficulty == difficulty
+        ]
+    assert list(index.bucket()) == list(range(len(questions)))
+    assert list(index.bucket("easy", "No Such Genre")) == []
+
+
+def test_sample_matches_filters(index):
+    """Samples are distinct and match the difficulty and genres asked for."""
+    genres = index.genres()[:2]
+    rng = random.Random(1)
+    for _ in range(50):
+        count = min(3, index.count("medium", genres))
+        picked = index.sample(count, "medium", genres, rng)
+        assert len({q.qid for q in picked}) == count
+        assert all(q.difficulty == "medium" and q.genre in genres
+                   for q in picked)
+
+
+def test_repeated_genre_counts_once(index):
+    """Naming a genre twice neither doubles its count nor its odds."""
+    genre = index.genres()[0]
+    assert index.count("easy", [genre, genre]) == index.count("easy", genre)
+    count = index.count("easy", genre)
+    picked = index.sample_positions(count, "easy", [genre, genre])
+    assert sorted(picked) == list(index.bucket("easy", genre))
+
+
+def test_too_few_questions(index):
+    """Asking for more questions than match is an error."""
+    genre = index.genres()[0]
+    count = index.count("hard", genre)
+    with pytest.raises(ValueError, match=f"Only {count} hard"):
+        index.sample(count + 1, "hard", genre)
+
+
+def test_sample_is_uniform_across_buckets(index):
+    """Positions from a union of buckets are drawn evenly."""
+    genres = index.genres()[:3]
+    positions = [p for b in index.buckets("easy", genres) for p in b]
+    rng = random.Random(2)
+    draws = Counter(
+        p for _ in range(20_000)
+        for p in index.sample_positions(1, "easy", genres, rng)
+    )
+    assert set(draws) == set(positions)
+    expected = 20_000 / len(positions)
+    assert all(abs(n - expected) < 0.2 * expected for n in draws.values())
+
+
+def test_relabeled_moves_questions(index):
+    """Relabeling rebuilds difficulty buckets but keeps genres."""
+    labels = ["hard"] * len(index)
+    relabeled = index.relabeled(labels)
+    assert relabeled.count("hard") == len(index)
+    assert relabeled.count("easy") == 0
+    assert relabeled.by_genre is index.by_genre
+    genre = index.genres()[0]
+    assert sorted(relabeled.bucket("hard", genre)) == sorted(
+        index.bucket(None, genre)
+    )
+
+
+def test_game_selection_by_difficulty(index):
+    """A game is easy, then medium, then hard questions."""
+    questions = select_game_questions(index=index, rng=random.Random(3))
+    assert len(questions) == TOTAL_QUESTIONS
+    order = {"easy": 0, "medium": 1, "hard": 2}
+    ranks = [order[q.difficulty] for q in questions]
+    assert ranks == sorted(ranks)
+
+
+def test_chain_indexing_across_parts():
+    """A chain reads through its parts, including at their boundaries."""
+    chain = _Chain([range(0, 3), range(10, 10), range(20, 22), range(5, 6)])
+    assert len(chain) == 6
+    assert [chain[i] for i in range(6)] == [0, 1, 2, 20, 21, 5]
+    assert len(_Chain([])) == 0
@@ -0,0 +1,104 @@
+"""
+Tests for game recording and replay.
+"""
+
+import pytest
+from graphics import HeadlessCanvas
+from src.data import questions as builtin_questions
+from src.data.records import Question
+from src.game import kiosk, recording
+from src.game.question_index import QuestionIndex
+from src.game.recording import GameRecorder, GameReplayer
+from src.tools.soak import ScriptedPlayer
+from src.ui.pacing import set_speed, get_speed
+
+
+def _bank(order):
+    """Index of built-in questions in the given order of their positions."""
+    return QuestionIndex([
+        Question.from_dict(builtin_questions.QUESTIONS[i], qid)
+        for qid, i in enumerate(order)
+    ])
+
+
+def _recorded(bank, positions):
+    """Replayer for a recording of bank questions at positions."""
+    recorder = GameRecorder(seed=7)
+    prepared = [bank.questions[i].shuffled([3, 2, 1, 0]) for i in positions]
+    recorder.prepare_questions(prepared, prepared)
+    return GameReplayer({
+        "version": recording.RECORDING_VERSION, "seed": recorder.seed,
+        "questions": recorder.questions, "hashes": recorder.hashes,
+        "permutations": recorder.permutations, "screens": 0, "events": [],
+    })
+
+
+def test_replay_finds_questions_after_reorder(monkeypatch):
+    """Recorded questions are found by hash in a reordered bank."""
+    count = len(builtin_questions.QUESTIONS)
+    replayer = _recorded(_bank(range(count)), [0, 5, 42])
+    reordered = _bank(range(count - 1, -1, -1))
+    monkeypatch.setattr(recording, "default_index", lambda: reordered)
+
+    questions = replayer.prepare_questions(None, None)
+
+    texts = [builtin_questions.QUESTIONS[i]["question"] for i in (0, 5, 42)]
+    assert [q.question for q in questions] == texts
+    assert [q.qid for q in questions] == [count - 1, count - 6, count - 43]
+    assert [q.order for q in questions] == [(3, 2, 1, 0)] * 3
+
+
+def test_replay_refuses_removed_questions():
+    """A recording whose questions left the bank is not replayed."""
+    replayer = _recorded(_bank(range(20)), [3, 15])
+    with pytest.raises(ValueError, match="1 recorded question"):
+        replayer.bank_positions(_bank(range(10)))
+
+
+def test_old_recordings_use_positions():
+    """Recordings without hashes replay by bank position."""
+    replayer = GameReplayer({
+        "version": 2, "seed": 1, "questions": [4, 2],
+        "permutations": [[0, 1, 2, 3]] * 2, "screens": 0, "events": [],
+    })
+    assert replayer.bank_positions(_bank(range(3))) == [4, 2]
+
+
+@pytest.fixture
+def headless():
+    """A headless canvas with delays skipped."""
+    speed = get_speed()
+    set_speed(0)
+    canvas = HeadlessCanvas(800, 600)
+    yield canvas
+    canvas.close()
+    set_speed(speed)
+
+
+def test_replay_saves_nothing(tmp_path, monkeypatch, headless):
+    """A replayed game reaches no leaderboard, results or telemetry sink."""
+    saved = []
+    monkeypatch.setattr(kiosk, "save_to_leaderboard",
+                        lambda *args: saved.append(args) or (1, 1))
+    monkeypatch.setattr(kiosk, "display_rank", lambda *args: None)
+    monkeypatch.setattr(kiosk, "default_results", lambda: None)
+    monkeypatch.setattr(kiosk, "default_sink", lambda: None)
+    monkeypatch.setattr(kiosk, "display_leaderboard", lambda *args: None)
+    path = tmp_path / "game.mmr"
+
+    recorder = GameRecorder(seed=11)
+    headless.input_script = ScriptedPlayer(seed=3)
+    headless.input_observer = recorder
+    recorded = kiosk.play_game(headless, recording=recorder)
+    recorder.save(path)
+    assert len(saved) == 1
+
+    def no_sink(*args):
+        raise AssertionError("replay reached a persistence sink")
+    monkeypatch.setattr(kiosk, "save_to_leaderboard", no_sink)
+    monkeypatch.setattr(kiosk, "default_results", no_sink)
+    monkeypatch.setattr(kiosk, "default_sink", no_sink)
+    replayer = GameReplayer.load(path)
+    headless.input_script = headless.input_observer = replayer
+    replayed = kiosk.play_game(headless, recording=replayer, persist=False)
+    assert replayed == recorded
@@ -0,0 +1,84 @@
+"""
+Tests for the Question record and option shuffling.
+"""
+
+import itertools
+import random
+from collections import Counter
+import pytest
+from src.data import questions as builtin_questions
+from src.data.records import Question, question_hash
+from src.game.questions import shuffle_question_options
+
+QUESTION = {
+    "question": "Who directed Jaws?",
+    "options": ["Spielberg", "Lucas", "Scott", "Cameron"],
+    "answer": "Spielberg", "audience": [70, 10, 15, 5],
+    "genre": "Thriller", "difficulty": "easy",
+}
+
+
+def test_from_dict_round_trip():
+    """A record built from a dictionary converts back to it."""
+    question = Question.from_dict(QUESTION, qid=7)
+    assert question.qid == 7
+    assert question.answer == "Spielberg"
+    assert question.answer_letter == "A"
+    assert question.order is None
+    assert question.to_dict() == QUESTION
+
+
+def test_records_are_immutable():
+    """Records have no instance dictionary and cannot be changed."""
+    question = Question.from_dict(QUESTION)
+    with pytest.raises(AttributeError):
+        question.answer_index = 2
+    with pytest.raises(AttributeError):
+        question.extra = 1
+
+
+@pytest.mark.parametrize("permutation", list(itertools.permutations(range(4))))
+def test_shuffle_moves_answer_with_its_option(permutation):
+    """Every permutation keeps the answer, its poll and the bank order."""
+    question = Question.from_dict(QUESTION)
+    shuffled = question.shuffled(permutation)
+    assert shuffled.answer == "Spielberg"
+    assert shuffled.options[shuffled.answer_index] == "Spielberg"
+    assert dict(zip(shuffled.options, shuffled.audience)) == dict(
+        zip(question.options, question.audience)
+    )
+    assert [question.options[i] for i in shuffled.order] == list(
+        shuffled.options
+    )
+
+
+def test_shuffling_twice_tracks_bank_positions():
+    """order always maps shown options to their bank positions."""
+    question = Question.from_dict(QUESTION)
+    twice = question.shuffled((1, 2, 3, 0)).shuffled((3, 2, 1, 0))
+    assert [question.options[i] for i in twice.order] == list(twice.options)
+    assert twice.answer == "Spielberg"
+
+
+def test_shuffle_is_uniform():
+    """Every ordering of four options is equally likely."""
+    question = Question.from_dict(QUESTION)
+    rng = random.Random(4)
+    counts = Counter(
+        shuffle_question_options(question, rng).options for _ in range(24_000)
+    )
+    assert len(counts) == 24
+    assert all(800 < n < 1200 for n in counts.values())
+
+
+def test_question_hash_identity():
+    """Hashes depend on the text alone and tell bank questions apart."""
+    assert question_hash("Who directed Jaws?") == question_hash(
+        "Who directed Jaws?"
+    )
+    assert question_hash("Who directed Jaws?") != question_hash(
+        "Who directed Jaws? "
+    )
+    assert 0 <= question_hash("") < 2**64
+    texts = {q["question"] for q in builtin_questions.QUESTIONS}
+    assert len({question_hash(t) for t in texts}) == len(texts)
@@ -0,0 +1,219 @@
+"""
+Tests for the columnar game results store and its queries.
+"""
+
+import os
+import random
+import pytest
+from src.game import results
+from src.game.results import (
+    ResultsStore, build_block, encode_record, iter_blocks, last_sealed,
+    pending_games, read_records, _append_block, _file_marker
+)
+
+GENRES = ("Action", "Drama", "Sci-Fi")
+DIFFICULTIES = ("easy", "medium", "hard")
+
+
+def _games(count, seed=0):
+    """Random finished games."""
+    rng = random.Random(seed)
+    games = []
+    for i in range(count):
+        asked = rng.randint(1, 8)
+        questions = []
+        for j in range(asked):
+            outcome = "correct" if j < asked - 1 else rng.choice(
+                ["correct", "wrong", "timeout"])
+            questions.append([
+                rng.getrandbits(64), rng.choice(GENRES), DIFFICULTIES[j % 3],
+                outcome, rng.sample(["5050", "phone", "audience"],
+                                    rng.randint(0, 1)),
+                rng.randint(0, 30000),
+            ])
+        score = sum(q[3] == "correct" for q in questions)
+        state = {"correct": "won", "wrong": "lost",
+                 "timeout": "timeout"}[questions[-1][3]]
+        games.append({
+            "time": 1_700_000_000 + i, "score": score, "prize": score * 500,
+            "state": state, "duration_ms": rng.randint(1000, 90000),
+            "lifelines": [n for q in questions for n in q[4]],
+            "questions": questions,
+        })
+    return games
+
+
+def _write(path, games, block_games):
+    """Save games through a store and close it."""
+    store = ResultsStore(str(path), block_games=block_games)
+    for game in games:
+        store.append(game)
+    store.close()
+
+
+def _stored(path):
+    """Games in sealed blocks and games still pending, as counts."""
+    sealed = sum(games for _, games, _, _ in iter_blocks(str(path)))
+    return sealed, len(pending_games(str(path)))
+
+
+@pytest.fixture
+def query():
+    """The NumPy query module."""
+    pytest.importorskip("numpy")
+    from src.game import results_query
+    return results_query
+
+
+def test_games_sealed_into_blocks(tmp_path):
+    """A tail holding a block's worth of games is sealed; the rest waits."""
+    path = tmp_path / "results.mmrs"
+    store = ResultsStore(str(path), block_games=4)
+    for game in _games(10):
+        store.append(game)
+        store._wakeup.set()
+    store.close()
+    blocks = [games for _, games, _, _ in iter_blocks(str(path))]
+    sealed, pending = _stored(path)
+    assert blocks and all(games >= 4 for games in blocks)
+    assert sealed + pending == 10
+    assert pending < 4
+    assert not os.path.exists(f"{path}.sealing")
+
+
+def test_queries_match_the_games(tmp_path, query):
+    """Summaries over blocks and tail agree with the games themselves."""
+    path = tmp_path / "results.mmrs"
+    games = _games(50, seed=1)
+    _write(path, games, block_games=16)
+    reader = query.ResultsReader(str(path))
+
+    summary = query.summary(reader)
+    assert summary["games"] == 50
+    assert summary["states"]["won"] == sum(g["state"] == "won" for g in games)
+    assert summary["mean_prize"] == pytest.approx(
+        sum(g["prize"] for g in games) / 50)
+    assert summary["lifelines"]["phone"] == sum(
+        "phone" in g["lifelines"] for g in games)
+
+    histogram = query.score_histogram(reader)
+    for score in range(len(histogram)):
+        assert histogram[score] == sum(g["score"] == score for g in games)
+
+    timeouts = query.genre_timeouts(reader)
+    answers = [q for g in games for q in g["questions"]]
+    for genre in GENRES:
+        asked = [q for q in answers if q[1] == genre]
+        assert timeouts[genre] == (
+            len(asked), sum(q[3] == "timeout" for q in asked))
+
+
+def test_question_stats_across_batches(tmp_path, query, monkeypatch):
+    """Per-question totals are the same however answers are batched."""
+    path = tmp_path / "results.mmrs"
+    games = _games(40, seed=2)
+    # Ask a few questions again in later games
+    for game in games[20:]:
+        game["questions"][0][0] = games[0]["questions"][0][0]
+    _write(path, games, block_games=8)
+    reader = query.ResultsReader(str(path))
+    whole = query.question_stats(reader)
+    monkeypatch.setattr(query, "_BATCH_ROWS", 10)
+    batched = query.question_stats(reader)
+    for a, b in zip(whole, batched):
+        assert a.tolist() == b.tolist()
+
+    repeated = games[0]["questions"][0][0]
+    i = whole.hashes.tolist().index(repeated)
+    answers = [q for g in games for q in g["questions"] if q[0] == repeated]
+    assert whole.asked[i] == len(answers)
+    assert whole.correct[i] == sum(q[3] == "correct" for q in answers)
+    assert whole.mean_ms[i] == pytest.approx(
+        sum(q[5] for q in answers) / len(answers))
+    assert whole.hashes.tolist() == sorted(whole.hashes.tolist())
+
+
+def test_torn_tail_line_is_dropped(tmp_path):
+    """A tail line torn by a crash is skipped and the next game kept."""
+    path = tmp_path / "results.mmrs"
+    games = _games(3)
+    with open(f"{path}.tail", "w", encoding="utf-8") as f:
+        f.write(encode_record(games[0]))
+        f.write(encode_record(games[1])[:-10])
+    _write(path, games[2:], block_games=100)
+    assert [g["time"] for g in read_records(f"{path}.tail")] == [
+        games[0]["time"], games[2]["time"]
+    ]
+
+
+def test_tail_counts_toward_the_block_after_restart(tmp_path):
+    """Games left in the tail count toward the next block after a restart."""
+    path = tmp_path / "results.mmrs"
+    games = _games(6)
+    _write(path, games[:3], block_games=4)
+    assert _stored(path) == (0, 3)
+    _write(path, games[3:], block_games=4)
+    assert _stored(path) == (6, 0)
+
+
+def test_torn_block_is_cut_off(tmp_path):
+    """A block torn by a crash is ignored and overwritten by the next."""
+    path = tmp_path / "results.mmrs"
+    games = _games(8)
+    _write(path, games[:4], block_games=4)
+    size = os.path.getsize(path)
+    with open(path, "ab") as f:
+        f.write(build_block(games[4:])[:40])
+    assert _stored(path) == (4, 0)
+    _append_block(str(path), build_block(games[4:]))
+    assert [games for _, games, _, _ in iter_blocks(str(path))] == [4, 4]
+    assert os.path.getsize(path) > size
+
+
+def test_seal_interrupted_before_block(tmp_path):
+    """A tail renamed aside but not sealed is read, then sealed on restart."""
+    path = tmp_path / "results.mmrs"
+    games = _games(4)
+    with open(f"{path}.sealing", "w", encoding="utf-8") as f:
+        f.writelines(encode_record(g) for g in games)
+    assert _stored(path) == (0, 4)
+    ResultsStore(str(path), block_games=4).close()
+    assert _stored(path) == (4, 0)
+    assert not os.path.exists(f"{path}.sealing")
+
+
+def test_seal_interrupted_after_block(tmp_path):
+    """A sealed tail left behind by a crash is not stored twice."""
+    path = tmp_path / "results.mmrs"
+    games = _games(4)
+    sealing = f"{path}.sealing"
+    with open(sealing, "w", encoding="utf-8") as f:
+        f.writelines(encode_record(g) for g in games)
+    _append_block(str(path), build_block(games, sealed=_file_marker(sealing)))
+    assert last_sealed(str(path)) == _file_marker(sealing)
+    assert _stored(path) == (4, 0)
+    ResultsStore(str(path), block_games=4).close()
+    assert _stored(path) == (4, 0)
+    assert not os.path.exists(sealing)
+
+
+def test_corrupt_column_detected(tmp_path, query):
+    """A column that fails its checksum is reported, not misread."""
+    path = tmp_path / "results.mmrs"
+    _write(path, _games(4), block_games=4)
+    with open(path, "r+b") as f:
+        f.seek(-3, os.SEEK_END)
+        byte = f.read(1)
+        f.seek(-3, os.SEEK_END)
+        f.write(bytes([byte[0] ^ 0xFF]))
+    reader = query.ResultsReader(str(path))
+    with pytest.raises(ValueError, match="corrupt"):
+        query.question_stats(reader)
+
+
+def test_other_version_rejected(tmp_path):
+    """A results file of another version is not read."""
+    path = tmp_path / "results.mmrs"
+    path.write_bytes(results.FILE_HEADER.pack(results.MAGIC, 1))
+    with pytest.raises(ValueError, match="version"):
+        list(iter_blocks(str(path)))
@@ -0,0 +1,120 @@
+"""
+Tests for the non-repeating question scheduler.
+"""
+
+import dbm
+import random
+from src.config import TOTAL_QUESTIONS
+from src.data import questions as builtin_questions
+from src.data.records import Question
+from src.game.question_index import QuestionIndex
+from src.game.scheduler import SeenScheduler, SeenBloom, _player_key
+
+
+def _index(order=None):
+    """Index of the built-in questions, optionally reordered."""
+    order = range(len(builtin_questions.QUESTIONS)) if order is None else order
+    return QuestionIndex([
+        Question.from_dict(builtin_questions.QUESTIONS[i], qid)
+        for qid, i in enumerate(order)
+    ])
+
+
+def _scheduler(tmp_path, index, seed=1, **kwargs):
+    return SeenScheduler(str(tmp_path / "seen"), index=index,
+                         rng=random.Random(seed), **kwargs)
+
+
+def test_bloom_has_no_false_negatives():
+    """Every added hash is reported as seen."""
+    bloom = SeenBloom.sized(500, 0.01)
+    rng = random.Random(2)
+    keys = [rng.getrandbits(64) for _ in range(500)]
+    for key in keys:
+        bloom.add(key)
+    assert all(key in bloom for key in keys)
+    others = [rng.getrandbits(64) for _ in range(10000)]
+    assert sum(key in bloom for key in others) < 300
+
+
+def test_bloom_sized_for_expected_entries():
+    """A filter fills up around the number of entries it was sized for."""
+    bloom = SeenBloom.sized(2000, 0.01)
+    assert bloom.hashes == 7
+    rng = random.Random(3)
+    for count in range(1, 2501):
+        bloom.add(rng.getrandbits(64))
+        if count == 1500:
+            assert not bloom.saturated()
+    assert bloom.saturated()
+
+
+def test_no_repeats_across_games(tmp_path):
+    """Games for one player repeat nothing until a bucket runs out."""
+    index = _index()
+    scheduler = _scheduler(tmp_path, index)
+    smallest = min(index.count(d, None) for d in ("easy", "medium", "hard"))
+    asked = []
+    for _ in range(smallest // 3):
+        asked += [q.question for q in scheduler.select("Ada")]
+    assert len(asked) == len(set(asked))
+
+
+def test_history_survives_bank_reorder(tmp_path):
+    """Seen questions are recognised after the bank is reordered."""
+    scheduler = _scheduler(tmp_path, _index())
+    first = {q.question for q in scheduler.select("Ada")}
+    count = len(builtin_questions.QUESTIONS)
+    reordered = _scheduler(tmp_path, _index(range(count - 1, -1, -1)), seed=1)
+    second = {q.question for q in reordered.select("Ada")}
+    assert not first & second
+
+
+def test_history_survives_questions_removed(tmp_path):
+    """Removing questions from the bank keeps the rest of the history."""
+    scheduler = _scheduler(tmp_path, _index())
+    first = {q.question for q in scheduler.select("Ada")}
+    kept = [i for i, q in enumerate(builtin_questions.QUESTIONS)
+            if i % 10 or q["question"] in first]
+    smaller = _scheduler(tmp_path, _index(kept), seed=5)
+    assert not first & {q.question for q in smaller.select("Ada")}
+
+
+def test_player_names_ignore_case_and_spaces(tmp_path):
+    """ " ada " and "ADA" share a record."""
+    scheduler = _scheduler(tmp_path, _index())
+    first = {q.question for q in scheduler.select(" ada ")}
+    assert not first & {q.question for q in scheduler.select("ADA")}
+    assert _player_key(" ada ") == _player_key("ADA")
+
+
+def test_record_sized_from_bank(tmp_path):
+    """Small banks get small records; the game budget caps large ones."""
+    scheduler = _scheduler(tmp_path, _index(), expected_games=1000)
+    assert len(scheduler._new_record().bits) == 119
+    few = _scheduler(tmp_path, _index(), expected_games=2)
+    assert len(few._new_record().bits) < 119
+
+
+def test_full_record_starts_over(tmp_path):
+    """A saturated record is replaced by an empty one at the next game."""
+    scheduler = _scheduler(tmp_path, _index(), expected_games=2)
+    games = 0
+    while not scheduler._load("Ada").saturated():
+        scheduler.select("Ada")
+        games += 1
+    assert games <= 3
+    scheduler.select("Ada")
+    record = scheduler._load("Ada")
+    set_bits = bin(int.from_bytes(record.bits, "little")).count("1")
+    assert set_bits <= TOTAL_QUESTIONS * record.hashes
+
+
+def test_position_records_start_over(tmp_path):
+    """Records written before hashes were used are ignored."""
+    path = str(tmp_path / "seen")
+    with dbm.open(path, "c") as db:
+        db[_player_key("Ada")] = b"B" + bytes(8) + b"\x00" + b"\xff" * 13
+    scheduler = _scheduler(tmp_path, _index())
+    record = scheduler._load("Ada")
+    assert record.KIND == SeenBloom.KIND and not any(record.bits)
@@ -0,0 +1,167 @@
+"""
+Tests for the segmented full-text question search.
+"""
+
+import os
+import pytest
+from src.data import search
+from src.data.records import Question
+from src.data.search import QuerySyntaxError, SearchIndex, parse_query
+
+
+def _question(text, options, genre="Drama", difficulty="easy"):
+    """A question record answered by its first option."""
+    audience = (70, 10, 10, 10)[:len(options)]
+    return Question(None, text, tuple(options), 0, audience, genre,
+                    difficulty, None)
+
+
+BANK = [
+    _question("Who played the Joker in The Dark Knight?",
+              ["Heath Ledger", "Jared Leto", "Jack Nicholson"], "Action"),
+    _question("Who directed The Dark Knight?",
+              ["Christopher Nolan", "Tim Burton", "Zack Snyder"], "Action",
+              "medium"),
+    _question("Which film features the Riddler?",
+              ["The Batman", "Joker", "Batman Begins"], "Sci-Fi", "hard"),
+    _question("Who composed the score of Inception?",
+              ["Hans Zimmer", "John Williams", "Howard Shore"], "Sci-Fi"),
+]
+
+QUERIES = [
+    "joker", "dark knight", "joker OR riddler", "knight -joker",
+    "NOT knight", "nol*", "answer:ledger", 'genre:"sci-fi"',
+    "(joker OR riddler) batman", "difficulty:hard", "option:batman",
+    "question:who -answer:nolan", "zimmer*",
+]
+
+
+@pytest.fixture
+def index(tmp_path):
+    """An index built over BANK."""
+    index = SearchIndex(str(tmp_path / "bank.search"))
+    index.update(BANK)
+    yield index
+    index.close()
+
+
+def _fresh(tmp_path, bank):
+    """Results of every query on a newly built index of bank."""
+    index = SearchIndex(str(tmp_path / "fresh.search"))
+    index.update(bank)
+    results = {query: index.search(query) for query in QUERIES}
+    index.close()
+    os.remove(tmp_path / "fresh.search")
+    return results
+
+
+@pytest.mark.parametrize("query, expected", [
+    ("joker", [0, 2]),
+    ("dark knight", [0, 1]),
+    ("joker OR riddler", [0, 2]),
+    ("knight -joker", [1]),
+    ("NOT knight", [2, 3]),
+    ("nol*", [1]),
+    ("answer:ledger", [0]),
+    ('genre:"sci-fi"', [2, 3]),
+    ("(joker OR riddler) batman", [2]),
+    ("difficulty:hard", [2]),
+    ("zimmer", [3]),
+    ("nothing", []),
+])
+def test_queries(index, query, expected):
+    """Words, fields, prefixes, negation and grouping select the right rows."""
+    assert index.search(query) == expected
+
+
+@pytest.mark.parametrize("query, message", [
+    ("", "expected a search term"),
+    ("(joker", "missing"),
+    ("joker)", "unbalanced"),
+    ("NOT", "NOT needs a term"),
+    ("title:joker", "unknown field"),
+    ('"!!"', "nothing to search for"),
+])
+def test_query_syntax_errors(query, message):
+    """Malformed queries raise QuerySyntaxError."""
+    with pytest.raises(QuerySyntaxError, match=message):
+        parse_query(query)
+
+
+def test_update_appends_changed_questions(tmp_path, index):
+    """Only new and changed questions go into an appended segment."""
+    bank = list(BANK)
+    bank[1] = _question("Who directed Memento?",
+                        ["Christopher Nolan", "David Fincher", "Ridley Scott"])
+    bank.append(_question("Which film is set on Pandora?",
+                          ["Avatar", "Dune", "Alien"], "Sci-Fi"))
+    assert index.update(bank) == (2, 0)
+    assert len(index.segments) == 2
+    assert len(index) == 5
+    assert {q: index.search(q) for q in QUERIES} == _fresh(tmp_path, bank)
+    assert index.search("memento OR pandora") == [1, 4]
+    assert index.update(bank) == (0, 0)
+    assert len(index.segments) == 2
+
+
+def test_update_removes_questions(tmp_path, index):
+    """A shorter bank drops the positions past its end."""
+    assert index.update(BANK[:2]) == (0, 2)
+    assert len(index) == 2
+    assert index.search("riddler OR zimmer") == []
+    assert index.search("NOT knight") == []
+    assert {q: index.search(q) for q in QUERIES} == _fresh(tmp_path, BANK[:2])
+
+
+def test_reopen_keeps_segments(tmp_path, index):
+    """Segments are read back from the file."""
+    bank = BANK + [_question("Which film is set on Pandora?",
+                             ["Avatar", "Dune", "Alien"])]
+    index.update(bank)
+    reopened = SearchIndex(index.path)
+    try:
+        assert len(reopened.segments) == 2
+        assert {q: reopened.search(q) for q in QUERIES} == _fresh(tmp_path, bank)
+    finally:
+        reopened.close()
+
+
+def test_torn_segment_is_ignored(tmp_path, index):
+    """A segment cut short by an interrupted append is skipped."""
+    before = {q: index.search(q) for q in QUERIES}
+    size = os.path.getsize(index.path)
+    index.update(BANK + [_question("Which film is set on Pandora?",
+                                   ["Avatar", "Dune", "Alien"])])
+    index.close()
+    with open(index.path, "r+b") as f:
+        f.truncate(size + (os.path.getsize(index.path) - size) // 2)
+    reopened = SearchIndex(index.path)
+    try:
+        assert len(reopened.segments) == 1
+        assert {q: reopened.search(q) for q in QUERIES} == before
+    finally:
+        reopened.close()
+
+
+def test_rebuild_after_max_segments(tmp_path, monkeypatch, index):
+    """Once MAX_SEGMENTS pile up, the next update writes one segment."""
+    monkeypatch.setattr(search, "MAX_SEGMENTS", 3)
+    bank = list(BANK)
+    for i in range(3):
+        bank[0] = _question(f"Who played the Joker in film {i}?",
+                            ["Heath Ledger", "Jared Leto", "Jack Nicholson"])
+        index.update(bank)
+    assert len(index.segments) == 1
+    assert {q: index.search(q) for q in QUERIES} == _fresh(tmp_path, bank)
+
+
+def test_stale_follows_source(tmp_path, index):
+    """An index is stale once its bank file changes."""
+    bank_file = tmp_path / "bank.jsonl"
+    bank_file.write_text("one\n")
+    assert index.stale(os.stat(bank_file))
+    index.update(BANK, os.stat(bank_file))
+    assert not index.stale(os.stat(bank_file))
+    os.utime(bank_file, ns=(0, 0))
+    assert index.stale(os.stat(bank_file))
+    assert SearchIndex(str(tmp_path / "missing.search")).stale()
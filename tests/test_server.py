@@ -0,0 +1,158 @@
+"""
+Tests for the asyncio game server and its timer wheel.
+"""
+
+import asyncio
+import json
+from src.server.bots import run_load, _percentile
+from src.server.game_server import GameServer
+from src.server.timer_wheel import TimerWheel
+
+
+def test_wheel_fires_at_deadline():
+    """A timer fires once its tick has passed, and only once."""
+    wheel = TimerWheel(start=100.0, resolution=0.1, slots=8)
+    fired = []
+    wheel.schedule(100.35, fired.append)
+    assert wheel.advance(100.3) == 0
+    assert wheel.advance(100.4) == 1
+    assert fired == [100.4]
+    assert wheel.advance(101.0) == 0
+    assert wheel.pending == 0
+
+
+def test_wheel_cancel():
+    """A cancelled timer never fires and stops counting as pending."""
+    wheel = TimerWheel(start=0.0, resolution=0.1, slots=8)
+    fired = []
+    wheel.schedule(0.2, fired.append).cancel()
+    wheel.schedule(0.2, fired.append)
+    assert wheel.advance(0.5) == 1
+    assert len(fired) == 1
+    assert wheel.pending == 0
+
+
+def test_wheel_past_deadline_fires_next_tick():
+    """A deadline already passed fires on the next tick, not at once."""
+    wheel = TimerWheel(start=0.0, resolution=0.1, slots=8)
+    wheel.advance(1.0)
+    fired = []
+    wheel.schedule(0.5, fired.append)
+    assert wheel.advance(1.0) == 0
+    assert wheel.advance(1.1) == 1
+
+
+def test_wheel_timers_beyond_one_turn():
+    """Timers more than one turn away wait out the extra turns."""
+    wheel = TimerWheel(start=0.0, resolution=0.1, slots=8)
+    fired = []
+    wheel.schedule(0.3, lambda now: fired.append("near"))
+    wheel.schedule(1.1, lambda now: fired.append("far"))
+    # Tick 11 shares a slot with tick 3
+    assert wheel.advance(0.35) == 1
+    assert wheel.advance(1.05) == 0
+    assert wheel.advance(1.15) == 1
+    assert fired == ["near", "far"]
+
+
+def test_wheel_jump_over_several_turns():
+    """Advancing past many turns at once fires everything that is due."""
+    wheel = TimerWheel(start=0.0, resolution=0.1, slots=8)
+    fired = []
+    for deadline in (0.25, 0.95, 2.0, 5.0):
+        wheel.schedule(deadline, fired.append)
+    assert wheel.advance(3.0) == 3
+    assert wheel.pending == 1
+    assert wheel.advance(5.0) == 1
+
+
+async def _exchange(port, messages):
+    """Send messages on one connection and collect every reply."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    replies = []
+    for message in messages:
+        writer.write(message + b"\n")
+        await writer.drain()
+        replies.append(json.loads(await reader.readline()))
+    return reader, writer, replies
+
+
+def test_server_reports_bad_messages():
+    """Malformed and out-of-turn messages get error replies."""
+    async def scenario():
+        server = GameServer(port=0, seed=1)
+        port = await server.start()
+        try:
+            _, writer, replies = await _exchange(port, [
+                b"not json", b'{"op": "dance"}', b'{"op": "answer", "letter": "A"}',
+            ])
+            writer.close()
+        finally:
+            await server.close()
+        return replies
+
+    replies = asyncio.run(scenario())
+    assert [reply["event"] for reply in replies] == ["error"] * 3
+    assert replies[2]["message"] == "No question in play"
+
+
+def test_server_times_out_question():
+    """An unanswered question times out from the timer wheel."""
+    async def scenario():
+        server = GameServer(port=0, timer_duration=0.2, seed=1)
+        port = await server.start()
+        try:
+            reader, writer, replies = await _exchange(
+                port, [b'{"op": "start", "name": "Ann"}']
+            )
+            for _ in range(2):
+                replies.append(json.loads(
+                    await asyncio.wait_for(reader.readline(), timeout=5)
+                ))
+            writer.close()
+        finally:
+            await server.close()
+        return server, replies
+
+    server, replies = asyncio.run(scenario())
+    assert [reply["event"] for reply in replies] == [
+        "question", "timeout", "game_over"
+    ]
+    assert replies[1]["answer"] in replies[0]["options"]
+    assert replies[2]["state"] == "timeout"
+    assert server.games_finished == 1
+
+
+def test_bots_finish_every_game():
+    """Concurrent bots each play all their games to the end."""
+    async def scenario():
+        server = GameServer(port=0, seed=2)
+        port = await server.start()
+        try:
+            report = await asyncio.wait_for(
+                run_load("127.0.0.1", port, 5, 3, seed=2), timeout=30
+            )
+            # Let the server notice the bots hanging up
+            for _ in range(100):
+                if server.connections == 0:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await server.close()
+        return server, report
+
+    server, report = asyncio.run(scenario())
+    assert report["sessions"] == 15
+    assert server.games_started == server.games_finished == 15
+    assert server.connections == 0
+    assert report["answers"] >= 15
+
+
+def test_percentile_nearest_rank():
+    """Percentiles pick the nearest rank of a sorted list."""
+    values = list(range(1, 101))
+    assert _percentile(values, 50) == 50
+    assert _percentile(values, 99) == 99
+    assert _percentile(values, 100) == 100
+    assert _percentile([7], 99) == 7
+    assert _percentile([], 50) == 0.0
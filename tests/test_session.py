@@ -0,0 +1,123 @@
+"""
+Tests for the headless GameSession state machine.
+"""
+
+import random
+import pytest
+from src.config import PRIZE_VALUES
+from src.data import questions as builtin_questions
+from src.data.records import Question
+from src.game import session as game_session
+from src.game.session import GameSession
+
+
+def _questions(count=3):
+    """The first count built-in questions, unshuffled."""
+    return [
+        Question.from_dict(builtin_questions.QUESTIONS[i], i)
+        for i in range(count)
+    ]
+
+
+def _wrong_letter(question):
+    """A letter that is not the question's answer."""
+    return next(letter for letter in game_session.ANSWER_LETTERS
+                if letter != question.answer_letter)
+
+
+def test_correct_answers_win():
+    """Answering every question correctly wins with its prize."""
+    game = GameSession(_questions(), timer_duration=10, rng=random.Random(1))
+    events = []
+    game.subscribe(events.append)
+    for i in range(3):
+        assert game.begin(now=i).event == "question"
+        transition = game.answer(game.question.answer_letter, now=i + 1)
+        assert (transition.event, transition.index) == ("correct", i)
+    assert game.state == game_session.WON
+    assert game.finished
+    assert game.prize == PRIZE_VALUES[3]
+    assert [t.event for t in events] == ["question", "correct"] * 3
+
+
+def test_wrong_answer_loses():
+    """A wrong answer ends the game and later events are ignored."""
+    game = GameSession(_questions(), timer_duration=10)
+    game.begin(now=0)
+    transition = game.answer(_wrong_letter(game.question), now=1)
+    assert (transition.event, transition.state) == ("wrong", game_session.LOST)
+    assert game.score == 0 and game.prize == 0
+    assert game.begin(now=2) is None
+    assert game.answer("A", now=2) is None
+    assert game.use_lifeline(1) is None
+
+
+def test_invalid_letter_rejected():
+    """Only A-D are answers."""
+    game = GameSession(_questions())
+    game.begin(now=0)
+    with pytest.raises(ValueError):
+        game.answer("E")
+
+
+def test_answer_before_begin_ignored():
+    """Answers between questions do nothing."""
+    game = GameSession(_questions())
+    assert game.answer("A") is None
+    assert game.state == game_session.READY
+
+
+def test_tick_counts_down_and_times_out():
+    """Ticks report whole seconds once each, then time out at the deadline."""
+    game = GameSession(_questions(), timer_duration=3)
+    game.begin(now=100)
+    assert game.tick(100.0) is None
+    assert game.tick(100.5) is None
+    assert game.tick(101.2).data == 2
+    assert game.tick(101.5) is None
+    assert game.tick(102.9).data == 1
+    transition = game.tick(103.0)
+    assert transition.event == "timeout"
+    assert game.state == game_session.TIMED_OUT
+    assert game.time_left == 0
+
+
+def test_late_answer_times_out():
+    """An answer given after the deadline counts as a timeout."""
+    game = GameSession(_questions(), timer_duration=5)
+    game.begin(now=0)
+    transition = game.answer(game.question.answer_letter, now=5)
+    assert transition.event == "timeout"
+    assert game.score == 0
+
+
+def test_lifelines_used_once():
+    """Each lifeline works once per game; unknown numbers are ignored."""
+    game = GameSession(_questions(), timer_duration=10, rng=random.Random(3))
+    game.begin(now=0)
+    question = game.question
+
+    name, eliminated = game.use_lifeline(1).data
+    assert name == "5050"
+    assert len(eliminated) == 2
+    assert question.answer_letter not in eliminated
+
+    name, pick = game.use_lifeline(2).data
+    assert name == "phone" and pick in question.options
+
+    name, poll = game.use_lifeline(3).data
+    assert name == "audience"
+    assert len(poll) == len(question.options) and sum(poll) == 100
+
+    for number in (1, 2, 3, 4):
+        assert game.use_lifeline(number) is None
+
+
+def test_lifelines_repeat_with_seed():
+    """Sessions with equally seeded generators give the same outcomes."""
+    outcomes = []
+    for _ in range(2):
+        game = GameSession(_questions(), rng=random.Random(42))
+        game.begin(now=0)
+        outcomes.append([game.use_lifeline(n).data for n in (1, 2, 3)])
+    assert outcomes[0] == outcomes[1]
@@ -0,0 +1,101 @@
+"""
+Tests for the vectorized Monte Carlo game simulator.
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.config import PRIZE_VALUES, TOTAL_QUESTIONS
+from src.game.simulation import (
+    POLICIES, LifelinePolicy, PlayerModel, lifeline_values, simulate,
+    simulate_games
+)
+
+ALL_FOUR = (1.0, 1.0, 1.0)
+
+
+def test_perfect_player_always_wins():
+    """A player who knows everything and never times out wins every game."""
+    result = simulate(1000, PlayerModel((1, 1, 1), (0, 0, 0)),
+                      POLICIES["greedy"], seed=1, workers=1)
+    assert result.score_counts[TOTAL_QUESTIONS] == 1000
+    assert result.score_counts.sum() == 1000
+    assert result.mean_prize == PRIZE_VALUES[TOTAL_QUESTIONS]
+    assert result.lifeline_uses.tolist() == [0, 0, 0]
+
+
+def test_timeouts_end_every_game():
+    """A player who always times out scores nothing."""
+    result = simulate(1000, PlayerModel((1, 1, 1), (1, 1, 1)),
+                      POLICIES["none"], seed=1, workers=1)
+    assert result.score_counts[0] == 1000
+    assert result.mean_prize == 0
+
+
+def test_guessing_matches_option_count():
+    """Pure guesses on four options are right a quarter of the time."""
+    rng = np.random.default_rng(5)
+    counts, uses = simulate_games(
+        rng, 200_000, PlayerModel((0, 0, 0), (0, 0, 0)), POLICIES["none"],
+        ladder=(0,), four_share=ALL_FOUR
+    )
+    assert counts.sum() == 200_000
+    assert counts[1] / 200_000 == pytest.approx(0.25, abs=0.005)
+    assert uses.sum() == 0
+
+
+@pytest.mark.parametrize("lifeline, expected", [
+    ("5050", 0.5), ("phone", 0.8),
+])
+def test_lifeline_success_rates(lifeline, expected):
+    """A 50/50 halves the guess; the friend is right 80% of the time."""
+    rng = np.random.default_rng(9)
+    counts, uses = simulate_games(
+        rng, 200_000, PlayerModel((0, 0, 0), (0, 0, 0)),
+        LifelinePolicy((lifeline,), 0), ladder=(0,), four_share=ALL_FOUR
+    )
+    assert counts[1] / 200_000 == pytest.approx(expected, abs=0.005)
+    assert uses.sum() == 200_000
+
+
+def test_lifeline_used_once_per_game():
+    """A lifeline is spent on the first unknown question only."""
+    rng = np.random.default_rng(2)
+    counts, uses = simulate_games(
+        rng, 10_000, PlayerModel((0, 0, 0), (0, 0, 0)),
+        LifelinePolicy(("phone",), 0), ladder=(0, 0, 0), four_share=ALL_FOUR
+    )
+    assert uses.tolist() == [0, 10_000, 0]
+
+
+def test_from_question_holds_lifelines_back():
+    """No lifeline is used before the policy's first question."""
+    rng = np.random.default_rng(2)
+    counts, uses = simulate_games(
+        rng, 10_000, PlayerModel((0, 1, 1), (0, 0, 0)),
+        LifelinePolicy(("5050",), 1), ladder=(0, 1), four_share=ALL_FOUR
+    )
+    assert uses.sum() == 0
+
+
+def test_sharding_does_not_change_results():
+    """The same seed gives the same totals inline and across processes."""
+    player = PlayerModel((0.9, 0.6, 0.3), (0.01, 0.02, 0.05))
+    inline = simulate(20_000, player, POLICIES["greedy"], seed=3,
+                      workers=1, shard_size=5_000)
+    pooled = simulate(20_000, player, POLICIES["greedy"], seed=3,
+                      workers=2, shard_size=5_000)
+    assert inline.score_counts.tolist() == pooled.score_counts.tolist()
+    assert inline.lifeline_uses.tolist() == pooled.lifeline_uses.tolist()
+    assert inline.mean_prize == pooled.mean_prize
+
+
+def test_lifeline_values_positive():
+    """Every lifeline of a policy adds to the mean prize of a weak player."""
+    player = PlayerModel((0.5, 0.3, 0.1), (0, 0, 0))
+    baseline, values = lifeline_values(50_000, player, POLICIES["greedy"],
+                                       seed=4, workers=1)
+    assert baseline.games == 50_000
+    assert set(values) == {"5050", "phone", "audience"}
+    assert all(value > 0 for value in values.values())
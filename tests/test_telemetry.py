@@ -0,0 +1,132 @@
+"""
+Tests for per-game telemetry and its background sink.
+"""
+
+import json
+import random
+import pytest
+from src.data import questions as builtin_questions
+from src.data.records import Question
+from src.game.session import GameSession
+from src.game.telemetry import GameTelemetry, TelemetrySink
+from src.ui import pacing
+
+
+class _ListSink:
+    """Sink that keeps events in a list."""
+
+    def __init__(self):
+        self.events = []
+
+    def emit(self, event):
+        self.events.append(event)
+
+
+@pytest.fixture
+def unthrottled():
+    """Skip delays, advancing the game clock instead."""
+    speed = pacing.get_speed()
+    pacing.set_speed(0)
+    yield
+    pacing.set_speed(speed)
+
+
+def _read(path):
+    """Events in a JSON lines file."""
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_sink_writes_queued_events_on_close(tmp_path):
+    """Everything emitted is on disk, in order, once the sink closes."""
+    path = tmp_path / "telemetry.jsonl"
+    sink = TelemetrySink(str(path), flush_interval=60)
+    for i in range(100):
+        sink.emit({"i": i})
+    sink.close()
+    sink.close()
+    assert [event["i"] for event in _read(path)] == list(range(100))
+
+
+def test_sink_rotates_and_keeps_backups(tmp_path):
+    """Full files are shifted to .1, .2 and the oldest dropped."""
+    path = tmp_path / "telemetry.jsonl"
+    for batch in range(4):
+        sink = TelemetrySink(str(path), max_bytes=10, backups=2)
+        sink.emit({"batch": batch})
+        sink.close()
+    assert not path.exists()
+    assert _read(f"{path}.1") == [{"batch": 3}]
+    assert _read(f"{path}.2") == [{"batch": 2}]
+    assert not (tmp_path / "telemetry.jsonl.3").exists()
+
+
+def test_sink_without_backups_discards_full_file(tmp_path):
+    """With no backups a full file is simply removed."""
+    path = tmp_path / "telemetry.jsonl"
+    sink = TelemetrySink(str(path), max_bytes=10, backups=0)
+    sink.emit({"big": "x" * 20})
+    sink.close()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_sink_reports_write_errors(tmp_path, capsys):
+    """A failed write is printed and the sink keeps going."""
+    sink = TelemetrySink(str(tmp_path / "missing" / "telemetry.jsonl"))
+    sink.emit({"i": 1})
+    sink.close()
+    assert capsys.readouterr().out.startswith("Error writing telemetry: ")
+
+
+def test_game_events(unthrottled):
+    """A game reports its start, questions, lifelines, answers and end."""
+    questions = [
+        Question.from_dict(builtin_questions.QUESTIONS[i], i) for i in range(2)
+    ]
+    session = GameSession(questions, timer_duration=30, rng=random.Random(1))
+    sink = _ListSink()
+    telemetry = GameTelemetry(sink, "Ann")
+    telemetry.subscribe(session)
+
+    telemetry.game_started(questions)
+    session.begin(pacing.now())
+    pacing.pause(2)
+    session.use_lifeline(1)
+    pacing.idle(3)
+    session.answer(questions[0].answer_letter, pacing.now())
+    session.begin(pacing.now())
+    session.answer("A" if questions[1].answer_letter != "A" else "B",
+                   pacing.now())
+    telemetry.game_finished(session)
+
+    events = sink.events
+    assert [e["type"] for e in events] == [
+        "game_start", "question", "lifeline", "answer", "question", "answer",
+        "game_end",
+    ]
+    assert {e["game"] for e in events} == {telemetry.game}
+    assert events[0]["player"] == "Ann" and events[0]["questions"] == 2
+    assert events[1]["text"] == questions[0].question
+    assert events[2]["lifeline"] == "5050"
+    assert events[2]["at_ms"] == pytest.approx(2000, abs=50)
+
+    first = events[3]
+    assert first["outcome"] == "correct"
+    assert first["reaction_ms"] == pytest.approx(5000, abs=50)
+    assert first["time_left"] == pytest.approx(25, abs=0.05)
+    assert first["lifelines"] == ["5050"]
+    # Skipped delays move the game clock but take no wall time
+    assert first["wall_ms"] < 1000
+    assert {"animation_ms", "waiting_ms", "other_ms"} <= set(first)
+
+    assert events[5]["outcome"] == "wrong" and events[5]["lifelines"] == []
+    end = events[6]
+    assert (end["state"], end["score"]) == ("lost", 1)
+    assert end["lifelines"] == ["5050"]
+
+
+def test_no_sink_records_nothing():
+    """Telemetry without a sink ignores every event."""
+    telemetry = GameTelemetry(None)
+    telemetry.game_started([])
+    assert telemetry.game_start is not None